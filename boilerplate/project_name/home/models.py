@@ -9,23 +9,32 @@ Features:
 - SEO fields via SeoFieldsMixin
 - Open Graph image via OpenGraphMixin
 - Breadcrumb support via BreadcrumbMixin
+- Bulk image rendition prefetch and hero/lazy loading hints via
+  RenditionPrefetchMixin
 - Only one HomePage allowed per site
 """
 from __future__ import annotations
 
 from django.core.exceptions import ValidationError
 from sum_core.blocks import PageStreamBlock
-from sum_core.pages.mixins import BreadcrumbMixin, OpenGraphMixin, SeoFieldsMixin
+from sum_core.pages.mixins import (
+    BreadcrumbMixin,
+    OpenGraphMixin,
+    RenditionPrefetchMixin,
+    SeoFieldsMixin,
+)
 from wagtail.admin.panels import FieldPanel
 from wagtail.fields import RichTextField, StreamField
 from wagtail.models import Page
 
 
-class HomePage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
+class HomePage(
+    SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, RenditionPrefetchMixin, Page
+):
     """
     Homepage for this client project.
 
-    Uses sum_core mixins for SEO, Open Graph, and breadcrumbs.
+    Uses sum_core mixins for SEO, Open Graph, breadcrumbs and rendition prefetch.
     Body content is built using sum_core's PageStreamBlock.
     """
 
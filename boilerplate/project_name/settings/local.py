@@ -47,6 +47,9 @@ CACHES = {
 CELERY_TASK_ALWAYS_EAGER: bool = True
 CELERY_TASK_EAGER_PROPAGATES: bool = True
 
+# No outbox relay process runs locally; relay each lead's side effects on commit.
+LEAD_OUTBOX_RELAY_ON_COMMIT: bool = True
+
 # =============================================================================
 # Observability (sum_core.ops)
 # =============================================================================
@@ -76,12 +76,42 @@ CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", REDIS_URL)  # no
 CELERY_TASK_ALWAYS_EAGER: bool = False
 CELERY_TASK_EAGER_PROPAGATES: bool = False
 
+# Lead notifications are published from the lead outbox by a relay: install
+# sum-<slug>-outbox.service, or schedule sum_core.leads.tasks.relay_lead_outbox_task
+# in Celery beat. /health/ reports "degraded" while messages wait longer than this.
+LEAD_OUTBOX_RELAY_ON_COMMIT: bool = False
+LEAD_OUTBOX_STALE_MINUTES: int = int(os.environ.get("LEAD_OUTBOX_STALE_MINUTES", "10"))
+
 # =============================================================================
 # Static Files - Production configuration
 # =============================================================================
 
-# In production, static files should be served by a CDN or whitenoise
-# This is a basic setup; extend as needed for your infrastructure
+# collectstatic writes content-hashed copies of sum_core and theme assets plus
+# precompressed .gz/.br siblings; Caddy serves them with immutable caching.
+# Install sum-core[compression] for Brotli output.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "sum_core.assets.storage.SumManifestStaticFilesStorage"},
+}
+
+# =============================================================================
+# Published-page snapshots
+# =============================================================================
+
+# Live pages are rendered to static HTML here on publish (and by
+# `export_page_snapshots` on deploy) for Caddy to serve to anonymous visitors.
+# Leave unset to disable.
+PAGE_SNAPSHOT_ROOT: str = os.getenv("DJANGO_PAGE_SNAPSHOT_ROOT", "")
+
+# =============================================================================
+# Form submissions
+# =============================================================================
+
+# Use the async submission view. Only set this when serving project_name.asgi
+# (the ASGI ExecStart in the systemd gunicorn template).
+FORM_SUBMISSION_ASYNC: bool = (
+    os.getenv("DJANGO_FORM_SUBMISSION_ASYNC", "False").lower() == "true"
+)
 
 # =============================================================================
 # Observability (sum_core.ops)
@@ -0,0 +1,17 @@
+"""
+ASGI application entry point.
+
+Replace 'project_name' with your actual project name after copying.
+For production, ensure DJANGO_SETTINGS_MODULE points to production settings.
+Serve with gunicorn's uvicorn worker (see the systemd gunicorn template) and
+set FORM_SUBMISSION_ASYNC to handle form submissions asynchronously.
+"""
+from __future__ import annotations
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_name.settings.local")
+
+application = get_asgi_application()
@@ -160,6 +160,7 @@ INSTALLED_APPS: list[str] = [
 
 MIDDLEWARE: list[str] = [
     "sum_core.ops.middleware.CorrelationIdMiddleware",  # Request correlation
+    "sum_core.forms.middleware.FormSubmissionGuardMiddleware",  # Before sessions/CSRF
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
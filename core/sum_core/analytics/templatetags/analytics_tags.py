@@ -1,56 +1,86 @@
 """
 Name: Analytics Tags
 Path: core/sum_core/analytics/templatetags/analytics_tags.py
-Purpose: Template tags for injecting GA4/GTM scripts based on SiteSettings.
+Purpose: Template tags for the analytics config and the sum_core script bundles.
 Family: Analytics
-Dependencies: SiteSettings, Django templates
+Dependencies: SiteSettings, Django templates, sum_core.assets.js
 """
 
 from django import template
-from django.utils.html import json_script
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join, json_script
+from sum_core.assets.js import get_built_js_bundle, get_unbundled_script_paths
 from sum_core.branding.models import SiteSettings
 
 register = template.Library()
 
 
-@register.simple_tag(takes_context=True)
-def analytics_head(context):
+def _analytics_config(request):
     """
-    Emits analytics configuration data for client-side loading.
+    Build the client-side analytics config for the request's site.
     Priority:
     1. GTM (if gtm_container_id is set)
     2. GA4 (if ga_measurement_id is set)
     3. None
     """
-    request = context.get("request")
-    if not request:
-        return ""
-
     settings = SiteSettings.for_request(request)
     gtm_id = getattr(settings, "gtm_container_id", "").strip()
     ga4_id = getattr(settings, "ga_measurement_id", "").strip()
 
     if gtm_id:
-        config = {
+        return {
             "gtm_container_id": gtm_id,
             "ga_measurement_id": "",
             "cookie_banner_enabled": settings.cookie_banner_enabled,
         }
-    elif ga4_id:
-        config = {
+    if ga4_id:
+        return {
             "gtm_container_id": "",
             "ga_measurement_id": ga4_id,
             "cookie_banner_enabled": settings.cookie_banner_enabled,
         }
-    else:
+    return None
+
+
+@register.simple_tag(takes_context=True)
+def analytics_head(context):
+    """
+    Emits analytics configuration data for client-side loading.
+
+    When the analytics bundle has been built its URL is included so the core
+    bundle can fetch it once consent allows.
+    """
+    request = context.get("request")
+    if not request:
         return ""
 
+    config = _analytics_config(request)
+    if config is None:
+        return ""
+
+    chunk = get_built_js_bundle("analytics")
+    if chunk is not None:
+        config["analytics_chunk_url"] = chunk.url
+
     return json_script(config, "sum-analytics-config")
 
 
 @register.simple_tag(takes_context=True)
 def analytics_body(context):
     """
-    Reserved for future analytics markup (kept for template compatibility).
+    Emits the sum_core scripts.
+
+    With built bundles this is a single deferred module script; the analytics
+    chunk is loaded by it on consent. Otherwise the individual scripts are
+    emitted with ``defer``.
     """
-    return ""
+    core = get_built_js_bundle("core")
+    if core is not None:
+        return format_html('<script type="module" src="{}"></script>', core.url)
+
+    request = context.get("request")
+    analytics_enabled = bool(request) and _analytics_config(request) is not None
+    paths = get_unbundled_script_paths(analytics_enabled)
+    return format_html_join(
+        "\n", '<script src="{}" defer></script>', ((static(path),) for path in paths)
+    )
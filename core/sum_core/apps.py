@@ -31,7 +31,9 @@ class SumCoreConfig(AppConfig):
     name: str = "sum_core"
 
     def ready(self) -> None:
-        """Wire up custom admin forms after all models are loaded."""
+        """Wire up custom admin forms, block cache and CSS bundle signal handlers."""
+        import sum_core.assets.css  # noqa: F401
+        import sum_core.blocks.cache  # noqa: F401
         from sum_core.branding.forms import SiteSettingsAdminForm
         from sum_core.branding.models import SiteSettings
 
@@ -0,0 +1,7 @@
+"""
+Name: Assets Package Init
+Path: core/sum_core/assets/__init__.py
+Purpose: Namespace for static asset bundling used by sum_core page templates.
+Family: Assets, performance.
+Dependencies: None at import time.
+"""
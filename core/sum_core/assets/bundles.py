@@ -0,0 +1,81 @@
+"""
+Name: Asset Bundles
+Path: core/sum_core/assets/bundles.py
+Purpose: Content-hashed bundle files written to static storage after collectstatic.
+Family: Assets, performance.
+Dependencies: django.contrib.staticfiles, sum_core.assets.storage.
+
+Bundles are concatenations of collected source files named by a hash of their
+content (``<dir>/<label>.<12 hex>.<ext>``), so the same immutable caching rules
+apply as for files fingerprinted by the manifest storage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from sum_core.assets.storage import write_compressed_siblings
+
+# Bundle names confirmed to exist in static storage by this process.
+_written_bundles: set[str] = set()
+
+
+@dataclass(frozen=True)
+class AssetBundle:
+    name: str
+    content: str
+
+    @property
+    def url(self) -> str:
+        # Bundle names are already content-hashed and written after collectstatic,
+        # so they bypass any hashed-manifest lookup in the staticfiles storage.
+        return urljoin(settings.STATIC_URL, self.name)
+
+
+def make_bundle(
+    directory: str, label: str, extension: str, content: str
+) -> AssetBundle:
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return AssetBundle(
+        name=f"{directory}/{label}.{digest}.{extension}", content=content
+    )
+
+
+def read_static_source(path: str) -> str:
+    """Read a collected source file through the staticfiles finders."""
+    found = finders.find(path)
+    if not found:
+        raise FileNotFoundError(f"Static source not found: {path}")
+    with open(found, encoding="utf-8") as handle:
+        return handle.read()
+
+
+def bundle_exists(bundle: AssetBundle) -> bool:
+    if bundle.name in _written_bundles:
+        return True
+    try:
+        exists = staticfiles_storage.exists(bundle.name)
+    except ImproperlyConfigured:
+        # No STATIC_ROOT (e.g. local runserver): callers serve the sources.
+        return False
+    if exists:
+        _written_bundles.add(bundle.name)
+    return exists
+
+
+def write_bundle(bundle: AssetBundle) -> bool:
+    """Write ``bundle`` to static storage. Returns False if it already existed."""
+    if bundle_exists(bundle):
+        return False
+    content = bundle.content.encode("utf-8")
+    staticfiles_storage.save(bundle.name, ContentFile(content))
+    write_compressed_siblings(staticfiles_storage, bundle.name, content)
+    _written_bundles.add(bundle.name)
+    return True
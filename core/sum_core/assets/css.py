@@ -0,0 +1,196 @@
+"""
+Name: Per-page CSS Bundles
+Path: core/sum_core/assets/css.py
+Purpose: Bundle only the sum_core component stylesheets a page's blocks use and
+extract the above-the-fold subset for inlining.
+Family: Assets, performance.
+Dependencies: sum_core.assets.bundles, Wagtail StreamField, wagtail.signals.
+
+``sum_core/css/main.css`` imports every component partial. Here each
+``PageStreamBlock`` child name maps to the partials its template needs, and each
+page type to the partials its own template needs; a page's stylesheet set is the
+site chrome plus the partials for its type and the blocks it contains,
+concatenated in ``main.css`` cascade order into a content-hashed bundle under
+``sum_core/css/bundles/``. The header, base styles and the first block's
+partials (normally the hero) are inlined as critical CSS while the bundle loads.
+
+Bundles are written to static storage, with precompressed siblings, by
+``build_css_bundles`` (run after ``collectstatic``) and on publish for pages
+whose set is new. Pages whose bundle
+has not been written yet fall back to ``main.css``.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from functools import cache, lru_cache
+
+from django.conf import settings
+from django.db import models, transaction
+from django.dispatch import receiver
+from sum_core.assets.bundles import (
+    AssetBundle,
+    make_bundle,
+    read_static_source,
+    write_bundle,
+)
+from wagtail.fields import StreamField
+from wagtail.signals import page_published
+
+logger = logging.getLogger(__name__)
+
+STYLESHEET_DIR = "sum_core/css"
+BUNDLE_DIR = "sum_core/css/bundles"
+FALLBACK_STYLESHEET = "sum_core/css/main.css"
+
+# Partials in main.css cascade order (file names without "components." / ".css").
+CASCADE_ORDER: tuple[str, ...] = (
+    "tokens",
+    "reset",
+    "typography",
+    "layout",
+    "utilities",
+    "buttons",
+    "header",
+    "hero",
+    "trust-strip",
+    "stats",
+    "features",
+    "comparison",
+    "portfolio",
+    "sticky-cta",
+    "cards",
+    "services",
+    "testimonials",
+    "gallery",
+    "forms",
+    "process",
+    "faq",
+    "content",
+    "footer",
+)
+BASE_PARTIALS = ("tokens", "reset", "typography", "layout", "utilities")
+CHROME_PARTIALS = ("buttons", "header", "sticky-cta", "footer")
+CRITICAL_PARTIALS = ("tokens", "reset", "typography", "layout", "buttons", "header")
+
+# PageStreamBlock child name -> component partials. Unlisted blocks use content.
+BLOCK_PARTIALS: dict[str, tuple[str, ...]] = {
+    "hero": ("hero",),
+    "hero_image": ("hero",),
+    "hero_gradient": ("hero",),
+    "service_cards": ("cards", "services"),
+    "service_detail": ("services",),
+    "testimonials": ("testimonials",),
+    "gallery": ("gallery",),
+    "featured_case_study": ("portfolio",),
+    "portfolio": ("portfolio", "gallery"),
+    "trust_strip": ("trust-strip",),
+    "trust_strip_logos": ("trust-strip",),
+    "stats": ("stats",),
+    "features": ("features",),
+    "comparison": ("comparison",),
+    "process": ("process",),
+    "faq": ("faq",),
+    "team_members": ("cards",),
+    "contact_form": ("forms",),
+    "quote_request_form": ("forms",),
+    "dynamic_form": ("forms",),
+}
+DEFAULT_BLOCK_PARTIALS = ("content",)
+
+# Page model label -> partials for markup rendered by the page template itself.
+PAGE_TYPE_PARTIALS: dict[str, tuple[str, ...]] = {
+    "sum_core_pages.serviceindexpage": ("cards", "services"),
+    "sum_core_pages.servicepage": ("services",),
+}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+
+
+def _ordered(partials: set[str]) -> tuple[str, ...]:
+    return tuple(name for name in CASCADE_ORDER if name in partials)
+
+
+def _partial_path(name: str) -> str:
+    if name in BASE_PARTIALS:
+        return f"{STYLESHEET_DIR}/{name}.css"
+    return f"{STYLESHEET_DIR}/components.{name}.css"
+
+
+@cache
+def _read_partial(name: str) -> str:
+    css = _COMMENT_RE.sub("", read_static_source(_partial_path(name)))
+    return _BLANK_LINES_RE.sub("\n", css).strip()
+
+
+def _concatenate(partials: tuple[str, ...]) -> str:
+    return "\n".join(_read_partial(name) for name in partials) + "\n"
+
+
+# =============================================================================
+# Page stylesheet sets
+# =============================================================================
+
+
+def _stream_children(page: models.Model):
+    for page_field in page._meta.get_fields():
+        if isinstance(page_field, StreamField):
+            yield from getattr(page, page_field.name, None) or ()
+
+
+def get_page_partials(page: models.Model) -> tuple[str, ...]:
+    """Return the ordered partials used by ``page``'s chrome, template and blocks."""
+    partials = set(BASE_PARTIALS) | set(CHROME_PARTIALS)
+    partials.update(PAGE_TYPE_PARTIALS.get(page._meta.label_lower, ()))
+    for child in _stream_children(page):
+        partials.update(BLOCK_PARTIALS.get(child.block_type, DEFAULT_BLOCK_PARTIALS))
+    return _ordered(partials)
+
+
+def get_critical_partials(page: models.Model) -> tuple[str, ...]:
+    """
+    Return the partials needed above the fold: base, header, the page type's
+    own markup and the first block.
+    """
+    partials = set(CRITICAL_PARTIALS)
+    partials.update(PAGE_TYPE_PARTIALS.get(page._meta.label_lower, ()))
+    first = next(iter(_stream_children(page)), None)
+    if first is not None:
+        partials.update(BLOCK_PARTIALS.get(first.block_type, DEFAULT_BLOCK_PARTIALS))
+    return _ordered(partials)
+
+
+@lru_cache(maxsize=256)
+def get_bundle(partials: tuple[str, ...]) -> AssetBundle:
+    """Concatenate ``partials`` into a bundle named by its content hash."""
+    return make_bundle(BUNDLE_DIR, "page", "css", _concatenate(partials))
+
+
+@lru_cache(maxsize=256)
+def get_critical_css(partials: tuple[str, ...]) -> str:
+    return _concatenate(partials)
+
+
+def write_page_bundle(page: models.Model) -> bool:
+    return write_bundle(get_bundle(get_page_partials(page)))
+
+
+# =============================================================================
+# Signal Handlers
+# =============================================================================
+
+
+@receiver(page_published, dispatch_uid="css_bundles_page_published")
+def _on_page_published(sender, instance, **kwargs) -> None:
+    if not getattr(settings, "STATIC_ROOT", None):
+        return
+
+    def _write() -> None:
+        try:
+            write_page_bundle(instance)
+        except Exception:
+            logger.exception("Failed to write CSS bundle for page %s", instance.pk)
+
+    transaction.on_commit(_write)
@@ -0,0 +1,69 @@
+"""
+Name: JavaScript Bundles
+Path: core/sum_core/assets/js.py
+Purpose: Bundle sum_core scripts into one deferred core module and a consent-gated
+analytics chunk.
+Family: Assets, analytics, performance.
+Dependencies: sum_core.assets.bundles.
+
+The core bundle carries consent, navigation and page behaviour plus a small
+loader that injects the analytics chunk (GA4/GTM loader and event tracking)
+once ``#sum-analytics-config`` is present and consent allows it. Bundles are
+written by ``build_js_bundles`` after ``collectstatic``; until then the
+individual source scripts are served with ``defer``.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+from sum_core.assets.bundles import (
+    AssetBundle,
+    bundle_exists,
+    make_bundle,
+    read_static_source,
+)
+
+SCRIPT_DIR = "sum_core/js"
+BUNDLE_DIR = "sum_core/js/bundles"
+CHUNK_LOADER = "analytics_chunk_loader.js"
+EVENT_TRACKING = "event_tracking.js"
+
+JS_BUNDLES: dict[str, tuple[str, ...]] = {
+    "core": (
+        "cookie_consent.js",
+        CHUNK_LOADER,
+        "main.js",
+        "navigation.js",
+        "portfolio_filter.js",
+    ),
+    "analytics": ("analytics_loader.js", EVENT_TRACKING),
+}
+
+
+def get_script_paths(label: str) -> list[str]:
+    return [f"{SCRIPT_DIR}/{name}" for name in JS_BUNDLES[label]]
+
+
+def get_unbundled_script_paths(analytics_enabled: bool) -> list[str]:
+    """Return the source scripts to emit individually when bundles are not built."""
+    names = [name for name in JS_BUNDLES["core"] if name != CHUNK_LOADER]
+    # Event tracking only needs a dataLayer, which it creates itself.
+    names += JS_BUNDLES["analytics"] if analytics_enabled else [EVENT_TRACKING]
+    return [f"{SCRIPT_DIR}/{name}" for name in names]
+
+
+@cache
+def get_js_bundle(label: str) -> AssetBundle:
+    # Each source is self-contained; the separator guards against a missing
+    # trailing semicolon joining two statements.
+    content = ";\n".join(
+        read_static_source(path).strip() for path in get_script_paths(label)
+    )
+    return make_bundle(BUNDLE_DIR, label, "js", content + "\n")
+
+
+def get_built_js_bundle(label: str) -> AssetBundle | None:
+    """Return the bundle if it has been written to static storage."""
+    bundle = get_js_bundle(label)
+    return bundle if bundle_exists(bundle) else None
@@ -0,0 +1,94 @@
+"""
+Name: Static Files Storage
+Path: core/sum_core/assets/storage.py
+Purpose: Content-hashed static files with precompressed `.gz`/`.br` siblings.
+Family: Assets, performance.
+Dependencies: django.contrib.staticfiles, gzip (stdlib), Brotli (optional).
+
+``SumManifestStaticFilesStorage`` fingerprints every collected file (sum_core
+CSS/JS and the active theme's statics alike) and rewrites ``url()``/``@import``
+references between them. After hashing, compressible hashed files get
+precompressed siblings so the web server can send them without compressing per
+request. Brotli output needs the optional ``Brotli`` package
+(``pip install sum-core[compression]``); without it only ``.gz`` is written.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+from collections.abc import Iterator
+from typing import Any
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_EXTENSIONS = frozenset(
+    {".css", ".js", ".mjs", ".map", ".svg", ".json", ".txt", ".xml", ".html"}
+)
+# Below this size the compressed sibling rarely pays for the extra file.
+MIN_COMPRESS_SIZE = 256
+
+
+def is_compressible(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def compress_variants(content: bytes) -> dict[str, bytes]:
+    """Return ``{suffix: data}`` for each encoding that shrinks ``content``."""
+    if len(content) < MIN_COMPRESS_SIZE:
+        return {}
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content, quality=11)
+    return {
+        suffix: data for suffix, data in variants.items() if len(data) < len(content)
+    }
+
+
+def write_compressed_siblings(storage: Storage, name: str, content: bytes) -> int:
+    """Write precompressed siblings of ``name``. Returns the number written."""
+    if not is_compressible(name):
+        return 0
+    written = 0
+    for suffix, data in compress_variants(content).items():
+        sibling = f"{name}{suffix}"
+        if storage.exists(sibling):
+            storage.delete(sibling)
+        storage.save(sibling, ContentFile(data))
+        written += 1
+    return written
+
+
+class SumManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Manifest storage that also precompresses hashed text assets."""
+
+    def post_process(
+        self, paths: dict[str, Any], dry_run: bool = False, **options: Any
+    ) -> Iterator[tuple[str, str | None, bool]]:
+        hashed_names: set[str] = set()
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run, **options
+        ):
+            if hashed_name and not isinstance(processed, Exception):
+                hashed_names.add(hashed_name)
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+        if brotli is None:
+            logger.info("Brotli not installed; writing .gz static siblings only")
+        for hashed_name in sorted(hashed_names):
+            if not is_compressible(hashed_name):
+                continue
+            with self.open(hashed_name) as handle:
+                write_compressed_siblings(self, hashed_name, handle.read())
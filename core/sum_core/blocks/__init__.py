@@ -7,6 +7,7 @@ Dependencies: PageStreamBlock from base module.
 """
 
 from .base import PageStreamBlock
+from .cache import CachedRenderMixin
 from .content import (
     ButtonGroupBlock,
     ComparisonBlock,
@@ -42,6 +43,7 @@ from .trust import TrustStripItemBlock
 
 __all__ = [
     "PageStreamBlock",
+    "CachedRenderMixin",
     "HeroImageBlock",
     "HeroGradientBlock",
     "HeroCTABlock",
@@ -7,6 +7,7 @@ Dependencies: Wagtail blocks, rich text utilities.
 """
 
 from sum_core.blocks.content import (
+    AnchoredRichTextBlock,
     ButtonGroupBlock,
     ComparisonBlock,
     DividerBlock,
@@ -39,7 +40,6 @@ from sum_core.blocks.services import ServiceCardsBlock, ServiceDetailBlock
 from sum_core.blocks.testimonials import TestimonialsBlock
 from sum_core.blocks.trust import StatsBlock
 from sum_core.blocks.trust import TrustStripBlock as TrustStripLogosBlock
-from wagtail import blocks
 from wagtail.blocks import StreamBlock
 
 
@@ -90,7 +90,7 @@ class PageStreamBlock(StreamBlock):
     quote_request_form = QuoteRequestFormBlock(group="Forms")
     dynamic_form = DynamicFormBlock(group="Forms")
 
-    rich_text = blocks.RichTextBlock(
+    rich_text = AnchoredRichTextBlock(
         label="Rich Text",
         help_text="Add formatted text content. Use H2-H4 for headings, avoid H1.",
         features=[
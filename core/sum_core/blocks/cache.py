@@ -0,0 +1,146 @@
+"""
+Name: Block Render Cache
+Path: core/sum_core/blocks/cache.py
+Purpose: Opt-in fragment cache for expensive StreamField child blocks.
+Family: Blocks, caching.
+Dependencies: django.core.cache, django.db.models.signals, Wagtail images.
+
+Blocks opt in by mixing in ``CachedRenderMixin`` and may declare which request
+query parameters change their output via ``render_cache_vary_on``. Rendered HTML
+is keyed by (page, live revision, block id, vary params), so a static section is
+rendered once per published revision rather than once per request. Vary values
+come from the visitor, so only values the block whitelists for its value are
+cached; anything else renders uncached rather than adding a key. Previews and
+renders without a page in context are never cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Collection
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.safestring import mark_safe
+
+BLOCK_RENDER_CACHE_PREFIX = "block_render"
+BLOCK_RENDER_VERSION_KEY = "block_render_version"
+BLOCK_RENDER_CACHE_TTL_DEFAULT = 3600
+
+
+def _get_cache_ttl() -> int:
+    """Get fragment TTL from settings or use default (1 hour)."""
+    return getattr(settings, "BLOCK_RENDER_CACHE_TTL", BLOCK_RENDER_CACHE_TTL_DEFAULT)
+
+
+def bump_block_render_cache_version() -> None:
+    if cache.add(BLOCK_RENDER_VERSION_KEY, 1):
+        return
+    try:
+        cache.incr(BLOCK_RENDER_VERSION_KEY)
+    except ValueError:
+        cache.set(BLOCK_RENDER_VERSION_KEY, 1)
+
+
+def _get_block_id(block: Any, value: Any, context: dict[str, Any]) -> str:
+    """
+    Return the StreamField child id for ``value``.
+
+    Page templates render children with ``{% for block in page.body %}``, so the
+    bound child is in context as ``block``. Fall back to a digest of the raw
+    value when the block is rendered some other way.
+    """
+    bound = context.get("block")
+    if getattr(bound, "value", None) is value and getattr(bound, "id", None):
+        return str(bound.id)
+    raw = json.dumps(block.get_prep_value(value), cls=DjangoJSONEncoder)
+    return hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def get_block_render_cache_key(
+    block: Any, value: Any, context: dict[str, Any] | None
+) -> str | None:
+    """Build the fragment key, or return None when the render must not be cached."""
+    if not context:
+        return None
+    page = context.get("page")
+    request = context.get("request")
+    revision_id = getattr(page, "live_revision_id", None)
+    if revision_id is None or getattr(request, "is_preview", False):
+        return None
+
+    query = getattr(request, "GET", {})
+    vary_values = []
+    for name in block.render_cache_vary_on:
+        raw = query.get(name, "").strip()
+        if raw and raw not in block.get_render_cache_vary_choices(value, name):
+            return None
+        vary_values.append(f"{name}={raw}")
+    vary = "&".join(vary_values)
+    version = cache.get(BLOCK_RENDER_VERSION_KEY) or "0"
+    block_id = _get_block_id(block, value, context)
+    return (
+        f"{BLOCK_RENDER_CACHE_PREFIX}:{page.pk}:{revision_id}:{block_id}:"
+        f"{hashlib.sha1(vary.encode('utf-8'), usedforsecurity=False).hexdigest()}:"
+        f"{version}"
+    )
+
+
+class CachedRenderMixin:
+    """
+    Cache a block's rendered HTML per page revision.
+
+    Only mix into blocks whose output depends solely on the block value, the
+    page and the declared query parameters (never on CSRF tokens or the user).
+    """
+
+    # Request query parameters that change the rendered output.
+    render_cache_vary_on: tuple[str, ...] = ()
+
+    def get_render_cache_vary_choices(self, value, name: str) -> Collection[str]:
+        """
+        Return the values of query parameter ``name`` worth caching for ``value``.
+
+        Renders with any other non-empty value are not cached. Override in blocks
+        that declare ``render_cache_vary_on``.
+        """
+        return ()
+
+    def render(self, value, context=None):
+        key = get_block_render_cache_key(self, value, context)
+        if key is None:
+            return super().render(value, context=context)
+
+        html = cache.get(key)
+        if html is None:
+            html = str(super().render(value, context=context))
+            cache.set(key, html, timeout=_get_cache_ttl())
+        return mark_safe(html)
+
+
+# =============================================================================
+# Signal Handlers
+# =============================================================================
+
+
+def _is_image_model(sender) -> bool:
+    from wagtail.images import get_image_model
+
+    return sender is get_image_model()
+
+
+@receiver(post_save, dispatch_uid="block_render_cache_image_save")
+def _on_image_save(sender, instance, **kwargs) -> None:
+    if _is_image_model(sender):
+        bump_block_render_cache_version()
+
+
+@receiver(post_delete, dispatch_uid="block_render_cache_image_delete")
+def _on_image_delete(sender, instance, **kwargs) -> None:
+    if _is_image_model(sender):
+        bump_block_render_cache_version()
@@ -5,7 +5,14 @@ Purpose: Define StructBlocks for rich content sections (Hero, Features, Portfoli
 Family: Used by StreamFields in pages.
 """
 
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.utils.safestring import mark_safe
 from django.utils.text import slugify
+from sum_core.blocks.cache import CachedRenderMixin
 from wagtail import blocks
 from wagtail.images.blocks import ImageChooserBlock
 
@@ -119,12 +126,57 @@ class PortfolioItemBlock(blocks.StructBlock):
         required=False, help_text="Link to full project case study"
     )
 
+    image_renditions = {"image": ("portfolio",)}
+
     class Meta:
         icon = "image"
         label = "Project Item"
 
 
-class PortfolioBlock(blocks.StructBlock):
+@dataclass(frozen=True)
+class PortfolioCategory:
+    label: str
+    slug: str
+
+    def __str__(self) -> str:
+        return self.label
+
+
+@dataclass(frozen=True)
+class PortfolioIndex:
+    """Categories in first-seen order and the item positions for each slug."""
+
+    categories: tuple[PortfolioCategory, ...]
+    positions: dict[str, tuple[int, ...]]
+
+    def filter(self, items: list, slug: str) -> list:
+        return [items[position] for position in self.positions.get(slug, ())]
+
+
+@lru_cache(maxsize=512)
+def build_portfolio_index(item_categories: tuple[str, ...]) -> PortfolioIndex:
+    """
+    Index items by category slug.
+
+    Keyed on the items' raw category labels, so each block value (and hence
+    each page revision) is slugified once per process rather than per request.
+    """
+    categories: dict[str, PortfolioCategory] = {}
+    positions: dict[str, list[int]] = {}
+    for position, raw in enumerate(item_categories):
+        label = raw.strip()
+        if not label:
+            continue
+        slug = slugify(label)
+        categories.setdefault(label, PortfolioCategory(label=label, slug=slug))
+        positions.setdefault(slug, []).append(position)
+    return PortfolioIndex(
+        categories=tuple(categories.values()),
+        positions={slug: tuple(found) for slug, found in positions.items()},
+    )
+
+
+class PortfolioBlock(CachedRenderMixin, blocks.StructBlock):
     eyebrow = blocks.CharBlock(required=False, help_text="Small label above heading")
     heading = blocks.RichTextBlock(
         required=True,
@@ -138,35 +190,36 @@ class PortfolioBlock(blocks.StructBlock):
     )
     items = blocks.ListBlock(PortfolioItemBlock(), min_num=1, max_num=12)
 
+    render_cache_vary_on = ("category",)
+
+    def _get_index(self, items: list) -> PortfolioIndex:
+        return build_portfolio_index(
+            tuple(item.get("category") or "" for item in items)
+        )
+
+    def get_render_cache_vary_choices(self, value, name: str) -> set[str]:
+        if name != "category":
+            return set()
+        index = self._get_index(list(value.get("items", [])))
+        return {category.slug for category in index.categories}
+
     def get_context(self, value, parent_context=None):
         context = super().get_context(value, parent_context=parent_context)
         items = list(value.get("items", []))
-        categories = []
-        for item in items:
-            category = (item.get("category") or "").strip()
-            if category and category not in categories:
-                categories.append(category)
+        index = self._get_index(items)
 
         request = parent_context.get("request") if parent_context else None
         active_category = ""
         if request:
             active_category = request.GET.get("category", "").strip()
 
-        if active_category:
-            filtered_items = [
-                item
-                for item in items
-                if (item.get("category") or "").strip()
-                and slugify((item.get("category") or "").strip()) == active_category
-            ]
-        else:
-            filtered_items = items
-
         context.update(
             {
-                "categories": categories,
+                "categories": list(index.categories),
                 "active_category": active_category,
-                "filtered_items": filtered_items,
+                "filtered_items": (
+                    index.filter(items, active_category) if active_category else items
+                ),
             }
         )
         return context
@@ -186,12 +239,14 @@ class TeamMemberItemBlock(blocks.StructBlock):
     role = blocks.CharBlock(required=False, help_text="Role or title.")
     bio = blocks.TextBlock(required=False, help_text="Short bio (1-2 sentences).")
 
+    image_renditions = {"photo": ("team",)}
+
     class Meta:
         icon = "user"
         label = "Team Member"
 
 
-class TeamMemberBlock(blocks.StructBlock):
+class TeamMemberBlock(CachedRenderMixin, blocks.StructBlock):
     eyebrow = blocks.CharBlock(
         max_length=100, required=False, help_text="Small label above heading"
     )
@@ -225,12 +280,14 @@ class TimelineItemBlock(blocks.StructBlock):
         help_text="Alt text for the image. Provide when an image is set.",
     )
 
+    image_renditions = {"image": ("timeline",)}
+
     class Meta:
         icon = "date"
         label = "Timeline Item"
 
 
-class TimelineBlock(blocks.StructBlock):
+class TimelineBlock(CachedRenderMixin, blocks.StructBlock):
     eyebrow = blocks.CharBlock(
         required=False, help_text="Optional accent label above the heading"
     )
@@ -398,6 +455,8 @@ class SocialProofQuoteBlock(blocks.StructBlock):
     role = blocks.CharBlock(required=False)
     company = blocks.CharBlock(required=False)
 
+    image_renditions = {"logo": ("fill-160x160",)}
+
     class Meta:
         icon = "openquote"
         label = "Social Proof Quote"
@@ -418,6 +477,9 @@ class ImageBlock(blocks.StructBlock):
         required=False, default=False, help_text="Stretch to full-width container."
     )
 
+    image_renditions = {"image": ("content",)}
+    priority_image = "image"
+
     class Meta:
         icon = "image"
         label = "Image"
@@ -507,6 +569,18 @@ class DividerBlock(blocks.StructBlock):
         template = "sum_core/blocks/content_divider.html"
 
 
+class AnchoredRichTextBlock(blocks.RichTextBlock):
+    """
+    Rich text whose h2/h3 headings get ids from the page outline.
+    """
+
+    def render(self, value, context=None):
+        from sum_core.pages.outline import anchor_headings_in_context
+
+        html = str(super().render(value, context=context))
+        return mark_safe(anchor_headings_in_context(html, context))
+
+
 class TableOfContentsItemBlock(blocks.StructBlock):
     """
     Single entry for the TableOfContentsBlock.
@@ -526,6 +600,9 @@ class TableOfContentsItemBlock(blocks.StructBlock):
 class TableOfContentsBlock(blocks.StructBlock):
     """
     Table of contents for legal pages.
+
+    On a page, entries come from the page outline (legal sections and h2
+    headings); the hand-entered items are used when no outline headings exist.
     """
 
     items = blocks.ListBlock(
@@ -534,6 +611,32 @@ class TableOfContentsBlock(blocks.StructBlock):
         help_text="Add links that point to anchors on the same page.",
     )
 
+    def get_context(self, value, parent_context=None):
+        context = super().get_context(value, parent_context=parent_context)
+        entries = self._get_outline_entries(parent_context)
+        if not entries:
+            entries = [
+                {"label": item.get("label"), "anchor": slugify(item.get("anchor", ""))}
+                for item in value.get("items", [])
+            ]
+        context["entries"] = entries
+        return context
+
+    @staticmethod
+    def _get_outline_entries(parent_context) -> list[dict[str, str]]:
+        """Generate entries from the page's stored outline when rendered on a page."""
+        from sum_core.pages.outline import get_page_outline
+        from wagtail.models import Page
+
+        page = parent_context.get("page") if parent_context else None
+        if not isinstance(page, Page):
+            return []
+        outline = get_page_outline(page, parent_context.get("request"))
+        return [
+            {"label": heading["text"], "anchor": heading["anchor"]}
+            for heading in outline.get_toc_entries()
+        ]
+
     class Meta:
         icon = "list-ol"
         label = "Table of Contents"
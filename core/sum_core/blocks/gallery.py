@@ -6,6 +6,7 @@ Family: Used via PageStreamBlock on core pages (e.g., HomePage) and other templa
 Dependencies: Wagtail blocks, wagtail.images ImageChooserBlock, sum_core design tokens.
 """
 
+from sum_core.blocks.cache import CachedRenderMixin
 from wagtail import blocks
 from wagtail.images.blocks import ImageChooserBlock
 
@@ -25,12 +26,14 @@ class GalleryImageBlock(blocks.StructBlock):
         help_text="Short caption, e.g. location or project type.",
     )
 
+    image_renditions = {"image": ("gallery",)}
+
     class Meta:
         icon = "image"
         label = "Gallery Image"
 
 
-class GalleryBlock(blocks.StructBlock):
+class GalleryBlock(CachedRenderMixin, blocks.StructBlock):
     """
     Gallery section block with heading, intro text, and a grid of images.
 
@@ -75,6 +78,8 @@ class FeaturedCaseStudyBlock(blocks.StructBlock):
     stats_label = blocks.CharBlock(max_length=50, required=False)
     stats_value = blocks.CharBlock(max_length=100, required=False)
 
+    image_renditions = {"image": ("case_study",)}
+
     class Meta:
         icon = "doc-full"
         template = "sum_core/blocks/featured_case_study.html"
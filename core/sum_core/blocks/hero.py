@@ -84,6 +84,9 @@ class HeroImageBlock(BaseHeroBlock):
         help_text="e.g. '£2,450'",
     )
 
+    image_renditions = {"image": ("hero",)}
+    priority_image = "image"
+
     class Meta:
         template = "sum_core/blocks/hero_image.html"
         icon = "image"
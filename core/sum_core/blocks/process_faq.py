@@ -9,6 +9,7 @@ Dependencies: Wagtail blocks, Django utilities, json.
 import json
 
 from django.utils.html import strip_tags
+from sum_core.blocks.cache import CachedRenderMixin
 from wagtail import blocks
 
 
@@ -35,7 +36,7 @@ class ProcessStepBlock(blocks.StructBlock):
         label = "Process Step"
 
 
-class ProcessStepsBlock(blocks.StructBlock):
+class ProcessStepsBlock(CachedRenderMixin, blocks.StructBlock):
     """
     Timeline/steps layout block.
     """
@@ -76,7 +77,7 @@ class FAQItemBlock(blocks.StructBlock):
         label = "FAQ Item"
 
 
-class FAQBlock(blocks.StructBlock):
+class FAQBlock(CachedRenderMixin, blocks.StructBlock):
     """
     Accordion-style FAQ block with valid JSON-LD schema.
     """
@@ -0,0 +1,376 @@
+"""
+Name: Block Rendition Prefetch
+Path: core/sum_core/blocks/renditions.py
+Purpose: Collect images used by StreamField blocks and resolve their renditions in bulk.
+Family: Blocks, images, performance.
+Dependencies: Wagtail images, Wagtail StreamField blocks.
+
+Blocks declare the rendition specs their templates request through an
+``image_renditions`` mapping of child field name to filter specs. A pre-render
+pass walks a page's StreamFields and loads the existing renditions of the
+declared specs for every image found in one query, into a request-scoped lookup
+that ``{% responsive_image %}`` reads before touching the database. The pass
+never creates renditions: missing ones are generated lazily by the template tag
+or ahead of time by the publish-time pregeneration task.
+
+Declared specs may also name a ``RenditionPreset``: a responsive recipe used by
+``{% responsive_image %}`` that expands to one rendition per srcset width for
+the fallback format and each modern format the image backend can encode.
+
+An ``ImageLoadingPlan`` records each page-level block's StreamField position so
+the tag can lazy-load images below the fold and give the first above-the-fold
+block that declares a ``priority_image`` field ``fetchpriority="high"`` plus a
+``<link rel="preload">`` in the document head.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from django.conf import settings
+from django.db import models
+from django.http import HttpRequest
+from wagtail import blocks
+from wagtail.fields import StreamField
+from wagtail.images import get_image_model
+from wagtail.images.models import AbstractImage, Filter
+
+REQUEST_RENDITIONS_ATTR = "_sum_renditions"
+REQUEST_IMAGE_LOADING_ATTR = "_sum_image_loading"
+
+RESPONSIVE_IMAGE_FORMATS_DEFAULT = ("avif", "webp")
+ABOVE_FOLD_BLOCKS_DEFAULT = 2
+
+
+# =============================================================================
+# Presets
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RenditionPreset:
+    """
+    Responsive image recipe.
+
+    ``ratio`` crops every width to a fixed aspect (``fill-``); without it the
+    source aspect is kept (``width-``). ``sizes`` is emitted verbatim.
+    """
+
+    widths: tuple[int, ...]
+    sizes: str
+    ratio: tuple[int, int] | None = None
+
+    def spec(self, width: int, image_format: str | None = None) -> str:
+        if self.ratio:
+            ratio_w, ratio_h = self.ratio
+            spec = f"fill-{width}x{round(width * ratio_h / ratio_w)}"
+        else:
+            spec = f"width-{width}"
+        return f"{spec}|format-{image_format}" if image_format else spec
+
+    def specs(self) -> list[str]:
+        """Every spec the preset renders: fallback first, then modern formats."""
+        return [
+            self.spec(width, image_format)
+            for image_format in (None, *get_responsive_image_formats())
+            for width in self.widths
+        ]
+
+
+GRID_SIZES = "(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
+HALF_SIZES = "(min-width: 1024px) 50vw, 100vw"
+
+RENDITION_PRESETS: dict[str, RenditionPreset] = {
+    "hero": RenditionPreset(widths=(768, 1280, 1920, 2560), sizes="100vw"),
+    "content": RenditionPreset(
+        widths=(640, 1024, 1600, 2400), sizes="(min-width: 1152px) 1152px, 100vw"
+    ),
+    "gallery": RenditionPreset(widths=(400, 800, 1200), sizes=GRID_SIZES, ratio=(4, 3)),
+    "portfolio": RenditionPreset(
+        widths=(400, 800, 1200),
+        sizes="(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 85vw",
+        ratio=(4, 3),
+    ),
+    "team": RenditionPreset(widths=(300, 600), sizes=GRID_SIZES, ratio=(1, 1)),
+    "feature": RenditionPreset(widths=(600, 900, 1200), sizes=HALF_SIZES, ratio=(4, 3)),
+    "case_study": RenditionPreset(
+        widths=(480, 800, 1200), sizes=HALF_SIZES, ratio=(4, 5)
+    ),
+    "timeline": RenditionPreset(
+        widths=(600, 1200), sizes="(min-width: 768px) 640px, 100vw", ratio=(5, 3)
+    ),
+    "card_wide": RenditionPreset(widths=(480, 800), sizes=HALF_SIZES, ratio=(16, 9)),
+    "card": RenditionPreset(widths=(400, 800), sizes=GRID_SIZES, ratio=(4, 3)),
+}
+
+
+@cache
+def _encodable_formats() -> frozenset[str]:
+    # Willow registers the pillow-heif plugins on import; whether AVIF is among
+    # them depends on the installed Pillow/pillow-heif versions.
+    import willow.plugins.pillow  # noqa: F401
+    from PIL import Image as PILImage
+
+    PILImage.init()
+    return frozenset(name.lower() for name in PILImage.SAVE)
+
+
+def get_responsive_image_formats() -> tuple[str, ...]:
+    """Configured modern formats the image backend can actually encode."""
+    configured = getattr(
+        settings, "RESPONSIVE_IMAGE_FORMATS", RESPONSIVE_IMAGE_FORMATS_DEFAULT
+    )
+    encodable = _encodable_formats()
+    return tuple(name for name in configured if name in encodable)
+
+
+def get_rendition_preset(name: str) -> RenditionPreset:
+    try:
+        return RENDITION_PRESETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown rendition preset: {name!r}") from None
+
+
+def expand_rendition_specs(specs: Iterable[str]) -> set[str]:
+    """Expand preset names to their filter specs; other entries pass through."""
+    expanded: set[str] = set()
+    for spec in specs:
+        if spec in RENDITION_PRESETS:
+            expanded.update(RENDITION_PRESETS[spec].specs())
+        else:
+            expanded.add(spec)
+    return expanded
+
+
+class RenditionLookup:
+    """Request-scoped map of (image id, filter spec) to rendition."""
+
+    def __init__(self) -> None:
+        self._renditions: dict[tuple[int, str], Any] = {}
+        self.prefetched_pages: set[int] = set()
+
+    def add(self, rendition: Any) -> None:
+        self._renditions[(rendition.image_id, rendition.filter_spec)] = rendition
+
+    def get(self, image: AbstractImage | None, spec: str) -> Any | None:
+        if image is None:
+            return None
+        return self._renditions.get((image.pk, spec))
+
+    def __len__(self) -> int:
+        return len(self._renditions)
+
+
+def get_rendition_lookup(request: HttpRequest | None) -> RenditionLookup:
+    """Return the lookup stored on ``request`` (a throwaway one if no request)."""
+    if request is None:
+        return RenditionLookup()
+    lookup = getattr(request, REQUEST_RENDITIONS_ATTR, None)
+    if lookup is None:
+        lookup = RenditionLookup()
+        setattr(request, REQUEST_RENDITIONS_ATTR, lookup)
+    return lookup
+
+
+# =============================================================================
+# Collection
+# =============================================================================
+
+
+def collect_block_images(
+    block: blocks.Block,
+    value: Any,
+    found: dict[int, tuple[list[AbstractImage], set[str]]],
+    specs: Iterable[str] = (),
+) -> None:
+    """Walk a block value, recording image instances and their declared specs."""
+    if value is None:
+        return
+    if isinstance(value, AbstractImage):
+        instances, image_specs = found.setdefault(value.pk, ([], set()))
+        if not any(instance is value for instance in instances):
+            instances.append(value)
+        image_specs.update(expand_rendition_specs(specs))
+        return
+    if isinstance(block, blocks.StreamBlock):
+        for child in value:
+            collect_block_images(child.block, child.value, found)
+    elif isinstance(block, blocks.ListBlock):
+        for item in value:
+            collect_block_images(block.child_block, item, found)
+    elif isinstance(block, blocks.StructBlock):
+        declared = getattr(block, "image_renditions", {})
+        for name, child_block in block.child_blocks.items():
+            collect_block_images(
+                child_block, value.get(name), found, declared.get(name, ())
+            )
+
+
+def collect_page_images(
+    page: models.Model,
+) -> dict[int, tuple[list[AbstractImage], set[str]]]:
+    """
+    Collect images from every StreamField and image foreign key on ``page``.
+
+    Page models may declare specs for their own image fields through the same
+    ``image_renditions`` mapping used by blocks.
+    """
+    found: dict[int, tuple[list[AbstractImage], set[str]]] = {}
+    image_model = get_image_model()
+    declared = getattr(page, "image_renditions", {})
+    for page_field in page._meta.get_fields():
+        if isinstance(page_field, StreamField):
+            collect_block_images(
+                page_field.stream_block, getattr(page, page_field.name, None), found
+            )
+        elif (
+            isinstance(page_field, models.ForeignKey)
+            and page_field.related_model is image_model
+        ):
+            collect_block_images(
+                None,
+                getattr(page, page_field.name, None),
+                found,
+                declared.get(page_field.name, ()),
+            )
+    return found
+
+
+def collect_rendition_specs(page: models.Model) -> dict[int, list[str]]:
+    """Return ``{image_id: [specs]}`` for every image with declared specs on ``page``."""
+    return {
+        image_id: sorted(specs)
+        for image_id, (_, specs) in collect_page_images(page).items()
+        if specs
+    }
+
+
+# =============================================================================
+# Prefetch
+# =============================================================================
+
+
+def prefetch_renditions(
+    found: dict[int, tuple[list[AbstractImage], set[str]]],
+    lookup: RenditionLookup,
+) -> None:
+    """
+    Load the existing renditions of the collected images' declared specs.
+
+    One query, filtered to the declared specs. Read-only: missing renditions
+    are left to the template's lazy fallback and the publish-time
+    pregeneration task, so a cold page view never resizes images in bulk.
+    """
+    wanted = {image_id: specs for image_id, (_, specs) in found.items() if specs}
+    if not wanted:
+        return
+
+    all_specs = set().union(*wanted.values())
+    filters = {spec: Filter(spec=spec) for spec in all_specs}
+    rendition_model = get_image_model().get_rendition_model()
+    for rendition in rendition_model.objects.filter(
+        image_id__in=list(wanted), filter_spec__in=all_specs
+    ):
+        if rendition.filter_spec not in wanted[rendition.image_id]:
+            continue
+        image = found[rendition.image_id][0][0]
+        # Renditions made before the focal point changed are stale.
+        if rendition.focal_point_key != filters[rendition.filter_spec].get_cache_key(
+            image
+        ):
+            continue
+        # Avoid a query per rendition when templates read alt text.
+        rendition.image = image
+        lookup.add(rendition)
+
+
+def prefetch_page_renditions(
+    page: models.Model, request: HttpRequest | None = None
+) -> RenditionLookup:
+    """Run the pre-render rendition pass for ``page`` once per request."""
+    lookup = get_rendition_lookup(request)
+    if page.pk in lookup.prefetched_pages:
+        return lookup
+    prefetch_renditions(collect_page_images(page), lookup)
+    lookup.prefetched_pages.add(page.pk)
+    return lookup
+
+
+# =============================================================================
+# Loading hints
+# =============================================================================
+
+
+def get_above_fold_blocks() -> int:
+    return getattr(settings, "ABOVE_FOLD_BLOCKS", ABOVE_FOLD_BLOCKS_DEFAULT)
+
+
+@dataclass
+class ImageLoadingPlan:
+    """Loading hints for a page's top-level StreamField blocks, keyed by block id."""
+
+    above_fold: int = ABOVE_FOLD_BLOCKS_DEFAULT
+    positions: dict[str, int] = field(default_factory=dict)
+    priority_block_id: str | None = None
+    priority_image: AbstractImage | None = None
+    priority_preset: str | None = None
+
+    def hints(self, block_id: str | None) -> dict[str, str]:
+        position = self.positions.get(block_id) if block_id else None
+        if position is None:
+            return {}
+        if block_id == self.priority_block_id:
+            return {"fetchpriority": "high"}
+        if position < self.above_fold:
+            return {}
+        return {"loading": "lazy"}
+
+
+def get_image_loading_plan(request: HttpRequest | None) -> ImageLoadingPlan:
+    """Return the plan stored on ``request`` (an empty one if none was built)."""
+    plan = getattr(request, REQUEST_IMAGE_LOADING_ATTR, None)
+    return plan if plan is not None else ImageLoadingPlan()
+
+
+def _priority_image(child: Any) -> tuple[AbstractImage, str] | None:
+    field_name = getattr(child.block, "priority_image", None)
+    if not field_name:
+        return None
+    image = child.value.get(field_name)
+    if not isinstance(image, AbstractImage):
+        return None
+    declared = getattr(child.block, "image_renditions", {}).get(field_name, ())
+    preset = next((name for name in declared if name in RENDITION_PRESETS), None)
+    return (image, preset) if preset else None
+
+
+def build_image_loading_plan(page: models.Model) -> ImageLoadingPlan:
+    """Number the page's top-level blocks and pick the preload candidate."""
+    plan = ImageLoadingPlan(above_fold=get_above_fold_blocks())
+    position = 0
+    for page_field in page._meta.get_fields():
+        if not isinstance(page_field, StreamField):
+            continue
+        for child in getattr(page, page_field.name, None) or ():
+            if child.id:
+                plan.positions[child.id] = position
+            if plan.priority_block_id is None and position < plan.above_fold:
+                priority = _priority_image(child)
+                if priority:
+                    plan.priority_block_id = child.id
+                    plan.priority_image, plan.priority_preset = priority
+            position += 1
+    return plan
+
+
+def plan_page_image_loading(
+    page: models.Model, request: HttpRequest | None
+) -> ImageLoadingPlan:
+    """Build the loading plan for ``page`` and keep it on ``request``."""
+    plan = build_image_loading_plan(page)
+    if request is not None:
+        setattr(request, REQUEST_IMAGE_LOADING_ATTR, plan)
+    return plan
@@ -6,6 +6,7 @@ Family: Used by PageStreamBlock and core page models (HomePage, ServicePage, etc
 Dependencies: Wagtail blocks, wagtailimages, sum_core.blocks.base, design system CSS
 """
 
+from sum_core.blocks.cache import CachedRenderMixin
 from wagtail import blocks
 from wagtail.images.blocks import ImageChooserBlock
 
@@ -35,12 +36,14 @@ class ServiceCardItemBlock(blocks.StructBlock):
         help_text="Defaults to “Learn more” if left blank.",
     )
 
+    image_renditions = {"image": ("card_wide", "card")}
+
     class Meta:
         icon = "doc-full"
         label = "Service Card"
 
 
-class ServiceCardsBlock(blocks.StructBlock):
+class ServiceCardsBlock(CachedRenderMixin, blocks.StructBlock):
     """
     A section containing a grid of ServiceCardItemBlocks.
     """
@@ -128,6 +131,8 @@ class ServiceDetailBlock(blocks.StructBlock):
         help_text="Optional call-to-action link (shown when label provided).",
     )
 
+    image_renditions = {"image": ("feature",)}
+
     class Meta:
         template = "sum_core/blocks/service_detail.html"
         icon = "placeholder"
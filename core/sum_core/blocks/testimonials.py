@@ -6,6 +6,7 @@ Family: Used by HomePage and other page StreamFields accepting social proof bloc
 Dependencies: Wagtail core blocks, base block mixins (from sum_core.blocks.base or similar), design system templates/CSS.
 """
 
+from sum_core.blocks.cache import CachedRenderMixin
 from wagtail import blocks
 from wagtail.images.blocks import ImageChooserBlock
 
@@ -24,12 +25,14 @@ class TestimonialBlock(blocks.StructBlock):
         help_text="Optional rating from 1 to 5 stars.",
     )
 
+    image_renditions = {"photo": ("fill-96x96",)}
+
     class Meta:
         icon = "user"
         label = "Testimonial"
 
 
-class TestimonialsBlock(blocks.StructBlock):
+class TestimonialsBlock(CachedRenderMixin, blocks.StructBlock):
     eyebrow = blocks.CharBlock(
         required=False, help_text="Small text above heading, e.g. 'Client Stories'."
     )
@@ -6,6 +6,7 @@ Family: Used by PageStreamBlock and homepage templates.
 Dependencies: wagtail.blocks, wagtail.images, sum_core.blocks.base.
 """
 
+from sum_core.blocks.cache import CachedRenderMixin
 from wagtail import blocks
 from wagtail.images.blocks import ImageChooserBlock
 
@@ -26,12 +27,14 @@ class TrustStripItemBlock(blocks.StructBlock):
         required=False, help_text="Optional URL to link to (e.g. association website)."
     )
 
+    image_renditions = {"logo": ("fill-240x120",)}
+
     class Meta:
         icon = "image"
         label = "Trust Item"
 
 
-class TrustStripBlock(blocks.StructBlock):
+class TrustStripBlock(CachedRenderMixin, blocks.StructBlock):
     """
     Horizontal row of trust logos/badges.
 
@@ -86,7 +89,7 @@ class StatItemBlock(blocks.StructBlock):
         label = "Stat"
 
 
-class StatsBlock(blocks.StructBlock):
+class StatsBlock(CachedRenderMixin, blocks.StructBlock):
     """
     Block for displaying 2-4 key statistics.
 
@@ -1,72 +1,143 @@
 """
 Name: Form Definition Cache
 Path: core/sum_core/forms/cache.py
-Purpose: Cache helpers and signal-based invalidation for FormDefinition lookups.
+Purpose: Signal-based refresh of cached form runtime specs, and the per-process LRU of
+generated dynamic form classes.
 Family: Forms, Caching.
 Dependencies: django.core.cache, django.db.models.signals
 """
 
 from __future__ import annotations
 
-from django.core.cache import cache
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-FORM_DEFINITION_CACHE_PREFIX = "form_definition"
-FORM_DEFINITION_VERSION_PREFIX = "form_definition_version"
 FORM_DEFINITION_CACHE_TTL_SECONDS = 1800
-FORM_DEFINITION_VERSION_TTL_SECONDS = 3600
-
-
-def get_form_definition_version_key(site_id: int, form_definition_id: int) -> str:
-    return f"{FORM_DEFINITION_VERSION_PREFIX}:{site_id}:{form_definition_id}"
 
-
-def get_form_definition_cache_key(
-    site_id: int, form_definition_id: int, version: str
-) -> str:
-    return f"{FORM_DEFINITION_CACHE_PREFIX}:{site_id}:{form_definition_id}:{version}"
+FORM_SCHEMA_CACHE_PREFIX = "dynamic_form_schema"
+FORM_CLASS_CACHE_SIZE = 256
+FORM_CLASS_CACHE_TTL_SECONDS = 3600
 
 
-def get_form_definition_cache_version(
-    site_id: int, form_definition_id: int
-) -> str | None:
-    version = cache.get(get_form_definition_version_key(site_id, form_definition_id))
-    if version is None:
+def get_form_definition_version(updated_at: datetime | None) -> str | None:
+    """Cache version of a form definition, derived from its ``updated_at``."""
+    if not updated_at:
+        return None
+    try:
+        return f"{updated_at.timestamp():.6f}"
+    except (TypeError, ValueError, AttributeError):
         return None
-    return str(version)
-
-
-def ensure_form_definition_cache_version(site_id: int, form_definition_id: int) -> str:
-    version_key = get_form_definition_version_key(site_id, form_definition_id)
-    if cache.add(version_key, 1, timeout=FORM_DEFINITION_VERSION_TTL_SECONDS):
-        return "1"
-    version = cache.get(version_key)
-    return str(version) if version is not None else "1"
 
 
-def bump_form_definition_cache_version(site_id: int, form_definition_id: int) -> str:
-    version_key = get_form_definition_version_key(site_id, form_definition_id)
-    if cache.add(version_key, 1, timeout=FORM_DEFINITION_VERSION_TTL_SECONDS):
-        return "1"
-    try:
-        return str(cache.incr(version_key))
-    except ValueError:
-        cache.set(version_key, 1, timeout=FORM_DEFINITION_VERSION_TTL_SECONDS)
-        return "1"
+def get_form_schema_cache_key(
+    form_definition_id: int, version: str, schema_version: int
+) -> str:
+    return (
+        f"{FORM_SCHEMA_CACHE_PREFIX}:v{schema_version}:{form_definition_id}:{version}"
+    )
+
+
+class FormClassCache:
+    """
+    Bounded LRU of generated form classes, one entry per form definition.
+
+    Each entry remembers the definition version it was built from; a lookup
+    for another version drops it, so edits never leave stale classes behind.
+    Entries also expire after ``FORM_CLASS_CACHE_TTL_SECONDS``. The size is
+    ``DYNAMIC_FORM_CLASS_CACHE_SIZE`` (least recently used entries are evicted
+    first). ``stats()`` reports hit/miss/eviction counters for monitoring.
+    """
+
+    def __init__(self, ttl: int = FORM_CLASS_CACHE_TTL_SECONDS) -> None:
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[str, float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            (
+                "hits",
+                "misses",
+                "stale",
+                "expired",
+                "evictions",
+                "schema_hits",
+                "schema_misses",
+            ),
+            0,
+        )
+
+    @property
+    def maxsize(self) -> int:
+        return int(
+            getattr(settings, "DYNAMIC_FORM_CLASS_CACHE_SIZE", FORM_CLASS_CACHE_SIZE)
+        )
+
+    def get(self, key: int, version: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            entry_version, cached_at, value = entry
+            if entry_version != version:
+                counter = "stale"
+            elif time.monotonic() - cached_at >= self.ttl:
+                counter = "expired"
+            else:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return value
+            del self._entries[key]
+            self._counters[counter] += 1
+            self._counters["misses"] += 1
+            return None
+
+    def set(self, key: int, version: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(self.maxsize, 1):
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for counter in self._counters:
+                self._counters[counter] = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **self._counters,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
 
 
 @receiver(post_save, dispatch_uid="form_definition_cache_version_save")
 def _on_form_definition_save(sender, instance, **kwargs) -> None:
     from sum_core.forms.models import FormDefinition
+    from sum_core.forms.runtime import refresh_form_runtime_spec
 
     if sender is FormDefinition and instance.pk:
-        bump_form_definition_cache_version(instance.site_id, instance.pk)
+        refresh_form_runtime_spec(instance)
 
 
 @receiver(post_delete, dispatch_uid="form_definition_cache_version_delete")
 def _on_form_definition_delete(sender, instance, **kwargs) -> None:
     from sum_core.forms.models import FormDefinition
+    from sum_core.forms.runtime import delete_form_runtime_spec
 
     if sender is FormDefinition and instance.pk:
-        bump_form_definition_cache_version(instance.site_id, instance.pk)
+        delete_form_runtime_spec(instance.pk)
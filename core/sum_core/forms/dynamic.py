@@ -3,17 +3,32 @@ Name: Dynamic form generation
 Path: core/sum_core/forms/dynamic.py
 Purpose: Generate Django forms from FormDefinition StreamField blocks at runtime.
 Family: Forms, Dynamic Forms foundation.
-Dependencies: Django forms, FormDefinition fields.
+Dependencies: Django forms, Django cache, FormDefinition fields, sum_core.forms.cache.
+
+Generating a form class is two steps. ``compile_form_schema`` walks the
+definition's StreamField into a JSON-serialisable schema (one spec per field,
+with widget attributes, choices and file rules resolved); the schema is kept
+in the shared cache, so other workers skip the StreamField walk. The form
+class is then built from the schema and kept in a bounded per-process LRU
+(``FormClassCache``). Both are keyed by the definition's ``updated_at``, so an
+edit is picked up on the next request.
 """
 
 from __future__ import annotations
 
 import logging
 import os
-import time
 from typing import Any
 
 from django import forms
+from django.core.cache import cache
+from sum_core.forms.cache import (
+    FORM_CLASS_CACHE_TTL_SECONDS,
+    FormClassCache,
+    get_form_definition_version,
+    get_form_schema_cache_key,
+)
+from sum_core.forms.runtime import FormRuntimeSpec
 
 try:
     import magic
@@ -24,9 +39,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-FORM_CLASS_CACHE_TTL_SECONDS = 3600
-# In-process cache: not shared across workers or persisted across restarts.
-_FORM_CLASS_CACHE: dict[str, tuple[float, type[forms.Form]]] = {}
+# Bump when the schema format changes so workers ignore old cached schemas.
+FORM_SCHEMA_VERSION = 1
+# In-process LRU of form classes; the schemas they are built from are shared.
+_FORM_CLASS_CACHE = FormClassCache()
 
 # MIME type mapping for common file extensions
 # Maps file extensions to expected MIME types for validation
@@ -128,10 +144,13 @@ def _validate_mime_type(uploaded_file, allowed_extensions: list[str]) -> str | N
 
     # Read file content for MIME detection
     try:
-        # Read first 2KB for MIME type detection
-        uploaded_file.seek(0)
-        file_header = uploaded_file.read(2048)
-        uploaded_file.seek(0)  # Reset file pointer
+        # StreamingFormUploadHandler keeps the first bytes while receiving
+        # the file; otherwise read the first 2KB for MIME type detection.
+        file_header = getattr(uploaded_file, "sniffed_header", None)
+        if file_header is None:
+            uploaded_file.seek(0)
+            file_header = uploaded_file.read(2048)
+            uploaded_file.seek(0)  # Reset file pointer
 
         if not file_header:
             return "File appears to be empty."
@@ -233,6 +252,8 @@ class DynamicFormGenerator:
     """
     Generates Django Form classes from FormDefinition at runtime.
 
+    Accepts a FormDefinition or its cached ``FormRuntimeSpec``.
+
     Usage:
         generator = DynamicFormGenerator(form_definition)
         FormClass = generator.generate_form_class()
@@ -244,26 +265,60 @@ class DynamicFormGenerator:
 
     def generate_form_class(self):
         """Returns a Django Form class with fields from FormDefinition."""
-        cache_key = self._get_cache_key()
-        if cache_key:
-            cached = _FORM_CLASS_CACHE.get(cache_key)
-            if cached:
-                cached_at, form_class = cached
-                if time.time() - cached_at < FORM_CLASS_CACHE_TTL_SECONDS:
-                    return form_class
-                _FORM_CLASS_CACHE.pop(cache_key, None)
+        version = self._get_cache_version()
+        form_id = getattr(self.form_definition, "pk", None)
+        if version:
+            form_class = _FORM_CLASS_CACHE.get(form_id, version)
+            if form_class is not None:
+                return form_class
+
+        form_class = self.build_form_class(self.get_form_schema())
+
+        if version:
+            _FORM_CLASS_CACHE.set(form_id, version, form_class)
+
+        return form_class
+
+    def get_form_schema(self) -> list[dict[str, Any]]:
+        """Return the compiled schema, from the shared cache when possible."""
+        if isinstance(self.form_definition, FormRuntimeSpec):
+            return list(self.form_definition.schema)
 
+        version = self._get_cache_version()
+        if not version:
+            return self.compile_form_schema()
+
+        cache_key = get_form_schema_cache_key(
+            self.form_definition.pk, version, FORM_SCHEMA_VERSION
+        )
+        schema = cache.get(cache_key)
+        if schema is not None:
+            _FORM_CLASS_CACHE.record("schema_hits")
+            return list(schema)
+
+        _FORM_CLASS_CACHE.record("schema_misses")
+        schema = self.compile_form_schema()
+        cache.set(cache_key, schema, timeout=FORM_CLASS_CACHE_TTL_SECONDS)
+        return schema
+
+    def compile_form_schema(self) -> list[dict[str, Any]]:
+        """Walk the definition's blocks into a JSON-serialisable field schema."""
+        schema = []
+        for block in self.form_definition.fields:
+            spec = self._compile_block(block.block_type, block.value)
+            if spec is not None:
+                schema.append(spec)
+        return schema
+
+    def build_form_class(self, schema: list[dict[str, Any]]):
+        """Build a Django Form class from a compiled schema."""
         fields: dict[str, forms.Field] = {}
         file_rules: dict[str, dict[str, Any]] = {}
 
-        for block in self.form_definition.fields:
-            mapped = self._map_block_to_field(block.block_type, block.value)
-            if mapped is None:
-                continue
-            field_name, field, file_rule = mapped
-            fields[field_name] = field
-            if file_rule:
-                file_rules[field_name] = file_rule
+        for spec in schema:
+            fields[spec["name"]] = self._build_field(spec)
+            if spec.get("file_rule"):
+                file_rules[spec["name"]] = spec["file_rule"]
 
         attrs: dict[str, Any] = {"__module__": __name__}
         attrs.update(fields)
@@ -272,128 +327,52 @@ class DynamicFormGenerator:
         attrs["clean"] = _file_validation_clean
 
         suffix = self.form_definition.pk or "Runtime"
-        form_class = type(f"DynamicForm{suffix}", (forms.Form,), attrs)
-
-        if cache_key:
-            _FORM_CLASS_CACHE[cache_key] = (time.time(), form_class)
+        return type(f"DynamicForm{suffix}", (forms.Form,), attrs)
 
-        return form_class
-
-    def _map_block_to_field(self, block_type, block_value):
-        """Maps a FormFieldBlock to a Django form field."""
-        if block_type in {"section_heading", "help_text"}:
+    def _compile_block(self, block_type, block_value) -> dict[str, Any] | None:
+        """Maps a FormFieldBlock to a field spec (None for layout blocks)."""
+        if block_type not in FIELD_BUILDERS:
             return None
 
-        field_name = block_value.get("field_name")
-        label = block_value.get("label", "")
-        help_text = block_value.get("help_text", "")
-        required = bool(block_value.get("required", True))
         widget_attrs = self._build_widget_attrs(block_type, block_value)
+        spec: dict[str, Any] = {
+            "name": block_value.get("field_name"),
+            "type": block_type,
+            "label": block_value.get("label", ""),
+            "help_text": block_value.get("help_text", ""),
+            "required": bool(block_value.get("required", True)),
+        }
 
-        if block_type == "text_input":
-            field = forms.CharField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                max_length=block_value.get("max_length"),
-                widget=forms.TextInput(
-                    attrs=self._apply_placeholder(block_value, widget_attrs)
-                ),
-            )
-            return field_name, field, None
-
-        if block_type == "email_input":
-            field = forms.EmailField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                max_length=block_value.get("max_length"),
-                widget=forms.EmailInput(
-                    attrs=self._apply_placeholder(block_value, widget_attrs)
-                ),
-            )
-            return field_name, field, None
+        if block_type in {"text_input", "email_input", "textarea"}:
+            spec["max_length"] = block_value.get("max_length")
+
+        if block_type in {"text_input", "email_input", "phone_input", "textarea"}:
+            widget_attrs = self._apply_placeholder(block_value, widget_attrs)
 
         if block_type == "phone_input":
-            attrs = self._apply_placeholder(block_value, widget_attrs)
             format_mask = block_value.get("format_mask")
             if format_mask:
-                attrs["data-format-mask"] = format_mask
-            field = forms.CharField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                widget=forms.TextInput(attrs=attrs),
-            )
-            return field_name, field, None
+                widget_attrs["data-format-mask"] = format_mask
 
         if block_type == "textarea":
-            attrs = self._apply_placeholder(block_value, widget_attrs)
             rows = block_value.get("rows")
             if rows:
-                attrs["rows"] = rows
-            field = forms.CharField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                max_length=block_value.get("max_length"),
-                widget=forms.Textarea(attrs=attrs),
-            )
-            return field_name, field, None
+                widget_attrs["rows"] = rows
 
         if block_type == "select":
-            choices = self._extract_choices(block_value.get("choices"))
-            allow_multiple = bool(block_value.get("allow_multiple", False))
-            if allow_multiple:
-                field = forms.MultipleChoiceField(
-                    label=label,
-                    required=required,
-                    help_text=help_text,
-                    choices=choices,
-                    widget=forms.SelectMultiple(attrs=widget_attrs),
-                )
-            else:
-                field = forms.ChoiceField(
-                    label=label,
-                    required=required,
-                    help_text=help_text,
-                    choices=choices,
-                    widget=forms.Select(attrs=widget_attrs),
-                )
-            return field_name, field, None
+            spec["allow_multiple"] = bool(block_value.get("allow_multiple", False))
+
+        if block_type in {"select", "checkbox_group", "radio_buttons"}:
+            spec["choices"] = [
+                list(choice)
+                for choice in self._extract_choices(block_value.get("choices"))
+            ]
 
         if block_type == "checkbox":
-            attrs = dict(widget_attrs)
+            widget_attrs = dict(widget_attrs)
             checked_value = block_value.get("checked_value")
             if checked_value:
-                attrs["value"] = checked_value
-            field = forms.BooleanField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                widget=forms.CheckboxInput(attrs=attrs),
-            )
-            return field_name, field, None
-
-        if block_type == "checkbox_group":
-            field = forms.MultipleChoiceField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                choices=self._extract_choices(block_value.get("choices")),
-                widget=forms.CheckboxSelectMultiple(attrs=widget_attrs),
-            )
-            return field_name, field, None
-
-        if block_type == "radio_buttons":
-            field = forms.ChoiceField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                choices=self._extract_choices(block_value.get("choices")),
-                widget=forms.RadioSelect(attrs=widget_attrs),
-            )
-            return field_name, field, None
+                widget_attrs["value"] = checked_value
 
         if block_type == "file_upload":
             max_size_mb = block_value.get("max_file_size_mb")
@@ -401,22 +380,34 @@ class DynamicFormGenerator:
                 max_size_bytes = max_size_mb * 1024 * 1024
             else:
                 max_size_bytes = None
-            file_rule = {
+            spec["file_rule"] = {
                 "extensions": self._normalize_extensions(
                     block_value.get("allowed_extensions", "")
                 ),
                 "max_size_bytes": max_size_bytes,
                 "max_size_mb": max_size_mb,
             }
-            field = forms.FileField(
-                label=label,
-                required=required,
-                help_text=help_text,
-                widget=forms.ClearableFileInput(attrs=widget_attrs),
-            )
-            return field_name, field, file_rule
 
-        return None
+        spec["widget_attrs"] = widget_attrs
+        return spec
+
+    def _build_field(self, spec: dict[str, Any]) -> forms.Field:
+        """Build a Django form field from a compiled field spec."""
+        field_class, widget_class, kwargs = FIELD_BUILDERS[spec["type"]]
+        if spec["type"] == "select" and spec.get("allow_multiple"):
+            field_class, widget_class = forms.MultipleChoiceField, forms.SelectMultiple
+        field_kwargs: dict[str, Any] = {
+            "label": spec["label"],
+            "required": spec["required"],
+            "help_text": spec["help_text"],
+            "widget": widget_class(attrs=dict(spec["widget_attrs"])),
+        }
+        for kwarg in kwargs:
+            if kwarg == "choices":
+                field_kwargs["choices"] = [tuple(choice) for choice in spec["choices"]]
+            else:
+                field_kwargs[kwarg] = spec.get(kwarg)
+        return field_class(**field_kwargs)
 
     def _build_widget_attrs(self, block_type, block_value) -> dict[str, str]:
         attrs: dict[str, str] = {}
@@ -498,16 +489,34 @@ class DynamicFormGenerator:
             normalized.append(ext)
         return normalized
 
-    def _get_cache_key(self) -> str | None:
-        form_definition = self.form_definition
-        form_id = getattr(form_definition, "pk", None) or getattr(
-            form_definition, "id", None
-        )
-        updated_at = getattr(form_definition, "updated_at", None)
-        if not form_id or not updated_at:
+    def _get_cache_version(self) -> str | None:
+        if isinstance(self.form_definition, FormRuntimeSpec):
+            return self.form_definition.version or None
+        if not getattr(self.form_definition, "pk", None):
             return None
-        try:
-            updated_stamp = f"{updated_at.timestamp():.6f}"
-        except (TypeError, ValueError):
-            return None
-        return f"dynamic_form_class:{form_id}:{updated_stamp}"
+        return get_form_definition_version(
+            getattr(self.form_definition, "updated_at", None)
+        )
+
+
+# Field class, widget class and extra spec keys passed to the field, by block type.
+FIELD_BUILDERS: dict[str, tuple[type[forms.Field], type[forms.Widget], tuple]] = {
+    "text_input": (forms.CharField, forms.TextInput, ("max_length",)),
+    "email_input": (forms.EmailField, forms.EmailInput, ("max_length",)),
+    "phone_input": (forms.CharField, forms.TextInput, ()),
+    "textarea": (forms.CharField, forms.Textarea, ("max_length",)),
+    "select": (forms.ChoiceField, forms.Select, ("choices",)),
+    "checkbox": (forms.BooleanField, forms.CheckboxInput, ()),
+    "checkbox_group": (
+        forms.MultipleChoiceField,
+        forms.CheckboxSelectMultiple,
+        ("choices",),
+    ),
+    "radio_buttons": (forms.ChoiceField, forms.RadioSelect, ("choices",)),
+    "file_upload": (forms.FileField, forms.ClearableFileInput, ()),
+}
+
+
+def get_form_class_cache_stats() -> dict[str, int]:
+    """Hit/miss/eviction counters of this process's form class cache."""
+    return _FORM_CLASS_CACHE.stats()
@@ -0,0 +1,217 @@
+"""
+Name: Form submission guard middleware
+Path: core/sum_core/forms/middleware.py
+Purpose: Reject oversized, blocked and obviously fake form submissions before sessions,
+CSRF, the ORM or the view run.
+Family: Forms, Spam Protection.
+Dependencies: Django, sum_core.forms.ratelimit, sum_core.forms.services,
+sum_core.forms.uploads, orjson (optional).
+
+Install it directly after ``CorrelationIdMiddleware``. For POSTs to the form
+submission URL it, in order:
+
+1. answers 429 (with ``Retry-After``) if the client, host or all submissions
+   are blocked after a recent rate-limit rejection - one cache read;
+2. answers 413 if ``Content-Length`` exceeds ``FORM_SUBMISSION_MAX_BODY_SIZE``
+   (``FORM_SUBMISSION_MAX_UPLOAD_SIZE`` for multipart uploads);
+3. parses the body (JSON with orjson when installed, URL-encoded with
+   ``parse_qsl``; multipart through ``request.POST``, which CSRF would parse
+   anyway, streaming files with ``StreamingFormUploadHandler``) and answers 400
+   if a file is too large, the dynamic-form honeypot is filled or the time
+   token is forged, malformed, expired or already used.
+
+Everything else - per-site honeypot names, minimum submit time, the rate-limit
+tiers themselves - stays in the view, which needs the site's configuration.
+The parsed body is kept on the request so the view does not parse it again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from typing import Any, cast
+from urllib.parse import parse_qsl
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig, TooManyFieldsSent
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.http.multipartparser import MultiPartParserError
+from django.urls import NoReverseMatch, reverse
+from sum_core.forms.ratelimit import get_rate_limit_block
+from sum_core.forms.services import SpamCheckResult, check_honeypot, check_timing
+from sum_core.forms.uploads import UPLOAD_ERRORS_ATTR, StreamingFormUploadHandler
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+PARSED_DATA_ATTR = "_sum_form_submission_data"
+FORM_SUBMIT_URL_NAME = "sum_core_forms:form_submit"
+# Dynamic form templates always render this honeypot field.
+DYNAMIC_FORM_HONEYPOT_FIELD = "website"
+
+DEFAULT_MAX_BODY_SIZE = 64 * 1024
+DEFAULT_MAX_UPLOAD_SIZE = 25 * 1024 * 1024
+
+
+def _loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def parse_submission_body(request: HttpRequest) -> dict[str, Any] | None:
+    """
+    Parse a JSON, URL-encoded or multipart submission body into a flat dict.
+
+    Returns None for bodies that cannot be parsed; the view decides what to do
+    with those.
+    """
+    content_type = request.content_type or ""
+    if "application/json" in content_type:
+        try:
+            data = _loads(request.body)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+    if content_type == "application/x-www-form-urlencoded":
+        try:
+            fields = parse_qsl(
+                request.body.decode(request.encoding or "utf-8", errors="replace"),
+                keep_blank_values=True,
+                max_num_fields=settings.DATA_UPLOAD_MAX_NUMBER_FIELDS,
+            )
+        except ValueError:
+            return None
+        # Last value wins, like QueryDict.dict().
+        return dict(fields)
+    if content_type.startswith("multipart/"):
+        # CsrfViewMiddleware parses multipart bodies anyway; parsing them here
+        # first costs nothing extra and Django reuses the result.
+        try:
+            return cast(dict[str, Any], request.POST.dict())
+        except (MultiPartParserError, RequestDataTooBig, TooManyFieldsSent):
+            return None
+    return None
+
+
+class FormSubmissionGuardMiddleware:
+    """Cheap early rejection for the form submission endpoint."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self._submit_path: str | None = None
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            # Keep ASGI requests on the event loop (see AsyncFormSubmissionView).
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.async_mode:
+            return self.__acall__(request)
+        if self.is_submission(request):
+            response = self.check(request)
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_submission(request):
+            # Cache reads and body parsing only - no database connection - so
+            # run in the thread pool rather than the single thread-sensitive
+            # worker the view's ORM calls share.
+            response = await sync_to_async(self.check, thread_sensitive=False)(request)
+            if response is not None:
+                return response
+        return await self.get_response(request)
+
+    def is_submission(self, request: HttpRequest) -> bool:
+        return request.method == "POST" and request.path_info == self.submit_path
+
+    @property
+    def submit_path(self) -> str:
+        if self._submit_path is None:
+            try:
+                self._submit_path = reverse(FORM_SUBMIT_URL_NAME)
+            except NoReverseMatch:
+                self._submit_path = ""
+        return self._submit_path
+
+    def check(self, request: HttpRequest) -> HttpResponse | None:
+        """Return an early rejection for ``request``, or None to let it through."""
+        retry_after = get_rate_limit_block(request)
+        if retry_after:
+            return self._reject(
+                request,
+                SpamCheckResult(
+                    is_spam=False,
+                    reason="Rate limit block",
+                    should_rate_limit=True,
+                    retry_after=retry_after,
+                ),
+            )
+
+        is_multipart = (request.content_type or "").startswith("multipart/")
+        if is_multipart:
+            max_size = getattr(
+                settings, "FORM_SUBMISSION_MAX_UPLOAD_SIZE", DEFAULT_MAX_UPLOAD_SIZE
+            )
+        else:
+            max_size = getattr(
+                settings, "FORM_SUBMISSION_MAX_BODY_SIZE", DEFAULT_MAX_BODY_SIZE
+            )
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > max_size:
+            logger.info(
+                "Form submission rejected early",
+                extra={"reason": "body_too_large", "content_length": content_length},
+            )
+            return JsonResponse(
+                {"success": False, "errors": {"__all__": ["Request too large"]}},
+                status=413,
+            )
+        if is_multipart:
+            request.upload_handlers = [StreamingFormUploadHandler(request)]
+        data = parse_submission_body(request)
+        upload_errors = getattr(request, UPLOAD_ERRORS_ATTR, None)
+        if upload_errors:
+            logger.info(
+                "Form submission rejected early", extra={"reason": "file_too_large"}
+            )
+            return JsonResponse({"success": False, "errors": upload_errors}, status=400)
+        if data is None:
+            return None
+        setattr(request, PARSED_DATA_ATTR, data)
+
+        if data.get("form_definition_id"):
+            result = check_honeypot(data, DYNAMIC_FORM_HONEYPOT_FIELD)
+            if result.is_spam:
+                return self._reject(request, result)
+
+        time_token = str(data.get("_time_token") or "")
+        if time_token:
+            # Minimum submit time is per-site configuration; the view checks it.
+            result = check_timing(time_token, min_seconds=0)
+            if result.is_spam:
+                return self._reject(request, result)
+        return None
+
+    def _reject(
+        self, request: HttpRequest, result: SpamCheckResult
+    ) -> HttpResponse | None:
+        # The view module imports this one; import it at call time.
+        from sum_core.forms.views import spam_response
+
+        logger.info("Form submission rejected early", extra={"reason": result.reason})
+        return spam_response(result, request)
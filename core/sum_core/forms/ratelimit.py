@@ -0,0 +1,320 @@
+"""
+Name: Form submission rate limiter
+Path: core/sum_core/forms/ratelimit.py
+Purpose: Tiered submission rate limits (per IP, IP+form, site, global) with Retry-After.
+Family: Forms, Spam Protection.
+Dependencies: Django cache (Redis via a Lua token bucket when configured), Django settings.
+
+Each submission is checked against a list of tiers, cheapest-to-exhaust
+first; the first tier that rejects it stops the check and its ``retry_after``
+becomes the response's ``Retry-After`` header. Rejected attempts do not use
+up any budget - the tiers already passed are refunded - so a client that
+honours ``Retry-After`` gets through and a flood cannot keep a window open
+forever.
+
+The per-IP tier comes from ``FormConfiguration.rate_limit_per_ip_per_hour``;
+the other tiers are configured with ``FORM_RATE_LIMITS`` (a limit of 0
+disables a tier)::
+
+    FORM_RATE_LIMITS = {
+        "ip_form": {"limit": 5, "window": 3600},
+        "site": {"limit": 120, "window": 60},
+        "global": {"limit": 600, "window": 60},
+    }
+
+When the view rejects a submission, the client (per-IP tier), host (site
+tier) or everyone (global tier) is also marked blocked for ``retry_after``
+seconds, so ``FormSubmissionGuardMiddleware`` can turn the rest of a flood
+away with one cache read.
+
+Limiters are pluggable with ``FORM_RATE_LIMIT_BACKEND`` (dotted path to a
+``RateLimiter`` subclass). By default a Django ``RedisCache`` gets the atomic
+Lua token bucket and any other cache (locmem in development and tests) the
+sliding-window counter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+from sum_core.ops.request_utils import get_client_ip
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "form_rate_limit"
+
+DEFAULT_RATE_LIMITS: dict[str, dict[str, int]] = {
+    "ip_form": {"limit": 0, "window": 3600},
+    "site": {"limit": 120, "window": 60},
+    "global": {"limit": 600, "window": 60},
+}
+
+
+@dataclass(frozen=True)
+class RateLimitTier:
+    name: str
+    key: str
+    limit: int
+    window: int  # seconds
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    remaining: int = 0
+    retry_after: int = 0  # seconds
+    tier: str = ""
+
+
+class RateLimiter:
+    """Consume one unit of a key's budget of ``limit`` per ``window`` seconds."""
+
+    def __init__(self, cache_alias: str = "default") -> None:
+        self.cache = caches[cache_alias]
+
+    def hit(self, key: str, limit: int, window: int) -> RateLimitDecision:
+        raise NotImplementedError
+
+    def refund(self, key: str, limit: int, window: int) -> None:
+        """Give back one unit taken by an allowed ``hit`` (no-op by default)."""
+
+
+class SlidingWindowRateLimiter(RateLimiter):
+    """
+    Sliding-window counter on any Django cache.
+
+    Keeps one counter per fixed window and weights the previous window by how
+    much of it still overlaps the sliding window. Counters expire two windows
+    after creation and are never touched, so a window always ends.
+    """
+
+    clock = staticmethod(time.time)
+
+    def hit(self, key: str, limit: int, window: int) -> RateLimitDecision:
+        now = self.clock()
+        bucket = int(now // window)
+        elapsed = now - bucket * window
+        current_key = f"{key}:{window}:{bucket}"
+        previous = int(self.cache.get(f"{key}:{window}:{bucket - 1}") or 0)
+        overlap = previous * (1 - elapsed / window)
+
+        current = self._incr(current_key, window)
+        if overlap + current <= limit:
+            return RateLimitDecision(
+                allowed=True, remaining=int(limit - overlap - current)
+            )
+
+        self._decr(current_key)
+        return RateLimitDecision(
+            allowed=False,
+            retry_after=self._retry_after(
+                previous, current - 1, limit, window, elapsed
+            ),
+        )
+
+    def refund(self, key: str, limit: int, window: int) -> None:
+        bucket = int(self.clock() // window)
+        current_key = f"{key}:{window}:{bucket}"
+        if int(self.cache.get(current_key) or 0) > 0:
+            self._decr(current_key)
+
+    def _incr(self, key: str, window: int) -> int:
+        self.cache.add(key, 0, timeout=window * 2)
+        try:
+            return int(self.cache.incr(key))
+        except ValueError:
+            # Expired between add() and incr().
+            self.cache.set(key, 1, timeout=window * 2)
+            return 1
+
+    def _decr(self, key: str) -> None:
+        try:
+            self.cache.decr(key)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def _retry_after(
+        previous: int, current: int, limit: int, window: int, elapsed: float
+    ) -> int:
+        """Seconds until one more hit fits under ``limit``."""
+        if current + 1 <= limit and previous:
+            # The previous window's share decays enough later in this window.
+            wait = window * (1 - (limit - current - 1) / previous) - elapsed
+        else:
+            # Wait for the next window, then for this window's share to decay.
+            wait = (window - elapsed) + window * (1 - (limit - 1) / max(current, 1))
+        return max(1, math.ceil(wait))
+
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+TOKEN_BUCKET_REFUND_SCRIPT = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+    redis.call('HSET', KEYS[1], 'tokens', tostring(math.min(tonumber(ARGV[1]), tokens + 1)))
+end
+return 0
+"""
+
+
+class RedisTokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket evaluated atomically in Redis with a Lua script.
+
+    Requires Django's ``RedisCache``. The bucket holds ``limit`` tokens and
+    refills at ``limit / window`` tokens per second, so bursts up to the limit
+    are allowed and the sustained rate is the configured one.
+    """
+
+    def __init__(self, cache_alias: str = "default") -> None:
+        super().__init__(cache_alias)
+        client = self.cache._cache.get_client(write=True)
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+        self._refund_script = client.register_script(TOKEN_BUCKET_REFUND_SCRIPT)
+
+    def hit(self, key: str, limit: int, window: int) -> RateLimitDecision:
+        allowed, tokens, retry_after = self._script(
+            keys=[self.cache.make_and_validate_key(key)],
+            args=[limit, limit / window, time.time()],
+        )
+        if int(allowed):
+            return RateLimitDecision(allowed=True, remaining=int(float(tokens)))
+        return RateLimitDecision(
+            allowed=False, retry_after=max(1, math.ceil(float(retry_after)))
+        )
+
+    def refund(self, key: str, limit: int, window: int) -> None:
+        self._refund_script(keys=[self.cache.make_and_validate_key(key)], args=[limit])
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the configured limiter (see ``FORM_RATE_LIMIT_BACKEND``)."""
+    backend_path = getattr(settings, "FORM_RATE_LIMIT_BACKEND", "")
+    if backend_path:
+        return import_string(backend_path)()
+    if isinstance(caches["default"], RedisCache):
+        return RedisTokenBucketRateLimiter()
+    return SlidingWindowRateLimiter()
+
+
+def _get_tier_config(name: str) -> dict[str, Any]:
+    overrides = getattr(settings, "FORM_RATE_LIMITS", {}).get(name, {})
+    return {**DEFAULT_RATE_LIMITS[name], **overrides}
+
+
+def get_ip_rate_limit_key(ip_address: str, site_id: int) -> str:
+    return f"{KEY_PREFIX}:{site_id}:{ip_address}"
+
+
+def get_rate_limit_tiers(
+    ip_address: str,
+    site_id: int,
+    max_per_hour: int,
+    form_key: str = "",
+) -> list[RateLimitTier]:
+    """Build the enabled tiers for one submission, narrowest first."""
+    ip_key = get_ip_rate_limit_key(ip_address, site_id)
+    tiers = [RateLimitTier("ip", ip_key, max_per_hour, 3600)]
+    if form_key:
+        digest = hashlib.sha256(form_key.encode()).hexdigest()[:16]
+        config = _get_tier_config("ip_form")
+        tiers.append(
+            RateLimitTier(
+                "ip_form", f"{ip_key}:{digest}", config["limit"], config["window"]
+            )
+        )
+    for name, key in (
+        ("site", f"{KEY_PREFIX}:site:{site_id}"),
+        ("global", f"{KEY_PREFIX}:global"),
+    ):
+        config = _get_tier_config(name)
+        tiers.append(RateLimitTier(name, key, config["limit"], config["window"]))
+    return [tier for tier in tiers if tier.limit > 0 and tier.window > 0]
+
+
+def check_rate_limit_tiers(
+    tiers: list[RateLimitTier], limiter: RateLimiter | None = None
+) -> RateLimitDecision:
+    """
+    Hit each tier in order; return the first rejection, else an allow.
+
+    On a rejection the tiers already passed are refunded, so a submission
+    turned away by the site or global tier costs the client nothing.
+    """
+    limiter = limiter or get_rate_limiter()
+    for index, tier in enumerate(tiers):
+        decision = limiter.hit(tier.key, tier.limit, tier.window)
+        if not decision.allowed:
+            for passed in tiers[:index]:
+                try:
+                    limiter.refund(passed.key, passed.limit, passed.window)
+                except Exception:
+                    logger.warning(
+                        "Failed to refund rate limit tier %s",
+                        passed.name,
+                        exc_info=True,
+                    )
+            return RateLimitDecision(
+                allowed=False, retry_after=decision.retry_after, tier=tier.name
+            )
+    return RateLimitDecision(allowed=True)
+
+
+# =============================================================================
+# Block markers (read by FormSubmissionGuardMiddleware)
+# =============================================================================
+
+
+def _get_block_keys(request: HttpRequest) -> dict[str, str]:
+    # The raw Host header: get_host() would raise for disallowed hosts.
+    host = request.META.get("HTTP_HOST", "").lower()
+    return {
+        "ip": f"{KEY_PREFIX}:blocked:{host}:{get_client_ip(request)}",
+        "site": f"{KEY_PREFIX}:blocked:{host}",
+        "global": f"{KEY_PREFIX}:blocked",
+    }
+
+
+def record_rate_limit_block(request: HttpRequest, tier: str, retry_after: int) -> None:
+    """Mark the rejected tier's scope blocked until ``retry_after`` passes."""
+    key = _get_block_keys(request).get(tier)
+    if key is None or retry_after <= 0:
+        return
+    caches["default"].set(key, time.time() + retry_after, timeout=retry_after)
+
+
+def get_rate_limit_block(request: HttpRequest) -> int:
+    """Seconds until ``request``'s client may submit again (0 if not blocked)."""
+    blocked = caches["default"].get_many(list(_get_block_keys(request).values()))
+    until = max(blocked.values(), default=0)
+    return max(0, math.ceil(until - time.time()))
@@ -0,0 +1,149 @@
+"""
+Name: Form runtime spec
+Path: core/sum_core/forms/runtime.py
+Purpose: Compact, cacheable snapshot of a FormDefinition for the submission path.
+Family: Forms, Caching.
+Dependencies: django.core.cache, FormDefinition, sum_core.forms.dynamic.
+
+Handling a submission needs a handful of a FormDefinition's settings and its
+compiled field schema, not the model instance or its raw StreamField. The
+runtime spec holds exactly that, stored as a plain tuple under one cache key
+per definition, with the definition version (``updated_at``) inside it, so a
+submission reads it with a single ``cache.get`` (``cache.aget`` from the
+async view). It is rebuilt whenever the definition is saved (see
+``sum_core.forms.cache``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import astuple, dataclass
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from sum_core.forms.cache import (
+    FORM_DEFINITION_CACHE_TTL_SECONDS,
+    get_form_definition_version,
+)
+
+FORM_RUNTIME_SPEC_PREFIX = "form_runtime_spec"
+# Bump when FormRuntimeSpec's fields change so old cached tuples are ignored.
+FORM_RUNTIME_SPEC_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FormRuntimeSpec:
+    id: int
+    site_id: int
+    version: str
+    name: str
+    slug: str
+    is_active: bool
+    success_message: str
+    email_notification_enabled: bool
+    has_notification_emails: bool
+    auto_reply_enabled: bool
+    webhook_enabled: bool
+    has_webhook_url: bool
+    schema: tuple[dict[str, Any], ...]
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+
+def get_form_runtime_spec_key(form_definition_id: int) -> str:
+    return (
+        f"{FORM_RUNTIME_SPEC_PREFIX}:v{FORM_RUNTIME_SPEC_VERSION}:{form_definition_id}"
+    )
+
+
+def build_form_runtime_spec(form_definition) -> FormRuntimeSpec:
+    """Snapshot ``form_definition``, compiling its field schema."""
+    from sum_core.forms.dynamic import DynamicFormGenerator
+
+    return FormRuntimeSpec(
+        id=form_definition.pk,
+        site_id=form_definition.site_id,
+        version=get_form_definition_version(form_definition.updated_at) or "",
+        name=form_definition.name,
+        slug=form_definition.slug,
+        is_active=form_definition.is_active,
+        success_message=form_definition.success_message,
+        email_notification_enabled=form_definition.email_notification_enabled,
+        has_notification_emails=bool(form_definition.notification_emails.strip()),
+        auto_reply_enabled=form_definition.auto_reply_enabled,
+        webhook_enabled=form_definition.webhook_enabled,
+        has_webhook_url=bool(form_definition.webhook_url),
+        schema=tuple(DynamicFormGenerator(form_definition).compile_form_schema()),
+    )
+
+
+def cache_form_runtime_spec(
+    form_definition, *, replace: bool = True
+) -> FormRuntimeSpec:
+    """Build and cache ``form_definition``'s spec (``replace=False``: only if absent)."""
+    spec = build_form_runtime_spec(form_definition)
+    store = cache.set if replace else cache.add
+    store(
+        get_form_runtime_spec_key(spec.id),
+        astuple(spec),
+        timeout=FORM_DEFINITION_CACHE_TTL_SECONDS,
+    )
+    return spec
+
+
+def refresh_form_runtime_spec(form_definition) -> None:
+    """
+    Drop the cached spec now and rebuild it once the save commits.
+
+    Until then submissions fall back to the database, so they never see a spec
+    from a transaction that rolls back.
+    """
+    cache.delete(get_form_runtime_spec_key(form_definition.pk))
+    transaction.on_commit(lambda: cache_form_runtime_spec(form_definition))
+
+
+def delete_form_runtime_spec(form_definition_id: int) -> None:
+    cache.delete(get_form_runtime_spec_key(form_definition_id))
+
+
+def get_form_runtime_spec(
+    site_id: int, form_definition_id: int
+) -> FormRuntimeSpec | None:
+    """Return the site's form definition as a runtime spec; one cache read when warm."""
+    cached = cache.get(get_form_runtime_spec_key(form_definition_id))
+    if cached is not None:
+        spec = FormRuntimeSpec(*cached)
+    else:
+        from sum_core.forms.models import FormDefinition
+
+        form_definition = FormDefinition.objects.filter(pk=form_definition_id).first()
+        if form_definition is None:
+            return None
+        # add(), not set(): never overwrite a spec a concurrent save just cached.
+        spec = cache_form_runtime_spec(form_definition, replace=False)
+    return spec if spec.site_id == site_id else None
+
+
+async def aget_form_runtime_spec(
+    site_id: int, form_definition_id: int
+) -> FormRuntimeSpec | None:
+    """Async ``get_form_runtime_spec`` for ``AsyncFormSubmissionView``."""
+    cached = await cache.aget(get_form_runtime_spec_key(form_definition_id))
+    if cached is not None:
+        spec = FormRuntimeSpec(*cached)
+    else:
+        from sum_core.forms.models import FormDefinition
+
+        form_definition = await FormDefinition.objects.filter(
+            pk=form_definition_id
+        ).afirst()
+        if form_definition is None:
+            return None
+        # Compiling the schema walks the StreamField, which may query.
+        spec = await sync_to_async(cache_form_runtime_spec)(
+            form_definition, replace=False
+        )
+    return spec if spec.site_id == site_id else None
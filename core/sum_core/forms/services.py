@@ -3,7 +3,7 @@ Name: Form spam protection and configuration services
 Path: core/sum_core/forms/services.py
 Purpose: Spam protection checks (honeypot, rate limiting, timing) and configuration retrieval.
 Family: Forms, Leads, Spam Protection.
-Dependencies: Django cache, FormConfiguration model, Wagtail Site.
+Dependencies: sum_core.forms.ratelimit, sum_core.forms.token_store, FormConfiguration model, Wagtail Site.
 """
 
 from __future__ import annotations
@@ -11,20 +11,26 @@ from __future__ import annotations
 import hashlib
 import hmac
 import logging
+import secrets
 import time
 from dataclasses import dataclass
 from typing import cast
 
 from django.conf import settings
-from django.core.cache import cache
 from django.http import HttpRequest
 from sum_core.forms.models import FormConfiguration
+from sum_core.forms.ratelimit import (
+    check_rate_limit_tiers,
+    get_ip_rate_limit_key,
+    get_rate_limit_tiers,
+)
+from sum_core.forms.token_store import get_seen_token_store
 from sum_core.ops.request_utils import get_client_ip as request_get_client_ip
 from wagtail.models import Site
 
 # Time token settings
 TIME_TOKEN_LIFETIME_SECONDS = 3600  # 1 hour max validity
-RATE_LIMIT_WINDOW_SECONDS = 3600
+TIME_TOKEN_NONCE_BYTES = 12  # 16 URL-safe characters, no ":"
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +41,8 @@ class SpamCheckResult:
     is_spam: bool
     reason: str = ""
     should_rate_limit: bool = False  # True if rate limit exceeded
+    retry_after: int = 0  # Seconds until a rate-limited client may retry
+    rate_limit_tier: str = ""  # The tier that rejected the submission
 
 
 def get_form_config(site: Site) -> FormConfiguration:
@@ -54,11 +62,11 @@ def get_form_config(site: Site) -> FormConfiguration:
 
 def get_rate_limit_cache_key(ip_address: str, site_id: int) -> str:
     """
-    Generate a cache key for rate limiting.
+    Generate the key of the per-IP rate limit tier.
 
     Keys are site-scoped to allow different limits per site.
     """
-    return f"form_rate_limit:{site_id}:{ip_address}"
+    return get_ip_rate_limit_key(ip_address, site_id)
 
 
 def check_honeypot(
@@ -85,96 +93,87 @@ def check_rate_limit(
     ip_address: str,
     site_id: int,
     max_per_hour: int,
+    form_key: str = "",
 ) -> SpamCheckResult:
     """
-    Check if IP address has exceeded rate limit for this site.
+    Check the submission against every rate limit tier.
 
-    Uses Django cache to track submission counts. The counter automatically
-    expires after 1 hour and increments atomically to prevent race conditions.
+    Tiers are per IP (``max_per_hour``), per IP and form (when ``form_key`` is
+    given), per site and global; see ``sum_core.forms.ratelimit``. The
+    submission is counted against each tier it passes. If the limiter's cache
+    is unavailable the check is skipped rather than blocking leads.
 
     Args:
         ip_address: Client IP address
         site_id: Wagtail Site ID for site-scoped limits
-        max_per_hour: Maximum allowed submissions per hour
+        max_per_hour: Maximum allowed submissions per IP per hour (0 disables)
+        form_key: Identifies the form being submitted (optional)
 
     Returns:
-        SpamCheckResult with should_rate_limit=True if limit exceeded
+        SpamCheckResult with should_rate_limit=True and retry_after if a tier
+        rejected the submission
     """
-    if max_per_hour <= 0:
-        return SpamCheckResult(is_spam=False)
-
-    cache_key = get_rate_limit_cache_key(ip_address, site_id)
-    new_count = _increment_rate_limit_counter(cache_key)
-    if new_count is None:
+    tiers = get_rate_limit_tiers(ip_address, site_id, max_per_hour, form_key)
+    try:
+        decision = check_rate_limit_tiers(tiers)
+    except Exception:
+        logger.warning("Rate limit check failed", exc_info=True)
         return SpamCheckResult(is_spam=False)
 
-    if new_count > max_per_hour:
+    if not decision.allowed:
+        logger.info(
+            "Form submission rate limited",
+            extra={"rate_limit_tier": decision.tier, "site_id": site_id},
+        )
         return SpamCheckResult(
             is_spam=False,
             reason="Rate limit exceeded",
             should_rate_limit=True,
+            retry_after=decision.retry_after,
+            rate_limit_tier=decision.tier,
         )
 
     return SpamCheckResult(is_spam=False)
 
 
-def increment_rate_limit_counter(ip_address: str, site_id: int) -> None:
-    """
-    Increment the rate limit counter for an IP/site combination.
-
-    Call this when you need to increment without running spam checks.
-    """
-    cache_key = get_rate_limit_cache_key(ip_address, site_id)
-    _increment_rate_limit_counter(cache_key)
-
-
-def _increment_rate_limit_counter(cache_key: str) -> int | None:
-    """Increment the rate limit counter, returning the updated value."""
-    try:
-        if cache.add(cache_key, 1, timeout=RATE_LIMIT_WINDOW_SECONDS):
-            return 1
-
-        try:
-            new_count = cast(int, cache.incr(cache_key))
-        except (ValueError, NotImplementedError):
-            current_count = cast(int, cache.get(cache_key, 0))
-            new_count = current_count + 1
-            cache.set(cache_key, new_count, timeout=RATE_LIMIT_WINDOW_SECONDS)
-            return new_count
-
-        try:
-            cache.touch(cache_key, timeout=RATE_LIMIT_WINDOW_SECONDS)
-        except NotImplementedError:
-            pass
-
-        return new_count
-    except Exception:
-        logger.warning("Rate limit counter update failed", exc_info=True)
-        return None
-
-
 def generate_time_token() -> str:
     """
-    Generate a signed time token for form timing validation.
+    Generate a signed, single-use time token for form timing validation.
 
-    The token contains the current timestamp, signed with the secret key.
-    Format: timestamp:signature
+    The token contains the current timestamp and a random nonce, signed with
+    the secret key. Format: timestamp:nonce:signature
 
     Returns:
         Signed time token string
     """
     timestamp = str(int(time.time()))
-    signature = _sign_timestamp(timestamp)
-    return f"{timestamp}:{signature}"
+    nonce = secrets.token_urlsafe(TIME_TOKEN_NONCE_BYTES)
+    signature = _sign_timestamp(f"{timestamp}:{nonce}")
+    return f"{timestamp}:{nonce}:{signature}"
 
 
 def _sign_timestamp(timestamp: str) -> str:
-    """Create HMAC signature for a timestamp."""
+    """Create HMAC signature for a timestamp (and nonce)."""
     key = settings.SECRET_KEY.encode()
     message = timestamp.encode()
     return hmac.new(key, message, hashlib.sha256).hexdigest()
 
 
+def _split_time_token(time_token: str) -> tuple[str, str, str] | None:
+    """
+    Split a token into (timestamp, nonce, signature), or None if malformed.
+
+    Tokens issued before nonces were added (timestamp:signature) get an empty
+    nonce; they stay valid, without replay protection, until they expire.
+    """
+    parts = time_token.split(":")
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2]
+    if len(parts) == 2:
+        return parts[0], "", parts[1]
+    return None
+
+
 def _log_time_token_issue(
     message: str,
     *,
@@ -217,8 +216,8 @@ def check_timing(
         )
         return SpamCheckResult(is_spam=False)
 
-    parts = time_token.split(":", 1)
-    if len(parts) != 2:
+    parts = _split_time_token(time_token)
+    if parts is None:
         # Malformed token - suspicious but not definitive
         _log_time_token_issue(
             "Time token malformed; rejecting submission",
@@ -228,10 +227,11 @@ def check_timing(
         )
         return SpamCheckResult(is_spam=True, reason="Invalid time token format")
 
-    timestamp_str, signature = parts
+    timestamp_str, nonce, signature = parts
 
     # Verify signature
-    expected_signature = _sign_timestamp(timestamp_str)
+    payload = f"{timestamp_str}:{nonce}" if nonce else timestamp_str
+    expected_signature = _sign_timestamp(payload)
     if not hmac.compare_digest(signature, expected_signature):
         _log_time_token_issue(
             "Time token signature mismatch; rejecting submission",
@@ -267,9 +267,57 @@ def check_timing(
             reason=f"Submitted too quickly ({elapsed}s < {min_seconds}s minimum)",
         )
 
+    # Already spent by an accepted submission
+    if nonce and _is_time_token_spent(nonce, token_time):
+        _log_time_token_issue(
+            "Time token already used; rejecting submission",
+            status="replayed",
+            reason="replay",
+            min_seconds=min_seconds,
+        )
+        return SpamCheckResult(is_spam=True, reason="Time token already used")
+
     return SpamCheckResult(is_spam=False)
 
 
+def _is_time_token_spent(nonce: str, issued_at: int) -> bool:
+    try:
+        return get_seen_token_store(TIME_TOKEN_LIFETIME_SECONDS).contains(
+            nonce, issued_at
+        )
+    except Exception:
+        # Fail open: never reject leads because the cache is unavailable.
+        logger.exception("Seen time-token lookup failed; replay check skipped")
+        return False
+
+
+def claim_time_token(time_token: str) -> bool:
+    """
+    Spend a time token that passed ``check_timing``.
+
+    Call this once the submission is accepted, so a visitor who fixes a
+    validation error can resubmit with the same token. Returns False if a
+    concurrent submission spent the token first.
+
+    Args:
+        time_token: Signed token from generate_time_token()
+
+    Returns:
+        True if the token was claimed (or carries no nonce), False on replay
+    """
+    parts = _split_time_token(time_token) if time_token else None
+    if parts is None or not parts[1]:
+        return True
+    timestamp_str, nonce, _signature = parts
+    try:
+        return get_seen_token_store(TIME_TOKEN_LIFETIME_SECONDS).add(
+            nonce, int(timestamp_str)
+        )
+    except Exception:
+        logger.exception("Seen time-token claim failed; replay check skipped")
+        return True
+
+
 def run_spam_checks(
     *,
     form_data: dict,
@@ -279,14 +327,15 @@ def run_spam_checks(
     honeypot_field_name: str,
     rate_limit_per_hour: int,
     min_seconds_to_submit: int,
+    form_key: str = "",
 ) -> SpamCheckResult:
     """
     Run all spam protection checks.
 
     Checks are run in order of computational cost (cheapest first):
     1. Honeypot check (instant)
-    2. Rate limit check (atomic cache increment)
-    3. Timing check (crypto verification)
+    2. Rate limit check (one atomic limiter hit per tier)
+    3. Timing check (crypto verification, one seen-token lookup)
 
     Args:
         form_data: Submitted form data
@@ -296,6 +345,7 @@ def run_spam_checks(
         honeypot_field_name: Name of honeypot field
         rate_limit_per_hour: Max submissions per IP per hour
         min_seconds_to_submit: Min seconds between render and submit
+        form_key: Identifies the submitted form for the per-IP+form tier
 
     Returns:
         SpamCheckResult with first failure reason, or success
@@ -306,7 +356,7 @@ def run_spam_checks(
         return result
 
     # 2. Rate limit check
-    result = check_rate_limit(ip_address, site_id, rate_limit_per_hour)
+    result = check_rate_limit(ip_address, site_id, rate_limit_per_hour, form_key)
     if result.should_rate_limit:
         return result
 
@@ -922,3 +922,50 @@ def send_webhook(
         "Form webhook sent successfully",
         extra={"lead_id": lead_id, "request_id": request_id or "-"},
     )
+
+
+@shared_task(ignore_result=True)
+def process_form_uploads(
+    lead_id: int,
+    form_definition_id: int,
+    request_id: str | None = None,
+) -> None:
+    """
+    Run ``FORM_UPLOAD_HOOKS`` (virus scans, thumbnails, ...) on a lead's files.
+
+    Each hook is called once per stored file; a failing hook is logged and the
+    remaining hooks and files still run.
+    """
+    from sum_core.forms.uploads import get_stored_uploads, get_upload_hooks
+    from sum_core.leads.models import Lead
+
+    set_sentry_context(
+        request_id=request_id,
+        lead_id=lead_id,
+        task="process_form_uploads",
+    )
+
+    lead = Lead.objects.filter(id=lead_id).first()
+    if lead is None:
+        logger.warning(
+            "Skipping upload hooks: lead missing",
+            extra={"lead_id": lead_id, "request_id": request_id or "-"},
+        )
+        return
+
+    hooks = get_upload_hooks()
+    for field_name, file_info in get_stored_uploads(lead.form_data).items():
+        for hook in hooks:
+            try:
+                hook(lead, field_name, file_info)
+            except Exception:
+                logger.exception(
+                    "Form upload hook failed",
+                    extra={
+                        "lead_id": lead_id,
+                        "form_definition_id": form_definition_id,
+                        "field_name": field_name,
+                        "hook": getattr(hook, "__name__", repr(hook)),
+                        "request_id": request_id or "-",
+                    },
+                )
@@ -0,0 +1,160 @@
+"""
+Name: Seen time-token store
+Path: core/sum_core/forms/token_store.py
+Purpose: Remember which single-use form time tokens have been spent so replays are rejected.
+Family: Forms, Spam Protection.
+Dependencies: Django cache (Redis via a Lua Bloom filter when configured), Django settings.
+
+A time token is valid for ``TIME_TOKEN_LIFETIME_SECONDS`` after it was issued,
+so a nonce only has to be remembered until then. Both stores answer
+``contains`` and ``add`` in O(1) and forget nonces once their token has
+expired:
+
+- ``CacheSeenTokenStore`` keeps one small cache key per spent nonce, expiring
+  with the token. Memory grows with the submission rate; fine for locmem in
+  development and for sites with modest traffic.
+- ``RedisBloomSeenTokenStore`` keeps a fixed-size Bloom filter per token
+  generation (one lifetime's worth of issue times). At most two generations
+  are live, so memory is bounded at ``2 * FORM_TIME_TOKEN_BLOOM_BITS / 8``
+  bytes (2 MB by default) however many submissions arrive. With the default
+  8M bits and 7 hashes and the one-hour token lifetime, 250,000 spent tokens
+  an hour (6 million a day) reject a fresh token by mistake about once in
+  100,000 submissions; the visitor is asked to refresh the page.
+
+The store is pluggable with ``FORM_TIME_TOKEN_STORE`` (dotted path to a
+``SeenTokenStore`` subclass). By default a Django ``RedisCache`` gets the Bloom
+filter and any other cache the key-per-nonce store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.utils.module_loading import import_string
+
+KEY_PREFIX = "form_time_token"
+
+DEFAULT_BLOOM_BITS = 2**23
+DEFAULT_BLOOM_HASHES = 7
+# Keeps a nonce around a little past its token's expiry to absorb clock skew
+# between web workers.
+EXPIRY_SLACK_SECONDS = 60
+
+
+class SeenTokenStore:
+    """Set of spent nonces, each remembered until its token expires."""
+
+    def __init__(self, lifetime: int, cache_alias: str = "default") -> None:
+        self.lifetime = lifetime
+        self.cache = caches[cache_alias]
+
+    def contains(self, nonce: str, issued_at: int) -> bool:
+        raise NotImplementedError
+
+    def add(self, nonce: str, issued_at: int) -> bool:
+        """Mark ``nonce`` spent; False if it already was."""
+        raise NotImplementedError
+
+
+class CacheSeenTokenStore(SeenTokenStore):
+    """One cache key per spent nonce, claimed atomically with ``cache.add()``."""
+
+    def contains(self, nonce: str, issued_at: int) -> bool:
+        return self.cache.get(self._key(nonce)) is not None
+
+    def add(self, nonce: str, issued_at: int) -> bool:
+        timeout = max(1, issued_at + self.lifetime - int(time.time()))
+        return bool(
+            self.cache.add(self._key(nonce), 1, timeout=timeout + EXPIRY_SLACK_SECONDS)
+        )
+
+    @staticmethod
+    def _key(nonce: str) -> str:
+        return f"{KEY_PREFIX}:seen:{nonce}"
+
+
+BLOOM_ADD_SCRIPT = """
+local seen = 1
+for i = 2, #ARGV do
+    if redis.call('GETBIT', KEYS[1], ARGV[i]) == 0 then
+        seen = 0
+        redis.call('SETBIT', KEYS[1], ARGV[i], 1)
+    end
+end
+redis.call('EXPIREAT', KEYS[1], ARGV[1])
+return seen
+"""
+
+BLOOM_CONTAINS_SCRIPT = """
+for i = 1, #ARGV do
+    if redis.call('GETBIT', KEYS[1], ARGV[i]) == 0 then
+        return 0
+    end
+end
+return 1
+"""
+
+
+class RedisBloomSeenTokenStore(SeenTokenStore):
+    """
+    Bloom filter of spent nonces in Redis bitmaps, one per token generation.
+
+    Requires Django's ``RedisCache``. Tokens issued in the same
+    ``lifetime``-long period share a bitmap, which expires once the last of
+    them has. Check-and-set runs in one Lua script, so two concurrent
+    submissions of the same token cannot both be accepted.
+    """
+
+    def __init__(self, lifetime: int, cache_alias: str = "default") -> None:
+        super().__init__(lifetime, cache_alias)
+        self.bits = int(
+            getattr(settings, "FORM_TIME_TOKEN_BLOOM_BITS", DEFAULT_BLOOM_BITS)
+        )
+        self.hashes = int(
+            getattr(settings, "FORM_TIME_TOKEN_BLOOM_HASHES", DEFAULT_BLOOM_HASHES)
+        )
+        client = self.cache._cache.get_client(write=True)
+        self._add_script = client.register_script(BLOOM_ADD_SCRIPT)
+        self._contains_script = client.register_script(BLOOM_CONTAINS_SCRIPT)
+
+    def contains(self, nonce: str, issued_at: int) -> bool:
+        return bool(
+            int(
+                self._contains_script(
+                    keys=[self._key(issued_at)], args=self._positions(nonce)
+                )
+            )
+        )
+
+    def add(self, nonce: str, issued_at: int) -> bool:
+        generation = issued_at // self.lifetime
+        expire_at = (generation + 2) * self.lifetime + EXPIRY_SLACK_SECONDS
+        seen = self._add_script(
+            keys=[self._key(issued_at)], args=[expire_at, *self._positions(nonce)]
+        )
+        return not int(seen)
+
+    def _key(self, issued_at: int) -> str:
+        generation = issued_at // self.lifetime
+        return self.cache.make_and_validate_key(f"{KEY_PREFIX}:bloom:{generation}")
+
+    def _positions(self, nonce: str) -> list[int]:
+        # Double hashing (Kirsch-Mitzenmacher): k positions from two hashes.
+        digest = hashlib.sha256(nonce.encode()).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+
+def get_seen_token_store(lifetime: int) -> SeenTokenStore:
+    """Return the configured store (see ``FORM_TIME_TOKEN_STORE``)."""
+    store_path = getattr(settings, "FORM_TIME_TOKEN_STORE", "")
+    if store_path:
+        return import_string(store_path)(lifetime)
+    if isinstance(caches["default"], RedisCache):
+        return RedisBloomSeenTokenStore(lifetime)
+    return CacheSeenTokenStore(lifetime)
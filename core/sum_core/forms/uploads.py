@@ -0,0 +1,146 @@
+"""
+Name: Streaming form upload handler
+Path: core/sum_core/forms/uploads.py
+Purpose: Receive dynamic form file uploads in bounded memory, checking size and content
+type as chunks arrive.
+Family: Forms, Dynamic Forms, Uploads.
+Dependencies: Django upload handlers, Django settings.
+
+``FormSubmissionGuardMiddleware`` installs ``StreamingFormUploadHandler`` for
+multipart POSTs to the form endpoint, before anything reads the body. Each
+file is written chunk by chunk to a temporary file, never held in memory:
+
+- the first ``MIME_SNIFF_BYTES`` are kept as ``sniffed_header`` on the
+  uploaded file, so MIME validation does not read the file again;
+- once a file passes ``FORM_UPLOAD_MAX_FILE_SIZE`` (default: the
+  ``FORM_SUBMISSION_MAX_UPLOAD_SIZE`` body limit) parsing stops and the error
+  is recorded on the request for the view to report. The rest of the body is
+  not read.
+
+Because the result is a temporary file, ``FileSystemStorage`` moves it into
+place instead of copying it, and other storages read it in chunks.
+
+Slow per-file work (virus scans, thumbnails) belongs in ``FORM_UPLOAD_HOOKS``:
+dotted paths to callables ``hook(lead, field_name, file_info)``, where
+``file_info`` is the stored file's metadata from ``Lead.form_data``. They run
+in a Celery task queued through the lead outbox once the lead is saved, so
+they never add to submission latency.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import (
+    FileUploadHandler,
+    StopFutureHandlers,
+    StopUpload,
+)
+from django.utils.module_loading import import_string
+
+UPLOAD_ERRORS_ATTR = "_sum_form_upload_errors"
+# libmagic needs no more than this to identify the formats we accept.
+MIME_SNIFF_BYTES = 2048
+DEFAULT_MAX_FILE_SIZE = 25 * 1024 * 1024
+# Outbox fan-out channel that runs FORM_UPLOAD_HOOKS (no Lead status field).
+UPLOAD_HOOKS_CHANNEL = "form_uploads"
+
+
+def get_max_upload_file_size() -> int:
+    return int(
+        getattr(
+            settings,
+            "FORM_UPLOAD_MAX_FILE_SIZE",
+            getattr(settings, "FORM_SUBMISSION_MAX_UPLOAD_SIZE", DEFAULT_MAX_FILE_SIZE),
+        )
+    )
+
+
+def format_file_size(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):g}MB"
+    return f"{size / 1024:g}KB"
+
+
+class StreamingFormUploadHandler(FileUploadHandler):
+    """Stream each file to disk, keeping its first bytes and enforcing a size cap."""
+
+    def __init__(self, request=None) -> None:
+        super().__init__(request)
+        self.max_file_size = get_max_upload_file_size()
+        self.header = b""
+        self.received = 0
+
+    def new_file(
+        self,
+        field_name,
+        file_name,
+        content_type,
+        content_length,
+        charset=None,
+        content_type_extra=None,
+    ) -> None:
+        super().new_file(
+            field_name,
+            file_name,
+            content_type,
+            content_length,
+            charset,
+            content_type_extra,
+        )
+        self.file = TemporaryUploadedFile(
+            self.file_name, self.content_type, 0, self.charset, content_type_extra
+        )
+        self.header = b""
+        self.received = 0
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        self.received += len(raw_data)
+        if self.received > self.max_file_size:
+            self._reject_too_large()
+        if len(self.header) < MIME_SNIFF_BYTES:
+            self.header += raw_data[: MIME_SNIFF_BYTES - len(self.header)]
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size: int) -> TemporaryUploadedFile:
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sniffed_header = self.header
+        return self.file
+
+    def upload_interrupted(self) -> None:
+        if hasattr(self, "file"):
+            self.file.close()  # Deletes the temporary file.
+
+    def _reject_too_large(self) -> None:
+        self.upload_interrupted()
+        if self.request is not None:
+            errors = getattr(self.request, UPLOAD_ERRORS_ATTR, {})
+            errors[self.field_name] = [
+                f"File must be {format_file_size(self.max_file_size)} or smaller."
+            ]
+            setattr(self.request, UPLOAD_ERRORS_ATTR, errors)
+        # Stop parsing without reading the rest of the body.
+        raise StopUpload(connection_reset=True)
+
+
+def get_stored_uploads(form_data: dict[str, Any] | None) -> dict[str, dict[str, Any]]:
+    """Stored file metadata in a lead's ``form_data``, by field name."""
+    return {
+        field_name: value
+        for field_name, value in (form_data or {}).items()
+        if isinstance(value, dict) and "path" in value
+    }
+
+
+def upload_hooks_enabled() -> bool:
+    return bool(getattr(settings, "FORM_UPLOAD_HOOKS", ()))
+
+
+def get_upload_hooks() -> list[Callable[..., Any]]:
+    return [import_string(path) for path in getattr(settings, "FORM_UPLOAD_HOOKS", ())]
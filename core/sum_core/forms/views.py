@@ -3,7 +3,7 @@ Name: Form submission handler
 Path: core/sum_core/forms/views.py
 Purpose: Accept Contact/Quote submissions, apply spam checks, persist Leads.
 Family: Forms, Leads, Attribution, Notifications.
-Dependencies: FormConfiguration, Lead service, Django cache, Wagtail Site.
+Dependencies: FormConfiguration, Lead service, Django cache, Wagtail Site, asgiref.
 """
 
 from __future__ import annotations
@@ -14,24 +14,38 @@ import re
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from django.core.cache import cache
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import validate_email
+from django.db import transaction
 from django.http import HttpRequest, JsonResponse
 from django.utils.decorators import method_decorator
 from django.utils.text import get_valid_filename
 from django.views import View
 from django.views.decorators.csrf import csrf_protect
-from sum_core.forms.cache import (
-    FORM_DEFINITION_CACHE_TTL_SECONDS,
-    ensure_form_definition_cache_version,
-    get_form_definition_cache_key,
-    get_form_definition_cache_version,
-)
 from sum_core.forms.dynamic import DynamicFormGenerator
-from sum_core.forms.models import FormConfiguration, FormDefinition
-from sum_core.forms.services import SpamCheckResult, run_spam_checks
+from sum_core.forms.middleware import PARSED_DATA_ATTR
+from sum_core.forms.models import FormConfiguration
+from sum_core.forms.ratelimit import record_rate_limit_block
+from sum_core.forms.runtime import (
+    FormRuntimeSpec,
+    aget_form_runtime_spec,
+    get_form_runtime_spec,
+)
+from sum_core.forms.services import (
+    SpamCheckResult,
+    claim_time_token,
+    generate_time_token,
+    run_spam_checks,
+)
+from sum_core.forms.uploads import (
+    UPLOAD_HOOKS_CHANNEL,
+    get_stored_uploads,
+    upload_hooks_enabled,
+)
+from sum_core.leads.outbox import enqueue_lead_side_effects
 from sum_core.leads.services import AttributionData, create_lead_from_submission
 from sum_core.ops.request_utils import get_client_ip
 from wagtail.models import Site
@@ -53,6 +67,45 @@ UK_PHONE_REGEX = re.compile(
 )
 
 
+def spam_response(
+    spam_result: SpamCheckResult, request: HttpRequest
+) -> JsonResponse | None:
+    """
+    Return the JsonResponse for a spam/rate-limit result, or None if it passed.
+
+    Shared with ``FormSubmissionGuardMiddleware`` so early rejections look the
+    same as the view's.
+    """
+    if spam_result.should_rate_limit:
+        response = JsonResponse(
+            {"success": False, "errors": {"__all__": ["Too many requests"]}},
+            status=429,
+        )
+        if spam_result.retry_after:
+            response["Retry-After"] = str(spam_result.retry_after)
+        return response
+
+    if spam_result.is_spam:
+        # Return 400 for spam (indistinguishable from validation error to bots)
+        is_xhr = request.headers.get("X-Requested-With") == "XMLHttpRequest"
+        if is_xhr and spam_result.reason.startswith("Submitted too quickly"):
+            message = "Please wait a moment and try again."
+        elif is_xhr and spam_result.reason in (
+            "Time token expired",
+            "Time token already used",
+        ):
+            message = "Please refresh the page and try again."
+        else:
+            message = "Invalid submission"
+
+        return JsonResponse(
+            {"success": False, "errors": {"__all__": [message]}},
+            status=400,
+        )
+
+    return None
+
+
 @method_decorator(csrf_protect, name="dispatch")
 class FormSubmissionView(View):
     """
@@ -96,18 +149,12 @@ class FormSubmissionView(View):
         self, request, data: dict[str, Any], site: Site
     ) -> JsonResponse:
         """Process legacy/static form submissions."""
-        config = self._get_config(site)
-
-        spam_result = run_spam_checks(
-            form_data=data,
-            ip_address=get_client_ip(request),
-            site_id=site.id,
-            time_token=data.get("_time_token", ""),
-            honeypot_field_name=config.honeypot_field_name,
-            rate_limit_per_hour=config.rate_limit_per_ip_per_hour,
-            min_seconds_to_submit=config.min_seconds_to_submit,
+        config, spam_response = self._check_spam(
+            request,
+            data,
+            site,
+            form_key=f"static:{str(data.get('form_type', '')).strip()}",
         )
-        spam_response = self._spam_response(spam_result, request)
         if spam_response:
             return spam_response
 
@@ -119,34 +166,76 @@ class FormSubmissionView(View):
                 status=400,
             )
 
-        # Create Lead (must happen before any side effects)
-        try:
-            lead = self._create_lead(data, site)
-        except ValueError as e:
-            return JsonResponse(
-                {"success": False, "errors": {"__all__": [str(e)]}},
-                status=400,
-            )
+        replay_response = self._claim_time_token(data, request)
+        if replay_response:
+            return replay_response
 
-        # Queue notification tasks AFTER lead is safely persisted
-        # Failure to queue does NOT lose the lead - we update status fields
-        self._queue_notification_tasks(lead, site.id, request)
-
-        return JsonResponse(
-            {
-                "success": True,
-                "message": "Thank you for your submission",
-                "lead_id": lead.id,
-            },
-            status=200,
-        )
+        return self._save_static_submission(data, site, request)
 
     def _handle_dynamic_form_submission(
         self, request, data: dict[str, Any], site: Site
     ) -> JsonResponse:
         """Process dynamic form submissions from FormDefinition."""
-        form_definition_id = data.get("form_definition_id")
-        form_definition = self._get_form_definition(form_definition_id, site)
+        form_definition = self._get_form_definition(
+            data.get("form_definition_id"), site
+        )
+        unavailable_response = self._check_form_definition(form_definition)
+        if unavailable_response:
+            return unavailable_response
+
+        # Dynamic forms always use "website" as honeypot field (set in template).
+        # This is simpler than the legacy per-site config and avoids confusion.
+        _config, spam_response = self._check_spam(
+            request,
+            data,
+            site,
+            form_key=f"definition:{form_definition.pk}",
+            honeypot_field_name="website",
+        )
+        if spam_response:
+            return spam_response
+
+        form, invalid_response = self._validate_dynamic_form(
+            form_definition, data, request
+        )
+        if invalid_response:
+            return invalid_response
+
+        replay_response = self._claim_time_token(data, request)
+        if replay_response:
+            return replay_response
+
+        form_data = self._build_dynamic_form_data(form, form_definition, request)
+        return self._save_dynamic_submission(
+            form, form_definition, form_data, data, site, request
+        )
+
+    def _check_spam(
+        self,
+        request: HttpRequest,
+        data: dict[str, Any],
+        site: Site,
+        *,
+        form_key: str,
+        honeypot_field_name: str | None = None,
+    ) -> tuple[FormConfiguration, JsonResponse | None]:
+        """Run the site's spam checks; return its config and any rejection."""
+        config = self._get_config(site)
+        spam_result = run_spam_checks(
+            form_data=data,
+            ip_address=get_client_ip(request),
+            site_id=site.id,
+            time_token=data.get("_time_token", ""),
+            honeypot_field_name=honeypot_field_name or config.honeypot_field_name,
+            rate_limit_per_hour=config.rate_limit_per_ip_per_hour,
+            min_seconds_to_submit=config.min_seconds_to_submit,
+            form_key=form_key,
+        )
+        return config, self._spam_response(spam_result, request)
+
+    def _check_form_definition(
+        self, form_definition: FormRuntimeSpec | None
+    ) -> JsonResponse | None:
         if form_definition is None:
             return JsonResponse(
                 {
@@ -161,52 +250,87 @@ class FormSubmissionView(View):
                 {"success": False, "errors": {"__all__": ["Form is inactive"]}},
                 status=400,
             )
+        return None
 
-        # Dynamic forms always use "website" as honeypot field (set in template).
-        # This is simpler than the legacy per-site config and avoids confusion.
-        config = self._get_config(site)
-        spam_result = run_spam_checks(
-            form_data=data,
-            ip_address=get_client_ip(request),
-            site_id=site.id,
-            time_token=data.get("_time_token", ""),
-            honeypot_field_name="website",
-            rate_limit_per_hour=config.rate_limit_per_ip_per_hour,
-            min_seconds_to_submit=config.min_seconds_to_submit,
-        )
-        spam_response = self._spam_response(spam_result, request)
-        if spam_response:
-            return spam_response
-
+    def _validate_dynamic_form(
+        self,
+        form_definition: FormRuntimeSpec,
+        data: dict[str, Any],
+        request: HttpRequest,
+    ) -> tuple[Any, JsonResponse | None]:
+        """Bind and validate the dynamic form; return it and any error response."""
         form_class = DynamicFormGenerator(form_definition).generate_form_class()
         form = form_class(data=data, files=request.FILES)
 
         if not form.is_valid():
-            return JsonResponse(
+            return form, JsonResponse(
                 {"success": False, "errors": self._format_form_errors(form)},
                 status=400,
             )
 
         lead_field_errors = self._validate_dynamic_lead_fields(form.cleaned_data)
         if lead_field_errors:
-            return JsonResponse(
+            return form, JsonResponse(
                 {"success": False, "errors": lead_field_errors},
                 status=400,
             )
+        return form, None
 
-        form_data = self._build_dynamic_form_data(form, form_definition, request)
+    def _save_static_submission(
+        self, data: dict[str, Any], site: Site, request: HttpRequest
+    ) -> JsonResponse:
+        # Create Lead and record its side effects in one transaction; the
+        # outbox relay queues the tasks, so the broker is never on this path.
+        try:
+            with transaction.atomic():
+                lead = self._create_lead(data, site)
+                self._queue_notification_tasks(lead, site.id, request)
+        except ValueError as e:
+            return JsonResponse(
+                {"success": False, "errors": {"__all__": [str(e)]}},
+                status=400,
+            )
+
+        return self._success_response(lead, "Thank you for your submission")
+
+    def _save_dynamic_submission(
+        self,
+        form,
+        form_definition: FormRuntimeSpec,
+        form_data: dict[str, Any],
+        data: dict[str, Any],
+        site: Site,
+        request: HttpRequest,
+    ) -> JsonResponse:
         attribution = self._build_attribution_data(data, request)
+        submitter_email = str(
+            form.cleaned_data.get("email") or form_data.get("email") or ""
+        )
+        initial_status, channels = self._get_dynamic_form_channel_status(
+            form_definition, submitter_email
+        )
+        if get_stored_uploads(form_data) and upload_hooks_enabled():
+            channels.add(UPLOAD_HOOKS_CHANNEL)
 
         try:
-            lead = create_lead_from_submission(
-                name=form.cleaned_data.get("name", ""),
-                email=form.cleaned_data.get("email", ""),
-                message=form.cleaned_data.get("message", ""),
-                form_type=form_definition.slug,
-                phone=form.cleaned_data.get("phone"),
-                form_data=form_data or None,
-                attribution=attribution,
-            )
+            with transaction.atomic():
+                lead = create_lead_from_submission(
+                    name=form.cleaned_data.get("name", ""),
+                    email=form.cleaned_data.get("email", ""),
+                    message=form.cleaned_data.get("message", ""),
+                    form_type=form_definition.slug,
+                    phone=form.cleaned_data.get("phone"),
+                    form_data=form_data or None,
+                    attribution=attribution,
+                    initial_status=initial_status,
+                )
+                self._queue_notification_tasks(
+                    lead,
+                    site.id,
+                    request,
+                    form_definition=form_definition,
+                    channels=channels,
+                )
         except ValueError as e:
             # Clean up any uploaded files since lead creation failed
             self._cleanup_uploaded_files(form_data)
@@ -215,16 +339,17 @@ class FormSubmissionView(View):
                 status=400,
             )
 
-        # Queue notification tasks AFTER lead is safely persisted
-        self._queue_notification_tasks(lead, site.id, request)
-        self._queue_dynamic_form_tasks(lead, form_definition, request)
+        return self._success_response(
+            lead, form_definition.success_message or "Thank you for your submission!"
+        )
 
+    def _success_response(self, lead: Lead, message: str) -> JsonResponse:
         return JsonResponse(
             {
                 "success": True,
-                "message": form_definition.success_message
-                or "Thank you for your submission!",
+                "message": message,
                 "lead_id": lead.id,
+                "time_token": generate_time_token(),
             },
             status=200,
         )
@@ -235,6 +360,11 @@ class FormSubmissionView(View):
 
         content_type = request.content_type or ""
 
+        # Already parsed by FormSubmissionGuardMiddleware
+        parsed = getattr(request, PARSED_DATA_ATTR, None)
+        if parsed is not None:
+            return cast(dict[str, Any], parsed)
+
         if "application/json" in content_type:
             try:
                 # helper to shut up mypy no-any-return
@@ -319,7 +449,7 @@ class FormSubmissionView(View):
         return errors
 
     def _build_dynamic_form_data(
-        self, form, form_definition: FormDefinition, request: HttpRequest
+        self, form, form_definition: FormRuntimeSpec, request: HttpRequest
     ) -> dict[str, Any]:
         """Extract non-core dynamic fields, persisting uploads to storage."""
         standard_fields = {"name", "email", "message", "phone"}
@@ -340,7 +470,7 @@ class FormSubmissionView(View):
     def _store_uploaded_file(
         self,
         uploaded_file: UploadedFile,
-        form_definition: FormDefinition,
+        form_definition: FormRuntimeSpec,
         field_name: str,
     ) -> dict[str, Any]:
         """Save uploaded file to storage and return metadata for form_data."""
@@ -413,66 +543,41 @@ class FormSubmissionView(View):
 
     def _get_form_definition(
         self, form_definition_id: str | None, site: Site
-    ) -> FormDefinition | None:
-        """Fetch a form definition for the current site."""
+    ) -> FormRuntimeSpec | None:
+        """Fetch a form definition's runtime spec for the current site."""
         if not form_definition_id:
             return None
         try:
             form_definition_pk = int(form_definition_id)
         except (TypeError, ValueError):
             return None
-        version = get_form_definition_cache_version(site.pk, form_definition_pk)
-        if version:
-            cache_key = get_form_definition_cache_key(
-                site.pk, form_definition_pk, version
-            )
-            form_definition = cache.get(cache_key)
-            if form_definition is not None:
-                return form_definition
-
-        form_definition = (
-            FormDefinition.objects.select_related("site")
-            .filter(pk=form_definition_pk, site=site)
-            .first()
-        )
-        if form_definition is not None:
-            version = ensure_form_definition_cache_version(site.pk, form_definition_pk)
-            cache_key = get_form_definition_cache_key(
-                site.pk, form_definition_pk, version
-            )
-            cache.set(
-                cache_key,
-                form_definition,
-                timeout=FORM_DEFINITION_CACHE_TTL_SECONDS,
-            )
-        return form_definition
+        return get_form_runtime_spec(site.pk, form_definition_pk)
 
     def _spam_response(
         self, spam_result: SpamCheckResult, request: HttpRequest
     ) -> JsonResponse | None:
         """Return a JsonResponse for spam/rate-limit results."""
         if spam_result.should_rate_limit:
-            return JsonResponse(
-                {"success": False, "errors": {"__all__": ["Too many requests"]}},
-                status=429,
+            # Let FormSubmissionGuardMiddleware turn away retries before they
+            # reach this view.
+            record_rate_limit_block(
+                request, spam_result.rate_limit_tier, spam_result.retry_after
             )
+        return spam_response(spam_result, request)
 
-        if spam_result.is_spam:
-            # Return 400 for spam (indistinguishable from validation error to bots)
-            is_xhr = request.headers.get("X-Requested-With") == "XMLHttpRequest"
-            if is_xhr and spam_result.reason.startswith("Submitted too quickly"):
-                message = "Please wait a moment and try again."
-            elif is_xhr and spam_result.reason == "Time token expired":
-                message = "Please refresh the page and try again."
-            else:
-                message = "Invalid submission"
-
-            return JsonResponse(
-                {"success": False, "errors": {"__all__": [message]}},
-                status=400,
-            )
+    def _claim_time_token(
+        self, data: dict[str, Any], request: HttpRequest
+    ) -> JsonResponse | None:
+        """
+        Spend the submission's time token; reject it if it was already spent.
 
-        return None
+        Runs after validation so a visitor can fix errors and resubmit.
+        """
+        if claim_time_token(str(data.get("_time_token") or "")):
+            return None
+        return spam_response(
+            SpamCheckResult(is_spam=True, reason="Time token already used"), request
+        )
 
     def _create_lead(self, data: dict, site: Site):
         """
@@ -537,192 +642,222 @@ class FormSubmissionView(View):
             attribution=attribution,
         )
 
-    def _queue_notification_tasks(self, lead, site_id: int, request) -> None:
+    def _get_dynamic_form_channel_status(
+        self, form_definition: FormRuntimeSpec, submitter_email: str
+    ) -> tuple[dict[str, str], set[str]]:
         """
-        Queue async notification tasks after lead creation.
+        Work out each dynamic form channel's initial status before the Lead exists.
 
-        Failure to queue does NOT lose the lead - we update status fields
-        to reflect the queueing failure for visibility in admin.
+        Returns the status/last-error field values to write with the Lead INSERT
+        and the channels whose tasks should be queued.
+        """
+        from sum_core.leads.models import EmailStatus, WebhookStatus
 
-        This ensures the "no lost leads" invariant is maintained even when
-        Celery/broker is unavailable.
+        initial_status: dict[str, str] = {}
+        channels: set[str] = set()
+
+        def resolve(
+            channel: str,
+            enabled: bool,
+            ready: bool,
+            pending: str,
+            failed: str,
+            disabled: str,
+            error: str,
+        ) -> None:
+            if not enabled:
+                status, last_error = disabled, ""
+            elif not ready:
+                status, last_error = failed, error
+            else:
+                status, last_error = pending, ""
+                channels.add(channel)
+            initial_status[f"{channel}_status"] = status
+            initial_status[f"{channel}_last_error"] = last_error
+
+        resolve(
+            "form_notification",
+            form_definition.email_notification_enabled,
+            form_definition.has_notification_emails,
+            EmailStatus.PENDING,
+            EmailStatus.FAILED,
+            EmailStatus.DISABLED,
+            "No notification recipients configured",
+        )
+        resolve(
+            "auto_reply",
+            form_definition.auto_reply_enabled,
+            bool(submitter_email.strip()),
+            EmailStatus.PENDING,
+            EmailStatus.FAILED,
+            EmailStatus.DISABLED,
+            "Submitter email missing",
+        )
+        resolve(
+            "form_webhook",
+            form_definition.webhook_enabled,
+            form_definition.has_webhook_url,
+            WebhookStatus.PENDING,
+            WebhookStatus.FAILED,
+            WebhookStatus.DISABLED,
+            "Webhook URL missing",
+        )
+        return initial_status, channels
+
+    def _queue_notification_tasks(
+        self,
+        lead: Lead,
+        site_id: int,
+        request: HttpRequest,
+        form_definition: FormRuntimeSpec | None = None,
+        channels: set[str] | None = None,
+    ) -> None:
+        """
+        Record the submission's notification side effects in the lead outbox.
+
+        Must be called inside the transaction that creates the Lead: the outbox
+        row commits (or rolls back) with it. The outbox relay later publishes a
+        single fan-out task, and the worker queues each channel's task. The
+        request never talks to the broker, so a slow or unavailable broker
+        neither delays the response nor marks the lead's channels failed.
 
         Args:
             lead: The created Lead instance.
             site_id: The Wagtail Site ID for per-site configuration lookup.
             request: The HTTP request (for extracting request_id).
+            form_definition: The dynamic form, if the submission came from one.
+            channels: Dynamic form channels to queue (see
+                ``_get_dynamic_form_channel_status``).
         """
-        from sum_core.leads.models import EmailStatus, WebhookStatus, ZapierStatus
-        from sum_core.leads.tasks import (
-            send_lead_notification,
-            send_lead_webhook,
-            send_zapier_webhook,
-        )
-
         # Get request_id set by CorrelationIdMiddleware (if available)
         request_id = getattr(request, "request_id", None)
+        enqueue_lead_side_effects(
+            lead,
+            site_id,
+            request_id=request_id,
+            form_definition_id=getattr(form_definition, "id", None),
+            form_channels=(channels or set()) if form_definition is not None else (),
+        )
 
-        # Attempt to queue email notification task
-        try:
-            send_lead_notification.delay(
-                lead.id, request_id=request_id, site_id=site_id
+
+@method_decorator(csrf_protect, name="post")
+class AsyncFormSubmissionView(FormSubmissionView):
+    """
+    ``FormSubmissionView`` for ASGI deployments (``FORM_SUBMISSION_ASYNC``).
+
+    Same phases and responses as the sync view, but the event loop is not held
+    while the database or cache answers: the definition lookup uses
+    ``cache.aget()`` and the async ORM, and the phases that need Django's sync
+    APIs (site and spam checks, the time-token claim, file storage, the lead
+    and outbox transaction) each run in one ``sync_to_async`` call. Form
+    validation runs on the event loop; it only touches data already in memory.
+    """
+
+    # csrf_protect wraps post() instead; its sync dispatch() wrapper cannot
+    # await the handler.
+    dispatch = View.dispatch
+
+    async def post(self, request, *args, **kwargs) -> JsonResponse:
+        """Handle form submission POST request."""
+        data = self._parse_request_data(request)
+        if data is None:
+            return JsonResponse(
+                {"success": False, "errors": {"__all__": ["Invalid request data"]}},
+                status=400,
             )
-        except Exception as e:
-            logger.exception(f"Failed to queue email notification for lead {lead.id}")
-            lead.email_status = EmailStatus.FAILED
-            lead.email_last_error = f"Failed to queue task: {str(e)[:500]}"
-            lead.save(update_fields=["email_status", "email_last_error"])
 
-        # Attempt to queue webhook notification task
-        try:
-            send_lead_webhook.delay(lead.id, request_id=request_id)
-        except Exception as e:
-            logger.exception(f"Failed to queue webhook notification for lead {lead.id}")
-            lead.webhook_status = WebhookStatus.FAILED
-            lead.webhook_last_error = f"Failed to queue task: {str(e)[:500]}"
-            lead.save(update_fields=["webhook_status", "webhook_last_error"])
-
-        # Attempt to queue Zapier webhook task (M4-007)
-        try:
-            send_zapier_webhook.delay(lead.id, site_id, request_id=request_id)
-        except Exception as e:
-            logger.exception(f"Failed to queue Zapier webhook for lead {lead.id}")
-            lead.zapier_status = ZapierStatus.FAILED
-            lead.zapier_last_error = f"Failed to queue task: {str(e)[:500]}"
-            lead.save(update_fields=["zapier_status", "zapier_last_error"])
-
-    def _queue_dynamic_form_tasks(
-        self, lead: Lead, form_definition: FormDefinition, request: HttpRequest
-    ) -> None:
-        """Queue async tasks for dynamic form notifications and webhooks."""
-        from sum_core.forms.tasks import (
-            send_auto_reply,
-            send_form_notification,
-            send_webhook,
+        site = await sync_to_async(self._get_site)(request)
+        if site is None:
+            return JsonResponse(
+                {"success": False, "errors": {"__all__": ["Site not found"]}},
+                status=400,
+            )
+
+        if data.get("form_definition_id"):
+            return await self._ahandle_dynamic_form_submission(request, data, site)
+
+        return await self._ahandle_static_form_submission(request, data, site)
+
+    async def _ahandle_static_form_submission(
+        self, request, data: dict[str, Any], site: Site
+    ) -> JsonResponse:
+        config, spam_response = await sync_to_async(self._check_spam)(
+            request,
+            data,
+            site,
+            form_key=f"static:{str(data.get('form_type', '')).strip()}",
         )
-        from sum_core.leads.models import EmailStatus, WebhookStatus
+        if spam_response:
+            return spam_response
 
-        request_id = getattr(request, "request_id", None)
-        update_fields: list[str] = []
-
-        queue_form_notification = False
-        if form_definition.email_notification_enabled:
-            if form_definition.notification_emails.strip():
-                lead.form_notification_status = EmailStatus.PENDING
-                lead.form_notification_last_error = ""
-                update_fields.extend(
-                    ["form_notification_status", "form_notification_last_error"]
-                )
-                queue_form_notification = True
-            else:
-                lead.form_notification_status = EmailStatus.FAILED
-                lead.form_notification_last_error = (
-                    "No notification recipients configured"
-                )
-                update_fields.extend(
-                    ["form_notification_status", "form_notification_last_error"]
-                )
-        else:
-            lead.form_notification_status = EmailStatus.DISABLED
-            lead.form_notification_last_error = ""
-            update_fields.extend(
-                ["form_notification_status", "form_notification_last_error"]
+        validation_errors = self._validate_submission(data, config)
+        if validation_errors:
+            return JsonResponse(
+                {"success": False, "errors": validation_errors},
+                status=400,
             )
 
-        submitter_email = (lead.email or lead.form_data.get("email") or "").strip()
-        queue_auto_reply = False
-        if form_definition.auto_reply_enabled:
-            if submitter_email:
-                lead.auto_reply_status = EmailStatus.PENDING
-                lead.auto_reply_last_error = ""
-                update_fields.extend(["auto_reply_status", "auto_reply_last_error"])
-                queue_auto_reply = True
-            else:
-                lead.auto_reply_status = EmailStatus.FAILED
-                lead.auto_reply_last_error = "Submitter email missing"
-                update_fields.extend(["auto_reply_status", "auto_reply_last_error"])
-        else:
-            lead.auto_reply_status = EmailStatus.DISABLED
-            lead.auto_reply_last_error = ""
-            update_fields.extend(["auto_reply_status", "auto_reply_last_error"])
-
-        queue_webhook = False
-        if form_definition.webhook_enabled:
-            if form_definition.webhook_url:
-                lead.form_webhook_status = WebhookStatus.PENDING
-                lead.form_webhook_last_error = ""
-                update_fields.extend(["form_webhook_status", "form_webhook_last_error"])
-                queue_webhook = True
-            else:
-                lead.form_webhook_status = WebhookStatus.FAILED
-                lead.form_webhook_last_error = "Webhook URL missing"
-                update_fields.extend(["form_webhook_status", "form_webhook_last_error"])
-        else:
-            lead.form_webhook_status = WebhookStatus.DISABLED
-            lead.form_webhook_last_error = ""
-            update_fields.extend(["form_webhook_status", "form_webhook_last_error"])
+        replay_response = await sync_to_async(self._claim_time_token)(data, request)
+        if replay_response:
+            return replay_response
 
-        if update_fields:
-            lead.save(update_fields=sorted(set(update_fields)))
+        return await sync_to_async(self._save_static_submission)(data, site, request)
 
-        if queue_form_notification:
-            try:
-                send_form_notification.delay(
-                    lead.id, form_definition.id, request_id=request_id
-                )
-            except Exception as exc:
-                logger.exception(
-                    "Failed to queue form notification task",
-                    extra={
-                        "lead_id": lead.id,
-                        "form_definition_id": form_definition.id,
-                    },
-                )
-                lead.form_notification_status = EmailStatus.FAILED
-                lead.form_notification_last_error = (
-                    f"Failed to queue task: {str(exc)[:500]}"
-                )
-                lead.save(
-                    update_fields=[
-                        "form_notification_status",
-                        "form_notification_last_error",
-                    ]
-                )
+    async def _ahandle_dynamic_form_submission(
+        self, request, data: dict[str, Any], site: Site
+    ) -> JsonResponse:
+        form_definition = await self._aget_form_definition(
+            data.get("form_definition_id"), site
+        )
+        unavailable_response = self._check_form_definition(form_definition)
+        if unavailable_response:
+            return unavailable_response
+
+        _config, spam_response = await sync_to_async(self._check_spam)(
+            request,
+            data,
+            site,
+            form_key=f"definition:{form_definition.pk}",
+            honeypot_field_name="website",
+        )
+        if spam_response:
+            return spam_response
 
-        if queue_auto_reply:
-            try:
-                send_auto_reply.delay(
-                    lead.id, form_definition.id, request_id=request_id
-                )
-            except Exception as exc:
-                logger.exception(
-                    "Failed to queue auto reply task",
-                    extra={
-                        "lead_id": lead.id,
-                        "form_definition_id": form_definition.id,
-                    },
-                )
-                lead.auto_reply_status = EmailStatus.FAILED
-                lead.auto_reply_last_error = f"Failed to queue task: {str(exc)[:500]}"
-                lead.save(update_fields=["auto_reply_status", "auto_reply_last_error"])
+        form, invalid_response = self._validate_dynamic_form(
+            form_definition, data, request
+        )
+        if invalid_response:
+            return invalid_response
 
-        if queue_webhook:
-            try:
-                send_webhook.delay(lead.id, form_definition.id, request_id=request_id)
-            except Exception as exc:
-                logger.exception(
-                    "Failed to queue form webhook task",
-                    extra={
-                        "lead_id": lead.id,
-                        "form_definition_id": form_definition.id,
-                    },
-                )
-                lead.form_webhook_status = WebhookStatus.FAILED
-                lead.form_webhook_last_error = f"Failed to queue task: {str(exc)[:500]}"
-                lead.save(
-                    update_fields=["form_webhook_status", "form_webhook_last_error"]
-                )
+        replay_response = await sync_to_async(self._claim_time_token)(data, request)
+        if replay_response:
+            return replay_response
+
+        form_data = await sync_to_async(self._build_dynamic_form_data)(
+            form, form_definition, request
+        )
+        return await sync_to_async(self._save_dynamic_submission)(
+            form, form_definition, form_data, data, site, request
+        )
+
+    async def _aget_form_definition(
+        self, form_definition_id: str | None, site: Site
+    ) -> FormRuntimeSpec | None:
+        if not form_definition_id:
+            return None
+        try:
+            form_definition_pk = int(form_definition_id)
+        except (TypeError, ValueError):
+            return None
+        return await aget_form_runtime_spec(site.pk, form_definition_pk)
+
+
+def get_form_submission_view():
+    """The submission view for this deployment (see ``FORM_SUBMISSION_ASYNC``)."""
+    if getattr(settings, "FORM_SUBMISSION_ASYNC", False):
+        return AsyncFormSubmissionView.as_view()
+    return FormSubmissionView.as_view()
 
 
 # Convenience function-based view for URL routing
-form_submission_view = FormSubmissionView.as_view()
+form_submission_view = get_form_submission_view()
@@ -0,0 +1,92 @@
+# Generated by Django 5.2.9 on 2026-10-19 14:52
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sum_core_leads", "0006_lead_dynamic_form_status_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeadOutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "site_id",
+                    models.PositiveIntegerField(
+                        help_text="Wagtail Site the form was submitted on."
+                    ),
+                ),
+                (
+                    "request_id",
+                    models.CharField(
+                        blank=True,
+                        help_text="Correlation ID of the originating request.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "form_definition_id",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="Dynamic form the submission came from, if any.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "form_channels",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Dynamic form channels to queue.",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "available_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="The relay skips the message until this time (retry backoff).",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of failed publish attempts."
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, help_text="Last publish error (truncated)."
+                    ),
+                ),
+                (
+                    "lead",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="outbox_messages",
+                        to="sum_core_leads.lead",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Lead outbox message",
+                "verbose_name_plural": "Lead outbox messages",
+                "ordering": ["id"],
+            },
+        ),
+    ]
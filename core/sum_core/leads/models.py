@@ -9,6 +9,7 @@ Dependencies: Django ORM, Wagtail Page model.
 from __future__ import annotations
 
 from django.db import models
+from django.utils import timezone
 from wagtail.models import Page
 
 
@@ -302,6 +303,64 @@ class Lead(models.Model):
         return f"{self.name} <{self.email}> ({self.form_type})"
 
 
+class LeadOutboxMessage(models.Model):
+    """
+    A lead's pending notification side effects (transactional outbox).
+
+    Written in the same transaction as the Lead, so a committed lead always has
+    its side effects recorded, without the request waiting on the broker. The
+    relay (``relay_lead_outbox``) publishes each message as one
+    ``process_lead_side_effects`` task and deletes it; messages that cannot be
+    published stay here and are retried with backoff.
+    """
+
+    lead: models.ForeignKey = models.ForeignKey(
+        Lead,
+        on_delete=models.CASCADE,
+        related_name="outbox_messages",
+    )
+    site_id: models.PositiveIntegerField = models.PositiveIntegerField(
+        help_text="Wagtail Site the form was submitted on.",
+    )
+    request_id: models.CharField = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="Correlation ID of the originating request.",
+    )
+    form_definition_id: models.PositiveIntegerField = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Dynamic form the submission came from, if any.",
+    )
+    form_channels: models.JSONField = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Dynamic form channels to queue.",
+    )
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    available_at: models.DateTimeField = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+        help_text="The relay skips the message until this time (retry backoff).",
+    )
+    attempts: models.PositiveIntegerField = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of failed publish attempts.",
+    )
+    last_error: models.TextField = models.TextField(
+        blank=True,
+        help_text="Last publish error (truncated).",
+    )
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "Lead outbox message"
+        verbose_name_plural = "Lead outbox messages"
+
+    def __str__(self) -> str:
+        return f"Outbox message {self.pk} for lead {self.lead_id}"
+
+
 class LeadSourceRule(models.Model):
     """
     Configurable rule for deriving lead_source from UTM/referrer fields.
@@ -0,0 +1,162 @@
+"""
+Name: Lead side-effect outbox
+Path: core/sum_core/leads/outbox.py
+Purpose: Record lead side effects in the Lead's transaction and relay them to Celery.
+Family: Leads, forms, notifications, reliability.
+Dependencies: Django ORM, LeadOutboxMessage, sum_core.leads.tasks (Celery).
+
+Form submissions write a ``LeadOutboxMessage`` alongside the Lead instead of
+talking to the broker, so response latency does not depend on broker health.
+``relay_lead_outbox`` drains the table in batches, publishing each message as a
+single ``process_lead_side_effects`` task; it runs as a loop
+(``manage.py relay_lead_outbox --loop``) or from Celery beat.
+
+A message that cannot be published stays in the outbox with exponential backoff
+and is retried until the broker is back, so a transient outage never leaves the
+lead's channels FAILED. Delivery is at-least-once: a relay that dies between
+publishing and deleting a message (or is slower than its lease) publishes it
+again.
+
+``LEAD_OUTBOX_RELAY_ON_COMMIT = True`` also relays each message right after its
+transaction commits, in the request process - for development and tests
+without a relay running; production leaves it off.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from sum_core.leads.models import Lead, LeadOutboxMessage
+
+logger = logging.getLogger(__name__)
+
+RELAY_BATCH_SIZE = 100
+RETRY_BACKOFF_BASE = 5  # seconds (5, 10, 20, ...)
+RETRY_BACKOFF_MAX = 300  # seconds
+# How long a relay owns the messages it claimed before another relay may
+# publish them again (it deletes them as soon as they are published).
+RELAY_LEASE_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class RelayResult:
+    published: int = 0
+    failed: int = 0
+
+
+def enqueue_lead_side_effects(
+    lead: Lead,
+    site_id: int,
+    request_id: str | None = None,
+    form_definition_id: int | None = None,
+    form_channels: Iterable[str] = (),
+) -> LeadOutboxMessage:
+    """
+    Record a lead's side effects in the outbox.
+
+    Call inside the transaction that creates the Lead, so both commit (or roll
+    back) together.
+    """
+    message = LeadOutboxMessage.objects.create(
+        lead=lead,
+        site_id=site_id,
+        request_id=(request_id or "")[:64],
+        form_definition_id=form_definition_id,
+        form_channels=sorted(form_channels),
+    )
+    if getattr(settings, "LEAD_OUTBOX_RELAY_ON_COMMIT", False):
+        transaction.on_commit(lambda: relay_lead_outbox(message_ids=[message.pk]))
+    return message
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next publish attempt of a message."""
+    seconds = RETRY_BACKOFF_BASE * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, RETRY_BACKOFF_MAX))
+
+
+def relay_lead_outbox(
+    batch_size: int = RELAY_BATCH_SIZE,
+    message_ids: Iterable[int] | None = None,
+) -> RelayResult:
+    """
+    Publish one batch of due outbox messages to the broker.
+
+    The batch is claimed first: its rows are locked with ``SKIP LOCKED``
+    (where supported) just long enough to push ``available_at`` out by
+    ``RELAY_LEASE_SECONDS``, and that commits before anything is published, so
+    a slow broker never holds a transaction or row locks open. Other relays
+    skip leased messages; if this relay dies, they pick them up once the lease
+    ends. The first publish failure ends the batch: the broker is most likely
+    down, and the remaining messages would only wait out the same connect
+    timeout, so their lease is released.
+    """
+    from sum_core.leads.tasks import process_lead_side_effects
+
+    now = timezone.now()
+    with transaction.atomic():
+        due = LeadOutboxMessage.objects.select_for_update(skip_locked=True).filter(
+            available_at__lte=now
+        )
+        if message_ids is not None:
+            due = due.filter(pk__in=list(message_ids))
+        messages = list(due.order_by("id")[:batch_size])
+        if not messages:
+            return RelayResult()
+        LeadOutboxMessage.objects.filter(pk__in=[m.pk for m in messages]).update(
+            available_at=now + timedelta(seconds=RELAY_LEASE_SECONDS)
+        )
+
+    published: list[int] = []
+    failed: LeadOutboxMessage | None = None
+    for message in messages:
+        try:
+            process_lead_side_effects.delay(
+                message.lead_id,
+                message.site_id,
+                request_id=message.request_id or None,
+                form_definition_id=message.form_definition_id,
+                form_channels=list(message.form_channels),
+            )
+        except Exception as exc:
+            logger.exception(
+                "Failed to relay lead outbox message",
+                extra={
+                    "lead_id": message.lead_id,
+                    "outbox_message_id": message.pk,
+                    "request_id": message.request_id or "-",
+                },
+            )
+            message.attempts += 1
+            message.last_error = str(exc)[:500]
+            message.available_at = now + get_retry_delay(message.attempts)
+            failed = message
+            break
+        published.append(message.pk)
+
+    if published:
+        LeadOutboxMessage.objects.filter(pk__in=published).delete()
+    if failed is not None:
+        failed.save(update_fields=["attempts", "last_error", "available_at"])
+        unattempted = [m.pk for m in messages[len(published) + 1 :]]
+        if unattempted:
+            LeadOutboxMessage.objects.filter(pk__in=unattempted).update(
+                available_at=now
+            )
+    return RelayResult(published=len(published), failed=int(failed is not None))
+
+
+def drain_lead_outbox(batch_size: int = RELAY_BATCH_SIZE) -> RelayResult:
+    """Relay batches until the outbox has no due messages or a publish fails."""
+    published = 0
+    while True:
+        result = relay_lead_outbox(batch_size=batch_size)
+        published += result.published
+        if result.failed or result.published < batch_size:
+            return RelayResult(published=published, failed=result.failed)
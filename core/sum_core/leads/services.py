@@ -52,6 +52,7 @@ def create_lead_from_submission(
     source_page: Page | None = None,
     attribution: AttributionData | None = None,
     post_create_hook: Callable[[Lead], None] | None = None,
+    initial_status: Mapping[str, str] | None = None,
 ) -> Lead:
     """
     Create and persist a Lead as the first durable step.
@@ -69,6 +70,8 @@ def create_lead_from_submission(
         source_page: Wagtail page where form was submitted (optional)
         attribution: Attribution data containing UTMs/URLs (optional)
         post_create_hook: Callback invoked after Lead is persisted (optional)
+        initial_status: Notification channel status/last-error field values,
+            written with the INSERT instead of a follow-up save (optional)
 
     Returns:
         The created Lead instance
@@ -131,6 +134,8 @@ def create_lead_from_submission(
         # Derived fields
         lead_source=lead_source,
         lead_source_detail=lead_source_detail,
+        # Notification channel statuses
+        **dict(initial_status or {}),
     )
 
     # Invoke hook after Lead is safely persisted
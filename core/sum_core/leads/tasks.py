@@ -3,7 +3,7 @@ Name: Lead async tasks
 Path: core/sum_core/leads/tasks.py
 Purpose: Send lead notifications and webhooks asynchronously with retries and status tracking.
 Family: Leads, forms, integrations, ops visibility.
-Dependencies: Celery, Django email backend, HTTP client, Lead model.
+Dependencies: Celery, Django email backend, HTTP client, Lead model, sum_core.forms.tasks.
 """
 
 from __future__ import annotations
@@ -17,6 +17,7 @@ from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.utils import timezone
+from sum_core.forms.uploads import UPLOAD_HOOKS_CHANNEL
 from sum_core.ops.sentry import set_sentry_context
 
 if TYPE_CHECKING:
@@ -730,3 +731,152 @@ def send_zapier_webhook(
             "attempts": attempt_count,
         },
     )
+
+
+# =============================================================================
+# Submission fan-out
+# =============================================================================
+
+# Dynamic form channel -> sum_core.forms.tasks task queued for it. Each task
+# takes (lead_id, form_definition_id, request_id=...).
+FORM_CHANNELS = {
+    "form_notification": "send_form_notification",
+    "auto_reply": "send_auto_reply",
+    "form_webhook": "send_webhook",
+    UPLOAD_HOOKS_CHANNEL: "process_form_uploads",
+}
+
+
+def record_queue_failures(lead_id: int, errors: dict[str, str]) -> dict[str, str]:
+    """
+    Mark channels whose task could not be queued as failed, in one UPDATE.
+
+    Args:
+        lead_id: The ID of the Lead.
+        errors: Map of channel (status field prefix) to queueing error.
+
+    Returns:
+        The status/last-error field values written.
+    """
+    from sum_core.leads.models import EmailStatus, Lead, WebhookStatus, ZapierStatus
+
+    failed_status = {
+        "email": EmailStatus.FAILED,
+        "webhook": WebhookStatus.FAILED,
+        "zapier": ZapierStatus.FAILED,
+        "form_notification": EmailStatus.FAILED,
+        "auto_reply": EmailStatus.FAILED,
+        "form_webhook": WebhookStatus.FAILED,
+    }
+    fields: dict[str, str] = {}
+    for channel, error in errors.items():
+        if channel not in failed_status:
+            # No status field (e.g. upload hooks); the failure is only logged.
+            continue
+        fields[f"{channel}_status"] = failed_status[channel]
+        fields[f"{channel}_last_error"] = f"Failed to queue task: {error[:500]}"
+    if fields:
+        Lead.objects.filter(pk=lead_id).update(**fields)
+    return fields
+
+
+def dispatch_lead_side_effects(
+    lead_id: int,
+    site_id: int,
+    request_id: str | None = None,
+    form_definition_id: int | None = None,
+    form_channels: list[str] | tuple[str, ...] = (),
+) -> dict[str, str]:
+    """
+    Queue each notification channel's task for a lead.
+
+    Returns:
+        Map of channel to error for tasks that could not be queued.
+    """
+    from sum_core.forms import tasks as form_tasks
+
+    dispatches = {
+        "email": lambda: send_lead_notification.delay(
+            lead_id, request_id=request_id, site_id=site_id
+        ),
+        "webhook": lambda: send_lead_webhook.delay(lead_id, request_id=request_id),
+        # M4-007
+        "zapier": lambda: send_zapier_webhook.delay(
+            lead_id, site_id, request_id=request_id
+        ),
+    }
+    if form_definition_id is not None:
+        for channel in form_channels:
+            task = getattr(form_tasks, FORM_CHANNELS[channel])
+            dispatches[channel] = lambda task=task: task.delay(
+                lead_id, form_definition_id, request_id=request_id
+            )
+
+    errors: dict[str, str] = {}
+    for channel, dispatch in dispatches.items():
+        try:
+            dispatch()
+        except Exception as exc:
+            logger.exception(
+                "Failed to queue lead task",
+                extra={
+                    "lead_id": lead_id,
+                    "channel": channel,
+                    "request_id": request_id or "-",
+                },
+            )
+            errors[channel] = str(exc)
+    return errors
+
+
+@shared_task(ignore_result=True)
+def process_lead_side_effects(
+    lead_id: int,
+    site_id: int,
+    request_id: str | None = None,
+    form_definition_id: int | None = None,
+    form_channels: list[str] | None = None,
+) -> None:
+    """
+    Fan out a submission's notification tasks from the worker.
+
+    The lead outbox relay publishes this single message; the worker then
+    queues each channel's task, which keeps its own retries and status fields
+    on Lead.
+
+    Args:
+        lead_id: The ID of the Lead that was submitted.
+        site_id: The ID of the Wagtail Site the form was submitted on.
+        request_id: Optional correlation ID from originating request.
+        form_definition_id: The dynamic form, if the submission came from one.
+        form_channels: Dynamic form channels (keys of FORM_CHANNELS) to queue.
+    """
+    set_sentry_context(
+        request_id=request_id,
+        lead_id=lead_id,
+        site_id=site_id,
+        task="process_lead_side_effects",
+    )
+    errors = dispatch_lead_side_effects(
+        lead_id,
+        site_id,
+        request_id=request_id,
+        form_definition_id=form_definition_id,
+        form_channels=form_channels or (),
+    )
+    record_queue_failures(lead_id, errors)
+
+
+@shared_task(ignore_result=True)
+def relay_lead_outbox_task(batch_size: int | None = None) -> int:
+    """
+    Publish due lead outbox messages (for Celery beat).
+
+    Deployments without beat run ``manage.py relay_lead_outbox --loop`` instead.
+
+    Returns:
+        The number of messages published.
+    """
+    from sum_core.leads.outbox import RELAY_BATCH_SIZE, drain_lead_outbox
+
+    return drain_lead_outbox(batch_size=batch_size or RELAY_BATCH_SIZE).published
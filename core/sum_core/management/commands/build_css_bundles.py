@@ -0,0 +1,34 @@
+"""
+Name: Build CSS Bundles Management Command
+Path: core/sum_core/management/commands/build_css_bundles.py
+Purpose: Write the per-page component stylesheet bundles for all live pages.
+Family: Django management command.
+Dependencies: Django, Wagtail, sum_core.assets.bundles, sum_core.assets.css.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from sum_core.assets.bundles import write_bundle
+from sum_core.assets.css import get_bundle, get_page_partials
+from wagtail.models import Page
+
+
+class Command(BaseCommand):
+    help = "Write content-hashed CSS bundles for the block sets used by live pages"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        partial_sets = {
+            get_page_partials(page)
+            for page in Page.objects.live().specific().iterator()
+        }
+        written = sum(
+            write_bundle(get_bundle(partials)) for partials in sorted(partial_sets)
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {written} new bundle(s) for {len(partial_sets)} stylesheet set(s)."
+            )
+        )
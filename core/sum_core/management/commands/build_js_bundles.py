@@ -0,0 +1,26 @@
+"""
+Name: Build JS Bundles Management Command
+Path: core/sum_core/management/commands/build_js_bundles.py
+Purpose: Write the content-hashed core and analytics script bundles.
+Family: Django management command.
+Dependencies: Django, sum_core.assets.bundles, sum_core.assets.js.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from sum_core.assets.bundles import write_bundle
+from sum_core.assets.js import JS_BUNDLES, get_js_bundle
+
+
+class Command(BaseCommand):
+    help = "Write the content-hashed sum_core JavaScript bundles"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for label in JS_BUNDLES:
+            bundle = get_js_bundle(label)
+            status = "Wrote" if write_bundle(bundle) else "Kept"
+            self.stdout.write(f"{status} {bundle.name}")
+        self.stdout.write(self.style.SUCCESS(f"{len(JS_BUNDLES)} bundle(s) ready."))
@@ -0,0 +1,35 @@
+"""
+Name: Export Page Snapshots Management Command
+Path: core/sum_core/management/commands/export_page_snapshots.py
+Purpose: Render every live public page to the static HTML snapshot tree.
+Family: Django management command.
+Dependencies: Django, sum_core.pages.snapshots.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from sum_core.pages.snapshots import export_all_page_snapshots, get_snapshot_root
+
+
+class Command(BaseCommand):
+    help = "Write static HTML snapshots of live pages to PAGE_SNAPSHOT_ROOT"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete snapshots that were not rewritten by this run.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        root = get_snapshot_root()
+        if root is None:
+            self.stdout.write("PAGE_SNAPSHOT_ROOT is not set; nothing to export.")
+            return
+        written = export_all_page_snapshots(prune=options["prune"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {written} page snapshot(s) to {root}.")
+        )
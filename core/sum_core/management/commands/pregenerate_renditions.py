@@ -0,0 +1,51 @@
+"""
+Name: Pre-generate Renditions Management Command
+Path: core/sum_core/management/commands/pregenerate_renditions.py
+Purpose: Backfill the image renditions used by sum_core templates for all live pages.
+Family: Django management command.
+Dependencies: Django, Wagtail, sum_core.pages.renditions, sum_core.pages.tasks.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from sum_core.pages.mixins import RenditionPrefetchMixin
+from sum_core.pages.renditions import pregenerate_page_renditions_sync
+from sum_core.pages.tasks import pregenerate_page_renditions
+from wagtail.models import Page
+
+
+class Command(BaseCommand):
+    help = "Generate the image renditions used by page templates for all live pages"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Generate renditions in this process instead of queueing Celery tasks.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        pages = [
+            page
+            for page in Page.objects.live().specific().iterator()
+            if isinstance(page, RenditionPrefetchMixin)
+        ]
+
+        if options["sync"]:
+            generated = sum(pregenerate_page_renditions_sync(page) for page in pages)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Ensured {generated} rendition(s) across {len(pages)} page(s)."
+                )
+            )
+            return
+
+        for page in pages:
+            pregenerate_page_renditions.delay(page.pk)
+        self.stdout.write(
+            self.style.SUCCESS(f"Queued rendition tasks for {len(pages)} page(s).")
+        )
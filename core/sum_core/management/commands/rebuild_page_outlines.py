@@ -0,0 +1,22 @@
+"""
+Name: Rebuild Page Outlines Management Command
+Path: core/sum_core/management/commands/rebuild_page_outlines.py
+Purpose: Store page outlines for all live pages (backfill after upgrades).
+Family: Django management command.
+Dependencies: Django, sum_core.pages.outline.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from sum_core.pages.outline import rebuild_page_outlines
+
+
+class Command(BaseCommand):
+    help = "Store page outlines (FAQ, headings, word count) for all live pages"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        built = rebuild_page_outlines()
+        self.stdout.write(self.style.SUCCESS(f"Built outlines for {built} page(s)."))
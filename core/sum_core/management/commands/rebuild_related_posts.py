@@ -0,0 +1,24 @@
+"""
+Name: Rebuild Related Posts Management Command
+Path: core/sum_core/management/commands/rebuild_related_posts.py
+Purpose: Rebuild the precomputed related-posts index for all live blog posts.
+Family: Django management command.
+Dependencies: Django, sum_core.pages.related.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from sum_core.pages.related import rebuild_related_posts_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild related posts and 'more in category' lists for all blog posts"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        indexed = rebuild_related_posts_index()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt related posts index for {indexed} post(s).")
+        )
@@ -0,0 +1,24 @@
+"""
+Name: Rebuild Search Index Management Command
+Path: core/sum_core/management/commands/rebuild_search_index.py
+Purpose: Rebuild the site search index from all live searchable pages.
+Family: Django management command.
+Dependencies: Django, sum_core.pages.search_index.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from sum_core.pages.search_index import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the site search index for all live searchable pages"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        indexed = rebuild_search_index()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt search index for {indexed} page(s).")
+        )
@@ -0,0 +1,57 @@
+"""
+Name: Relay Lead Outbox Management Command
+Path: core/sum_core/management/commands/relay_lead_outbox.py
+Purpose: Publish pending lead side effects from the outbox to the Celery broker.
+Family: Django management command.
+Dependencies: Django, sum_core.leads.outbox.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from sum_core.leads.outbox import RELAY_BATCH_SIZE, drain_lead_outbox
+
+
+class Command(BaseCommand):
+    help = "Publish pending lead side effects from the outbox to the broker"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep relaying, polling every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait between polls when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=RELAY_BATCH_SIZE,
+            help="Messages published per transaction.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        batch_size = options["batch_size"]
+        if not options["loop"]:
+            result = drain_lead_outbox(batch_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Published {result.published} outbox message(s)"
+                    + (" (broker unavailable, will retry)." if result.failed else ".")
+                )
+            )
+            return
+
+        self.stdout.write(f"Relaying lead outbox every {options['interval']}s.")
+        while True:
+            close_old_connections()
+            drain_lead_outbox(batch_size=batch_size)
+            time.sleep(options["interval"])
@@ -9,11 +9,13 @@ Key Functions:
     - get_nav_cache_key(site_id, nav_type): Get a single cache key
     - get_nav_cache_keys(site_id): Get all nav cache keys for a site
     - invalidate_nav_cache(site_id, types): Invalidate specific or all nav cache keys
+    - get_nav_version(site_id): Timestamp of the last invalidation (HTTP validators)
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from django.core.cache import cache
@@ -34,6 +36,7 @@ logger = logging.getLogger(__name__)
 
 CACHE_KEY_PREFIX = "nav"
 NAV_TYPES = frozenset({"header", "footer", "sticky"})
+NAV_VERSION_KEY_PREFIX = "nav_version"
 
 
 # =============================================================================
@@ -72,6 +75,31 @@ def get_nav_cache_keys(site_id: int) -> list[str]:
     ]
 
 
+def get_nav_version(site_id: int) -> float:
+    """
+    Get the navigation/site settings version for a site.
+
+    The version is the UNIX time of the last invalidation. If the key has been
+    evicted it restarts at the current time, so it never moves backwards.
+
+    Args:
+        site_id: The site ID
+
+    Returns:
+        Version timestamp in seconds
+    """
+    key = f"{NAV_VERSION_KEY_PREFIX}:{site_id}"
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time(), timeout=None)
+        version = cache.get(key) or time.time()
+    return version
+
+
+def _bump_nav_version(site_id: int) -> None:
+    cache.set(f"{NAV_VERSION_KEY_PREFIX}:{site_id}", time.time(), timeout=None)
+
+
 def invalidate_nav_cache(site_id: int, *, types: set[str] | None = None) -> None:
     """
     Invalidate navigation cache keys for a site.
@@ -95,6 +123,7 @@ def invalidate_nav_cache(site_id: int, *, types: set[str] | None = None) -> None
     if keys:
         try:
             cache.delete_many(keys)
+            _bump_nav_version(site_id)
             logger.debug("Invalidated nav cache keys for site %s: %s", site_id, keys)
         except Exception:
             # Log but don't fail if cache deletion fails
@@ -3,7 +3,8 @@ Name: health
 Path: core/sum_core/ops/health.py
 Purpose: Runtime health checks for monitoring (/health/).
 Family: Ops/Monitoring (Milestone 4)
-Dependencies: Django DB connection, cache backend, optional Celery app config
+Dependencies: Django DB connection, cache backend, optional Celery app config,
+sum_core.leads.models.LeadOutboxMessage
 
 Health contract (authoritative):
 - Overall `status` is one of: `ok`, `degraded`, `unhealthy`
@@ -14,7 +15,10 @@ Health contract (authoritative):
 
 Severity rules (current baseline):
 - Critical checks: DB, cache. If either fails => overall `unhealthy`.
-- Non-critical check: Celery. If it fails (and is configured) => overall `degraded`.
+- Non-critical checks: Celery, lead outbox. If either fails => overall `degraded`.
+  The lead outbox check fails when messages are older than
+  `LEAD_OUTBOX_STALE_MINUTES` (default 10): nothing relays them to Celery unless
+  the outbox relay service or Celery beat runs, and their leads get no notifications.
 """
 
 from __future__ import annotations
@@ -22,11 +26,13 @@ from __future__ import annotations
 import os
 import time
 from dataclasses import asdict, dataclass
+from datetime import timedelta
 from typing import Any, cast
 
 from django.conf import settings
 from django.core.cache import cache
 from django.db import connection
+from django.utils import timezone
 from kombu import Connection
 
 
@@ -97,18 +103,39 @@ def check_celery() -> CheckResult:
         return CheckResult(status="fail", detail=str(e))
 
 
+def check_lead_outbox() -> CheckResult:
+    from sum_core.leads.models import LeadOutboxMessage
+
+    stale_minutes = getattr(settings, "LEAD_OUTBOX_STALE_MINUTES", 10)
+    cutoff = timezone.now() - timedelta(minutes=stale_minutes)
+    try:
+        stale = LeadOutboxMessage.objects.filter(created_at__lt=cutoff).count()
+    except Exception as e:
+        return CheckResult(status="fail", detail=str(e))
+    if stale:
+        return CheckResult(
+            status="fail",
+            detail=(
+                f"{stale} lead outbox message(s) older than {stale_minutes} minutes; "
+                "is the outbox relay running?"
+            ),
+        )
+    return CheckResult(status="ok")
+
+
 def get_health_status() -> dict[str, Any]:
     checks = {
         "db": check_db(),
         "cache": check_cache(),
         "celery": check_celery(),
+        "lead_outbox": check_lead_outbox(),
     }
 
     # Determine overall status.
     # NOTE: checks expose "ok"/"fail", while overall status uses the broader contract:
     # ok/degraded/unhealthy (see module docstring).
     critical_checks = ("db", "cache")
-    non_critical_checks = ("celery",)
+    non_critical_checks = ("celery", "lead_outbox")
 
     is_unhealthy = any(checks[name].status == "fail" for name in critical_checks)
     is_degraded = any(checks[name].status == "fail" for name in non_critical_checks)
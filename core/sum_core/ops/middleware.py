@@ -12,6 +12,7 @@ import contextvars
 import uuid
 from collections.abc import Callable
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpRequest, HttpResponse
 
 # Context variable to store request_id for the current request context
@@ -42,30 +43,53 @@ class CorrelationIdMiddleware:
     - Stores the ID on request.request_id
     - Makes ID available via context variable for logging
     - Sets X-Request-ID response header
+
+    Sync and async capable, so it does not force an ASGI request into a thread.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            # Let Django's ASGI handler call this middleware without a thread.
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # Get or generate request ID
-        request_id = request.headers.get(REQUEST_ID_HEADER)
-        if not request_id:
-            request_id = str(uuid.uuid4())
-
-        # Store on request object for direct access
-        request.request_id = request_id
-
-        # Store in context variable for logging filter access
-        token = _request_id_var.set(request_id)
+        if self.async_mode:
+            return self.__acall__(request)
 
+        token = self._start(request)
         try:
             response = self.get_response(request)
 
             # Set response header
-            response[REQUEST_ID_HEADER] = request_id
+            response[REQUEST_ID_HEADER] = request.request_id
 
             return response
         finally:
             # Reset context variable after request completes
             _request_id_var.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = self._start(request)
+        try:
+            response = await self.get_response(request)
+            response[REQUEST_ID_HEADER] = request.request_id
+            return response
+        finally:
+            _request_id_var.reset(token)
+
+    def _start(self, request: HttpRequest) -> contextvars.Token[str | None]:
+        # Get or generate request ID
+        request_id = request.headers.get(REQUEST_ID_HEADER)
+        if not request_id:
+            request_id = str(uuid.uuid4())
+
+        # Store on request object for direct access
+        request.request_id = request_id
+
+        # Store in context variable for logging filter access
+        return _request_id_var.set(request_id)
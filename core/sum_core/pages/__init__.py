@@ -41,6 +41,10 @@ def __getattr__(name: str):
         from sum_core.pages.legal import LegalPage
 
         return LegalPage
+    if name == "SearchPage":
+        from sum_core.pages.search import SearchPage
+
+        return SearchPage
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -52,6 +56,7 @@ __all__ = [
     "BlogIndexPage",
     "BlogPostPage",
     "LegalPage",
+    "SearchPage",
 ]
 
 default_app_config = "sum_core.pages.apps.PagesConfig"
@@ -20,5 +20,11 @@ class PagesConfig(AppConfig):
     verbose_name: str = "SUM Core Pages"
 
     def ready(self) -> None:
-        """Import cache module to register signal handlers."""
+        """Import modules that register signal handlers (caches, indexes, outlines, renditions,
+        snapshots)."""
         import sum_core.pages.cache  # noqa: F401
+        import sum_core.pages.outline  # noqa: F401
+        import sum_core.pages.related  # noqa: F401
+        import sum_core.pages.renditions  # noqa: F401
+        import sum_core.pages.search_index  # noqa: F401
+        import sum_core.pages.snapshots  # noqa: F401
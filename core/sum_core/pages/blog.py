@@ -22,7 +22,12 @@ from sum_core.pages.cache import (
     BLOG_CATEGORIES_CACHE_TTL_SECONDS,
     get_blog_categories_cache_key,
 )
-from sum_core.pages.mixins import BreadcrumbMixin, OpenGraphMixin, SeoFieldsMixin
+from sum_core.pages.mixins import (
+    BreadcrumbMixin,
+    OpenGraphMixin,
+    RenditionPrefetchMixin,
+    SeoFieldsMixin,
+)
 from wagtail.admin.panels import (
     FieldPanel,
     MultiFieldPanel,
@@ -119,6 +124,10 @@ class BlogIndexPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
     # v0.6 rendering contract: themes own page templates under theme/
     template: str = "theme/blog_index_page.html"
 
+    # Listings change with every post, so keep shared copies briefly.
+    cache_max_age = 30
+    cache_stale_while_revalidate = 60
+
     class Meta:
         verbose_name = "Blog Index Page"
         verbose_name_plural = "Blog Index Pages"
@@ -224,7 +233,9 @@ class BlogIndexPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
         return context
 
 
-class BlogPostPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
+class BlogPostPage(
+    SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, RenditionPrefetchMixin, Page
+):
     """
     Individual blog post/article.
 
@@ -305,11 +316,52 @@ class BlogPostPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
     subpage_types: list[str] = []
     template: str = "theme/blog_post_page.html"
 
+    # Renditions requested by the post hero and post card templates.
+    image_renditions = {
+        "featured_image": ("fill-1600x900|format-webp", "fill-720x480|format-webp")
+    }
+
     def save(self, *args, **kwargs):
         """Auto-calculate reading time before saving."""
         self.reading_time = self.calculate_reading_time()
         super().save(*args, **kwargs)
 
+    def get_context(self, request, *args, **kwargs):
+        """Add precomputed related posts and same-category posts to context."""
+        context = super().get_context(request, *args, **kwargs)
+        context["related_posts"] = self.get_related_posts()
+        context["more_in_category"] = self.get_more_in_category()
+        return context
+
+    def _get_linked_posts(self, kind: str) -> models.QuerySet[BlogPostPage]:
+        return (
+            BlogPostPage.objects.live()
+            .public()
+            .filter(
+                related_to_links__post=self,
+                related_to_links__kind=kind,
+                published_date__lte=timezone.now(),
+            )
+            .select_related("category", "featured_image")
+            .order_by("related_to_links__rank")
+        )
+
+    def get_related_posts(self) -> models.QuerySet[BlogPostPage]:
+        """
+        Return the precomputed most similar posts (see sum_core.pages.related).
+
+        Lists are rebuilt in a Celery task on publish; no scoring happens here.
+        """
+        from sum_core.pages.related import RelatedBlogPost
+
+        return self._get_linked_posts(RelatedBlogPost.Kind.RELATED)
+
+    def get_more_in_category(self) -> models.QuerySet[BlogPostPage]:
+        """Return the precomputed most similar posts from the same category."""
+        from sum_core.pages.related import RelatedBlogPost
+
+        return self._get_linked_posts(RelatedBlogPost.Kind.CATEGORY)
+
     def calculate_reading_time(self) -> int:
         """
         Calculate reading time based on word count.
@@ -1,8 +1,8 @@
 """
-Name: Blog Category Cache
+Name: Page Listing Cache
 Path: core/sum_core/pages/cache.py
-Purpose: Cache helpers and signal-based invalidation for blog category listings.
-Family: Pages, Blog.
+Purpose: Cache helpers and signal-based invalidation for blog category and service listings.
+Family: Pages, Blog, Services.
 Dependencies: django.core.cache, django.db.models.signals, wagtail.signals
 """
 
@@ -11,30 +11,80 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from wagtail.signals import page_published, page_unpublished
+from wagtail.images import get_image_model
+from wagtail.models import Page, PageViewRestriction
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+)
 
 if TYPE_CHECKING:
     from sum_core.pages.blog import BlogIndexPage
+    from sum_core.pages.services import ServiceIndexPage
 
 BLOG_CATEGORIES_CACHE_PREFIX = "blog_categories"
 BLOG_CATEGORIES_VERSION_KEY = "blog_categories_version"
 BLOG_CATEGORIES_CACHE_TTL_SECONDS = 3600
 
+SERVICE_LISTING_CACHE_PREFIX = "service_listing"
+SERVICE_LISTING_VERSION_PREFIX = "service_listing_version"
+SERVICE_LISTING_CACHE_TTL_SECONDS = 3600
+# Bump when ServiceListingItem's fields change so old cached tuples are ignored.
+SERVICE_LISTING_FORMAT_VERSION = 2
+
 
 def get_blog_categories_cache_key(blog_index: BlogIndexPage) -> str:
     version = cache.get(BLOG_CATEGORIES_VERSION_KEY) or "0"
     return f"{BLOG_CATEGORIES_CACHE_PREFIX}:{blog_index.pk}:{blog_index.path}:{version}"
 
 
-def bump_blog_categories_cache_version() -> None:
-    if cache.add(BLOG_CATEGORIES_VERSION_KEY, 1):
+def _bump_version(key: str) -> None:
+    if cache.add(key, 1):
         return
     try:
-        cache.incr(BLOG_CATEGORIES_VERSION_KEY)
+        cache.incr(key)
     except ValueError:
-        cache.set(BLOG_CATEGORIES_VERSION_KEY, 1)
+        cache.set(key, 1)
+
+
+def bump_blog_categories_cache_version() -> None:
+    _bump_version(BLOG_CATEGORIES_VERSION_KEY)
+
+
+def _service_listing_version_key(index_path: str) -> str:
+    return f"{SERVICE_LISTING_VERSION_PREFIX}:{index_path}"
+
+
+def get_service_listing_cache_key(service_index: ServiceIndexPage) -> str:
+    version = cache.get(_service_listing_version_key(service_index.path)) or "0"
+    return (
+        f"{SERVICE_LISTING_CACHE_PREFIX}:v{SERVICE_LISTING_FORMAT_VERSION}:"
+        f"{service_index.pk}:{service_index.path}:{version}"
+    )
+
+
+def bump_service_listing_cache_version(index_path: str) -> None:
+    """Invalidate the cached listing of the service index at ``index_path``."""
+    _bump_version(_service_listing_version_key(index_path))
+
+
+def _parent_path(page: Page) -> str:
+    return page.path[: -Page.steplen]
+
+
+def _bump_service_listings_around(page: Page) -> None:
+    """Bump the index listing ``page`` and any service index at or below it."""
+    from sum_core.pages.services import ServiceIndexPage
+
+    bump_service_listing_cache_version(_parent_path(page))
+    for path in ServiceIndexPage.objects.filter(path__startswith=page.path).values_list(
+        "path", flat=True
+    ):
+        bump_service_listing_cache_version(path)
 
 
 @receiver(post_save, dispatch_uid="blog_categories_cache_category_save")
@@ -64,14 +114,64 @@ def _on_blog_post_delete(sender, instance, **kwargs) -> None:
 @receiver(page_published, dispatch_uid="blog_categories_cache_page_published")
 def _on_page_published(sender, instance, **kwargs) -> None:
     from sum_core.pages.blog import BlogIndexPage, BlogPostPage
+    from sum_core.pages.services import ServicePage
 
     if isinstance(instance, BlogIndexPage | BlogPostPage):
         bump_blog_categories_cache_version()
+    elif isinstance(instance, ServicePage):
+        bump_service_listing_cache_version(_parent_path(instance))
 
 
 @receiver(page_unpublished, dispatch_uid="blog_categories_cache_page_unpublished")
 def _on_page_unpublished(sender, instance, **kwargs) -> None:
     from sum_core.pages.blog import BlogIndexPage, BlogPostPage
+    from sum_core.pages.services import ServicePage
 
     if isinstance(instance, BlogIndexPage | BlogPostPage):
         bump_blog_categories_cache_version()
+    elif isinstance(instance, ServicePage):
+        bump_service_listing_cache_version(_parent_path(instance))
+
+
+@receiver(post_delete, dispatch_uid="service_listing_cache_service_delete")
+def _on_service_delete(sender, instance, **kwargs) -> None:
+    from sum_core.pages.services import ServicePage
+
+    if sender is ServicePage:
+        bump_service_listing_cache_version(_parent_path(instance))
+
+
+@receiver(post_page_move, dispatch_uid="service_listing_cache_page_move")
+def _on_page_move(sender, instance, parent_page_before, parent_page_after, **kwargs):
+    from sum_core.pages.services import ServicePage
+
+    if isinstance(instance, ServicePage):
+        bump_service_listing_cache_version(parent_page_before.path)
+        bump_service_listing_cache_version(parent_page_after.path)
+
+
+@receiver(page_slug_changed, dispatch_uid="service_listing_cache_slug_changed")
+def _on_page_slug_changed(sender, instance, **kwargs) -> None:
+    # Listed URLs below the renamed page change.
+    _bump_service_listings_around(instance)
+
+
+@receiver(post_save, dispatch_uid="service_listing_cache_restriction_save")
+@receiver(post_delete, dispatch_uid="service_listing_cache_restriction_delete")
+def _on_view_restriction_change(sender, instance, **kwargs) -> None:
+    if sender is PageViewRestriction:
+        _bump_service_listings_around(instance.page)
+
+
+@receiver(post_save, dispatch_uid="service_listing_cache_image_save")
+@receiver(pre_delete, dispatch_uid="service_listing_cache_image_delete")
+def _on_image_change(sender, instance, **kwargs) -> None:
+    # Cached listings carry the featured image and its renditions.
+    if sender is not get_image_model():
+        return
+    from sum_core.pages.services import ServicePage
+
+    for path in ServicePage.objects.filter(featured_image_id=instance.pk).values_list(
+        "path", flat=True
+    ):
+        bump_service_listing_cache_version(path[: -Page.steplen])
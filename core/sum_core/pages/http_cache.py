@@ -0,0 +1,204 @@
+"""
+Name: Page HTTP Caching
+Path: core/sum_core/pages/http_cache.py
+Purpose: ETag/Last-Modified validators, 304 responses and per-page-type Cache-Control.
+Family: Pages, performance.
+Dependencies: django.core.cache, django.utils.cache, sum_core.navigation.cache,
+Wagtail Site.
+
+``SeoFieldsMixin.serve`` uses these helpers for anonymous GET/HEAD requests.
+Validators combine the page's ``last_published_at`` with the site's
+navigation/settings version (bumped when navigation, branding settings or any
+page in the site is published, unpublished or deleted), the content version and
+the sum_core version, so a conditional request is answered with 304 before the
+page is rendered.
+
+The content version covers what Celery tasks write after a publish has already
+bumped the site version: the related-posts index, the search index and
+pre-generated renditions. Each task bumps its key with ``bump_content_version``
+once its writes are committed, so pages served in between revalidate again.
+
+Rendered responses get ``Cache-Control: public, max-age=..., stale-while-revalidate=...``
+from the page type's ``cache_max_age``/``cache_stale_while_revalidate``
+attributes, overridable per model with ``PAGE_CACHE_CONTROL``::
+
+    PAGE_CACHE_CONTROL = {
+        "sum_core_pages.legalpage": {"max_age": 86400, "stale_while_revalidate": 86400},
+    }
+
+Responses that depend on the visitor (CSRF token, session access, cookies or
+``Vary: Cookie``) are marked ``private, no-cache`` instead, so shared caches
+never store them and browsers revalidate with the validators.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import (
+    get_conditional_response,
+    has_vary_header,
+    patch_cache_control,
+)
+from django.utils.http import http_date
+from sum_core import __version__
+from sum_core.navigation.cache import get_nav_version
+from wagtail.models import Page, Site
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+# Versions of content written off the request path (UNIX time of the last write).
+RELATED_POSTS_VERSION_KEY = "content_version:related_posts"
+SEARCH_INDEX_VERSION_KEY = "content_version:search_index"
+RENDITIONS_VERSION_KEY = "content_version:renditions"
+CONTENT_VERSION_KEYS = (
+    RELATED_POSTS_VERSION_KEY,
+    SEARCH_INDEX_VERSION_KEY,
+    RENDITIONS_VERSION_KEY,
+)
+
+
+@dataclass(frozen=True)
+class PageValidators:
+    etag: str
+    last_modified: float
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int
+    stale_while_revalidate: int
+
+
+def get_cache_policy(page: Page) -> CachePolicy | None:
+    """Return the page type's Cache-Control policy, or None to send none."""
+    overrides = getattr(settings, "PAGE_CACHE_CONTROL", {}).get(page._meta.label_lower)
+    max_age = getattr(page, "cache_max_age", None)
+    stale_while_revalidate = getattr(page, "cache_stale_while_revalidate", 0)
+    if overrides is not None:
+        max_age = overrides.get("max_age", max_age)
+        stale_while_revalidate = overrides.get(
+            "stale_while_revalidate", stale_while_revalidate
+        )
+    if max_age is None:
+        return None
+    return CachePolicy(int(max_age), int(stale_while_revalidate or 0))
+
+
+def bump_content_version(key: str) -> None:
+    """Record that the content tracked by ``key`` changed."""
+    cache.set(key, time.time(), timeout=None)
+
+
+def get_content_version() -> float:
+    """
+    Return the latest of the content versions.
+
+    Evicted keys restart at the current time, so the version never moves
+    backwards.
+    """
+    versions = cache.get_many(CONTENT_VERSION_KEYS)
+    missing = [key for key in CONTENT_VERSION_KEYS if key not in versions]
+    if missing:
+        now = time.time()
+        for key in missing:
+            cache.add(key, now, timeout=None)
+        versions = cache.get_many(CONTENT_VERSION_KEYS)
+    return max(versions.values(), default=time.time())
+
+
+def is_cacheable_request(request: HttpRequest) -> bool:
+    """Only anonymous GET/HEAD page views (not previews) get validators."""
+    if request.method not in CACHEABLE_METHODS or getattr(request, "is_preview", False):
+        return False
+    # Without a session cookie the visitor is anonymous; checking request.user
+    # would load the session and add Vary: Cookie to every page.
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return True
+    user = getattr(request, "user", None)
+    return not (user is not None and user.is_authenticated)
+
+
+def get_page_validators(page: Page, request: HttpRequest) -> PageValidators | None:
+    """Return the page's validators for ``request``, or None if not cacheable."""
+    if not is_cacheable_request(request) or page.last_published_at is None:
+        return None
+    site = Site.find_for_request(request)
+    site_version = get_nav_version(site.pk) if site is not None else 0.0
+    content_version = get_content_version()
+    published = page.last_published_at.timestamp()
+    digest = hashlib.sha256(
+        f"{page.pk}:{published}:{site_version}:{content_version}:{__version__}".encode()
+    ).hexdigest()[:20]
+    # Weak: the HTML is equivalent, not byte-identical (e.g. CSRF token masks).
+    return PageValidators(
+        etag=f'W/"{digest}"',
+        last_modified=max(published, site_version, content_version),
+    )
+
+
+def get_not_modified_response(
+    request: HttpRequest, validators: PageValidators
+) -> HttpResponse | None:
+    """Return a 304 if the request's conditional headers match, else None."""
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=int(validators.last_modified)
+    )
+    if response is not None:
+        response.headers["Last-Modified"] = http_date(validators.last_modified)
+    return response
+
+
+def _varies_by_visitor(request: HttpRequest, response: HttpResponse) -> bool:
+    session = getattr(request, "session", None)
+    return bool(
+        response.cookies
+        or has_vary_header(response, "Cookie")
+        or request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        or (session is not None and session.accessed)
+    )
+
+
+def _set_cache_control(
+    page: Page, request: HttpRequest, response: HttpResponse
+) -> HttpResponse:
+    if response.status_code != 200 or response.has_header("Cache-Control"):
+        return response
+    if _varies_by_visitor(request, response):
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+    policy = get_cache_policy(page)
+    if policy is not None:
+        directives: dict[str, Any] = {"public": True, "max_age": policy.max_age}
+        if policy.stale_while_revalidate:
+            directives["stale_while_revalidate"] = policy.stale_while_revalidate
+        patch_cache_control(response, **directives)
+    return response
+
+
+def apply_cache_headers(
+    page: Page,
+    request: HttpRequest,
+    response: HttpResponse,
+    validators: PageValidators,
+) -> HttpResponse:
+    """Add validators and Cache-Control to a freshly served page response."""
+    if response.status_code != 200:
+        return response
+    response.headers.setdefault("ETag", validators.etag)
+    response.headers.setdefault("Last-Modified", http_date(validators.last_modified))
+    if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+        # Whether the page used the CSRF token or session is known only once
+        # its template has been rendered.
+        response.add_post_render_callback(
+            lambda rendered: _set_cache_control(page, request, rendered)
+        )
+        return response
+    return _set_cache_control(page, request, response)
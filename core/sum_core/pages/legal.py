@@ -57,6 +57,10 @@ class LegalPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
     # v0.6 rendering contract: themes own page templates under theme/
     template: str = "theme/legal_page.html"
 
+    # Legal text rarely changes; let browsers and shared caches keep it a day.
+    cache_max_age = 86400
+    cache_stale_while_revalidate = 86400
+
     class Meta:
         verbose_name = "Legal Page"
         verbose_name_plural = "Legal Pages"
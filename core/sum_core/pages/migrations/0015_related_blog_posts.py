@@ -0,0 +1,88 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sum_core_pages", "0014_merge_0013_blogindexpage_fields_0013_legalpage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogPostTermVector",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="term_vector",
+                        serialize=False,
+                        to="sum_core_pages.blogpostpage",
+                    ),
+                ),
+                ("terms", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Blog post term vector",
+                "verbose_name_plural": "Blog post term vectors",
+            },
+        ),
+        migrations.CreateModel(
+            name="RelatedBlogPost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("related", "Related"),
+                            ("category", "More in category"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("score", models.FloatField(default=0.0)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_post_links",
+                        to="sum_core_pages.blogpostpage",
+                    ),
+                ),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_to_links",
+                        to="sum_core_pages.blogpostpage",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Related blog post",
+                "verbose_name_plural": "Related blog posts",
+                "ordering": ["post", "kind", "rank"],
+                "indexes": [
+                    models.Index(
+                        fields=["post", "kind", "rank"],
+                        name="sum_core_pa_post_id_405fc3_idx",
+                    )
+                ],
+                "unique_together": {("post", "kind", "related")},
+            },
+        ),
+    ]
@@ -0,0 +1,154 @@
+# Generated by Django 5.2.9 on 2026-10-19 14:10
+
+import django.core.validators
+import django.db.models.deletion
+import wagtail.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sum_core_pages", "0015_related_blog_posts"),
+        ("wagtailcore", "0094_alter_page_locale"),
+        ("wagtailimages", "0027_image_description"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("body", models.TextField(blank=True)),
+                (
+                    "length",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of indexed terms (title weighted).",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Search document",
+                "verbose_name_plural": "Search documents",
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchPage",
+            fields=[
+                (
+                    "page_ptr",
+                    models.OneToOneField(
+                        auto_created=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        parent_link=True,
+                        primary_key=True,
+                        serialize=False,
+                        to="wagtailcore.page",
+                    ),
+                ),
+                (
+                    "meta_title",
+                    models.CharField(
+                        blank=True,
+                        help_text="Optional. If blank, defaults to “{page title} | {site name}”.",
+                        max_length=60,
+                    ),
+                ),
+                (
+                    "meta_description",
+                    models.TextField(
+                        blank=True,
+                        help_text="Optional. Brief summary for search engines (recommended max 160 characters).",
+                        max_length=160,
+                    ),
+                ),
+                (
+                    "seo_noindex",
+                    models.BooleanField(
+                        default=False,
+                        help_text="If checked, this page will be hidden from search engines (noindex).",
+                        verbose_name="No-Index",
+                    ),
+                ),
+                (
+                    "seo_nofollow",
+                    models.BooleanField(
+                        default=False,
+                        help_text="If checked, search engines will not follow links on this page (nofollow).",
+                        verbose_name="No-Follow",
+                    ),
+                ),
+                (
+                    "intro",
+                    wagtail.fields.RichTextField(
+                        blank=True,
+                        help_text="Optional intro text displayed above the search form.",
+                    ),
+                ),
+                (
+                    "results_per_page",
+                    models.IntegerField(
+                        default=10,
+                        help_text="Number of results to display per page.",
+                        validators=[django.core.validators.MinValueValidator(1)],
+                    ),
+                ),
+                (
+                    "og_image",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Optional. If blank, uses the page featured image (if present), otherwise the site default OG image.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="wagtailimages.image",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search Page",
+                "verbose_name_plural": "Search Pages",
+            },
+            bases=("wagtailcore.page", models.Model),
+        ),
+        migrations.CreateModel(
+            name="SearchTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=64)),
+                ("frequency", models.PositiveIntegerField(default=1)),
+                (
+                    "document",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="postings",
+                        to="sum_core_pages.searchdocument",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search term",
+                "verbose_name_plural": "Search terms",
+                "unique_together": {("term", "document")},
+            },
+        ),
+    ]
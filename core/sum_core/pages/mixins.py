@@ -1,9 +1,11 @@
 """
-Name: Page Mixins (SEO, Open Graph, Breadcrumbs)
+Name: Page Mixins (SEO, Open Graph, Breadcrumbs, Rendition Prefetch)
 Path: core/sum_core/pages/mixins.py
-Purpose: Provide reusable Wagtail Page mixins for SEO fields, Open Graph metadata, and breadcrumbs.
+Purpose: Provide reusable Wagtail Page mixins for SEO fields and HTTP caching, Open Graph
+metadata, breadcrumbs and bulk image rendition prefetching.
 Family: SUM Platform – Page Types (mixed into Wagtail Page models)
-Dependencies: Django models, Wagtail Page, wagtailimages, sum_core.branding.models.SiteSettings
+Dependencies: Django models, Wagtail Page, wagtailimages, sum_core.branding.models.SiteSettings,
+sum_core.blocks.renditions, sum_core.pages.http_cache
 """
 
 from __future__ import annotations
@@ -12,7 +14,16 @@ from typing import Any
 
 from django.db import models
 from django.http import HttpRequest
+from sum_core.blocks.renditions import (
+    plan_page_image_loading,
+    prefetch_page_renditions,
+)
 from sum_core.branding.models import SiteSettings
+from sum_core.pages.http_cache import (
+    apply_cache_headers,
+    get_not_modified_response,
+    get_page_validators,
+)
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel
 from wagtail.models import Page
 
@@ -24,8 +35,16 @@ class SeoFieldsMixin(models.Model):
     Fields:
     - meta_title: short title suitable for search snippets (<title>)
     - meta_description: short summary suitable for <meta name="description">
+
+    Also serves the page with HTTP validators (304 for matching conditional
+    requests) and a ``Cache-Control`` policy set per page type through
+    ``cache_max_age``/``cache_stale_while_revalidate`` (seconds; a
+    ``cache_max_age`` of None sends no policy). See sum_core.pages.http_cache.
     """
 
+    cache_max_age: int | None = 60
+    cache_stale_while_revalidate: int = 300
+
     meta_title = models.CharField(
         max_length=60,
         blank=True,
@@ -63,6 +82,17 @@ class SeoFieldsMixin(models.Model):
     class Meta:
         abstract = True
 
+    def serve(self, request, *args, **kwargs):
+        validators = get_page_validators(self, request)
+        if validators is not None:
+            not_modified = get_not_modified_response(request, validators)
+            if not_modified is not None:
+                return not_modified
+        response = super().serve(request, *args, **kwargs)
+        if validators is not None:
+            apply_cache_headers(self, request, response, validators)
+        return response
+
     def get_meta_title(self, site_settings: SiteSettings) -> str:
         """
         Return meta title for <title>.
@@ -203,3 +233,20 @@ class BreadcrumbMixin(models.Model):
                 }
             )
         return crumbs
+
+
+class RenditionPrefetchMixin:
+    """
+    Resolve image renditions for the page's StreamFields in bulk before rendering.
+
+    Also records each block's position so ``{% responsive_image %}`` can lazy-load
+    below-the-fold images and prioritise the first hero image.
+
+    Mix in before ``Page`` on page types whose templates render image blocks.
+    """
+
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        prefetch_page_renditions(self, request)
+        plan_page_image_loading(self, request)
+        return context
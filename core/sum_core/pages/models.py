@@ -3,13 +3,19 @@ Name: Pages Models Aggregator
 Path: core/sum_core/pages/models.py
 Purpose: Register page models for Django model discovery.
 Family: SUM Platform – Page Types
-Dependencies: sum_core.pages.standard.StandardPage, sum_core.pages.services
+Dependencies: sum_core.pages.standard.StandardPage, sum_core.pages.services,
+sum_core.pages.related, sum_core.pages.search, sum_core.pages.search_index,
+sum_core.pages.outline
 """
 
 from __future__ import annotations
 
 from sum_core.pages.blog import BlogIndexPage, BlogPostPage, Category
 from sum_core.pages.legal import LegalPage
+from sum_core.pages.outline import PageOutline
+from sum_core.pages.related import BlogPostTermVector, RelatedBlogPost
+from sum_core.pages.search import SearchPage
+from sum_core.pages.search_index import SearchDocument, SearchTerm
 from sum_core.pages.services import ServiceIndexPage, ServicePage
 from sum_core.pages.standard import StandardPage
 
@@ -21,4 +27,10 @@ __all__ = [
     "BlogIndexPage",
     "BlogPostPage",
     "LegalPage",
+    "BlogPostTermVector",
+    "RelatedBlogPost",
+    "SearchPage",
+    "SearchDocument",
+    "SearchTerm",
+    "PageOutline",
 ]
@@ -0,0 +1,303 @@
+"""
+Name: Page Outline
+Path: core/sum_core/pages/outline.py
+Purpose: Per-revision page outline (FAQ pairs, heading anchors, word count) stored at publish.
+Family: Pages, SEO.
+Dependencies: Django ORM, wagtail.signals, sum_core.pages.search_index.
+
+Publishing a page walks its StreamFields once and stores the FAQ question/answer
+pairs, the h2/h3 headings of ``rich_text``/``content``/``legal_section`` blocks
+with unique anchors, and a word count. FAQ schema, the table of contents block,
+heading anchors and reading time then read that row instead of re-parsing the
+StreamField per request. Rows are keyed to the live revision and written only
+at publish and by ``rebuild_page_outlines``; page views never write. A stale or
+missing row (e.g. pages published before outlines existed) is built in memory
+for that request, as are previews.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterator
+from html import unescape
+from typing import Any
+
+from django.db import models
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.utils.html import strip_tags
+from django.utils.text import slugify
+from sum_core.pages.search_index import stream_to_text
+from wagtail.fields import StreamField
+from wagtail.models import Page
+from wagtail.rich_text import RichText
+from wagtail.signals import page_published
+
+logger = logging.getLogger(__name__)
+
+READING_WORDS_PER_MINUTE = 200
+# StreamField block types whose rich text contributes headings.
+RICH_TEXT_BLOCK_TYPES = frozenset({"rich_text", "content"})
+LEGAL_SECTION_BLOCK_TYPES = frozenset({"legal_section", "section"})
+
+HEADING_RE = re.compile(r"<h([23])(\s[^>]*)?>(.*?)</h\1>", re.IGNORECASE | re.DOTALL)
+ID_ATTR_RE = re.compile(r"\sid\s*=", re.IGNORECASE)
+
+_REQUEST_ATTR = "_sum_page_outline"
+
+
+class PageOutline(models.Model):
+    """Outline of a page's live revision."""
+
+    page = models.OneToOneField(
+        Page,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="outline",
+    )
+    revision = models.ForeignKey(
+        "wagtailcore.Revision",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    faq_items = models.JSONField(default=list, blank=True)
+    headings = models.JSONField(default=list, blank=True)
+    word_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Page outline"
+        verbose_name_plural = "Page outlines"
+
+    def __str__(self) -> str:
+        return f"Outline for page {self.page_id}"
+
+    @property
+    def reading_time(self) -> int:
+        """Estimated reading time in minutes (minimum 1)."""
+        return max(1, round(self.word_count / READING_WORDS_PER_MINUTE))
+
+    def get_toc_entries(self) -> list[dict[str, Any]]:
+        """Top-level (h2) headings in page order."""
+        return [heading for heading in self.headings if heading["level"] == 2]
+
+    def get_block_anchors(self, block_id: str | None) -> list[str]:
+        """Anchors for the rich-text headings of one block, in document order."""
+        return [
+            heading["anchor"]
+            for heading in self.headings
+            if heading["block_id"] == block_id and heading["in_rich_text"]
+        ]
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+
+def _stream_children(page: Page) -> Iterator[Any]:
+    for page_field in page._meta.get_fields():
+        if isinstance(page_field, StreamField):
+            yield from getattr(page, page_field.name, None) or ()
+
+
+def _rich_text_source(value: Any) -> str:
+    if isinstance(value, RichText):
+        return value.source
+    return str(value or "")
+
+
+def _plain(html: str) -> str:
+    return re.sub(r"\s+", " ", unescape(strip_tags(html))).strip()
+
+
+class _AnchorRegistry:
+    def __init__(self) -> None:
+        self.used: set[str] = set()
+
+    def claim(self, text: str) -> str:
+        base = slugify(text) or "section"
+        anchor = base
+        suffix = 2
+        while anchor in self.used:
+            anchor = f"{base}-{suffix}"
+            suffix += 1
+        self.used.add(anchor)
+        return anchor
+
+
+def iter_rich_text_headings(html: str) -> Iterator[tuple[int, str]]:
+    """Yield ``(level, text)`` for each h2/h3 in ``html``."""
+    for match in HEADING_RE.finditer(html):
+        text = _plain(match.group(3))
+        if text:
+            yield int(match.group(1)), text
+
+
+def build_page_outline(page: Page) -> PageOutline:
+    """Build an unsaved outline from ``page``'s StreamFields."""
+    faq_items: list[dict[str, str]] = []
+    headings: list[dict[str, Any]] = []
+    anchors = _AnchorRegistry()
+    children = list(_stream_children(page))
+
+    # Explicit legal section anchors are fixed, so reserve them first.
+    for child in children:
+        if child.block_type in LEGAL_SECTION_BLOCK_TYPES:
+            anchors.used.add(slugify(child.value.get("anchor") or ""))
+
+    for child in children:
+        block_id = str(child.id) if child.id else None
+        rich_text = ""
+        if child.block_type == "faq":
+            for item in child.value.get("items", []):
+                question = (item.get("question") or "").strip()
+                answer = _plain(_rich_text_source(item.get("answer")))
+                if question and answer:
+                    faq_items.append({"question": question, "answer": answer})
+        elif child.block_type in LEGAL_SECTION_BLOCK_TYPES:
+            headings.append(
+                {
+                    "level": 2,
+                    "text": (child.value.get("heading") or "").strip(),
+                    "anchor": slugify(child.value.get("anchor") or ""),
+                    "block_id": block_id,
+                    "in_rich_text": False,
+                }
+            )
+            rich_text = _rich_text_source(child.value.get("body"))
+        elif child.block_type == "rich_text":
+            rich_text = _rich_text_source(child.value)
+        elif child.block_type in RICH_TEXT_BLOCK_TYPES:
+            rich_text = _rich_text_source(child.value.get("body"))
+
+        for level, text in iter_rich_text_headings(rich_text):
+            headings.append(
+                {
+                    "level": level,
+                    "text": text,
+                    "anchor": anchors.claim(text),
+                    "block_id": block_id,
+                    "in_rich_text": True,
+                }
+            )
+
+    return PageOutline(
+        page_id=page.pk,
+        faq_items=faq_items,
+        headings=headings,
+        word_count=len(stream_to_text(children).split()),
+    )
+
+
+# =============================================================================
+# Storage and lookup
+# =============================================================================
+
+
+def refresh_page_outline(page: Page) -> PageOutline:
+    """Rebuild and store the outline for ``page``'s live revision."""
+    outline = build_page_outline(page)
+    outline.revision_id = page.live_revision_id
+    outline.save()
+    return outline
+
+
+def rebuild_page_outlines() -> int:
+    """Store outlines for every live page; returns the number built."""
+    built = 0
+    for page in Page.objects.live().specific().iterator():
+        try:
+            refresh_page_outline(page)
+        except Exception:
+            logger.exception("Failed to build outline for page %s", page.pk)
+        else:
+            built += 1
+    return built
+
+
+def get_page_outline(page: Page, request: HttpRequest | None = None) -> PageOutline:
+    """
+    Return the outline for ``page``, memoized on the page instance.
+
+    Never writes: previews, pages without a live revision and pages whose
+    stored outline is missing or stale get an unsaved outline built from the
+    in-memory content.
+    """
+    outline = page.__dict__.get(_REQUEST_ATTR)
+    if outline is not None:
+        return outline
+
+    if (
+        getattr(request, "is_preview", False)
+        or not page.pk
+        or page.live_revision_id is None
+    ):
+        outline = build_page_outline(page)
+    else:
+        outline = PageOutline.objects.filter(page_id=page.pk).first()
+        if outline is None or outline.revision_id != page.live_revision_id:
+            outline = build_page_outline(page)
+    page.__dict__[_REQUEST_ATTR] = outline
+    return outline
+
+
+def add_heading_anchors(html: str, anchors: list[str] | None = None) -> str:
+    """
+    Give each h2/h3 in ``html`` an ``id``.
+
+    ``anchors`` (from the stored outline) are used in order; without them,
+    anchors are derived from the heading text. Headings that already carry an
+    id are left alone.
+    """
+    remaining = list(anchors or [])
+    registry = _AnchorRegistry() if anchors is None else None
+
+    def _replace(match: re.Match[str]) -> str:
+        level, attrs, inner = match.group(1), match.group(2) or "", match.group(3)
+        text = _plain(inner)
+        if not text:
+            return match.group(0)
+        if registry is not None:
+            anchor = registry.claim(text)
+        elif remaining:
+            anchor = remaining.pop(0)
+        else:
+            return match.group(0)
+        if ID_ATTR_RE.search(attrs):
+            return match.group(0)
+        return f'<h{level} id="{anchor}"{attrs}>{inner}</h{level}>'
+
+    return HEADING_RE.sub(_replace, html)
+
+
+def anchor_headings_in_context(html: str, context: Any, block: Any = None) -> str:
+    """
+    Add heading ids to rendered rich text using the outline of the page in context.
+
+    ``block`` is the StreamField child the text belongs to; it defaults to the
+    ``block`` in context, which page templates set when iterating StreamFields.
+    """
+    page = context.get("page") if context else None
+    anchors = None
+    block_id = getattr(block or (context or {}).get("block"), "id", None)
+    if isinstance(page, Page) and block_id:
+        outline = get_page_outline(page, context.get("request"))
+        anchors = outline.get_block_anchors(str(block_id)) or None
+    return add_heading_anchors(html, anchors)
+
+
+# =============================================================================
+# Signal Handlers
+# =============================================================================
+
+
+@receiver(page_published, dispatch_uid="page_outline_page_published")
+def _on_page_published(sender, instance, **kwargs) -> None:
+    try:
+        refresh_page_outline(instance)
+    except Exception:
+        logger.exception("Failed to build outline for page %s", instance.pk)
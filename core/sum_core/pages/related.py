@@ -0,0 +1,510 @@
+"""
+Name: Related Blog Posts Index
+Path: core/sum_core/pages/related.py
+Purpose: Precomputed TF-IDF similarity index for related posts and "more in category".
+Family: Pages, Blog.
+Dependencies: Django ORM, wagtail.signals, sum_core.pages.http_cache,
+sum_core.pages.tasks (Celery).
+
+Scoring happens off the request path: publishing a BlogPostPage queues a Celery
+task that re-indexes the post and stores its top-N neighbours. Templates read the
+stored rows via BlogPostPage.get_related_posts()/get_more_in_category().
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db import models, transaction
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from sum_core.pages.http_cache import RELATED_POSTS_VERSION_KEY, bump_content_version
+from wagtail.signals import page_published, page_unpublished
+
+logger = logging.getLogger(__name__)
+
+RELATED_POSTS_LIMIT = 4
+# Added to the cosine score when both posts share a category.
+CATEGORY_BOOST = 0.15
+MIN_TERM_LENGTH = 3
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    {
+        "about",
+        "after",
+        "all",
+        "also",
+        "and",
+        "any",
+        "are",
+        "because",
+        "been",
+        "before",
+        "but",
+        "can",
+        "could",
+        "did",
+        "does",
+        "each",
+        "for",
+        "from",
+        "had",
+        "has",
+        "have",
+        "her",
+        "his",
+        "how",
+        "into",
+        "its",
+        "just",
+        "more",
+        "most",
+        "not",
+        "now",
+        "only",
+        "other",
+        "our",
+        "out",
+        "over",
+        "some",
+        "such",
+        "than",
+        "that",
+        "the",
+        "their",
+        "them",
+        "then",
+        "there",
+        "these",
+        "they",
+        "this",
+        "those",
+        "through",
+        "too",
+        "very",
+        "was",
+        "were",
+        "what",
+        "when",
+        "where",
+        "which",
+        "while",
+        "who",
+        "will",
+        "with",
+        "would",
+        "you",
+        "your",
+    }
+)
+
+
+class BlogPostTermVector(models.Model):
+    """Stored term frequencies for a live blog post (the similarity corpus)."""
+
+    post = models.OneToOneField(
+        "sum_core_pages.BlogPostPage",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="term_vector",
+    )
+    terms = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Blog post term vector"
+        verbose_name_plural = "Blog post term vectors"
+
+    def __str__(self) -> str:
+        return f"Term vector for post {self.post_id}"
+
+
+class RelatedBlogPost(models.Model):
+    """A precomputed, ranked neighbour of a blog post."""
+
+    class Kind(models.TextChoices):
+        RELATED = "related", "Related"
+        CATEGORY = "category", "More in category"
+
+    post = models.ForeignKey(
+        "sum_core_pages.BlogPostPage",
+        on_delete=models.CASCADE,
+        related_name="related_post_links",
+    )
+    related = models.ForeignKey(
+        "sum_core_pages.BlogPostPage",
+        on_delete=models.CASCADE,
+        related_name="related_to_links",
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField(default=0.0)
+
+    class Meta:
+        ordering = ["post", "kind", "rank"]
+        unique_together = [("post", "kind", "related")]
+        indexes = [models.Index(fields=["post", "kind", "rank"])]
+        verbose_name = "Related blog post"
+        verbose_name_plural = "Related blog posts"
+
+    def __str__(self) -> str:
+        return f"{self.post_id} -> {self.related_id} ({self.kind} #{self.rank})"
+
+
+# =============================================================================
+# Term extraction
+# =============================================================================
+
+
+def extract_terms(text: str) -> dict[str, int]:
+    """Return term frequencies for the given plain text."""
+    tokens = (
+        token
+        for token in TOKEN_PATTERN.findall((text or "").lower())
+        if len(token) >= MIN_TERM_LENGTH
+        and token not in STOP_WORDS
+        and not token.isdigit()
+    )
+    return dict(Counter(tokens))
+
+
+def build_post_terms(post) -> dict[str, int]:
+    """Return term frequencies for a BlogPostPage (title, excerpt and body)."""
+    title = str(post.title or "")
+    # Titles carry more signal than body copy; weight them accordingly.
+    text = " ".join([title, title, str(post.excerpt or ""), post._get_body_text()])
+    return extract_terms(text)
+
+
+# =============================================================================
+# Scoring
+# =============================================================================
+
+
+@dataclass
+class _IndexedPost:
+    post_id: int
+    category_id: int | None
+    published_date: datetime | None
+    weights: dict[str, float]
+
+
+def _compute_idf(term_sets: Iterable[Iterable[str]], total: int) -> dict[str, float]:
+    document_frequency: Counter[str] = Counter()
+    for terms in term_sets:
+        document_frequency.update(terms)
+    return {
+        term: math.log((1 + total) / (1 + count)) + 1
+        for term, count in document_frequency.items()
+    }
+
+
+def _weight_terms(terms: dict[str, int], idf: dict[str, float]) -> dict[str, float]:
+    weights = {
+        term: (1 + math.log(count)) * idf.get(term, 0.0)
+        for term, count in terms.items()
+        if count > 0
+    }
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    if not norm:
+        return {}
+    return {term: weight / norm for term, weight in weights.items()}
+
+
+def _cosine(left: dict[str, float], right: dict[str, float]) -> float:
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(weight * right.get(term, 0.0) for term, weight in left.items())
+
+
+def _similarity(left: _IndexedPost, right: _IndexedPost) -> float:
+    score = _cosine(left.weights, right.weights)
+    if _same_category(left, right):
+        score += CATEGORY_BOOST
+    return score
+
+
+def _load_corpus() -> dict[int, _IndexedPost]:
+    """Load every indexed live post with TF-IDF weights computed over the corpus."""
+    rows = list(
+        BlogPostTermVector.objects.filter(post__live=True).values_list(
+            "post_id", "post__category_id", "post__published_date", "terms"
+        )
+    )
+    idf = _compute_idf((terms.keys() for _, _, _, terms in rows), len(rows))
+    return {
+        post_id: _IndexedPost(
+            post_id=post_id,
+            category_id=category_id,
+            published_date=published_date,
+            weights=_weight_terms(terms, idf),
+        )
+        for post_id, category_id, published_date, terms in rows
+    }
+
+
+def _sort_key(entry: tuple[_IndexedPost, float]) -> tuple[float, float]:
+    post, score = entry
+    published = post.published_date.timestamp() if post.published_date else 0.0
+    return (-score, -published)
+
+
+def _same_category(left: _IndexedPost, right: _IndexedPost) -> bool:
+    return left.category_id is not None and left.category_id == right.category_id
+
+
+def _rank(
+    target: _IndexedPost, candidates: Iterable[tuple[_IndexedPost, float]]
+) -> dict[str, list[tuple[_IndexedPost, float]]]:
+    """Split scored candidates into ranked related and same-category lists."""
+    related: list[tuple[_IndexedPost, float]] = []
+    same_category: list[tuple[_IndexedPost, float]] = []
+    for candidate, score in candidates:
+        if candidate.post_id == target.post_id:
+            continue
+        if score > 0:
+            related.append((candidate, score))
+        if _same_category(target, candidate):
+            same_category.append((candidate, score))
+
+    related.sort(key=_sort_key)
+    same_category.sort(key=_sort_key)
+    return {
+        RelatedBlogPost.Kind.RELATED: related[:RELATED_POSTS_LIMIT],
+        RelatedBlogPost.Kind.CATEGORY: same_category[:RELATED_POSTS_LIMIT],
+    }
+
+
+def _build_rows(
+    post_id: int, ranked: dict[str, list[tuple[_IndexedPost, float]]]
+) -> list[RelatedBlogPost]:
+    return [
+        RelatedBlogPost(
+            post_id=post_id,
+            related_id=candidate.post_id,
+            kind=kind,
+            rank=rank,
+            score=round(score, 6),
+        )
+        for kind, entries in ranked.items()
+        for rank, (candidate, score) in enumerate(entries, start=1)
+    ]
+
+
+def _replace_rows(post_ids: Iterable[int], rows: list[RelatedBlogPost]) -> None:
+    with transaction.atomic():
+        RelatedBlogPost.objects.filter(post_id__in=list(post_ids)).delete()
+        RelatedBlogPost.objects.bulk_create(rows)
+    bump_content_version(RELATED_POSTS_VERSION_KEY)
+
+
+def _recompute(post_ids: Iterable[int], corpus: dict[int, _IndexedPost]) -> None:
+    """Fully recompute neighbour lists for the given posts against the corpus."""
+    post_ids = [post_id for post_id in post_ids if post_id in corpus]
+    rows: list[RelatedBlogPost] = []
+    for post_id in post_ids:
+        target = corpus[post_id]
+        ranked = _rank(
+            target,
+            ((other, _similarity(target, other)) for other in corpus.values()),
+        )
+        rows.extend(_build_rows(post_id, ranked))
+    _replace_rows(post_ids, rows)
+
+
+# =============================================================================
+# Public API (called from Celery tasks and management commands)
+# =============================================================================
+
+
+def _merge_into_neighbour(
+    neighbour: _IndexedPost,
+    links: list[RelatedBlogPost],
+    target: _IndexedPost,
+    score: float,
+    corpus: dict[int, _IndexedPost],
+) -> dict[str, list[tuple[_IndexedPost, float]]]:
+    """
+    Merge a re-scored post into a neighbour's stored lists without a rescan.
+
+    If the post (or a post no longer in the corpus) drops out of one of the
+    lists, the freed slot could belong to any post, so the neighbour is
+    re-ranked against the whole corpus instead.
+    """
+    ranked: dict[str, list[tuple[_IndexedPost, float]]] = {}
+    for kind in RelatedBlogPost.Kind.values:
+        listed = [link for link in links if link.kind == kind]
+        entries = [
+            (corpus[link.related_id], link.score)
+            for link in listed
+            if link.related_id != target.post_id and link.related_id in corpus
+        ]
+        if kind == RelatedBlogPost.Kind.RELATED:
+            keeps_target = score > 0
+        else:
+            keeps_target = _same_category(neighbour, target)
+        if keeps_target:
+            entries.append((target, score))
+        if len(entries) < len(listed):
+            return _rank(
+                neighbour,
+                ((other, _similarity(neighbour, other)) for other in corpus.values()),
+            )
+        entries.sort(key=_sort_key)
+        ranked[kind] = entries[:RELATED_POSTS_LIMIT]
+    return ranked
+
+
+def refresh_related_posts(post_id: int, neighbour_ids: Iterable[int] = ()) -> None:
+    """
+    Re-index one post and update the neighbour lists it can affect.
+
+    The post's own lists are recomputed against the whole corpus. Other posts
+    only have this post merged into (or dropped from) their stored lists, so a
+    publish costs one pass over the corpus instead of a full rebuild.
+
+    If the post is no longer live it is removed from the index instead, and
+    ``neighbour_ids`` (posts that listed it before a delete cascade) are refilled.
+    """
+    from sum_core.pages.blog import BlogPostPage
+
+    post = BlogPostPage.objects.filter(pk=post_id).first()
+    if post is None or not post.live:
+        remove_post_from_related_index(post_id, neighbour_ids=neighbour_ids)
+        return
+
+    BlogPostTermVector.objects.update_or_create(
+        post_id=post_id, defaults={"terms": build_post_terms(post)}
+    )
+    corpus = _load_corpus()
+    target = corpus[post_id]
+    scores = {
+        other.post_id: _similarity(target, other)
+        for other in corpus.values()
+        if other.post_id != post_id
+    }
+    rows = _build_rows(
+        post_id, _rank(target, ((corpus[pk], s) for pk, s in scores.items()))
+    )
+
+    candidate_ids = {
+        pk
+        for pk, score in scores.items()
+        if score > 0 or _same_category(corpus[pk], target)
+    }
+    candidate_ids.update(
+        pk
+        for pk in RelatedBlogPost.objects.filter(related_id=post_id).values_list(
+            "post_id", flat=True
+        )
+        if pk in scores
+    )
+    existing: dict[int, list[RelatedBlogPost]] = {pk: [] for pk in candidate_ids}
+    for link in RelatedBlogPost.objects.filter(post_id__in=candidate_ids):
+        existing[link.post_id].append(link)
+
+    changed: list[int] = []
+    for neighbour_id, links in existing.items():
+        ranked = _merge_into_neighbour(
+            corpus[neighbour_id], links, target, scores[neighbour_id], corpus
+        )
+        new_rows = _build_rows(neighbour_id, ranked)
+        old = sorted((link.kind, link.rank, link.related_id) for link in links)
+        new = sorted((row.kind, row.rank, row.related_id) for row in new_rows)
+        if old != new:
+            changed.append(neighbour_id)
+            rows.extend(new_rows)
+
+    _replace_rows([post_id, *changed], rows)
+
+
+def remove_post_from_related_index(
+    post_id: int, neighbour_ids: Iterable[int] = ()
+) -> None:
+    """Drop a post from the index and refill the lists that referenced it."""
+    affected = set(neighbour_ids)
+    affected.update(
+        RelatedBlogPost.objects.filter(related_id=post_id).values_list(
+            "post_id", flat=True
+        )
+    )
+    BlogPostTermVector.objects.filter(post_id=post_id).delete()
+    RelatedBlogPost.objects.filter(post_id=post_id).delete()
+    affected.discard(post_id)
+    if affected:
+        _recompute(affected, _load_corpus())
+
+
+def rebuild_related_posts_index() -> int:
+    """Re-index every live blog post and recompute all neighbour lists."""
+    from sum_core.pages.blog import BlogPostPage
+
+    live_posts = list(BlogPostPage.objects.live())
+    live_ids = [post.pk for post in live_posts]
+    with transaction.atomic():
+        BlogPostTermVector.objects.exclude(post_id__in=live_ids).delete()
+        RelatedBlogPost.objects.exclude(post_id__in=live_ids).delete()
+        for post in live_posts:
+            BlogPostTermVector.objects.update_or_create(
+                post_id=post.pk, defaults={"terms": build_post_terms(post)}
+            )
+    corpus = _load_corpus()
+    _recompute(corpus.keys(), corpus)
+    return len(corpus)
+
+
+# =============================================================================
+# Signal Handlers
+# =============================================================================
+
+
+def _queue_related_posts_refresh(
+    post_id: int, neighbour_ids: list[int] | None = None
+) -> None:
+    from sum_core.pages.tasks import update_related_posts
+
+    def _dispatch() -> None:
+        try:
+            update_related_posts.delay(post_id, neighbour_ids=neighbour_ids)
+        except Exception:
+            logger.exception("Failed to queue related posts refresh for %s", post_id)
+
+    # Publishing runs inside a transaction; the worker must see committed data.
+    transaction.on_commit(_dispatch)
+
+
+@receiver(page_published, dispatch_uid="related_posts_page_published")
+def _on_page_published(sender, instance, **kwargs) -> None:
+    from sum_core.pages.blog import BlogPostPage
+
+    if isinstance(instance, BlogPostPage):
+        _queue_related_posts_refresh(instance.pk)
+
+
+@receiver(page_unpublished, dispatch_uid="related_posts_page_unpublished")
+def _on_page_unpublished(sender, instance, **kwargs) -> None:
+    from sum_core.pages.blog import BlogPostPage
+
+    if isinstance(instance, BlogPostPage):
+        _queue_related_posts_refresh(instance.pk)
+
+
+@receiver(pre_delete, dispatch_uid="related_posts_pre_delete")
+def _on_blog_post_delete(sender, instance, **kwargs) -> None:
+    from sum_core.pages.blog import BlogPostPage
+
+    # Links to the deleted post cascade away, so capture who listed it first.
+    if sender is BlogPostPage:
+        neighbour_ids = list(
+            RelatedBlogPost.objects.filter(related_id=instance.pk).values_list(
+                "post_id", flat=True
+            )
+        )
+        _queue_related_posts_refresh(instance.pk, neighbour_ids=neighbour_ids)
@@ -0,0 +1,127 @@
+"""
+Name: Rendition Pre-generation
+Path: core/sum_core/pages/renditions.py
+Purpose: Generate the image renditions used by sum_core templates off the request path.
+Family: Pages, images, async processing.
+Dependencies: Wagtail images, wagtail.models.ReferenceIndex, wagtail.signals,
+sum_core.blocks.renditions, sum_core.pages.http_cache, sum_core.pages.tasks (Celery).
+
+Publishing a page queues a task that collects the declared rendition specs for
+every image on the page and fans out one generation task per image, so Pillow
+resizes run across the worker pool instead of in the first visitor's request.
+Saving an image regenerates its specs for every page that references it.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from sum_core.blocks.renditions import collect_rendition_specs
+from sum_core.pages.http_cache import RENDITIONS_VERSION_KEY, bump_content_version
+from sum_core.pages.mixins import RenditionPrefetchMixin
+from wagtail.images import get_image_model
+from wagtail.images.models import SourceImageIOError
+from wagtail.models import Page, ReferenceIndex
+from wagtail.signals import page_published
+
+logger = logging.getLogger(__name__)
+
+
+def generate_image_renditions(image_id: int, specs: Iterable[str]) -> int:
+    """Create any missing renditions of one image. Returns the number of specs."""
+    specs = sorted(set(specs))
+    image = get_image_model().objects.filter(pk=image_id).first()
+    if image is None or not specs:
+        return 0
+    try:
+        image.get_renditions(*specs)
+    except SourceImageIOError:
+        logger.warning(
+            "Source file missing for image %s; skipping renditions", image_id
+        )
+        return 0
+    bump_content_version(RENDITIONS_VERSION_KEY)
+    return len(specs)
+
+
+def get_page_rendition_specs(page_id: int) -> dict[int, list[str]]:
+    """Return ``{image_id: [specs]}`` for a live page's declared renditions."""
+    page = Page.objects.live().filter(pk=page_id).specific().first()
+    if page is None or not isinstance(page, RenditionPrefetchMixin):
+        return {}
+    return collect_rendition_specs(page)
+
+
+def get_image_usage_page_ids(image_id: int) -> list[int]:
+    """Return IDs of pages whose content references the image."""
+    page_content_type_id = ContentType.objects.get_for_model(
+        Page, for_concrete_model=False
+    ).id
+    image_content_type_id = ContentType.objects.get_for_model(
+        get_image_model(), for_concrete_model=False
+    ).id
+    return list(
+        ReferenceIndex.objects.filter(
+            to_content_type_id=image_content_type_id,
+            to_object_id=image_id,
+            base_content_type_id=page_content_type_id,
+        )
+        .values_list("object_id", flat=True)
+        .distinct()
+    )
+
+
+def get_image_rendition_specs(image_id: int) -> list[str]:
+    """Return the union of specs requested for an image by the pages using it."""
+    specs: set[str] = set()
+    for page_id in get_image_usage_page_ids(image_id):
+        specs.update(get_page_rendition_specs(int(page_id)).get(image_id, ()))
+    return sorted(specs)
+
+
+def pregenerate_page_renditions_sync(page: Page) -> int:
+    """Generate every declared rendition for ``page`` in-process."""
+    if not isinstance(page, RenditionPrefetchMixin):
+        return 0
+    return sum(
+        generate_image_renditions(image_id, specs)
+        for image_id, specs in collect_rendition_specs(page).items()
+    )
+
+
+# =============================================================================
+# Signal Handlers
+# =============================================================================
+
+
+def _queue_on_commit(task, object_id: int, label: str) -> None:
+    def _dispatch() -> None:
+        try:
+            task.delay(object_id)
+        except Exception:
+            logger.exception("Failed to queue %s renditions for %s", label, object_id)
+
+    transaction.on_commit(_dispatch)
+
+
+@receiver(page_published, dispatch_uid="renditions_page_published")
+def _on_page_published(sender, instance, **kwargs) -> None:
+    if not isinstance(instance, RenditionPrefetchMixin):
+        return
+    from sum_core.pages.tasks import pregenerate_page_renditions
+
+    _queue_on_commit(pregenerate_page_renditions, instance.pk, "page")
+
+
+@receiver(post_save, dispatch_uid="renditions_image_saved")
+def _on_image_saved(sender, instance, **kwargs) -> None:
+    if sender is not get_image_model():
+        return
+    from sum_core.pages.tasks import pregenerate_image_renditions
+
+    _queue_on_commit(pregenerate_image_renditions, instance.pk, "image")
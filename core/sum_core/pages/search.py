@@ -0,0 +1,92 @@
+"""
+Name: Search Page Model
+Path: core/sum_core/pages/search.py
+Purpose: SearchPage model rendering ranked, paginated results from the site search index.
+Family: SUM Platform – Page Types
+Dependencies: Wagtail Page model, sum_core.pages.search_index
+"""
+
+from __future__ import annotations
+
+from django.core.validators import MinValueValidator
+from django.db import models
+from sum_core.pages.mixins import BreadcrumbMixin, OpenGraphMixin, SeoFieldsMixin
+from sum_core.pages.search_index import search
+from wagtail.admin.panels import FieldPanel
+from wagtail.fields import RichTextField
+from wagtail.models import Page, Site
+
+MAX_QUERY_LENGTH = 200
+
+
+class SearchPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
+    """
+    Site search results page.
+
+    URL: /search/?q=<query>&page=<n>
+    """
+
+    intro = RichTextField(
+        blank=True,
+        help_text="Optional intro text displayed above the search form.",
+    )
+    results_per_page = models.IntegerField(
+        default=10,
+        help_text="Number of results to display per page.",
+        validators=[MinValueValidator(1)],
+    )
+
+    content_panels = Page.content_panels + [
+        FieldPanel("intro"),
+        FieldPanel("results_per_page"),
+    ]
+
+    promote_panels = (
+        SeoFieldsMixin.seo_panels
+        + OpenGraphMixin.open_graph_panels
+        + Page.promote_panels
+    )
+
+    # SearchPage is a leaf page - no child pages allowed
+    subpage_types: list[str] = []
+
+    # v0.6 rendering contract: themes own page templates under theme/
+    template: str = "theme/search_page.html"
+
+    # Results follow the search index; always revalidate.
+    cache_max_age = 0
+    cache_stale_while_revalidate = 0
+
+    class Meta:
+        verbose_name = "Search Page"
+        verbose_name_plural = "Search Pages"
+
+    def get_context(self, request, *args, **kwargs):
+        """
+        Add the query, ranked results and pagination to template context.
+
+        Query params:
+        - q: search terms
+        - page: 1-based page number
+        Results are scoped to the site this page belongs to.
+        """
+        context = super().get_context(request, *args, **kwargs)
+        query_params = request.GET if request is not None else {}
+        query = (query_params.get("q") or "").strip()[:MAX_QUERY_LENGTH]
+
+        results_page = None
+        results = []
+        if query:
+            site = self.get_site() or Site.objects.filter(is_default_site=True).first()
+            results_page, results = search(
+                query,
+                page_number=query_params.get("page", 1),
+                per_page=self.results_per_page,
+                root_page=site.root_page if site else None,
+                request=request,
+            )
+
+        context["search_query"] = query
+        context["search_results"] = results
+        context["results_page"] = results_page
+        return context
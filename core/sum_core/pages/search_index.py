@@ -0,0 +1,412 @@
+"""
+Name: Site Search Index
+Path: core/sum_core/pages/search_index.py
+Purpose: Inverted index over stored plain text of content pages, ranked with BM25.
+Family: Pages, Search.
+Dependencies: Django ORM, django.core.cache, wagtail.signals, sum_core.pages.http_cache,
+sum_core.pages.tasks (Celery).
+
+Pages are indexed off the request path when published. Queries read the
+postings table with two small aggregate queries plus one ranked, paginated
+query, so no StreamField is parsed at search time.
+
+Pages under a view restriction are excluded at query time. Saving a restriction
+also drops its subtree from the index, and deleting one queues the subtree for
+re-indexing.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.cache import cache
+from django.core.paginator import Page as PaginatorPage
+from django.core.paginator import Paginator
+from django.db import models, transaction
+from django.db.models import (
+    Avg,
+    Case,
+    Count,
+    Exists,
+    FloatField,
+    OuterRef,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Length, Substr
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.utils.html import strip_tags
+from sum_core.pages.http_cache import SEARCH_INDEX_VERSION_KEY, bump_content_version
+from sum_core.pages.related import extract_terms
+from wagtail.models import Page, PageViewRestriction
+from wagtail.rich_text import RichText
+from wagtail.signals import page_published, page_unpublished
+
+logger = logging.getLogger(__name__)
+
+# Text sources per searchable page model (in addition to the page title).
+SEARCHABLE_PAGE_FIELDS: dict[str, tuple[str, ...]] = {
+    "sum_core_pages.blogpostpage": ("excerpt", "body"),
+    "sum_core_pages.servicepage": ("short_description", "body"),
+    "sum_core_pages.standardpage": ("body",),
+    "sum_core_pages.legalpage": ("sections",),
+}
+
+TITLE_WEIGHT = 3
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TERMS = 8
+SNIPPET_LENGTH = 200
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SEARCH_STATS_CACHE_KEY = "search_index_stats"
+SEARCH_STATS_CACHE_TTL_SECONDS = 3600
+
+
+class SearchDocument(models.Model):
+    """Stored plain text of an indexed, live, public page."""
+
+    page = models.OneToOneField(
+        Page,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    length = models.PositiveIntegerField(
+        default=0, help_text="Number of indexed terms (title weighted)."
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Search document"
+        verbose_name_plural = "Search documents"
+
+    def __str__(self) -> str:
+        return str(self.title)
+
+
+class SearchTerm(models.Model):
+    """A posting: how often a term occurs in a search document."""
+
+    document = models.ForeignKey(
+        SearchDocument, on_delete=models.CASCADE, related_name="postings"
+    )
+    term = models.CharField(max_length=MAX_TERM_LENGTH)
+    frequency = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = [("term", "document")]
+        verbose_name = "Search term"
+        verbose_name_plural = "Search terms"
+
+    def __str__(self) -> str:
+        return f"{self.term} ({self.frequency})"
+
+
+# =============================================================================
+# Text extraction
+# =============================================================================
+
+
+def stream_to_text(value: Any) -> str:
+    """Flatten a StreamField/StructBlock/ListBlock value into plain text."""
+    parts: list[str] = []
+    _collect_text(value, parts)
+    return " ".join(part for part in parts if part).strip()
+
+
+def _collect_text(value: Any, parts: list[str]) -> None:
+    if value is None or isinstance(value, bool | int | float):
+        return
+    if isinstance(value, RichText):
+        parts.append(strip_tags(value.source))
+        return
+    if isinstance(value, str):
+        parts.append(strip_tags(value))
+        return
+    if isinstance(value, models.Model):
+        # Images, documents, snippets and page choosers carry no body text.
+        return
+    if hasattr(value, "block_type") and hasattr(value, "value"):
+        _collect_text(value.value, parts)
+        return
+    if hasattr(value, "items") and callable(value.items):
+        for child in value.values():
+            _collect_text(child, parts)
+        return
+    if isinstance(value, Iterable):
+        for child in value:
+            _collect_text(child, parts)
+
+
+def get_page_search_text(page: Page) -> str | None:
+    """Return plain text for a searchable page, or None if the type isn't indexed."""
+    fields = SEARCHABLE_PAGE_FIELDS.get(page._meta.label_lower)
+    if fields is None:
+        return None
+    return " ".join(stream_to_text(getattr(page, name, None)) for name in fields)
+
+
+# =============================================================================
+# Indexing
+# =============================================================================
+
+
+def _bump_stats() -> None:
+    cache.delete(SEARCH_STATS_CACHE_KEY)
+    bump_content_version(SEARCH_INDEX_VERSION_KEY)
+
+
+def _get_stats() -> tuple[int, float]:
+    stats = cache.get(SEARCH_STATS_CACHE_KEY)
+    if stats is None:
+        aggregate = SearchDocument.objects.aggregate(
+            total=Count("pk"), avg_length=Avg("length")
+        )
+        stats = (aggregate["total"] or 0, float(aggregate["avg_length"] or 0.0))
+        cache.set(SEARCH_STATS_CACHE_KEY, stats, timeout=SEARCH_STATS_CACHE_TTL_SECONDS)
+    return stats
+
+
+def remove_page_from_search_index(page_id: int) -> None:
+    """Remove a page's document and postings from the index."""
+    deleted, _ = SearchDocument.objects.filter(page_id=page_id).delete()
+    if deleted:
+        _bump_stats()
+
+
+def index_page(page_id: int) -> bool:
+    """
+    (Re-)index one page. Returns True if the page is now in the index.
+
+    Pages that are not live, have view restrictions, or are not a searchable
+    type are removed instead.
+    """
+    page = Page.objects.filter(pk=page_id).specific().first()
+    text = get_page_search_text(page) if page is not None else None
+    if (
+        page is None
+        or text is None
+        or not page.live
+        or page.get_view_restrictions().exists()
+    ):
+        remove_page_from_search_index(page_id)
+        return False
+
+    title = str(page.title or "")
+    counts: Counter[str] = Counter(extract_terms(text))
+    for term, count in extract_terms(title).items():
+        counts[term] += count * TITLE_WEIGHT
+
+    with transaction.atomic():
+        document, _ = SearchDocument.objects.update_or_create(
+            page_id=page.pk,
+            defaults={
+                "title": title[:255],
+                "body": re.sub(r"\s+", " ", text).strip(),
+                "length": sum(counts.values()),
+            },
+        )
+        SearchTerm.objects.filter(document=document).delete()
+        SearchTerm.objects.bulk_create(
+            [
+                SearchTerm(document=document, term=term, frequency=count)
+                for term, count in counts.items()
+                if len(term) <= MAX_TERM_LENGTH
+            ]
+        )
+    _bump_stats()
+    return True
+
+
+def rebuild_search_index() -> int:
+    """Rebuild the whole index from live pages of every searchable type."""
+    SearchDocument.objects.all().delete()
+    _bump_stats()
+    indexed = 0
+    for model_label in SEARCHABLE_PAGE_FIELDS:
+        app_label, model_name = model_label.split(".")
+        page_ids = Page.objects.live().filter(
+            content_type__app_label=app_label, content_type__model=model_name
+        )
+        for page_id in page_ids.values_list("pk", flat=True):
+            indexed += int(index_page(page_id))
+    return indexed
+
+
+# =============================================================================
+# Querying
+# =============================================================================
+
+
+@dataclass
+class SearchResult:
+    """A ranked search hit ready for template rendering."""
+
+    page: Page
+    title: str
+    url: str
+    snippet: str
+    score: float
+
+
+def parse_query(query: str) -> list[str]:
+    """Return the distinct index terms for a user query (capped)."""
+    return list(extract_terms(query))[:MAX_QUERY_TERMS]
+
+
+def _build_snippet(body: str, terms: Sequence[str]) -> str:
+    lowered = body.lower()
+    positions = [lowered.find(term) for term in terms if term in lowered]
+    start = max(0, min(positions) - SNIPPET_LENGTH // 4) if positions else 0
+    snippet = body[start : start + SNIPPET_LENGTH].strip()
+    if start > 0:
+        snippet = f"…{snippet}"
+    if start + SNIPPET_LENGTH < len(body):
+        snippet = f"{snippet}…"
+    return snippet
+
+
+def ranked_documents(terms: Sequence[str], root_page: Page | None = None):
+    """
+    Return a queryset of {document_id, score} ordered by BM25 score.
+
+    The queryset is lazy so a Paginator only fetches the requested slice.
+    """
+    total, avg_length = _get_stats()
+    if not terms or not total:
+        return SearchTerm.objects.none().values("document_id")
+
+    document_frequencies = dict(
+        SearchTerm.objects.filter(term__in=terms)
+        .values_list("term")
+        .annotate(df=Count("document_id"))
+    )
+    if not document_frequencies:
+        return SearchTerm.objects.none().values("document_id")
+
+    frequency = Cast("frequency", FloatField())
+    length_norm = Value(BM25_K1 * (1 - BM25_B)) + Value(
+        BM25_K1 * BM25_B / (avg_length or 1.0)
+    ) * Cast("document__length", FloatField())
+    term_score = frequency * Value(BM25_K1 + 1) / (frequency + length_norm)
+    weights = [
+        When(
+            term=term,
+            then=term_score * Value(math.log(1 + (total - df + 0.5) / (df + 0.5))),
+        )
+        for term, df in document_frequencies.items()
+    ]
+
+    postings = SearchTerm.objects.filter(term__in=list(document_frequencies))
+    if root_page is not None:
+        postings = postings.filter(document__page__path__startswith=root_page.path)
+    # Restrictions added after a page was indexed must hide it straight away.
+    restricted = PageViewRestriction.objects.filter(
+        page__path=Substr(OuterRef("document__page__path"), 1, Length("page__path"))
+    )
+    postings = postings.exclude(Exists(restricted))
+    return (
+        postings.values("document_id")
+        .annotate(score=Sum(Case(*weights, output_field=FloatField())))
+        .order_by("-score", "document_id")
+    )
+
+
+def search(
+    query: str,
+    *,
+    page_number: int | str = 1,
+    per_page: int = 10,
+    root_page: Page | None = None,
+    request: HttpRequest | None = None,
+) -> tuple[PaginatorPage, list[SearchResult]]:
+    """Run a ranked search and return the paginator page plus hydrated results."""
+    terms = parse_query(query)
+    paginator = Paginator(ranked_documents(terms, root_page=root_page), per_page)
+    page_obj = paginator.get_page(page_number)
+
+    scores = {row["document_id"]: row["score"] for row in page_obj.object_list}
+    documents = SearchDocument.objects.filter(pk__in=list(scores)).select_related(
+        "page"
+    )
+    by_id = {document.pk: document for document in documents}
+    results = [
+        SearchResult(
+            page=by_id[document_id].page,
+            title=by_id[document_id].title,
+            url=by_id[document_id].page.get_url(request=request) or "",
+            snippet=_build_snippet(by_id[document_id].body, terms),
+            score=score,
+        )
+        for document_id, score in scores.items()
+        if document_id in by_id
+    ]
+    return page_obj, results
+
+
+# =============================================================================
+# Signal Handlers
+# =============================================================================
+
+
+def _queue_search_index_update(page_id: int) -> None:
+    from sum_core.pages.tasks import update_search_index
+
+    def _dispatch() -> None:
+        try:
+            update_search_index.delay(page_id)
+        except Exception:
+            logger.exception("Failed to queue search index update for %s", page_id)
+
+    transaction.on_commit(_dispatch)
+
+
+@receiver(page_published, dispatch_uid="search_index_page_published")
+def _on_page_published(sender, instance, **kwargs) -> None:
+    if instance._meta.label_lower in SEARCHABLE_PAGE_FIELDS:
+        _queue_search_index_update(instance.pk)
+
+
+@receiver(page_unpublished, dispatch_uid="search_index_page_unpublished")
+def _on_page_unpublished(sender, instance, **kwargs) -> None:
+    if instance._meta.label_lower in SEARCHABLE_PAGE_FIELDS:
+        remove_page_from_search_index(instance.pk)
+
+
+@receiver(post_save, dispatch_uid="search_index_restriction_save")
+def _on_view_restriction_save(sender, instance, **kwargs) -> None:
+    if sender is not PageViewRestriction:
+        return
+    # Drop the subtree now; index_page keeps restricted pages out from here on.
+    deleted, _ = SearchDocument.objects.filter(
+        page__path__startswith=instance.page.path
+    ).delete()
+    if deleted:
+        _bump_stats()
+
+
+@receiver(post_delete, dispatch_uid="search_index_restriction_delete")
+def _on_view_restriction_delete(sender, instance, **kwargs) -> None:
+    if sender is not PageViewRestriction:
+        return
+    page_ids = (
+        Page.objects.live()
+        .filter(path__startswith=instance.page.path)
+        .values_list("pk", "content_type__app_label", "content_type__model")
+    )
+    for page_id, app_label, model_name in page_ids:
+        if f"{app_label}.{model_name}" in SEARCHABLE_PAGE_FIELDS:
+            _queue_search_index_update(page_id)
@@ -3,20 +3,90 @@ Name: Service Page Models
 Path: core/sum_core/pages/services.py
 Purpose: ServiceIndexPage and ServicePage models for service content organization.
 Family: SUM Platform – Page Types
-Dependencies: Wagtail Page model, sum_core.blocks.base.PageStreamBlock
+Dependencies: Wagtail Page model, sum_core.blocks.base.PageStreamBlock,
+sum_core.blocks.renditions, sum_core.pages.cache
 """
 
 from __future__ import annotations
 
+from dataclasses import astuple, dataclass
+from typing import Any
+
+from django.core.cache import cache
 from django.db import models
 from sum_core.blocks.base import PageStreamBlock
-from sum_core.pages.mixins import BreadcrumbMixin, OpenGraphMixin, SeoFieldsMixin
+from sum_core.blocks.renditions import (
+    RenditionLookup,
+    collect_block_images,
+    prefetch_renditions,
+)
+from sum_core.pages.cache import (
+    SERVICE_LISTING_CACHE_TTL_SECONDS,
+    get_service_listing_cache_key,
+)
+from sum_core.pages.mixins import (
+    BreadcrumbMixin,
+    OpenGraphMixin,
+    RenditionPrefetchMixin,
+    SeoFieldsMixin,
+)
 from wagtail.admin.panels import FieldPanel
 from wagtail.fields import StreamField
 from wagtail.models import Page
 
-
-class ServiceIndexPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
+# ServicePage fields read to build the service index cards.
+SERVICE_LISTING_FIELDS = (
+    "title",
+    "slug",
+    "path",
+    "depth",
+    "url_path",
+    "short_description",
+    "featured_image",
+)
+# Renditions requested by the service index cards.
+SERVICE_LISTING_RENDITIONS = ("fill-160x160",)
+
+
+@dataclass(frozen=True)
+class ServiceListingItem:
+    """One service index card, cached as a plain tuple."""
+
+    id: int
+    title: str
+    short_description: str
+    url: str
+    # Card rendition of the featured image: url, width, height and alt.
+    image: dict[str, Any] | None = None
+
+    @classmethod
+    def from_page(
+        cls, service: ServicePage, lookup: RenditionLookup
+    ) -> ServiceListingItem:
+        image = None
+        if service.featured_image is not None:
+            spec = SERVICE_LISTING_RENDITIONS[0]
+            rendition = lookup.get(
+                service.featured_image, spec
+            ) or service.featured_image.get_rendition(spec)
+            image = {
+                "url": rendition.url,
+                "width": rendition.width,
+                "height": rendition.height,
+                "alt": rendition.alt,
+            }
+        return cls(
+            id=service.pk,
+            title=service.title,
+            short_description=service.short_description,
+            url=service.get_url() or "",
+            image=image,
+        )
+
+
+class ServiceIndexPage(
+    SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, RenditionPrefetchMixin, Page
+):
     """
     Landing page for services that lists all child ServicePage items.
 
@@ -58,18 +128,55 @@ class ServiceIndexPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
         verbose_name = "Service Index Page"
         verbose_name_plural = "Service Index Pages"
 
+    def get_services(self) -> list[ServiceListingItem]:
+        """
+        Return the listing cards of live, public ServicePage children.
+
+        Children are loaded with one query projected to ``SERVICE_LISTING_FIELDS``
+        with their featured image joined, and the card renditions are fetched
+        in bulk. Each card is reduced to plain data (title, description, URL,
+        rendition) and cached per index as tuples, never as model instances;
+        publishing, unpublishing, moving or deleting a child bumps the index's
+        version.
+        """
+        cache_key = get_service_listing_cache_key(self)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return [ServiceListingItem(*row) for row in cached]
+
+        services = list(
+            ServicePage.objects.child_of(self)
+            .live()
+            .public()
+            .only(*SERVICE_LISTING_FIELDS)
+            .select_related("featured_image")
+            .order_by("path")
+        )
+        found: dict = {}
+        for service in services:
+            collect_block_images(
+                None, service.featured_image, found, SERVICE_LISTING_RENDITIONS
+            )
+        lookup = RenditionLookup()
+        prefetch_renditions(found, lookup)
+        items = [ServiceListingItem.from_page(service, lookup) for service in services]
+        cache.set(
+            cache_key,
+            [astuple(item) for item in items],
+            timeout=SERVICE_LISTING_CACHE_TTL_SECONDS,
+        )
+        return items
+
     def get_context(self, request, *args, **kwargs):
         """Add live, public ServicePage children to context."""
         context = super().get_context(request, *args, **kwargs)
-
-        # Get all live, public ServicePage children
-        services = self.get_children().live().public().specific().type(ServicePage)
-
-        context["services"] = services
+        context["services"] = self.get_services()
         return context
 
 
-class ServicePage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
+class ServicePage(
+    SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, RenditionPrefetchMixin, Page
+):
     """
     Individual service detail page.
 
@@ -121,6 +228,9 @@ class ServicePage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
     # v0.6 rendering contract: themes own page templates under theme/
     template: str = "theme/service_page.html"
 
+    # Renditions requested by the service page and service index templates.
+    image_renditions = {"featured_image": ("width-1200", "fill-160x160")}
+
     class Meta:
         verbose_name = "Service Page"
         verbose_name_plural = "Service Pages"
@@ -0,0 +1,339 @@
+"""
+Name: Published Page Snapshots
+Path: core/sum_core/pages/snapshots.py
+Purpose: Render live pages to static HTML (with .gz/.br siblings) for the web server
+to serve to anonymous visitors.
+Family: Pages, performance, deployment.
+Dependencies: Django request handler (in-process rendering), wagtail.signals,
+sum_core.assets.storage, sum_core.pages.tasks (Celery).
+
+Enabled by setting ``PAGE_SNAPSHOT_ROOT``. Each live, public page is rendered
+through the full middleware stack as an anonymous GET and written to
+``<root>/<hostname><url path>index.html``. Responses that depend on the
+visitor (``Vary: Cookie``, cookies set, private/no-store caching - e.g. pages
+carrying a CSRF token for a form) are never snapshotted, so those pages and all
+POSTs keep going to Django.
+
+Publishing re-exports the page and its ancestors (whose listings may show it)
+after commit; unpublishing or deleting removes the stale files, and moving or
+renaming removes the old subtree and re-exports it at its new URL. Saving the
+header or footer navigation or the site settings (branding) re-exports the
+whole site, since every page carries them. ``export_page_snapshots`` rebuilds
+the whole tree after a deploy.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.db import transaction
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.test import RequestFactory
+from sum_core.assets.storage import compress_variants
+from wagtail.models import Page, Site
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+    pre_page_move,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "index.html"
+COMPRESSED_SUFFIXES = (".gz", ".br")
+UNCACHEABLE_DIRECTIVES = ("private", "no-store", "no-cache")
+# Site-wide settings rendered on every page (header, footer, branding).
+SITE_CHROME_MODELS = frozenset(
+    {
+        "sum_core_navigation.headernavigation",
+        "sum_core_navigation.footernavigation",
+        "sum_core.sitesettings",
+    }
+)
+
+
+def get_snapshot_root() -> Path | None:
+    root = getattr(settings, "PAGE_SNAPSHOT_ROOT", None)
+    return Path(root) if root else None
+
+
+def get_snapshot_dir(page: Page, root: Path | None = None) -> Path | None:
+    """Return the directory holding ``page``'s snapshot, or None if it has no URL."""
+    root = root or get_snapshot_root()
+    url_parts = page.get_url_parts()
+    if root is None or url_parts is None:
+        return None
+    site_id, _root_url, page_path = url_parts
+    site = Site.objects.filter(pk=site_id).only("hostname").first()
+    if site is None or not page_path:
+        return None
+    host_dir = (root / site.hostname).resolve()
+    directory = (host_dir / page_path.strip("/")).resolve()
+    # Guard against URL paths escaping the snapshot root.
+    if directory != host_dir and host_dir not in directory.parents:
+        return None
+    return directory
+
+
+def is_snapshottable(response: HttpResponse) -> bool:
+    """True if ``response`` is the same for every anonymous visitor."""
+    if response.status_code != 200 or response.streaming:
+        return False
+    if not response.get("Content-Type", "").startswith("text/html"):
+        return False
+    if response.cookies:
+        return False
+    vary = {part.strip().lower() for part in response.get("Vary", "").split(",")}
+    if "cookie" in vary or "*" in vary:
+        return False
+    cache_control = response.get("Cache-Control", "").lower()
+    return not any(directive in cache_control for directive in UNCACHEABLE_DIRECTIVES)
+
+
+@cache
+def _get_handler() -> BaseHandler:
+    """The project's request handler, with ``settings.MIDDLEWARE`` loaded once."""
+    handler = BaseHandler()
+    handler.load_middleware()
+    return handler
+
+
+def render_page(page: Page) -> HttpResponse | None:
+    """Render ``page`` as an anonymous GET through the middleware stack."""
+    url_parts = page.get_url_parts()
+    if url_parts is None:
+        return None
+    site_id, root_url, page_path = url_parts
+    site = Site.objects.get(pk=site_id)
+    request = RequestFactory().get(
+        page_path,
+        HTTP_HOST=site.hostname,
+        secure=root_url.startswith("https://") or site.port == 443,
+    )
+    # Exceptions become error responses, which are never snapshotted. The
+    # response is not closed: that fires request_finished, which would close
+    # the calling task's database connection.
+    return _get_handler().get_response(request)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_snapshot(directory: Path, content: bytes) -> None:
+    """Write ``index.html`` and its compressed siblings, dropping stale ones."""
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / SNAPSHOT_FILENAME
+    variants = compress_variants(content)
+    # Siblings first: the server never pairs a new index.html with old siblings
+    # for longer than this loop.
+    for suffix in COMPRESSED_SUFFIXES:
+        sibling = target.with_name(target.name + suffix)
+        if suffix in variants:
+            _write_atomic(sibling, variants[suffix])
+        elif sibling.exists():
+            sibling.unlink()
+    _write_atomic(target, content)
+
+
+def remove_snapshot(directory: Path, recursive: bool = False) -> None:
+    """Remove a page's snapshot files (or its whole subtree)."""
+    if recursive:
+        shutil.rmtree(directory, ignore_errors=True)
+        return
+    for name in (
+        SNAPSHOT_FILENAME,
+        *(SNAPSHOT_FILENAME + s for s in COMPRESSED_SUFFIXES),
+    ):
+        (directory / name).unlink(missing_ok=True)
+
+
+def export_page(page: Page, root: Path | None = None) -> Path | None:
+    """
+    Snapshot one page. Returns the written file, or None if the page was skipped.
+
+    Skipped pages (not live, restricted, or visitor-dependent) have any existing
+    snapshot removed so the server falls through to Django.
+    """
+    root = root or get_snapshot_root()
+    directory = get_snapshot_dir(page, root)
+    if directory is None:
+        return None
+    page = page.specific
+    if not page.live or page.get_view_restrictions().exists():
+        remove_snapshot(directory)
+        return None
+
+    response = render_page(page)
+    if response is None or not is_snapshottable(response):
+        remove_snapshot(directory)
+        return None
+    write_snapshot(directory, response.content)
+    return directory / SNAPSHOT_FILENAME
+
+
+def export_page_snapshots(page_ids: Iterable[int]) -> int:
+    """Re-export the given pages. Returns the number of snapshots written."""
+    root = get_snapshot_root()
+    if root is None:
+        return 0
+    written = 0
+    for page in Page.objects.filter(pk__in=list(page_ids)).specific():
+        try:
+            if export_page(page, root) is not None:
+                written += 1
+        except Exception:
+            logger.exception("Failed to export snapshot for page %s", page.pk)
+    return written
+
+
+def export_all_page_snapshots(prune: bool = False) -> int:
+    """
+    Export every live public page. Returns the number of snapshots written.
+
+    With ``prune``, snapshots not rewritten by this run (pages since removed,
+    renamed or made visitor-dependent) are deleted.
+    """
+    root = get_snapshot_root()
+    if root is None:
+        return 0
+    written: set[Path] = set()
+    pages = Page.objects.live().public().filter(depth__gt=1).specific()
+    for page in pages.iterator():
+        try:
+            path = export_page(page, root)
+        except Exception:
+            logger.exception("Failed to export snapshot for page %s", page.pk)
+            continue
+        if path is not None:
+            written.add(path)
+    if prune and root.exists():
+        for path in root.resolve().rglob(SNAPSHOT_FILENAME):
+            if path not in written:
+                remove_snapshot(path.parent)
+    return len(written)
+
+
+def export_site_snapshots(site_id: int) -> int:
+    """Re-export every live public page of one site."""
+    site = Site.objects.filter(pk=site_id).select_related("root_page").first()
+    if site is None:
+        return 0
+    pages = site.root_page.get_descendants(inclusive=True).live().public()
+    return export_page_snapshots(pages.values_list("pk", flat=True))
+
+
+def get_affected_page_ids(page: Page) -> list[int]:
+    """The published page plus its live ancestors below the tree root."""
+    ancestors = page.get_ancestors().live().filter(depth__gt=1)
+    return [page.pk, *ancestors.values_list("pk", flat=True)]
+
+
+def get_subtree_page_ids(page: Page) -> list[int]:
+    """``get_affected_page_ids`` plus the page's live descendants (URL changes)."""
+    descendants = page.get_descendants().live()
+    return [*get_affected_page_ids(page), *descendants.values_list("pk", flat=True)]
+
+
+# =============================================================================
+# Signal Handlers
+# =============================================================================
+
+
+def _queue_export(page_ids: list[int]) -> None:
+    from sum_core.pages.tasks import export_page_snapshots as export_task
+
+    def _dispatch() -> None:
+        try:
+            export_task.delay(page_ids)
+        except Exception:
+            logger.exception("Failed to queue snapshot export for pages %s", page_ids)
+
+    transaction.on_commit(_dispatch)
+
+
+def _queue_site_export(site_id: int) -> None:
+    from sum_core.pages.tasks import export_site_snapshots as export_task
+
+    def _dispatch() -> None:
+        try:
+            export_task.delay(site_id)
+        except Exception:
+            logger.exception("Failed to queue snapshot export for site %s", site_id)
+
+    transaction.on_commit(_dispatch)
+
+
+def _remove_for(page: Page, recursive: bool = False) -> None:
+    try:
+        directory = get_snapshot_dir(page)
+    except Exception:
+        logger.exception("Failed to resolve snapshot path for page %s", page.pk)
+        return
+    if directory is not None:
+        remove_snapshot(directory, recursive=recursive)
+
+
+@receiver(page_published, dispatch_uid="page_snapshots_page_published")
+def _on_page_published(sender, instance, **kwargs) -> None:
+    if get_snapshot_root() is not None:
+        _queue_export(get_affected_page_ids(instance))
+
+
+@receiver(page_unpublished, dispatch_uid="page_snapshots_page_unpublished")
+def _on_page_unpublished(sender, instance, **kwargs) -> None:
+    if get_snapshot_root() is not None:
+        _remove_for(instance)
+        _queue_export(get_affected_page_ids(instance)[1:])
+
+
+@receiver(page_slug_changed, dispatch_uid="page_snapshots_page_slug_changed")
+def _on_page_slug_changed(sender, instance, instance_before, **kwargs) -> None:
+    if get_snapshot_root() is not None:
+        # Descendant URLs change too: drop the old subtree, export the new one.
+        _remove_for(instance_before, recursive=True)
+        if instance.live:
+            _queue_export(get_subtree_page_ids(instance))
+
+
+@receiver(pre_page_move, dispatch_uid="page_snapshots_pre_page_move")
+def _on_pre_page_move(sender, instance, **kwargs) -> None:
+    if get_snapshot_root() is not None:
+        _remove_for(instance, recursive=True)
+
+
+@receiver(post_page_move, dispatch_uid="page_snapshots_post_page_move")
+def _on_post_page_move(sender, instance, **kwargs) -> None:
+    if get_snapshot_root() is not None and instance.live:
+        _queue_export(get_subtree_page_ids(instance))
+
+
+@receiver(pre_delete, dispatch_uid="page_snapshots_page_deleted")
+def _on_page_deleted(sender, instance, **kwargs) -> None:
+    if isinstance(instance, Page) and get_snapshot_root() is not None:
+        _remove_for(instance, recursive=True)
+
+
+@receiver(post_save, dispatch_uid="page_snapshots_site_chrome_saved")
+def _on_site_chrome_saved(sender, instance, created=False, **kwargs) -> None:
+    # for_site() creates missing rows with their defaults (including while a
+    # page renders), which cannot change any snapshot; only edits can.
+    if (
+        not created
+        and sender._meta.label_lower in SITE_CHROME_MODELS
+        and get_snapshot_root() is not None
+    ):
+        _queue_site_export(instance.site_id)
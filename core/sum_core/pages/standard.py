@@ -9,13 +9,20 @@ Dependencies: Wagtail Page model, sum_core.blocks.base.PageStreamBlock
 from __future__ import annotations
 
 from sum_core.blocks.base import PageStreamBlock
-from sum_core.pages.mixins import BreadcrumbMixin, OpenGraphMixin, SeoFieldsMixin
+from sum_core.pages.mixins import (
+    BreadcrumbMixin,
+    OpenGraphMixin,
+    RenditionPrefetchMixin,
+    SeoFieldsMixin,
+)
 from wagtail.admin.panels import FieldPanel
 from wagtail.fields import StreamField
 from wagtail.models import Page
 
 
-class StandardPage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
+class StandardPage(
+    SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, RenditionPrefetchMixin, Page
+):
     """
     General-purpose content page for About, FAQ, Terms, Service Overview, etc.
 
@@ -0,0 +1,176 @@
+"""
+Name: Pages async tasks
+Path: core/sum_core/pages/tasks.py
+Purpose: Background maintenance of precomputed page data (related posts, search index,
+image renditions, HTML snapshots).
+Family: Pages, Blog, async processing.
+Dependencies: Celery, sum_core.pages.related, sum_core.pages.search_index,
+sum_core.pages.renditions, sum_core.pages.snapshots.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRIES = 3
+RETRY_BACKOFF = 60  # seconds
+
+
+@shared_task(
+    bind=True,
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_BACKOFF,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def update_related_posts(
+    self, post_id: int, neighbour_ids: list[int] | None = None
+) -> None:
+    """
+    Re-index a blog post and refresh the stored related-post lists it affects.
+
+    Args:
+        post_id: The BlogPostPage ID that was published, unpublished or deleted.
+        neighbour_ids: Posts that listed a deleted post (captured before cascade).
+    """
+    from sum_core.pages.related import refresh_related_posts
+
+    refresh_related_posts(post_id, neighbour_ids=neighbour_ids or ())
+    logger.debug("Refreshed related posts for blog post %s", post_id)
+
+
+@shared_task(
+    bind=True,
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_BACKOFF,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def update_search_index(self, page_id: int) -> None:
+    """
+    Re-index a page in the site search index (or drop it if no longer live).
+
+    Args:
+        page_id: The page ID that was published.
+    """
+    from sum_core.pages.search_index import index_page
+
+    indexed = index_page(page_id)
+    logger.debug("Search index update for page %s (indexed=%s)", page_id, indexed)
+
+
+@shared_task(
+    bind=True,
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_BACKOFF,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def generate_image_renditions(self, image_id: int, specs: list[str]) -> None:
+    """
+    Create any missing renditions of one image.
+
+    Args:
+        image_id: The image to render.
+        specs: Wagtail filter specs (e.g. ``fill-1200x900``).
+    """
+    from sum_core.pages.renditions import generate_image_renditions as generate
+
+    generated = generate(image_id, specs)
+    logger.debug("Ensured %s rendition(s) for image %s", generated, image_id)
+
+
+@shared_task(
+    bind=True,
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_BACKOFF,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def pregenerate_page_renditions(self, page_id: int) -> None:
+    """
+    Fan out one rendition task per image used by a published page.
+
+    Args:
+        page_id: The page ID that was published.
+    """
+    from sum_core.pages.renditions import get_page_rendition_specs
+
+    specs_by_image = get_page_rendition_specs(page_id)
+    for image_id, specs in specs_by_image.items():
+        generate_image_renditions.delay(image_id, specs)
+    logger.debug(
+        "Queued renditions for %s image(s) on page %s", len(specs_by_image), page_id
+    )
+
+
+@shared_task(
+    bind=True,
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_BACKOFF,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def pregenerate_image_renditions(self, image_id: int) -> None:
+    """
+    Regenerate an image's renditions for every page that references it.
+
+    Args:
+        image_id: The image that was saved.
+    """
+    from sum_core.pages.renditions import generate_image_renditions as generate
+    from sum_core.pages.renditions import get_image_rendition_specs
+
+    generated = generate(image_id, get_image_rendition_specs(image_id))
+    logger.debug("Ensured %s rendition(s) for image %s", generated, image_id)
+
+
+@shared_task(
+    bind=True,
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_BACKOFF,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def export_page_snapshots(self, page_ids: list[int]) -> None:
+    """
+    Re-render the static HTML snapshots of published pages.
+
+    Args:
+        page_ids: The published page and the ancestors that list it.
+    """
+    from sum_core.pages.snapshots import export_page_snapshots as export
+
+    written = export(page_ids)
+    logger.debug("Wrote %s snapshot(s) for pages %s", written, page_ids)
+
+
+@shared_task(
+    bind=True,
+    max_retries=MAX_RETRIES,
+    default_retry_delay=RETRY_BACKOFF,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+)
+def export_site_snapshots(self, site_id: int) -> None:
+    """
+    Re-render every page snapshot of a site after its navigation or branding changed.
+
+    Args:
+        site_id: The site whose header, footer or settings were saved.
+    """
+    from sum_core.pages.snapshots import export_site_snapshots as export
+
+    written = export(site_id)
+    logger.debug("Wrote %s snapshot(s) for site %s", written, site_id)
@@ -177,13 +177,13 @@ def render_schema(context, page):
     """
     import json
 
+    from sum_core.pages.outline import get_page_outline
     from sum_core.seo.schema import (
         build_article_schema,
         build_breadcrumb_schema,
         build_faq_schema,
         build_localbusiness_schema,
         build_service_schema,
-        extract_faq_items_from_streamfield,
     )
 
     request = context.get("request")
@@ -216,13 +216,12 @@ def render_schema(context, page):
         if service:
             schemas.append(service)
 
-    # FAQPage (pages containing FAQBlock)
-    if hasattr(page.specific, "body"):
-        faq_items = extract_faq_items_from_streamfield(page.specific.body)
-        if faq_items:
-            faq_schema = build_faq_schema(faq_items)
-            if faq_schema:
-                schemas.append(faq_schema)
+    # FAQPage (pages containing FAQBlock), from the per-revision page outline
+    faq_items = get_page_outline(page.specific, request).faq_items
+    if faq_items:
+        faq_schema = build_faq_schema(faq_items)
+        if faq_schema:
+            schemas.append(faq_schema)
 
     # BreadcrumbList (all pages)
     breadcrumb = build_breadcrumb_schema(page.specific, request)
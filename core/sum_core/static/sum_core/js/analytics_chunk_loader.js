@@ -0,0 +1,88 @@
+/**
+ * Name: Analytics Chunk Loader
+ * Path: core/sum_core/static/sum_core/js/analytics_chunk_loader.js
+ * Purpose: Fetch the analytics/event tracking bundle only once consent allows it.
+ * Family: Analytics
+ * Dependencies: #sum-analytics-config (analytics_head), cookieConsentChanged event.
+ */
+
+(function () {
+  'use strict';
+
+  const CONFIG_ID = 'sum-analytics-config';
+  const CONSENT_COOKIE = 'sum_cookie_consent';
+  const CONSENT_VERSION_COOKIE = 'sum_cookie_consent_v';
+  const CONSENT_ACCEPTED = 'accepted';
+
+  let requested = false;
+
+  function getConfig() {
+    const configEl = document.getElementById(CONFIG_ID);
+    if (!configEl) {
+      return null;
+    }
+
+    try {
+      return JSON.parse(configEl.textContent || '{}');
+    } catch (error) {
+      return null;
+    }
+  }
+
+  function getCookie(name) {
+    const value = `; ${document.cookie}`;
+    const parts = value.split(`; ${name}=`);
+    if (parts.length === 2) {
+      const encodedValue = parts.pop().split(';').shift();
+      try {
+        return decodeURIComponent(encodedValue);
+      } catch (error) {
+        return encodedValue;
+      }
+    }
+    return null;
+  }
+
+  function getConsentVersion() {
+    const versionMeta = document.querySelector('meta[name="sum:cookie-consent-version"]');
+    return versionMeta ? versionMeta.content : '1';
+  }
+
+  function isConsentAccepted(consentRequired) {
+    if (!consentRequired) {
+      return true;
+    }
+
+    return (
+      getCookie(CONSENT_COOKIE) === CONSENT_ACCEPTED &&
+      getCookie(CONSENT_VERSION_COOKIE) === getConsentVersion()
+    );
+  }
+
+  function maybeLoadChunk() {
+    if (requested) {
+      return;
+    }
+
+    const config = getConfig();
+    if (!config || !config.analytics_chunk_url) {
+      return;
+    }
+    if (!isConsentAccepted(Boolean(config.cookie_banner_enabled))) {
+      return;
+    }
+
+    requested = true;
+    const script = document.createElement('script');
+    script.async = true;
+    script.src = config.analytics_chunk_url;
+    document.head.appendChild(script);
+  }
+
+  maybeLoadChunk();
+  document.addEventListener('cookieConsentChanged', function (event) {
+    if (event && event.detail && event.detail.consent === CONSENT_ACCEPTED) {
+      maybeLoadChunk();
+    }
+  });
+})();
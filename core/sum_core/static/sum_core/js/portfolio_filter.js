@@ -0,0 +1,129 @@
+/**
+ * Name: Portfolio Filter
+ * Path: core/sum_core/static/sum_core/js/portfolio_filter.js
+ * Purpose: Switch PortfolioBlock categories in place using cached per-category fragments.
+ * Family: Blocks
+ * Dependencies: [data-portfolio] sections with [data-portfolio-filter] links.
+ *
+ * Filter links stay plain `?category=` links. When JS is available the matching
+ * block fragment is fetched (server side it is a block render-cache hit), kept in
+ * memory per URL and swapped in without navigating. Links are prefetched on hover
+ * or focus so most switches are instant.
+ */
+
+(function () {
+  'use strict';
+
+  const SECTION_SELECTOR = '[data-portfolio]';
+  const LINK_SELECTOR = '[data-portfolio-filter]';
+
+  // "<section id> <URL>" -> Promise<string | null> of the block's outer HTML.
+  const fragments = new Map();
+
+  function fragmentKey(sectionId, url) {
+    return sectionId + ' ' + url;
+  }
+
+  function fetchFragment(url, sectionId) {
+    const key = fragmentKey(sectionId, url);
+    if (!fragments.has(key)) {
+      const request = fetch(url, { credentials: 'same-origin' })
+        .then(function (response) {
+          return response.ok ? response.text() : null;
+        })
+        .then(function (html) {
+          if (!html) {
+            return null;
+          }
+          const doc = new DOMParser().parseFromString(html, 'text/html');
+          const section = doc.getElementById(sectionId);
+          return section ? section.outerHTML : null;
+        })
+        .catch(function () {
+          return null;
+        });
+      fragments.set(key, request);
+      request.then(function (fragment) {
+        if (fragment === null) {
+          fragments.delete(key);
+        }
+      });
+    }
+    return fragments.get(key);
+  }
+
+  function revealAll(section) {
+    section.querySelectorAll('.reveal').forEach(function (el) {
+      el.classList.add('active');
+    });
+    section.querySelectorAll('.reveal-group').forEach(function (el) {
+      el.classList.add('is-in-view');
+    });
+  }
+
+  function getTarget(event) {
+    const link = event.target.closest ? event.target.closest(LINK_SELECTOR) : null;
+    if (!link) {
+      return null;
+    }
+    const section = link.closest(SECTION_SELECTOR);
+    return section && section.id ? { link: link, section: section } : null;
+  }
+
+  function onClick(event) {
+    if (event.defaultPrevented || event.button !== 0 || event.metaKey || event.ctrlKey || event.shiftKey) {
+      return;
+    }
+    const target = getTarget(event);
+    if (!target) {
+      return;
+    }
+
+    event.preventDefault();
+    const url = target.link.href;
+    fetchFragment(url, target.section.id).then(function (fragment) {
+      if (fragment === null) {
+        window.location.href = url;
+        return;
+      }
+      const current = document.getElementById(target.section.id);
+      if (!current) {
+        return;
+      }
+      const template = document.createElement('template');
+      template.innerHTML = fragment;
+      const replacement = template.content.firstElementChild;
+      revealAll(replacement);
+      current.replaceWith(replacement);
+      window.history.replaceState(window.history.state, '', url);
+    });
+  }
+
+  function onPrefetch(event) {
+    const target = getTarget(event);
+    if (target) {
+      fetchFragment(target.link.href, target.section.id);
+    }
+  }
+
+  function init() {
+    // The block as rendered is the fragment for the current URL.
+    document.querySelectorAll(SECTION_SELECTOR).forEach(function (section) {
+      if (section.id) {
+        fragments.set(
+          fragmentKey(section.id, window.location.href),
+          Promise.resolve(section.outerHTML)
+        );
+      }
+    });
+    document.addEventListener('click', onClick);
+    document.addEventListener('pointerover', onPrefetch);
+    document.addEventListener('focusin', onPrefetch);
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+})();
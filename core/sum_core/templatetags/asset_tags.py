@@ -0,0 +1,57 @@
+"""
+Name: sum_core Asset Tags
+Path: core/sum_core/templatetags/asset_tags.py
+Purpose: Emit per-page stylesheet bundles with inlined critical CSS.
+Family: Django template libraries.
+Dependencies: sum_core.assets.bundles, sum_core.assets.css.
+
+Usage::
+
+    {% load asset_tags %}
+    {% page_stylesheets page %}
+
+When the page's bundle has been built, the critical partials are inlined and
+the bundle loads without blocking render; otherwise ``main.css`` is linked.
+"""
+
+from __future__ import annotations
+
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from sum_core.assets.bundles import bundle_exists
+from sum_core.assets.css import (
+    FALLBACK_STYLESHEET,
+    get_bundle,
+    get_critical_css,
+    get_critical_partials,
+    get_page_partials,
+)
+
+register = template.Library()
+
+
+@register.simple_tag
+def page_stylesheets(page=None) -> str:
+    """Render the stylesheet tags for ``page``."""
+    if not page:
+        return format_html(
+            '<link rel="stylesheet" href="{}">', static(FALLBACK_STYLESHEET)
+        )
+    bundle = get_bundle(get_page_partials(page))
+    if not bundle_exists(bundle):
+        return format_html(
+            '<link rel="stylesheet" href="{}">', static(FALLBACK_STYLESHEET)
+        )
+    critical = get_critical_css(get_critical_partials(page))
+    return format_html(
+        "<style>{}</style>\n"
+        '<link rel="preload" as="style" href="{}" '
+        "onload=\"this.onload=null;this.rel='stylesheet'\">\n"
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        # Our own stylesheet source; escaping would corrupt selectors like ">".
+        mark_safe(critical),
+        bundle.url,
+        bundle.url,
+    )
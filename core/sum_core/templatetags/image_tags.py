@@ -0,0 +1,139 @@
+"""
+Name: sum_core Image Tags
+Path: core/sum_core/templatetags/image_tags.py
+Purpose: Render responsive `<picture>` markup from rendition presets.
+Family: Django template libraries.
+Dependencies: Wagtail images, sum_core.blocks.renditions.
+
+Usage::
+
+    {% load image_tags %}
+    {% responsive_image item.image "gallery" alt=item.alt_text class="w-full" %}
+    {% image_preload %}  {# in <head> #}
+
+Emits one `<source>` per modern format (AVIF/WebP when the backend can encode
+them) and an `<img>` fallback with `srcset`/`sizes` and the intrinsic
+width/height of its largest rendition so the browser can reserve space.
+Inside a page-level block the page's loading plan adds `loading="lazy"` below
+the fold and `fetchpriority="high"` for the preloaded hero image; explicit
+attributes passed to the tag win.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django import template
+from django.utils.html import format_html, format_html_join
+from sum_core.blocks.renditions import (
+    get_image_loading_plan,
+    get_rendition_lookup,
+    get_rendition_preset,
+    get_responsive_image_formats,
+)
+from wagtail.images.shortcuts import get_renditions_or_not_found
+
+register = template.Library()
+
+
+def _resolve_renditions(image: Any, specs: list[str], request: Any) -> dict[str, Any]:
+    lookup = get_rendition_lookup(request)
+    renditions = {}
+    missing = []
+    for spec in specs:
+        rendition = lookup.get(image, spec)
+        if rendition is None:
+            missing.append(spec)
+        else:
+            renditions[spec] = rendition
+    if missing:
+        # Uses prefetched renditions when the page ran the bulk pass.
+        for spec, rendition in get_renditions_or_not_found(image, missing).items():
+            renditions[spec] = rendition
+            if rendition.pk:
+                lookup.add(rendition)
+    return renditions
+
+
+def _srcset(renditions: list[Any]) -> str:
+    # Wagtail never upscales, so preset widths above the original's all come
+    # back at the original width; list each width once.
+    by_width: dict[int, Any] = {}
+    for rendition in renditions:
+        by_width.setdefault(rendition.width, rendition)
+    return ", ".join(
+        f"{rendition.url} {width}w" for width, rendition in by_width.items()
+    )
+
+
+@register.simple_tag(takes_context=True)
+def responsive_image(context, image, preset_name: str, **attrs: Any) -> str:
+    """Render ``image`` as a `<picture>` using the named rendition preset."""
+    if not image:
+        return ""
+    request = context.get("request")
+    preset = get_rendition_preset(preset_name)
+    renditions = _resolve_renditions(image, preset.specs(), request)
+    # Templates iterate page StreamFields as ``{% for block in page.body %}``.
+    block_id = getattr(context.get("block"), "id", None)
+    attrs = {**get_image_loading_plan(request).hints(block_id), **attrs}
+
+    def variants(image_format: str | None) -> list[Any]:
+        return [renditions[preset.spec(width, image_format)] for width in preset.widths]
+
+    fallback = variants(None)
+    largest = fallback[-1]
+    sources = format_html_join(
+        "",
+        '<source type="image/{}" srcset="{}" sizes="{}">',
+        (
+            (image_format, _srcset(variants(image_format)), preset.sizes)
+            for image_format in get_responsive_image_formats()
+        ),
+    )
+
+    alt = attrs.pop("alt", None)
+    img_attrs = {
+        "src": largest.url,
+        "srcset": _srcset(fallback),
+        "sizes": preset.sizes,
+        "width": largest.width,
+        "height": largest.height,
+        "alt": image.default_alt_text if alt is None else alt,
+        "decoding": "async",
+        **{name.replace("_", "-"): value for name, value in attrs.items()},
+    }
+    img = format_html_join(
+        " ",
+        '{}="{}"',
+        (
+            (name, value)
+            for name, value in img_attrs.items()
+            if value not in (None, False)
+        ),
+    )
+    return format_html("<picture>{}<img {} /></picture>", sources, img)
+
+
+@register.simple_tag(takes_context=True)
+def image_preload(context) -> str:
+    """Preload the page's priority image in the best format the browser accepts."""
+    request = context.get("request")
+    plan = get_image_loading_plan(request)
+    if plan.priority_image is None:
+        return ""
+    preset = get_rendition_preset(plan.priority_preset)
+    formats = get_responsive_image_formats()
+    image_format = formats[0] if formats else None
+    renditions = _resolve_renditions(
+        plan.priority_image,
+        [preset.spec(width, image_format) for width in preset.widths],
+        request,
+    )
+    return format_html(
+        '<link rel="preload" as="image" imagesrcset="{}" imagesizes="{}"{} '
+        'fetchpriority="high">',
+        _srcset(list(renditions.values())),
+        preset.sizes,
+        format_html(' type="image/{}"', image_format) if image_format else "",
+    )
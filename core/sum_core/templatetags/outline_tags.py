@@ -0,0 +1,46 @@
+"""
+Name: sum_core Outline Tags
+Path: core/sum_core/templatetags/outline_tags.py
+Purpose: Render rich text with heading anchors and expose the stored page outline.
+Family: Django template libraries.
+Dependencies: Wagtail rich text, sum_core.pages.outline.
+
+Usage::
+
+    {% load outline_tags %}
+    {% anchored_richtext self.body %}
+    {% anchored_richtext section.value.body block=section %}
+    {% page_outline page as outline %}{{ outline.reading_time }} min read
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django import template
+from django.utils.safestring import mark_safe
+from sum_core.pages.outline import (
+    PageOutline,
+    anchor_headings_in_context,
+    get_page_outline,
+)
+from wagtail.models import Page
+from wagtail.templatetags.wagtailcore_tags import richtext
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def page_outline(context, page=None) -> PageOutline | None:
+    """Return the outline for ``page`` (default: the page in context)."""
+    page = context.get("page") if page is None else page
+    if not isinstance(page, Page):
+        return None
+    return get_page_outline(page, context.get("request"))
+
+
+@register.simple_tag(takes_context=True)
+def anchored_richtext(context, value: Any, block: Any = None) -> str:
+    """Render rich text with ids on its h2/h3 headings matching the page outline."""
+    html = str(richtext(value))
+    return mark_safe(anchor_headings_in_context(html, context, block))
@@ -10,13 +10,20 @@ from __future__ import annotations
 
 from django.core.exceptions import ValidationError
 from sum_core.blocks import PageStreamBlock
-from sum_core.pages.mixins import BreadcrumbMixin, OpenGraphMixin, SeoFieldsMixin
+from sum_core.pages.mixins import (
+    BreadcrumbMixin,
+    OpenGraphMixin,
+    RenditionPrefetchMixin,
+    SeoFieldsMixin,
+)
 from wagtail.admin.panels import FieldPanel
 from wagtail.fields import RichTextField, StreamField
 from wagtail.models import Page
 
 
-class HomePage(SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, Page):
+class HomePage(
+    SeoFieldsMixin, OpenGraphMixin, BreadcrumbMixin, RenditionPrefetchMixin, Page
+):
     """
     Homepage for the test project with StreamField body, SEO fields, and one-per-site enforcement.
 
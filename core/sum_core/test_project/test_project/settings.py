@@ -104,6 +104,7 @@ CACHES = {
 
 MIDDLEWARE: list[str] = [
     "sum_core.ops.middleware.CorrelationIdMiddleware",  # Must be early for request_id
+    "sum_core.forms.middleware.FormSubmissionGuardMiddleware",  # Before sessions/CSRF
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -268,6 +269,8 @@ CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "memory://")
 CELERY_RESULT_BACKEND: str = os.getenv("CELERY_RESULT_BACKEND", "cache+memory://")
 CELERY_TASK_ALWAYS_EAGER: bool = True  # Run tasks synchronously
 CELERY_TASK_EAGER_PROPAGATES: bool = True  # Propagate exceptions in eager mode
+# No outbox relay process runs here; relay each lead's side effects on commit.
+LEAD_OUTBOX_RELAY_ON_COMMIT: bool = True
 
 # Email Configuration
 EMAIL_BACKEND: str = os.getenv(
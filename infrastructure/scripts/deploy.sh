@@ -12,6 +12,7 @@ Expected server layout:
   /srv/sum/<slug>/venv/  (python venv)
   /srv/sum/<slug>/.env   (env vars: DJANGO_SETTINGS_MODULE, DB creds, etc)
   /srv/sum/<slug>/static (collectstatic target; via DJANGO_STATIC_ROOT)
+  /srv/sum/<slug>/snapshots (page HTML snapshots; via DJANGO_PAGE_SNAPSHOT_ROOT)
   /srv/sum/<slug>/media  (upload target; via DJANGO_MEDIA_ROOT)
 
 Notes:
@@ -117,8 +118,21 @@ log "Running migrations"
 log "Collecting static"
 "$PY" manage.py collectstatic --noinput
 
+log "Building per-page CSS bundles"
+"$PY" manage.py build_css_bundles
+
+log "Building JS bundles"
+"$PY" manage.py build_js_bundles
+
+log "Storing page outlines"
+"$PY" manage.py rebuild_page_outlines
+
+log "Exporting published-page snapshots"
+"$PY" manage.py export_page_snapshots --prune
+
 GUNICORN_SERVICE="sum-${SITE_SLUG}-gunicorn.service"
 CELERY_SERVICE="sum-${SITE_SLUG}-celery.service"
+OUTBOX_SERVICE="sum-${SITE_SLUG}-outbox.service"
 
 if [[ "$NO_RESTART" != "true" ]]; then
   log "Restarting systemd service: $GUNICORN_SERVICE"
@@ -132,14 +146,32 @@ if [[ "$NO_RESTART" != "true" ]]; then
       log "Celery unit exists but is not enabled; skipping restart: $CELERY_SERVICE"
     fi
   fi
+
+  if sudo systemctl list-unit-files "$OUTBOX_SERVICE" >/dev/null 2>&1; then
+    if sudo systemctl is-enabled "$OUTBOX_SERVICE" >/dev/null 2>&1; then
+      log "Restarting (enabled) service: $OUTBOX_SERVICE"
+      sudo systemctl restart "$OUTBOX_SERVICE"
+    else
+      log "WARNING: outbox relay unit exists but is not enabled: $OUTBOX_SERVICE"
+      log "WARNING: lead notifications are not sent unless Celery beat runs sum_core.leads.tasks.relay_lead_outbox_task"
+    fi
+  else
+    log "WARNING: outbox relay unit not installed: $OUTBOX_SERVICE"
+    log "WARNING: lead notifications are not sent unless Celery beat runs sum_core.leads.tasks.relay_lead_outbox_task"
+    log "WARNING: see docs/dev/deploy/vps-golden-path.md (lead outbox relay)"
+  fi
 else
   log "--no-restart set; skipping systemd restart"
 fi
 
 if [[ -n "$DOMAIN" ]]; then
   log "Smoke check: https://${DOMAIN}/health/"
-  curl -fsS "https://${DOMAIN}/health/" >/dev/null
-  log "Health OK"
+  HEALTH="$(curl -fsS "https://${DOMAIN}/health/")"
+  if grep -q '"status": *"degraded"' <<<"$HEALTH"; then
+    log "WARNING: health is degraded: $HEALTH"
+  else
+    log "Health OK"
+  fi
 
   log "Optional: https://${DOMAIN}/sitemap.xml"
   if curl -fsS "https://${DOMAIN}/sitemap.xml" >/dev/null; then
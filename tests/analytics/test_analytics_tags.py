@@ -77,7 +77,9 @@ class TestAnalyticsTags:
         out = self.render_template(
             "{% load analytics_tags %}{% analytics_body %}", {"request": request}
         )
-        assert out.strip() == ""
+        assert "GTM-BODY" not in out
+        assert "googletagmanager.com/ns.html" not in out
+        assert 'src="/static/sum_core/js/analytics_loader.js" defer' in out
 
     def test_analytics_body_ga4_ignored(self, wagtail_default_site):
         self.setup_settings(wagtail_default_site, ga4="G-ONLY")
@@ -87,7 +89,8 @@ class TestAnalyticsTags:
         out = self.render_template(
             "{% load analytics_tags %}{% analytics_body %}", {"request": request}
         )
-        assert out.strip() == ""
+        assert "G-ONLY" not in out
+        assert "googletagmanager.com" not in out
 
     def test_analytics_head_resolves_site_settings_by_host(self, wagtail_default_site):
         self.setup_settings(wagtail_default_site, gtm="GTM-DEFAULT")
@@ -0,0 +1,7 @@
+"""
+Name: Assets Test Package
+Path: tests/assets/__init__.py
+Purpose: Test suite for sum_core.assets module.
+Family: Part of the assets-level test suite.
+Dependencies: sum_core.assets module.
+"""
@@ -0,0 +1,120 @@
+"""
+Name: CSS Bundle Tests
+Path: tests/assets/test_css_bundles.py
+Purpose: Validate block-to-stylesheet mapping, bundle writing and critical CSS inlining.
+"""
+
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+from sum_core.assets import bundles, css
+from sum_core.blocks import PageStreamBlock
+from sum_core.pages.services import ServiceIndexPage
+from sum_core.pages.standard import StandardPage
+from wagtail.models import Site
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def static_root(settings, tmp_path):
+    settings.STATIC_ROOT = str(tmp_path)
+    bundles._written_bundles.clear()
+    yield tmp_path
+    bundles._written_bundles.clear()
+
+
+@pytest.fixture
+def gallery_page():
+    home = Site.objects.get(is_default_site=True).root_page
+    page = StandardPage(title="Projects", slug="projects")
+    page.body = PageStreamBlock().to_python(
+        [
+            {"type": "hero_gradient", "value": {"headline": "<p>Projects</p>"}},
+            {"type": "gallery", "value": {"images": []}},
+            {"type": "rich_text", "value": "<p>Notes</p>"},
+        ]
+    )
+    home.add_child(instance=page)
+    return page
+
+
+def _render(page) -> str:
+    return Template("{% load asset_tags %}{% page_stylesheets page %}").render(
+        Context({"page": page})
+    )
+
+
+def test_page_partials_follow_blocks_in_cascade_order(gallery_page) -> None:
+    partials = css.get_page_partials(gallery_page)
+
+    assert {"hero", "gallery", "content", "header", "footer"} <= set(partials)
+    assert "comparison" not in partials
+    assert "testimonials" not in partials
+    assert list(partials) == [name for name in css.CASCADE_ORDER if name in partials]
+
+
+def test_critical_partials_cover_header_and_first_block(gallery_page) -> None:
+    critical = css.get_critical_partials(gallery_page)
+
+    assert {"tokens", "header", "hero"} <= set(critical)
+    assert "gallery" not in critical
+    assert "footer" not in critical
+
+
+def test_unbuilt_bundle_falls_back_to_main_css(gallery_page) -> None:
+    html = _render(gallery_page)
+
+    assert "sum_core/css/main.css" in html
+    assert "<style>" not in html
+
+
+def test_command_writes_bundle_and_tag_inlines_critical_css(
+    gallery_page, static_root
+) -> None:
+    out = StringIO()
+    call_command("build_css_bundles", stdout=out)
+
+    bundle = css.get_bundle(css.get_page_partials(gallery_page))
+    written = (static_root / bundle.name).read_text()
+    assert ".gallery" in written
+    assert ".comparison" not in written
+    assert (static_root / f"{bundle.name}.gz").exists()
+    assert "new bundle(s)" in out.getvalue()
+
+    html = _render(gallery_page)
+    assert "main.css" not in html
+    assert f'<link rel="preload" as="style" href="/static/{bundle.name}"' in html
+    style = html.split("<style>", 1)[1].split("</style>", 1)[0]
+    assert ".hero" in style
+    assert ".gallery" not in style
+
+
+def test_bundle_name_is_content_hashed(gallery_page) -> None:
+    partials = css.get_page_partials(gallery_page)
+    bundle = css.get_bundle(partials)
+
+    assert bundle.name.startswith("sum_core/css/bundles/page.")
+    assert bundle.name != css.get_bundle(partials[:-1]).name
+
+
+def test_page_template_markup_is_bundled_without_blocks(static_root) -> None:
+    home = Site.objects.get(is_default_site=True).root_page
+    page = ServiceIndexPage(title="Services", slug="services-css")
+    home.add_child(instance=page)
+    page.save_revision().publish()
+
+    assert {"cards", "services"} <= set(css.get_page_partials(page))
+    assert "services" in css.get_critical_partials(page)
+
+    call_command("build_css_bundles", stdout=StringIO())
+    html = _render(page)
+    bundle = css.get_bundle(css.get_page_partials(page))
+    assert f"/static/{bundle.name}" in html
+    written = (static_root / bundle.name).read_text()
+    assert ".services__grid" in written
+    assert ".card__body" in written
@@ -0,0 +1,89 @@
+"""
+Name: JS Bundle Tests
+Path: tests/assets/test_js_bundles.py
+Purpose: Validate the core/analytics script bundles and how analytics tags emit them.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import RequestFactory
+from sum_core.assets import bundles, js
+from sum_core.branding.models import SiteSettings
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def static_root(settings, tmp_path):
+    settings.STATIC_ROOT = str(tmp_path)
+    bundles._written_bundles.clear()
+    yield tmp_path
+    bundles._written_bundles.clear()
+
+
+@pytest.fixture
+def request_with_gtm(wagtail_default_site):
+    site_settings = SiteSettings.for_site(wagtail_default_site)
+    site_settings.gtm_container_id = "GTM-BUNDLE"
+    site_settings.cookie_banner_enabled = True
+    site_settings.save()
+    request = RequestFactory().get("/")
+    request.site = wagtail_default_site
+    return request
+
+
+def _render(source: str, request) -> str:
+    return Template("{% load analytics_tags %}" + source).render(
+        Context({"request": request})
+    )
+
+
+def test_bundles_concatenate_sources_under_a_content_hash() -> None:
+    core = js.get_js_bundle("core")
+    analytics = js.get_js_bundle("analytics")
+
+    assert re.fullmatch(r"sum_core/js/bundles/core\.[0-9a-f]{12}\.js", core.name)
+    assert "cookieConsentChanged" in core.content
+    assert "analytics_chunk_url" in core.content
+    assert "googletagmanager.com" not in core.content
+    assert "googletagmanager.com" in analytics.content
+    assert "form_submission" in analytics.content
+
+
+def test_unbuilt_bundles_fall_back_to_deferred_sources(request_with_gtm) -> None:
+    head = _render("{% analytics_head %}", request_with_gtm)
+    body = _render("{% analytics_body %}", request_with_gtm)
+
+    assert "analytics_chunk_url" not in head
+    assert "analytics_chunk_loader.js" not in body
+    scripts = re.findall(r'<script src="([^"]+)" defer></script>', body)
+    assert scripts == [
+        f"/static/{path}" for path in js.get_unbundled_script_paths(True)
+    ]
+
+
+def test_built_bundles_emit_one_module_and_a_gated_chunk_url(
+    request_with_gtm, static_root
+) -> None:
+    out = StringIO()
+    call_command("build_js_bundles", stdout=out)
+
+    core = js.get_js_bundle("core")
+    analytics = js.get_js_bundle("analytics")
+    assert (static_root / core.name).exists()
+    assert "2 bundle(s) ready." in out.getvalue()
+
+    body = _render("{% analytics_body %}", request_with_gtm)
+    assert body == f'<script type="module" src="{core.url}"></script>'
+
+    head = _render("{% analytics_head %}", request_with_gtm)
+    config = json.loads(re.search(r">(.*)</script>", head).group(1))
+    assert config["analytics_chunk_url"] == analytics.url
+    assert config["cookie_banner_enabled"] is True
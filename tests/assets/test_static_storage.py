@@ -0,0 +1,75 @@
+"""
+Name: Static Files Storage Tests
+Path: tests/assets/test_static_storage.py
+Purpose: Validate content hashing and precompressed siblings written at collectstatic time.
+"""
+
+from __future__ import annotations
+
+import gzip
+import re
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from sum_core.assets.storage import (
+    SumManifestStaticFilesStorage,
+    compress_variants,
+    write_compressed_siblings,
+)
+
+COMPONENT_CSS = ".hero { color: red; }\n" * 40
+MAIN_CSS = '@import "components.hero.css";\nbody { margin: 0; }\n'
+
+
+def _collect(tmp_path) -> SumManifestStaticFilesStorage:
+    source = FileSystemStorage(location=tmp_path / "source")
+    target = SumManifestStaticFilesStorage(location=tmp_path / "static")
+    files = {
+        "sum_core/css/main.css": MAIN_CSS,
+        "sum_core/css/components.hero.css": COMPONENT_CSS,
+        "sum_core/img/logo.png": "not really a png",
+    }
+    for name, content in files.items():
+        source.save(name, ContentFile(content.encode()))
+        target.save(name, ContentFile(content.encode()))
+    paths = {name: (source, name) for name in files}
+    list(target.post_process(paths))
+    return target
+
+
+def test_post_process_hashes_and_rewrites_imports(tmp_path) -> None:
+    storage = _collect(tmp_path)
+
+    main = storage.stored_name("sum_core/css/main.css")
+    component = storage.stored_name("sum_core/css/components.hero.css")
+
+    assert re.search(r"main\.[0-9a-f]{12}\.css$", main)
+    with storage.open(main) as handle:
+        assert component.rsplit("/", 1)[1] in handle.read().decode()
+
+
+def test_post_process_writes_gzip_sibling_for_hashed_text_assets(tmp_path) -> None:
+    storage = _collect(tmp_path)
+    component = storage.stored_name("sum_core/css/components.hero.css")
+
+    with storage.open(f"{component}.gz") as handle:
+        assert gzip.decompress(handle.read()).decode() == COMPONENT_CSS
+    # Binary and tiny files are left alone.
+    assert not storage.exists(f"{storage.stored_name('sum_core/img/logo.png')}.gz")
+    assert not storage.exists(f"{storage.stored_name('sum_core/css/main.css')}.gz")
+
+
+def test_compress_variants_skips_small_content() -> None:
+    assert compress_variants(b"a{}") == {}
+    assert ".gz" in compress_variants(COMPONENT_CSS.encode())
+
+
+def test_write_compressed_siblings_replaces_stale_sibling(tmp_path) -> None:
+    storage = FileSystemStorage(location=tmp_path)
+    storage.save("bundle.css.gz", ContentFile(b"stale"))
+
+    written = write_compressed_siblings(storage, "bundle.css", COMPONENT_CSS.encode())
+
+    assert written >= 1
+    with storage.open("bundle.css.gz") as handle:
+        assert gzip.decompress(handle.read()).decode() == COMPONENT_CSS
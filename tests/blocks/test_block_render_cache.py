@@ -0,0 +1,150 @@
+"""
+Name: Block Render Cache Tests
+Path: tests/blocks/test_block_render_cache.py
+Purpose: Validate per-revision fragment caching for opted-in StreamField blocks.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from sum_core.blocks import PageStreamBlock
+from sum_core.blocks.cache import (
+    BLOCK_RENDER_VERSION_KEY,
+    get_block_render_cache_key,
+)
+from sum_core.blocks.content import PortfolioBlock
+from sum_core.blocks.process_faq import FAQBlock
+from sum_core.pages.standard import StandardPage
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Site
+
+pytestmark = pytest.mark.django_db
+
+FAQ_VALUE = {
+    "heading": "<p>Questions</p>",
+    "items": [{"question": "How long?", "answer": "<p>Two days.</p>"}],
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def faq_page():
+    home = Site.objects.get(is_default_site=True).root_page
+    page = StandardPage(title="FAQ", slug="faq")
+    page.body = PageStreamBlock().to_python([{"type": "faq", "value": FAQ_VALUE}])
+    home.add_child(instance=page)
+    page.save_revision().publish()
+    page.refresh_from_db()
+    return page
+
+
+def _render_first_block(page, request):
+    child = page.body[0]
+    context = {"page": page, "request": request, "block": child}
+    return child.block.render(child.value, context=context)
+
+
+def test_second_render_of_same_revision_is_served_from_cache(faq_page, rf) -> None:
+    request = rf.get("/faq/")
+
+    with patch.object(
+        FAQBlock, "get_context", autospec=True, side_effect=FAQBlock.get_context
+    ) as get_context:
+        first = _render_first_block(faq_page, request)
+        second = _render_first_block(faq_page, request)
+
+    assert get_context.call_count == 1
+    assert first == second
+    assert "How long?" in second
+
+
+def test_key_uses_block_id_and_live_revision(faq_page, rf) -> None:
+    child = faq_page.body[0]
+    context = {"page": faq_page, "request": rf.get("/"), "block": child}
+
+    key = get_block_render_cache_key(child.block, child.value, context)
+
+    assert f":{faq_page.live_revision_id}:{child.id}:" in key
+
+
+def test_publishing_new_revision_renders_again(faq_page, rf) -> None:
+    request = rf.get("/faq/")
+    _render_first_block(faq_page, request)
+
+    faq_page.save_revision().publish()
+    faq_page.refresh_from_db()
+
+    with patch.object(
+        FAQBlock, "get_context", autospec=True, side_effect=FAQBlock.get_context
+    ) as get_context:
+        _render_first_block(faq_page, request)
+
+    assert get_context.call_count == 1
+
+
+def test_preview_and_pageless_renders_are_not_cached(faq_page, rf) -> None:
+    preview_request = rf.get("/faq/")
+    preview_request.is_preview = True
+    child = faq_page.body[0]
+
+    assert (
+        get_block_render_cache_key(
+            child.block, child.value, {"page": faq_page, "request": preview_request}
+        )
+        is None
+    )
+    assert get_block_render_cache_key(child.block, child.value, {}) is None
+
+
+def test_portfolio_varies_on_category_param(faq_page, rf) -> None:
+    block = PortfolioBlock()
+    value = block.to_python(
+        {"heading": "<p>Work</p>", "items": [{"category": "Residential"}]}
+    )
+
+    all_key = get_block_render_cache_key(
+        block, value, {"page": faq_page, "request": rf.get("/")}
+    )
+    filtered_key = get_block_render_cache_key(
+        block, value, {"page": faq_page, "request": rf.get("/?category=residential")}
+    )
+    ignored_param_key = get_block_render_cache_key(
+        block, value, {"page": faq_page, "request": rf.get("/?utm_source=ad")}
+    )
+
+    assert all_key != filtered_key
+    assert all_key == ignored_param_key
+
+
+def test_portfolio_skips_cache_for_unknown_categories(faq_page, rf) -> None:
+    block = PortfolioBlock()
+    value = block.to_python(
+        {"heading": "<p>Work</p>", "items": [{"category": "Residential"}]}
+    )
+
+    for category in ("commercial", "Residential", "residential%00", "x" * 500):
+        request = rf.get("/", {"category": category})
+        assert (
+            get_block_render_cache_key(
+                block, value, {"page": faq_page, "request": request}
+            )
+            is None
+        )
+
+
+def test_image_save_bumps_cache_version() -> None:
+    before = cache.get(BLOCK_RENDER_VERSION_KEY) or 0
+
+    Image.objects.create(title="Roof", file=get_test_image_file())
+
+    assert (cache.get(BLOCK_RENDER_VERSION_KEY) or 0) > before
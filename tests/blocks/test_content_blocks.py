@@ -8,6 +8,7 @@ from sum_core.blocks.content import (
     QuoteBlock,
     RichTextContentBlock,
     SpacerBlock,
+    build_portfolio_index,
 )
 from sum_core.blocks.gallery import FeaturedCaseStudyBlock
 from wagtail import blocks
@@ -129,3 +130,27 @@ def test_featured_case_study_block_definition():
     assert not block.child_blocks["cta_url"].required
     assert not block.child_blocks["stats_label"].required
     assert not block.child_blocks["stats_value"].required
+
+
+def test_portfolio_index_groups_positions_by_category_slug():
+    build_portfolio_index.cache_clear()
+    index = build_portfolio_index(
+        ("Residential", " Commercial ", "", "Residential", "Listed Buildings")
+    )
+
+    assert [(c.label, c.slug) for c in index.categories] == [
+        ("Residential", "residential"),
+        ("Commercial", "commercial"),
+        ("Listed Buildings", "listed-buildings"),
+    ]
+    assert str(index.categories[2]) == "Listed Buildings"
+    assert index.positions["residential"] == (0, 3)
+    assert index.filter(list("abcde"), "commercial") == ["b"]
+    assert index.filter(list("abcde"), "unknown") == []
+
+    assert (
+        build_portfolio_index(
+            ("Residential", " Commercial ", "", "Residential", "Listed Buildings")
+        )
+        is index
+    )
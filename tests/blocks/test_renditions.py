@@ -0,0 +1,112 @@
+"""
+Name: Block Rendition Prefetch Tests
+Path: tests/blocks/test_renditions.py
+Purpose: Validate the bulk rendition pass for StreamField pages.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.template import Context, Template
+from sum_core.blocks import PageStreamBlock
+from sum_core.blocks.renditions import (
+    collect_page_images,
+    expand_rendition_specs,
+    get_rendition_lookup,
+    prefetch_page_renditions,
+)
+from sum_core.pages.standard import StandardPage
+from wagtail.images.models import Image, Rendition
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Site
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def images():
+    return [
+        Image.objects.create(title=f"Photo {index}", file=get_test_image_file())
+        for index in range(3)
+    ]
+
+
+@pytest.fixture
+def gallery_page(images):
+    home = Site.objects.get(is_default_site=True).root_page
+    page = StandardPage(title="Projects", slug="projects")
+    page.body = PageStreamBlock().to_python(
+        [
+            {
+                "type": "gallery",
+                "value": {
+                    "images": [
+                        {"image": image.pk, "alt_text": image.title} for image in images
+                    ]
+                },
+            },
+            {"type": "image_block", "value": {"image": images[0].pk, "alt_text": "A"}},
+        ]
+    )
+    home.add_child(instance=page)
+    return StandardPage.objects.get(pk=page.pk)
+
+
+def test_collect_page_images_records_declared_specs(gallery_page, images) -> None:
+    found = collect_page_images(gallery_page)
+
+    assert set(found) == {image.pk for image in images}
+    _, first_specs = found[images[0].pk]
+    assert first_specs == expand_rendition_specs(["gallery", "content"])
+    assert {"fill-1200x900", "width-2400"} <= first_specs
+
+
+def test_prefetch_is_read_only_and_loads_only_declared_specs(
+    gallery_page, images, rf
+) -> None:
+    lookup = prefetch_page_renditions(gallery_page, rf.get("/projects/"))
+
+    assert not Rendition.objects.exists()
+    assert len(lookup) == 0
+
+    for image in images:
+        image.get_renditions("fill-1200x900", "width-37")
+    request = rf.get("/projects/")
+    lookup = prefetch_page_renditions(gallery_page, request)
+
+    assert lookup.get(images[1], "fill-1200x900") is not None
+    assert lookup.get(images[1], "width-37") is None
+    assert get_rendition_lookup(request) is lookup
+
+
+def test_templates_resolve_prefetched_renditions_without_queries(
+    gallery_page, images, rf, django_assert_num_queries
+) -> None:
+    for image in images:
+        image.get_renditions(*expand_rendition_specs(["gallery"]))
+    cache.clear()  # Rule out Wagtail's own rendition cache.
+    request = rf.get("/projects/")
+    gallery = gallery_page.body[0].value
+
+    prefetch_page_renditions(gallery_page, request)
+
+    template = Template(
+        "{% load image_tags %}"
+        "{% for item in gallery.images %}"
+        '{% responsive_image item.image "gallery" alt="" %}'
+        "{% endfor %}"
+    )
+    with django_assert_num_queries(0):
+        html = template.render(Context({"gallery": gallery, "request": request}))
+    assert html.count("fill-1200x900") == 3
+
+
+def test_prefetch_runs_once_per_request(
+    gallery_page, rf, django_assert_num_queries
+) -> None:
+    request = rf.get("/projects/")
+    prefetch_page_renditions(gallery_page, request)
+
+    with django_assert_num_queries(0):
+        prefetch_page_renditions(gallery_page, request)
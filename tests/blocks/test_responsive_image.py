@@ -0,0 +1,182 @@
+"""
+Name: Responsive Image Tag Tests
+Path: tests/blocks/test_responsive_image.py
+Purpose: Validate rendition presets, the `{% responsive_image %}` picture markup and
+position-based loading hints.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.template import Context, Template
+from sum_core.blocks import PageStreamBlock
+from sum_core.blocks.renditions import (
+    RENDITION_PRESETS,
+    RenditionPreset,
+    build_image_loading_plan,
+    expand_rendition_specs,
+    get_rendition_lookup,
+    prefetch_renditions,
+)
+from sum_core.pages.standard import StandardPage
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Site
+
+pytestmark = pytest.mark.django_db
+
+FORMATS = "sum_core.blocks.renditions.get_responsive_image_formats"
+TAG_FORMATS = "sum_core.templatetags.image_tags.get_responsive_image_formats"
+
+
+@pytest.fixture(autouse=True)
+def _clear_rendition_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def image():
+    return Image.objects.create(title="Kitchen", file=get_test_image_file())
+
+
+@pytest.fixture
+def hero_page(image):
+    home = Site.objects.get(is_default_site=True).root_page
+    page = StandardPage(title="Kitchens", slug="kitchens")
+    page.body = PageStreamBlock().to_python(
+        [
+            {
+                "type": "hero_image",
+                "value": {
+                    "headline": "<p>Kitchens</p>",
+                    "image": image.pk,
+                    "image_alt": "Hero kitchen",
+                },
+            },
+            {"type": "rich_text", "value": "<p>Intro</p>"},
+            {"type": "gallery", "value": {"images": [{"image": image.pk}]}},
+        ]
+    )
+    home.add_child(instance=page)
+    page.save_revision().publish()
+    return StandardPage.objects.get(pk=page.pk)
+
+
+def _render(source: str, **context) -> str:
+    return Template("{% load image_tags %}" + source).render(Context(context))
+
+
+def test_preset_specs_cover_each_width_and_format() -> None:
+    preset = RenditionPreset(widths=(400, 800), sizes="100vw", ratio=(4, 3))
+
+    with patch(FORMATS, return_value=("avif", "webp")):
+        assert preset.specs() == [
+            "fill-400x300",
+            "fill-800x600",
+            "fill-400x300|format-avif",
+            "fill-800x600|format-avif",
+            "fill-400x300|format-webp",
+            "fill-800x600|format-webp",
+        ]
+    assert RenditionPreset(widths=(640,), sizes="100vw").spec(640) == "width-640"
+
+
+def test_declared_preset_names_expand_and_raw_specs_pass_through() -> None:
+    specs = expand_rendition_specs(["gallery", "fill-96x96"])
+
+    assert "fill-96x96" in specs
+    assert set(RENDITION_PRESETS["gallery"].specs()) <= specs
+
+
+def test_tag_renders_picture_with_sources_srcset_and_dimensions(image) -> None:
+    with (
+        patch(FORMATS, return_value=("webp",)),
+        patch(TAG_FORMATS, return_value=("webp",)),
+    ):
+        html = _render(
+            '{% responsive_image image "gallery" alt="Fitted kitchen" loading="lazy" %}',
+            image=image,
+        )
+
+    assert html.startswith("<picture>")
+    assert '<source type="image/webp"' in html
+    assert "image/avif" not in html
+    assert html.count(" 400w") == 2
+    assert 'sizes="(min-width: 1024px) 33vw' in html
+    largest = image.get_rendition("fill-1200x900")
+    assert f'src="{largest.url}"' in html
+    assert f'width="{largest.width}" height="{largest.height}"' in html
+    assert 'alt="Fitted kitchen"' in html
+    assert 'loading="lazy"' in html
+
+
+def test_srcset_lists_widths_clamped_to_the_original_once(image) -> None:
+    with patch(TAG_FORMATS, return_value=("webp",)):
+        html = _render('{% responsive_image image "gallery" %}', image=image)
+
+    original = f" {image.width}w"
+    assert html.count(original) == 2  # Once in the <source>, once in the <img>.
+    for srcset in html.split('srcset="')[1:]:
+        widths = [entry.split()[-1] for entry in srcset.split('"')[0].split(", ")]
+        assert len(widths) == len(set(widths))
+
+
+def test_tag_uses_prefetched_renditions_without_queries(
+    image, rf, django_assert_num_queries
+) -> None:
+    specs = expand_rendition_specs(["team"])
+    image.get_renditions(*specs)
+    request = rf.get("/")
+    prefetch_renditions({image.pk: ([image], specs)}, get_rendition_lookup(request))
+
+    with django_assert_num_queries(0):
+        html = _render(
+            '{% responsive_image image "team" alt="" %}', image=image, request=request
+        )
+
+    assert 'alt=""' in html
+    assert "fill-600x600" in html
+
+
+def test_tag_renders_nothing_without_image() -> None:
+    assert _render('{% responsive_image image "hero" %}', image=None) == ""
+
+
+def test_loading_plan_prioritises_first_hero_and_lazy_loads_below_fold(
+    hero_page, image
+) -> None:
+    plan = build_image_loading_plan(hero_page)
+    hero, intro, gallery = hero_page.body
+
+    assert plan.priority_block_id == hero.id
+    assert plan.priority_image == image
+    assert plan.hints(hero.id) == {"fetchpriority": "high"}
+    assert plan.hints(intro.id) == {}
+    assert plan.hints(gallery.id) == {"loading": "lazy"}
+    assert plan.hints(None) == {}
+
+
+def test_hero_beyond_the_fold_is_not_prioritised(hero_page, settings) -> None:
+    settings.ABOVE_FOLD_BLOCKS = 0
+
+    plan = build_image_loading_plan(hero_page)
+
+    assert plan.priority_block_id is None
+    assert plan.hints(hero_page.body[0].id) == {"loading": "lazy"}
+
+
+def test_page_render_preloads_hero_and_lazy_loads_gallery(client, hero_page) -> None:
+    html = client.get(hero_page.url).content.decode()
+
+    head, body = html.split("</head>", 1)
+    assert '<link rel="preload" as="image"' in head
+    assert 'fetchpriority="high"' in head
+    hero_markup, gallery_markup = body.split("Intro", 1)
+    assert 'fetchpriority="high"' in hero_markup
+    assert 'loading="lazy"' not in hero_markup
+    assert 'loading="lazy"' in gallery_markup
@@ -169,6 +169,19 @@ def _isolate_django_media_root(_session_media_root: Path, settings) -> None:
         storages._storages.clear()
 
 
+@pytest.fixture(autouse=True)
+def _clear_page_listing_cache() -> None:
+    """
+    Drop cached page listings left by earlier tests.
+
+    Listing caches are keyed by page id and tree path, which repeat across
+    tests once each test's transaction is rolled back.
+    """
+    from django.core.cache import cache
+
+    cache.clear()
+
+
 @pytest.fixture()
 def wagtail_default_site(db):
     """
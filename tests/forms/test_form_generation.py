@@ -8,11 +8,19 @@ Dependencies: pytest, Django forms, FormDefinition.
 
 from __future__ import annotations
 
+import json
+from unittest import mock
+
 import pytest
 from django import forms
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
-from sum_core.forms.dynamic import DynamicFormGenerator
+from sum_core.forms.dynamic import (
+    _FORM_CLASS_CACHE,
+    DynamicFormGenerator,
+    get_form_class_cache_stats,
+)
 from sum_core.forms.models import FormDefinition
 
 # Check if libmagic is available for MIME validation tests
@@ -306,6 +314,84 @@ def test_form_class_cache_reuses_definition_version(wagtail_default_site):
     assert new_class is not form_class
 
 
+@pytest.mark.django_db
+def test_workers_rebuild_form_class_from_shared_schema(wagtail_default_site):
+    cache.clear()
+    _FORM_CLASS_CACHE.clear()
+    form_def = FormDefinition.objects.create(
+        site=wagtail_default_site,
+        name="Shared Schema",
+        slug="shared-schema",
+        fields=[
+            ("text_input", {"field_name": "name", "label": "Name"}),
+            (
+                "radio_buttons",
+                {
+                    "field_name": "contact",
+                    "label": "Contact",
+                    "choices": [option("email", "Email")],
+                },
+            ),
+            (
+                "file_upload",
+                {
+                    "field_name": "plans",
+                    "label": "Plans",
+                    "allowed_extensions": "pdf",
+                    "max_file_size_mb": 2,
+                },
+            ),
+        ],
+    )
+    first_class = DynamicFormGenerator(form_def).generate_form_class()
+    schema = DynamicFormGenerator(form_def).get_form_schema()
+    assert json.loads(json.dumps(schema)) == schema
+
+    # Another worker: empty local cache, schema already in the shared cache.
+    _FORM_CLASS_CACHE.clear()
+    with mock.patch.object(DynamicFormGenerator, "compile_form_schema") as compile_:
+        form_class = DynamicFormGenerator(form_def).generate_form_class()
+    compile_.assert_not_called()
+
+    assert form_class is not first_class
+    assert list(form_class.base_fields) == ["name", "contact", "plans"]
+    assert form_class.base_fields["contact"].choices == [("email", "Email")]
+    assert form_class._file_validation_rules["plans"]["extensions"] == [".pdf"]
+    assert get_form_class_cache_stats()["schema_hits"] == 1
+
+
+@pytest.mark.django_db
+def test_form_class_cache_is_bounded_lru(wagtail_default_site, settings):
+    settings.DYNAMIC_FORM_CLASS_CACHE_SIZE = 2
+    _FORM_CLASS_CACHE.clear()
+    form_defs = [
+        FormDefinition.objects.create(
+            site=wagtail_default_site,
+            name=f"Form {i}",
+            slug=f"lru-form-{i}",
+            fields=[("text_input", {"field_name": "name", "label": "Name"})],
+        )
+        for i in range(3)
+    ]
+
+    first_class = DynamicFormGenerator(form_defs[0]).generate_form_class()
+    DynamicFormGenerator(form_defs[1]).generate_form_class()
+    # Touch the first form so the second becomes least recently used.
+    assert DynamicFormGenerator(form_defs[0]).generate_form_class() is first_class
+    DynamicFormGenerator(form_defs[2]).generate_form_class()
+    assert DynamicFormGenerator(form_defs[0]).generate_form_class() is first_class
+
+    # A new version replaces the old entry instead of accumulating.
+    form_defs[0].save()
+    DynamicFormGenerator(form_defs[0]).generate_form_class()
+
+    stats = get_form_class_cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["stale"] == 1
+    assert stats["hits"] == 2
+
+
 @pytest.mark.django_db
 @requires_libmagic
 def test_mime_type_validation_rejects_spoofed_extensions(wagtail_default_site):
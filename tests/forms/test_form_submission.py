@@ -15,12 +15,15 @@ import pytest
 from django.core.cache import cache
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import Client
-from sum_core.forms.cache import get_form_definition_cache_version
+from django.test.utils import CaptureQueriesContext
 from sum_core.forms.models import FormConfiguration, FormDefinition
-from sum_core.forms.services import generate_time_token, get_rate_limit_cache_key
+from sum_core.forms.runtime import get_form_runtime_spec_key
+from sum_core.forms.services import check_rate_limit, generate_time_token
 from sum_core.forms.views import FormSubmissionView
 from sum_core.leads.models import Lead
+from sum_core.leads.tasks import process_lead_side_effects
 
 
 @pytest.fixture(autouse=True)
@@ -124,30 +127,52 @@ def make_dynamic_submission_data(form_definition, time_token: str = "") -> dict:
 
 
 @pytest.mark.django_db
-def test_form_definition_cache_invalidates_on_update(wagtail_site):
+def test_form_definition_cache_invalidates_on_update(
+    wagtail_site, django_capture_on_commit_callbacks
+):
     form_definition = create_dynamic_form_definition(wagtail_site)
     view = FormSubmissionView()
 
     cached = view._get_form_definition(str(form_definition.pk), wagtail_site)
-    version_before = get_form_definition_cache_version(
-        wagtail_site.pk, form_definition.pk
-    )
-
     assert cached is not None
-    assert version_before is not None
+    assert cached.version
 
-    form_definition.name = "Updated"
-    form_definition.save(update_fields=["name"])
+    with django_capture_on_commit_callbacks(execute=True):
+        form_definition.name = "Updated"
+        form_definition.save(update_fields=["name", "updated_at"])
 
-    version_after = get_form_definition_cache_version(
-        wagtail_site.pk, form_definition.pk
-    )
-    refreshed = view._get_form_definition(str(form_definition.pk), wagtail_site)
+    with CaptureQueriesContext(connection) as queries:
+        refreshed = view._get_form_definition(str(form_definition.pk), wagtail_site)
 
-    assert version_after is not None
-    assert version_before != version_after
+    assert len(queries) == 0
     assert refreshed is not None
     assert refreshed.name == "Updated"
+    assert refreshed.version != cached.version
+
+
+@pytest.mark.django_db
+def test_form_runtime_spec_is_read_with_one_cache_get(wagtail_site):
+    form_definition = create_dynamic_form_definition(wagtail_site)
+    view = FormSubmissionView()
+    view._get_form_definition(str(form_definition.pk), wagtail_site)
+
+    with mock.patch.object(cache, "get", wraps=cache.get) as cache_get:
+        spec = view._get_form_definition(str(form_definition.pk), wagtail_site)
+
+    assert cache_get.call_count == 1
+    # Stored as plain values, not a pickled model instance.
+    assert isinstance(cache.get(get_form_runtime_spec_key(form_definition.pk)), tuple)
+    assert spec.slug == form_definition.slug
+    assert [field["name"] for field in spec.schema] == [
+        "name",
+        "email",
+        "message",
+        "phone",
+        "service",
+    ]
+    # Other sites cannot submit this definition.
+    other_site = mock.Mock(pk=wagtail_site.pk + 1)
+    assert view._get_form_definition(str(form_definition.pk), other_site) is None
 
 
 @pytest.mark.django_db
@@ -395,9 +420,9 @@ class TestFormSubmissionSpamProtection:
 
     def test_rate_limit_exceeded_returns_429(self, client, wagtail_site, form_config):
         """Exceeding rate limit should return 429."""
-        # Set counter to limit
-        cache_key = get_rate_limit_cache_key("127.0.0.1", wagtail_site.id)
-        cache.set(cache_key, 20, timeout=3600)
+        # Use up the per-IP budget
+        for _ in range(20):
+            check_rate_limit("127.0.0.1", wagtail_site.id, 20)
 
         data = make_valid_submission_data()
 
@@ -408,6 +433,7 @@ class TestFormSubmissionSpamProtection:
         )
 
         assert response.status_code == 429
+        assert int(response["Retry-After"]) > 0
         resp_data = response.json()
         assert "Too many requests" in str(resp_data["errors"])
 
@@ -429,6 +455,52 @@ class TestFormSubmissionSpamProtection:
 
         assert response.status_code == 400
 
+    def test_replayed_time_token_returns_400(
+        self, client, wagtail_site, form_config, valid_time_token
+    ):
+        """A time token is spent by the first accepted submission."""
+        data = make_valid_submission_data(valid_time_token)
+
+        with mock.patch("sum_core.forms.services.time.time") as mock_time:
+            mock_time.return_value = int(valid_time_token.split(":")[0]) + 5
+            first = client.post(
+                "/forms/submit/", data=data, HTTP_HOST=wagtail_site.hostname
+            )
+            replay = client.post(
+                "/forms/submit/",
+                data=data,
+                HTTP_HOST=wagtail_site.hostname,
+                HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+            )
+
+        assert first.status_code == 200
+        assert first.json()["time_token"] != valid_time_token
+        assert replay.status_code == 400
+        assert replay.json()["errors"]["__all__"] == [
+            "Please refresh the page and try again."
+        ]
+        assert Lead.objects.count() == 1
+
+    def test_validation_error_does_not_spend_time_token(
+        self, client, wagtail_site, form_config, valid_time_token
+    ):
+        """A visitor can fix a validation error and resubmit the same form."""
+        data = make_valid_submission_data(valid_time_token)
+
+        with mock.patch("sum_core.forms.services.time.time") as mock_time:
+            mock_time.return_value = int(valid_time_token.split(":")[0]) + 5
+            invalid = client.post(
+                "/forms/submit/",
+                data={**data, "email": "not-an-email"},
+                HTTP_HOST=wagtail_site.hostname,
+            )
+            fixed = client.post(
+                "/forms/submit/", data=data, HTTP_HOST=wagtail_site.hostname
+            )
+
+        assert invalid.status_code == 400
+        assert fixed.status_code == 200
+
 
 @pytest.mark.django_db
 class TestFormSubmissionCSRF:
@@ -654,9 +726,8 @@ class TestFormSubmissionSuccess:
     def test_rate_limit_incremented_on_success(
         self, client, wagtail_site, form_config, valid_time_token
     ):
-        """Rate limit counter should be incremented after successful submission."""
+        """A successful submission should count against the rate limit."""
         data = make_valid_submission_data(valid_time_token)
-        cache_key = get_rate_limit_cache_key("127.0.0.1", wagtail_site.id)
 
         with mock.patch("sum_core.forms.services.time.time") as mock_time:
             token_time = int(valid_time_token.split(":")[0])
@@ -669,7 +740,7 @@ class TestFormSubmissionSuccess:
             )
 
         assert response.status_code == 200
-        assert cache.get(cache_key) == 1
+        assert check_rate_limit("127.0.0.1", wagtail_site.id, 1).should_rate_limit
 
 
 @pytest.mark.django_db
@@ -699,6 +770,91 @@ class TestDynamicFormSubmission:
         assert lead.form_data["service"] == "roofing"
         assert lead.form_data["ip_address"] == "127.0.0.1"
 
+    def test_dynamic_submission_writes_channel_statuses_in_one_insert(
+        self,
+        client,
+        wagtail_site,
+        form_config,
+        valid_time_token,
+        django_capture_on_commit_callbacks,
+    ):
+        """Channel statuses go into the INSERT; queue failures share one UPDATE."""
+        from sum_core.leads.models import EmailStatus, WebhookStatus
+
+        form_definition = create_dynamic_form_definition(wagtail_site)
+        form_definition.email_notification_enabled = True
+        form_definition.notification_emails = "ops@example.com"
+        form_definition.auto_reply_enabled = True
+        form_definition.webhook_enabled = True
+        form_definition.webhook_url = ""
+        form_definition.save()
+        data = make_dynamic_submission_data(form_definition, valid_time_token)
+        table = connection.ops.quote_name(Lead._meta.db_table)
+
+        with (
+            mock.patch("sum_core.forms.services.time.time") as mock_time,
+            CaptureQueriesContext(connection) as queries,
+        ):
+            mock_time.return_value = int(valid_time_token.split(":")[0]) + 5
+            with django_capture_on_commit_callbacks() as callbacks:
+                response = client.post(
+                    "/forms/submit/", data=data, HTTP_HOST=wagtail_site.hostname
+                )
+
+        assert response.status_code == 200
+        lead_writes = [
+            q["sql"] for q in queries if table in q["sql"] and "SELECT" not in q["sql"]
+        ]
+        assert len(lead_writes) == 1 and lead_writes[0].startswith("INSERT")
+        lead = Lead.objects.get(pk=response.json()["lead_id"])
+        assert lead.form_notification_status == EmailStatus.PENDING
+        assert lead.auto_reply_status == EmailStatus.PENDING
+        assert lead.form_webhook_status == WebhookStatus.FAILED
+        assert lead.form_webhook_last_error == "Webhook URL missing"
+        assert lead.outbox_messages.count() == 1
+
+        # Tasks are only sent to the broker once the Lead has committed.
+        with (
+            mock.patch(
+                "sum_core.forms.tasks.send_form_notification.delay",
+                side_effect=Exception("broker down"),
+            ) as notification_delay,
+            mock.patch(
+                "sum_core.forms.tasks.send_auto_reply.delay",
+                side_effect=Exception("broker down"),
+            ),
+            mock.patch("sum_core.leads.tasks.send_lead_notification.delay"),
+            mock.patch("sum_core.leads.tasks.send_lead_webhook.delay"),
+            mock.patch("sum_core.leads.tasks.send_zapier_webhook.delay"),
+            mock.patch.object(
+                process_lead_side_effects,
+                "delay",
+                side_effect=lambda *args, **kwargs: process_lead_side_effects.apply(
+                    args=args, kwargs=kwargs
+                ),
+            ) as fan_out_delay,
+            CaptureQueriesContext(connection) as queries,
+        ):
+            for callback in callbacks:
+                callback()
+
+        # One publish per outbox message; the worker fans out per channel.
+        fan_out_delay.assert_called_once()
+        assert fan_out_delay.call_args.kwargs["form_channels"] == [
+            "auto_reply",
+            "form_notification",
+        ]
+        notification_delay.assert_called_once()
+        assert not lead.outbox_messages.exists()
+        lead_writes = [
+            q["sql"] for q in queries if table in q["sql"] and "SELECT" not in q["sql"]
+        ]
+        assert len(lead_writes) == 1 and lead_writes[0].startswith("UPDATE")
+        lead.refresh_from_db()
+        assert lead.form_notification_status == EmailStatus.FAILED
+        assert lead.auto_reply_status == EmailStatus.FAILED
+        assert "broker down" in lead.auto_reply_last_error
+
     def test_dynamic_validation_errors_return_400(
         self, client, wagtail_site, form_config
     ):
@@ -759,8 +915,8 @@ class TestDynamicFormSubmission:
         form_definition = create_dynamic_form_definition(wagtail_site)
         data = make_dynamic_submission_data(form_definition)
 
-        cache_key = get_rate_limit_cache_key("127.0.0.1", wagtail_site.id)
-        cache.set(cache_key, 20, timeout=3600)
+        for _ in range(20):
+            check_rate_limit("127.0.0.1", wagtail_site.id, 20)
 
         response = client.post(
             "/forms/submit/",
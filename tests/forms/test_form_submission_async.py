@@ -0,0 +1,179 @@
+"""
+Name: Async form submission tests
+Path: tests/forms/test_form_submission_async.py
+Purpose: Verify the ASGI form submission view matches the sync view's behaviour.
+Family: Test Suite, Forms, Leads.
+Dependencies: pytest, asgiref, Django AsyncRequestFactory/AsyncClient,
+sum_core.forms.views.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import AsyncClient, AsyncRequestFactory
+from django.urls import include, path
+from sum_core.forms.models import FormConfiguration, FormDefinition
+from sum_core.forms.runtime import get_form_runtime_spec_key
+from sum_core.forms.services import generate_time_token
+from sum_core.forms.views import (
+    AsyncFormSubmissionView,
+    FormSubmissionView,
+    get_form_submission_view,
+)
+from sum_core.leads.models import Lead, LeadOutboxMessage
+
+pytestmark = pytest.mark.django_db
+
+# Routes the submit URL to the async view, as FORM_SUBMISSION_ASYNC does.
+urlpatterns = [
+    path(
+        "forms/",
+        include(
+            (
+                [
+                    path(
+                        "submit/",
+                        AsyncFormSubmissionView.as_view(),
+                        name="form_submit",
+                    )
+                ],
+                "sum_core_forms",
+            )
+        ),
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    settings.LEAD_OUTBOX_RELAY_ON_COMMIT = False
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def form_config(wagtail_default_site):
+    config, _ = FormConfiguration.objects.get_or_create(
+        site=wagtail_default_site,
+        defaults={"honeypot_field_name": "company", "min_seconds_to_submit": 3},
+    )
+    return config
+
+
+@pytest.fixture
+def dynamic_form(wagtail_default_site):
+    return FormDefinition.objects.create(
+        site=wagtail_default_site,
+        name="Async Contact",
+        slug="async-contact",
+        fields=[
+            ("text_input", {"field_name": "name", "label": "Name"}),
+            ("email_input", {"field_name": "email", "label": "Email"}),
+            ("textarea", {"field_name": "message", "label": "Message"}),
+        ],
+    )
+
+
+def _submit(data: dict, *, enforce_csrf: bool = False):
+    token = generate_time_token()
+    request = AsyncRequestFactory().post(
+        "/forms/submit/", {**data, "_time_token": token}
+    )
+    request._dont_enforce_csrf_checks = not enforce_csrf
+    with mock.patch("sum_core.forms.services.time.time") as mock_time:
+        mock_time.return_value = int(token.split(":")[0]) + 5
+        return async_to_sync(AsyncFormSubmissionView.as_view())(request)
+
+
+def test_view_is_async_and_selected_by_setting(settings) -> None:
+    assert AsyncFormSubmissionView.view_is_async
+    assert not FormSubmissionView.view_is_async
+
+    settings.FORM_SUBMISSION_ASYNC = True
+    assert get_form_submission_view().view_class is AsyncFormSubmissionView
+    settings.FORM_SUBMISSION_ASYNC = False
+    assert get_form_submission_view().view_class is FormSubmissionView
+
+
+def test_static_submission_creates_lead_and_outbox_message(form_config) -> None:
+    response = _submit(
+        {
+            "name": "John Doe",
+            "email": "john@example.com",
+            "message": "Hello",
+            "form_type": "contact",
+            "company": "",
+        }
+    )
+
+    assert response.status_code == 200
+    lead = Lead.objects.get(pk=json.loads(response.content)["lead_id"])
+    assert lead.email == "john@example.com"
+    assert LeadOutboxMessage.objects.filter(lead=lead).exists()
+
+
+def test_dynamic_submission_reads_cached_spec(dynamic_form) -> None:
+    data = {
+        "form_definition_id": str(dynamic_form.id),
+        "name": "Jane",
+        "email": "jane@example.com",
+        "message": "Quote please",
+        "website": "",
+    }
+
+    response = _submit(data)
+
+    assert response.status_code == 200
+    assert Lead.objects.get().form_type == "async-contact"
+    assert cache.get(get_form_runtime_spec_key(dynamic_form.id)) is not None
+    assert json.loads(response.content)["time_token"]
+
+
+def test_errors_match_sync_view(dynamic_form) -> None:
+    response = _submit(
+        {"form_definition_id": str(dynamic_form.id), "name": "Jane", "website": ""}
+    )
+
+    assert response.status_code == 400
+    assert set(json.loads(response.content)["errors"]) == {"email", "message"}
+    assert not Lead.objects.exists()
+
+
+def test_csrf_is_enforced(form_config) -> None:
+    response = _submit({"name": "John"}, enforce_csrf=True)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.urls(__name__)
+def test_asgi_stack_runs_without_thread_adaptation(
+    form_config, settings, caplog
+) -> None:
+    # Django logs each sync/async adaptation of a middleware or view at DEBUG.
+    settings.DEBUG = True
+    token = generate_time_token()
+    data = {
+        "name": "John Doe",
+        "email": "john@example.com",
+        "message": "Hello",
+        "form_type": "contact",
+        "company": "",
+        "_time_token": token,
+    }
+
+    with caplog.at_level(logging.DEBUG, logger="django.request"):
+        with mock.patch("sum_core.forms.services.time.time") as mock_time:
+            mock_time.return_value = int(token.split(":")[0]) + 5
+            response = async_to_sync(AsyncClient().post)("/forms/submit/", data)
+
+    assert response.status_code == 200
+    assert response["X-Request-ID"]
+    assert Lead.objects.filter(email="john@example.com").exists()
+    assert not [r for r in caplog.records if "adapted" in r.getMessage()]
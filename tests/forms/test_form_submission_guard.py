@@ -0,0 +1,117 @@
+"""
+Name: Form submission guard middleware tests
+Path: tests/forms/test_form_submission_guard.py
+Purpose: Verify floods and fake submissions are rejected before sessions, CSRF and the ORM.
+Family: Test Suite, Forms, Spam Protection.
+Dependencies: pytest, Django test client, sum_core.forms.middleware.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.test import Client
+from sum_core.forms.services import check_rate_limit, generate_time_token
+from sum_core.forms.views import FormSubmissionView
+from wagtail.models import Site
+
+SUBMIT_URL = "/forms/submit/"
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def view_post():
+    with mock.patch.object(
+        FormSubmissionView,
+        "post",
+        autospec=True,
+        return_value=JsonResponse({"success": True}),
+    ) as post:
+        yield post
+
+
+def _post_json(client: Client, payload: dict, **extra):
+    return client.post(
+        SUBMIT_URL, data=json.dumps(payload), content_type="application/json", **extra
+    )
+
+
+def test_forged_time_token_rejected_without_queries(
+    client, view_post, django_assert_num_queries
+) -> None:
+    with django_assert_num_queries(0):
+        response = _post_json(client, {"name": "Bot", "_time_token": "123:forged"})
+
+    assert response.status_code == 400
+    assert response.json()["errors"]["__all__"] == ["Invalid submission"]
+    view_post.assert_not_called()
+
+
+def test_dynamic_honeypot_rejected_early(client, view_post) -> None:
+    response = client.post(
+        SUBMIT_URL, {"form_definition_id": "1", "website": "http://spam.example"}
+    )
+
+    assert response.status_code == 400
+    view_post.assert_not_called()
+
+
+def test_oversized_body_rejected(client, settings, view_post) -> None:
+    settings.FORM_SUBMISSION_MAX_BODY_SIZE = 100
+
+    response = _post_json(client, {"message": "x" * 200})
+
+    assert response.status_code == 413
+    view_post.assert_not_called()
+
+
+def test_rate_limited_client_is_blocked_before_the_view(client) -> None:
+    site = Site.objects.get(is_default_site=True)
+    for _ in range(20):
+        check_rate_limit("127.0.0.1", site.id, 20)
+
+    first = client.post(SUBMIT_URL, {"name": "Flood", "form_type": "contact"})
+    assert first.status_code == 429
+
+    with mock.patch.object(FormSubmissionView, "post", autospec=True) as view_post:
+        second = client.post(SUBMIT_URL, {"name": "Flood", "form_type": "contact"})
+    view_post.assert_not_called()
+
+    assert second.status_code == 429
+    assert 0 < int(second["Retry-After"]) <= int(first["Retry-After"])
+
+
+def test_block_is_per_client(client, view_post) -> None:
+    site = Site.objects.get(is_default_site=True)
+    for _ in range(20):
+        check_rate_limit("127.0.0.1", site.id, 20)
+    view_post.side_effect = lambda view, request: view._spam_response(
+        check_rate_limit("127.0.0.1", site.id, 20), request
+    )
+    assert client.post(SUBMIT_URL, {"name": "Flood"}).status_code == 429
+    view_post.side_effect = None
+
+    Client(REMOTE_ADDR="10.0.0.9").post(SUBMIT_URL, {"name": "Real"})
+    assert view_post.call_count == 2
+
+
+def test_valid_submission_passes_through_with_parsed_body(client, view_post) -> None:
+    payload = {"name": "Real", "_time_token": generate_time_token()}
+
+    _post_json(client, payload)
+
+    view_post.assert_called_once()
+    request = view_post.call_args.args[1]
+    assert request._sum_form_submission_data == payload
@@ -40,8 +40,9 @@ def test_form_hidden_fields_valid_token():
 
     # Verify token format
     assert ":" in token
-    timestamp, signature = token.split(":")
+    timestamp, nonce, signature = token.split(":")
     assert timestamp.isdigit()
+    assert len(nonce) > 0
     assert len(signature) > 0
 
 
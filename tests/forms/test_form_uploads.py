@@ -0,0 +1,141 @@
+"""
+Name: Form upload streaming tests
+Path: tests/forms/test_form_uploads.py
+Purpose: Verify dynamic form files are streamed with bounded memory and hooks run after save.
+Family: Test Suite, Forms, Dynamic Forms, Uploads.
+Dependencies: pytest, Django test client, sum_core.forms.uploads.
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.files.uploadhandler import StopFutureHandlers
+from sum_core.forms.models import FormDefinition
+from sum_core.forms.services import generate_time_token
+from sum_core.forms.tasks import process_form_uploads
+from sum_core.forms.uploads import UPLOAD_HOOKS_CHANNEL, StreamingFormUploadHandler
+from sum_core.leads.models import Lead, LeadOutboxMessage
+
+pytestmark = pytest.mark.django_db
+
+PDF_BYTES = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+HOOK_CALLS: list[tuple[int, str, str]] = []
+
+
+def record_upload(lead, field_name, file_info) -> None:
+    HOOK_CALLS.append((lead.id, field_name, file_info["name"]))
+
+
+def failing_hook(lead, field_name, file_info) -> None:
+    raise RuntimeError("Scanner offline")
+
+
+@pytest.fixture(autouse=True)
+def clear_state():
+    cache.clear()
+    HOOK_CALLS.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def upload_form(wagtail_default_site):
+    return FormDefinition.objects.create(
+        site=wagtail_default_site,
+        name="Upload",
+        slug="upload",
+        fields=[
+            ("text_input", {"field_name": "name", "label": "Name"}),
+            ("email_input", {"field_name": "email", "label": "Email"}),
+            ("textarea", {"field_name": "message", "label": "Message"}),
+            (
+                "file_upload",
+                {
+                    "field_name": "plans",
+                    "label": "Plans",
+                    "allowed_extensions": ".pdf",
+                    "max_file_size_mb": 5,
+                },
+            ),
+        ],
+    )
+
+
+def _submit(client, form_definition, upload):
+    token = generate_time_token()
+    with mock.patch("sum_core.forms.services.time.time") as mock_time:
+        mock_time.return_value = int(token.split(":")[0]) + 5
+        return client.post(
+            "/forms/submit/",
+            {
+                "form_definition_id": str(form_definition.id),
+                "_time_token": token,
+                "name": "Jane",
+                "email": "jane@example.com",
+                "message": "Plans attached.",
+                "website": "",
+                "plans": upload,
+            },
+        )
+
+
+def test_handler_streams_to_temp_file_and_keeps_header(settings) -> None:
+    settings.FORM_UPLOAD_MAX_FILE_SIZE = 10_000
+    handler = StreamingFormUploadHandler()
+    with pytest.raises(StopFutureHandlers):
+        handler.new_file("plans", "plans.pdf", "application/pdf", None)
+
+    handler.receive_data_chunk(b"a" * 1500, 0)
+    handler.receive_data_chunk(b"b" * 1500, 1500)
+    uploaded = handler.file_complete(3000)
+
+    assert isinstance(uploaded, TemporaryUploadedFile)
+    assert uploaded.size == 3000
+    assert uploaded.sniffed_header == b"a" * 1500 + b"b" * 548
+    assert uploaded.read() == b"a" * 1500 + b"b" * 1500
+    uploaded.close()
+
+
+def test_oversized_file_aborts_before_the_view(
+    client, settings, upload_form, django_assert_num_queries
+) -> None:
+    settings.FORM_UPLOAD_MAX_FILE_SIZE = 1024
+    upload = SimpleUploadedFile("plans.pdf", PDF_BYTES + b"x" * 4096)
+
+    with django_assert_num_queries(0):
+        response = _submit(client, upload_form, upload)
+
+    assert response.status_code == 400
+    assert response.json()["errors"] == {"plans": ["File must be 1KB or smaller."]}
+    assert not Lead.objects.exists()
+
+
+def test_upload_hooks_run_after_the_lead_is_saved(
+    client, settings, upload_form
+) -> None:
+    settings.LEAD_OUTBOX_RELAY_ON_COMMIT = False
+    settings.FORM_UPLOAD_HOOKS = [
+        "tests.forms.test_form_uploads.failing_hook",
+        "tests.forms.test_form_uploads.record_upload",
+    ]
+
+    response = _submit(client, upload_form, SimpleUploadedFile("plans.pdf", PDF_BYTES))
+
+    assert response.status_code == 200
+    assert HOOK_CALLS == []
+    lead = Lead.objects.get(pk=response.json()["lead_id"])
+    try:
+        message = LeadOutboxMessage.objects.get(lead=lead)
+        assert UPLOAD_HOOKS_CHANNEL in message.form_channels
+
+        process_form_uploads(lead.id, upload_form.id)
+
+        assert HOOK_CALLS == [(lead.id, "plans", "plans.pdf")]
+        assert lead.form_data["plans"]["size"] == len(PDF_BYTES)
+    finally:
+        default_storage.delete(lead.form_data["plans"]["path"])
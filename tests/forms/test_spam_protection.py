@@ -14,16 +14,28 @@ from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
-from django.core.cache import cache
+from django.core.cache import cache, caches
+from sum_core.forms.ratelimit import (
+    RedisTokenBucketRateLimiter,
+    SlidingWindowRateLimiter,
+    get_rate_limiter,
+)
 from sum_core.forms.services import (
+    SpamCheckResult,
+    _sign_timestamp,
     check_honeypot,
     check_rate_limit,
     check_timing,
+    claim_time_token,
     generate_time_token,
     get_rate_limit_cache_key,
-    increment_rate_limit_counter,
     run_spam_checks,
 )
+from sum_core.forms.token_store import (
+    CacheSeenTokenStore,
+    RedisBloomSeenTokenStore,
+    get_seen_token_store,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -34,6 +46,25 @@ def clear_cache():
     cache.clear()
 
 
+@pytest.fixture
+def redis_cache(settings):
+    """A Django RedisCache backed by fakeredis (with Lua scripting)."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    settings.CACHES = {
+        **settings.CACHES,
+        "redis": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://fakeredis:6379/0",
+            "OPTIONS": {"connection_class": fakeredis.FakeConnection},
+        },
+    }
+    redis_cache = caches["redis"]
+    redis_cache.clear()
+    yield redis_cache
+    redis_cache.clear()
+
+
 class TestHoneypotCheck:
     """Tests for honeypot spam detection."""
 
@@ -65,6 +96,11 @@ class TestHoneypotCheck:
         assert result.is_spam
 
 
+def _exhaust(ip_address: str, site_id: int, max_per_hour: int) -> None:
+    for _ in range(max_per_hour):
+        assert not check_rate_limit(ip_address, site_id, max_per_hour).should_rate_limit
+
+
 class TestRateLimitCheck:
     """Tests for rate limiting."""
 
@@ -76,33 +112,23 @@ class TestRateLimitCheck:
 
     def test_under_limit_passes(self):
         """Submissions under limit should pass."""
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        cache.set(cache_key, 5, timeout=3600)
+        _exhaust("192.168.1.1", 1, 5)
 
         result = check_rate_limit("192.168.1.1", site_id=1, max_per_hour=10)
         assert not result.should_rate_limit
 
-    def test_at_limit_triggers_rate_limit(self):
-        """Submission at limit should trigger rate limit."""
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        cache.set(cache_key, 10, timeout=3600)
+    def test_over_limit_triggers_rate_limit_with_retry_after(self):
+        """The submission after the limit is rejected with a Retry-After delay."""
+        _exhaust("192.168.1.1", 1, 10)
 
         result = check_rate_limit("192.168.1.1", site_id=1, max_per_hour=10)
         assert result.should_rate_limit
         assert "Rate limit" in result.reason
-
-    def test_over_limit_triggers_rate_limit(self):
-        """Submission over limit should trigger rate limit."""
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        cache.set(cache_key, 15, timeout=3600)
-
-        result = check_rate_limit("192.168.1.1", site_id=1, max_per_hour=10)
-        assert result.should_rate_limit
+        assert 0 < result.retry_after <= 2 * 3600
 
     def test_different_ips_are_independent(self):
         """Different IPs should have independent counters."""
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        cache.set(cache_key, 10, timeout=3600)
+        _exhaust("192.168.1.1", 1, 10)
 
         # Different IP should not be rate limited
         result = check_rate_limit("192.168.1.2", site_id=1, max_per_hour=10)
@@ -110,58 +136,169 @@ class TestRateLimitCheck:
 
     def test_different_sites_are_independent(self):
         """Different sites should have independent counters."""
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        cache.set(cache_key, 10, timeout=3600)
+        _exhaust("192.168.1.1", 1, 10)
 
         # Same IP, different site should not be rate limited
         result = check_rate_limit("192.168.1.1", site_id=2, max_per_hour=10)
         assert not result.should_rate_limit
 
+    def test_ip_form_tier_is_per_form(self, settings):
+        """The IP+form tier limits one form without blocking the others."""
+        settings.FORM_RATE_LIMITS = {"ip_form": {"limit": 2, "window": 3600}}
+        for _ in range(2):
+            assert not check_rate_limit("192.168.1.1", 1, 10, "quote").should_rate_limit
+
+        assert check_rate_limit("192.168.1.1", 1, 10, "quote").should_rate_limit
+        assert not check_rate_limit("192.168.1.1", 1, 10, "contact").should_rate_limit
+
+    def test_site_and_global_tiers_cap_all_ips(self, settings):
+        """Site and global ceilings apply across client IPs."""
+        settings.FORM_RATE_LIMITS = {
+            "site": {"limit": 2, "window": 60},
+            "global": {"limit": 3, "window": 60},
+        }
+        assert not check_rate_limit("10.0.0.1", 1, 10).should_rate_limit
+        assert not check_rate_limit("10.0.0.2", 1, 10).should_rate_limit
+        assert check_rate_limit("10.0.0.3", 1, 10).should_rate_limit
+
+        assert not check_rate_limit("10.0.0.4", 2, 10).should_rate_limit
+        assert check_rate_limit("10.0.0.5", 3, 10).should_rate_limit
+
+    def test_rejection_by_a_later_tier_refunds_earlier_tiers(self, settings):
+        """A submission refused by the site tier costs no per-IP budget."""
+        settings.FORM_RATE_LIMITS = {"site": {"limit": 1, "window": 60}}
+        assert not check_rate_limit("10.0.0.1", 1, 2).should_rate_limit
+        for _ in range(3):
+            assert check_rate_limit("10.0.0.2", 1, 2).rate_limit_tier == "site"
+
+        settings.FORM_RATE_LIMITS = {"site": {"limit": 10, "window": 60}}
+        for _ in range(2):
+            assert not check_rate_limit("10.0.0.2", 1, 2).should_rate_limit
+        assert check_rate_limit("10.0.0.2", 1, 2).rate_limit_tier == "ip"
+
+    def test_limiter_failure_does_not_block(self):
+        """A cache outage skips the check rather than losing leads."""
+        with mock.patch(
+            "sum_core.forms.services.check_rate_limit_tiers",
+            side_effect=ConnectionError("cache down"),
+        ):
+            result = check_rate_limit("192.168.1.1", site_id=1, max_per_hour=10)
+        assert not result.should_rate_limit
 
-class TestIncrementRateLimitCounter:
-    """Tests for rate limit counter increment."""
+    def test_rate_limit_key_is_site_scoped(self):
+        assert get_rate_limit_cache_key("192.168.1.1", 1) != get_rate_limit_cache_key(
+            "192.168.1.1", 2
+        )
 
-    def test_increment_from_zero(self):
-        """Counter should increment from 0 to 1."""
-        increment_rate_limit_counter("192.168.1.1", site_id=1)
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        assert cache.get(cache_key) == 1
 
-    def test_increment_existing_counter(self):
-        """Counter should increment existing value."""
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        cache.set(cache_key, 5, timeout=3600)
+class TestSlidingWindowRateLimiter:
+    """Tests for the cache-backed sliding window limiter."""
 
-        increment_rate_limit_counter("192.168.1.1", site_id=1)
-        assert cache.get(cache_key) == 6
+    def _limiter(self, now: list[float]) -> SlidingWindowRateLimiter:
+        limiter = SlidingWindowRateLimiter()
+        limiter.clock = lambda: now[0]
+        return limiter
 
-    def test_increment_is_atomic_under_concurrency(self):
-        """Concurrent increments should not lose updates."""
-        ip_address = "192.168.1.1"
-        site_id = 1
-        cache_key = get_rate_limit_cache_key(ip_address, site_id)
+    def test_window_slides_and_rejections_are_free(self):
+        """Blocked clients regain budget as the window slides past their hits."""
+        now = [6000.0]
+        limiter = self._limiter(now)
+        assert limiter.hit("k", limit=2, window=60).allowed
+        assert limiter.hit("k", limit=2, window=60).allowed
 
-        def worker() -> None:
-            increment_rate_limit_counter(ip_address, site_id=site_id)
+        rejected = limiter.hit("k", limit=2, window=60)
+        assert not rejected.allowed
+        assert rejected.retry_after == 90
+        for _ in range(5):
+            assert not limiter.hit("k", limit=2, window=60).allowed
+
+        now[0] += 89
+        assert not limiter.hit("k", limit=2, window=60).allowed
+        now[0] += 1
+        assert limiter.hit("k", limit=2, window=60).allowed
+
+    def test_hits_are_atomic_under_concurrency(self):
+        """Concurrent hits should not lose updates."""
+        limiter = SlidingWindowRateLimiter()
+        limiter.clock = lambda: 6000.0
 
         with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(worker) for _ in range(50)]
-            for future in futures:
-                future.result()
+            futures = [executor.submit(limiter.hit, "k", 100, 3600) for _ in range(50)]
+            assert all(future.result().allowed for future in futures)
+
+        assert limiter.hit("k", limit=100, window=3600).remaining == 49
 
-        assert cache.get(cache_key) == 50
+    def test_backend_is_configurable(self, settings):
+        assert isinstance(get_rate_limiter(), SlidingWindowRateLimiter)
+
+        settings.FORM_RATE_LIMIT_BACKEND = (
+            "sum_core.forms.ratelimit.SlidingWindowRateLimiter"
+        )
+        assert isinstance(get_rate_limiter(), SlidingWindowRateLimiter)
+
+
+class TestRedisTokenBucketRateLimiter:
+    """Tests for the Lua token bucket used with RedisCache."""
+
+    def _hit(self, limiter, now: float, limit: int = 2, window: int = 60):
+        with mock.patch("sum_core.forms.ratelimit.time.time", return_value=now):
+            return limiter.hit("k", limit=limit, window=window)
+
+    def test_allows_burst_then_rejects_with_retry_after(self, redis_cache):
+        limiter = RedisTokenBucketRateLimiter("redis")
+
+        first = self._hit(limiter, 1000.0)
+        assert first.allowed and first.remaining == 1
+        assert self._hit(limiter, 1000.0).allowed
+
+        rejected = self._hit(limiter, 1000.0)
+        assert not rejected.allowed
+        # One token refills every window / limit = 30 seconds.
+        assert rejected.retry_after == 30
+        assert self._hit(limiter, 1010.0).retry_after == 20
+
+    def test_bucket_refills_at_the_configured_rate(self, redis_cache):
+        limiter = RedisTokenBucketRateLimiter("redis")
+        for _ in range(2):
+            assert self._hit(limiter, 1000.0).allowed
+        assert not self._hit(limiter, 1029.0).allowed
+
+        assert self._hit(limiter, 1030.0).allowed
+        assert not self._hit(limiter, 1030.0).allowed
+        # Never refills beyond the limit.
+        assert self._hit(limiter, 5000.0).remaining == 1
+
+    def test_refund_returns_a_token_up_to_capacity(self, redis_cache):
+        limiter = RedisTokenBucketRateLimiter("redis")
+        for _ in range(2):
+            self._hit(limiter, 1000.0)
+
+        limiter.refund("k", limit=2, window=60)
+        assert self._hit(limiter, 1000.0).allowed
+        limiter.refund("k", limit=2, window=60)
+        limiter.refund("k", limit=2, window=60)
+        assert self._hit(limiter, 1000.0).remaining == 1
+
+    def test_is_the_default_for_redis_cache(self, redis_cache, settings):
+        settings.CACHES = {**settings.CACHES, "default": settings.CACHES["redis"]}
+        assert isinstance(get_rate_limiter(), RedisTokenBucketRateLimiter)
 
 
 class TestTimeTokenGeneration:
     """Tests for time token generation."""
 
     def test_generates_valid_format(self):
-        """Token should be in timestamp:signature format."""
+        """Token should be in timestamp:nonce:signature format."""
         token = generate_time_token()
         parts = token.split(":")
-        assert len(parts) == 2
+        assert len(parts) == 3
         assert parts[0].isdigit()
-        assert len(parts[1]) == 64  # Full SHA-256 HMAC hexdigest
+        assert len(parts[1]) == 16
+        assert len(parts[2]) == 64  # Full SHA-256 HMAC hexdigest
+
+    def test_generates_distinct_nonces(self):
+        """Tokens issued in the same second must still differ."""
+        assert generate_time_token() != generate_time_token()
 
     def test_generates_unique_tokens(self):
         """Each call should generate a unique signature timing."""
@@ -275,6 +412,122 @@ class TestTimingCheck:
         assert "expired" in result.reason.lower()
 
 
+class TestTimeTokenReplay:
+    """Tests for single-use time tokens."""
+
+    def _check_later(self, token: str) -> SpamCheckResult:
+        with mock.patch("sum_core.forms.services.time.time") as mock_time:
+            mock_time.return_value = int(token.split(":")[0]) + 5
+            return check_timing(token, min_seconds=3)
+
+    def test_claimed_token_is_rejected(self, caplog_propagate):
+        token = generate_time_token()
+        assert not self._check_later(token).is_spam
+        assert claim_time_token(token)
+
+        with caplog_propagate("sum_core.forms.services", "sum_core") as caplog:
+            with caplog.at_level(logging.WARNING):
+                result = self._check_later(token)
+
+        assert result.is_spam
+        assert result.reason == "Time token already used"
+        assert any(
+            getattr(record, "metric_name", "") == "forms.time_token.replayed"
+            for record in caplog.records
+        )
+
+    def test_token_can_only_be_claimed_once(self):
+        token = generate_time_token()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            claims = list(pool.map(lambda _: claim_time_token(token), range(4)))
+        assert claims.count(True) == 1
+
+    def test_other_tokens_unaffected(self):
+        assert claim_time_token(generate_time_token())
+        assert not self._check_later(generate_time_token()).is_spam
+
+    def test_legacy_token_without_nonce_still_accepted(self):
+        timestamp = str(int(time.time()))
+        token = f"{timestamp}:{_sign_timestamp(timestamp)}"
+
+        assert claim_time_token(token)
+        assert not self._check_later(token).is_spam
+
+    def test_nonce_is_covered_by_signature(self):
+        timestamp, _nonce, signature = generate_time_token().split(":")
+        result = self._check_later(f"{timestamp}:forgednonce00000:{signature}")
+        assert result.is_spam
+        assert "signature" in result.reason.lower()
+
+    def test_store_failure_fails_open(self):
+        token = generate_time_token()
+        with (
+            mock.patch.object(
+                CacheSeenTokenStore, "add", side_effect=ConnectionError("down")
+            ),
+            mock.patch.object(
+                CacheSeenTokenStore, "contains", side_effect=ConnectionError("down")
+            ),
+        ):
+            assert claim_time_token(token)
+            assert not self._check_later(token).is_spam
+
+
+class TestRedisBloomSeenTokenStore:
+    """Tests for the Bloom-filter seen-token store used with RedisCache."""
+
+    LIFETIME = 3600
+
+    def _store(self) -> RedisBloomSeenTokenStore:
+        return RedisBloomSeenTokenStore(self.LIFETIME, cache_alias="redis")
+
+    def _generation(self) -> int:
+        return int(time.time()) // self.LIFETIME
+
+    def test_add_contains_and_replay(self, redis_cache):
+        store = self._store()
+        issued_at = self._generation() * self.LIFETIME + 10
+
+        assert not store.contains("nonce-a", issued_at)
+        assert store.add("nonce-a", issued_at)
+        assert store.contains("nonce-a", issued_at)
+        assert not store.add("nonce-a", issued_at)
+        assert not store.contains("nonce-b", issued_at)
+        assert store.add("nonce-b", issued_at + 100)
+
+    def test_each_generation_has_its_own_expiring_filter(self, redis_cache):
+        store = self._store()
+        client = redis_cache._cache.get_client()
+        generation = self._generation()
+        first = (generation - 1) * self.LIFETIME + 10
+        second = generation * self.LIFETIME + 10
+        store.add("nonce-a", first)
+
+        assert not store.contains("nonce-a", second)
+        assert store.add("nonce-a", second)
+        assert store._key(first) != store._key(second)
+        # A filter lives until its last token has expired, plus slack.
+        assert client.expiretime(store._key(first)) == (
+            (generation + 1) * self.LIFETIME + 60
+        )
+        assert client.expiretime(store._key(second)) == (
+            (generation + 2) * self.LIFETIME + 60
+        )
+
+        # Filters of generations whose tokens have all expired are dropped.
+        store.add("nonce-a", (generation - 3) * self.LIFETIME)
+        assert not client.exists(store._key((generation - 3) * self.LIFETIME))
+
+    def test_is_the_default_for_redis_cache(self, redis_cache, settings):
+        settings.CACHES = {**settings.CACHES, "default": settings.CACHES["redis"]}
+        store = get_seen_token_store(self.LIFETIME)
+        assert isinstance(store, RedisBloomSeenTokenStore)
+
+        token = generate_time_token()
+        assert claim_time_token(token)
+        assert not claim_time_token(token)
+
+
 class TestRunSpamChecks:
     """Integration tests for combined spam checks."""
 
@@ -314,8 +567,7 @@ class TestRunSpamChecks:
 
     def test_rate_limit_returns_correct_flag(self):
         """Rate limit should set should_rate_limit flag."""
-        cache_key = get_rate_limit_cache_key("192.168.1.1", 1)
-        cache.set(cache_key, 20, timeout=3600)
+        _exhaust("192.168.1.1", 1, 20)
 
         result = run_spam_checks(
             form_data={"company": ""},
@@ -327,6 +579,7 @@ class TestRunSpamChecks:
             min_seconds_to_submit=3,
         )
         assert result.should_rate_limit
+        assert result.retry_after > 0
         assert not result.is_spam  # Rate limit is separate from spam
 
     def test_timing_check_runs_when_others_pass(self):
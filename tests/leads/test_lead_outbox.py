@@ -0,0 +1,148 @@
+"""
+Name: Lead outbox tests
+Path: tests/leads/test_lead_outbox.py
+Purpose: Verify lead side effects are recorded with the Lead and relayed to the broker.
+Family: Leads, forms, reliability.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import transaction
+from django.test import Client
+from django.utils import timezone
+from sum_core.leads.models import Lead, LeadOutboxMessage
+from sum_core.leads.outbox import (
+    RELAY_LEASE_SECONDS,
+    enqueue_lead_side_effects,
+    relay_lead_outbox,
+)
+from sum_core.leads.tasks import process_lead_side_effects
+
+pytestmark = pytest.mark.django_db
+
+
+def _lead(email: str = "outbox@example.com") -> Lead:
+    return Lead.objects.create(
+        name="Outbox", email=email, message="Hi", form_type="contact"
+    )
+
+
+def test_submission_writes_outbox_without_touching_broker(
+    settings, django_capture_on_commit_callbacks
+) -> None:
+    settings.LEAD_OUTBOX_RELAY_ON_COMMIT = False
+    cache.clear()
+
+    with patch.object(process_lead_side_effects, "delay") as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            response = Client().post(
+                "/forms/submit/",
+                {
+                    "name": "Outbox",
+                    "email": "outbox@example.com",
+                    "message": "Broker is slow",
+                    "form_type": "contact",
+                },
+            )
+
+    assert response.status_code == 200
+    delay.assert_not_called()
+    message = LeadOutboxMessage.objects.get(lead_id=response.json()["lead_id"])
+    assert message.attempts == 0
+    assert message.form_channels == []
+
+
+def test_outbox_message_rolls_back_with_lead(settings) -> None:
+    settings.LEAD_OUTBOX_RELAY_ON_COMMIT = False
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        enqueue_lead_side_effects(_lead(), site_id=1)
+        raise RuntimeError
+
+    assert not Lead.objects.exists()
+    assert not LeadOutboxMessage.objects.exists()
+
+
+def test_relay_stops_at_first_publish_failure_and_backs_off(settings) -> None:
+    settings.LEAD_OUTBOX_RELAY_ON_COMMIT = False
+    first, second, third = (
+        enqueue_lead_side_effects(
+            _lead(f"lead{i}@example.com"),
+            site_id=1,
+            request_id="req-1",
+            form_definition_id=7,
+            form_channels={"form_notification", "auto_reply"},
+        )
+        for i in range(3)
+    )
+
+    with patch.object(
+        process_lead_side_effects,
+        "delay",
+        side_effect=[None, Exception("Broker unreachable")],
+    ) as delay:
+        result = relay_lead_outbox()
+
+    assert (result.published, result.failed) == (1, 1)
+    assert delay.call_count == 2
+    assert delay.call_args_list[0].kwargs == {
+        "request_id": "req-1",
+        "form_definition_id": 7,
+        "form_channels": ["auto_reply", "form_notification"],
+    }
+    assert not LeadOutboxMessage.objects.filter(pk=first.pk).exists()
+    second.refresh_from_db()
+    assert second.attempts == 1
+    assert second.last_error == "Broker unreachable"
+    assert second.available_at > timezone.now()
+    third.refresh_from_db()
+    assert third.attempts == 0
+
+    # The backed-off message is skipped until it is due again.
+    with patch.object(process_lead_side_effects, "delay") as delay:
+        assert relay_lead_outbox().published == 1
+    assert delay.call_args.args[0] == third.lead_id
+
+
+def test_relay_publishes_after_claiming_outside_the_transaction(settings) -> None:
+    settings.LEAD_OUTBOX_RELAY_ON_COMMIT = False
+    message = enqueue_lead_side_effects(_lead(), site_id=1)
+    connection = transaction.get_connection()
+    depth = len(connection.atomic_blocks)
+    observed = []
+
+    def publish(*args, **kwargs):
+        leased = LeadOutboxMessage.objects.get(pk=message.pk)
+        observed.append((len(connection.atomic_blocks), leased.available_at))
+
+    with patch.object(process_lead_side_effects, "delay", side_effect=publish):
+        assert relay_lead_outbox().published == 1
+
+    ((publish_depth, available_at),) = observed
+    assert publish_depth == depth
+    assert available_at > timezone.now() + timedelta(seconds=RELAY_LEASE_SECONDS - 5)
+    assert not LeadOutboxMessage.objects.exists()
+
+
+def test_command_drains_due_messages(settings) -> None:
+    settings.LEAD_OUTBOX_RELAY_ON_COMMIT = False
+    for i in range(3):
+        enqueue_lead_side_effects(_lead(f"lead{i}@example.com"), site_id=1)
+    LeadOutboxMessage.objects.filter(pk=LeadOutboxMessage.objects.last().pk).update(
+        available_at=timezone.now() + timedelta(minutes=5)
+    )
+
+    out = StringIO()
+    with patch.object(process_lead_side_effects, "delay") as delay:
+        call_command("relay_lead_outbox", "--batch-size", "1", stdout=out)
+
+    assert delay.call_count == 2
+    assert "Published 2 outbox message(s)." in out.getvalue()
+    assert LeadOutboxMessage.objects.count() == 1
@@ -10,11 +10,25 @@ from unittest.mock import patch
 import pytest
 from django.core.cache import cache
 from django.test import Client
+from django.utils import timezone
 from sum_core.forms.models import FormConfiguration
-from sum_core.leads.models import EmailStatus, Lead, WebhookStatus
+from sum_core.leads.models import EmailStatus, Lead, LeadOutboxMessage, WebhookStatus
+from sum_core.leads.outbox import relay_lead_outbox
+from sum_core.leads.tasks import process_lead_side_effects
 from wagtail.models import Site
 
 
+@pytest.fixture(autouse=True)
+def run_lead_fan_out_inline():
+    """Run the submission fan-out task in-process, as the worker would."""
+
+    def run(*args, **kwargs):
+        return process_lead_side_effects.apply(args=args, kwargs=kwargs)
+
+    with patch.object(process_lead_side_effects, "delay", side_effect=run):
+        yield
+
+
 def _disable_rate_limit() -> None:
     cache.clear()
     site = Site.objects.get(is_default_site=True)
@@ -28,9 +42,13 @@ class TestNotificationQueueFailures:
     """
     Test that leads are preserved and status updated even if
     Celery task queueing fails (e.g. Broker down).
+
+    Tasks are relayed from the lead outbox once the Lead's transaction commits
+    (LEAD_OUTBOX_RELAY_ON_COMMIT), so each submission runs the captured
+    on_commit callbacks.
     """
 
-    def test_broker_down_during_email_queue(self):
+    def test_broker_down_during_email_queue(self, django_capture_on_commit_callbacks):
         """
         If queuing the email task raises an exception (e.g. broker down),
         the lead should still exist, and email_status should be FAILED.
@@ -49,7 +67,8 @@ class TestNotificationQueueFailures:
             "sum_core.leads.tasks.send_lead_notification.delay",
             side_effect=Exception("Redis connection refused"),
         ):
-            response = client.post("/forms/submit/", data)
+            with django_capture_on_commit_callbacks(execute=True):
+                response = client.post("/forms/submit/", data)
 
         assert response.status_code == 200
         assert response.json()["success"] is True
@@ -68,7 +87,7 @@ class TestNotificationQueueFailures:
         # Since we didn't mock send_lead_webhook.delay, and settings might not have URL, check default.
         # If eager, it would run.
 
-    def test_broker_down_during_webhook_queue(self):
+    def test_broker_down_during_webhook_queue(self, django_capture_on_commit_callbacks):
         """
         If queuing the webhook task raises an exception,
         the lead should still exist, and webhook_status should be FAILED.
@@ -86,7 +105,8 @@ class TestNotificationQueueFailures:
             "sum_core.leads.tasks.send_lead_webhook.delay",
             side_effect=Exception("Kombu error"),
         ):
-            response = client.post("/forms/submit/", data)
+            with django_capture_on_commit_callbacks(execute=True):
+                response = client.post("/forms/submit/", data)
 
         assert response.status_code == 200
 
@@ -94,7 +114,7 @@ class TestNotificationQueueFailures:
         assert lead.webhook_status == WebhookStatus.FAILED
         assert "Kombu error" in lead.webhook_last_error
 
-    def test_both_queues_fail_persists_lead(self):
+    def test_both_queues_fail_persists_lead(self, django_capture_on_commit_callbacks):
         """
         Even if EVERYTHING fails (both tasks queueing), the lead must persist.
         """
@@ -117,7 +137,8 @@ class TestNotificationQueueFailures:
                 side_effect=Exception("Error 2"),
             ),
         ):
-            response = client.post("/forms/submit/", data)
+            with django_capture_on_commit_callbacks(execute=True):
+                response = client.post("/forms/submit/", data)
 
         assert response.status_code == 200
 
@@ -126,3 +147,42 @@ class TestNotificationQueueFailures:
         assert "Error 1" in lead.email_last_error
         assert lead.webhook_status == WebhookStatus.FAILED
         assert "Error 2" in lead.webhook_last_error
+
+    def test_fan_out_queue_failure_keeps_lead_pending_in_outbox(
+        self, django_capture_on_commit_callbacks
+    ):
+        """
+        If the fan-out task cannot be published, the outbox keeps the message
+        for a later relay instead of failing the lead's channels.
+        """
+        _disable_rate_limit()
+        client = Client()
+        data = {
+            "name": "Fan Out Fail",
+            "email": "fanout@example.com",
+            "message": "Broker down before fan-out",
+            "form_type": "contact",
+        }
+
+        with patch.object(
+            process_lead_side_effects,
+            "delay",
+            side_effect=Exception("Broker unreachable"),
+        ):
+            with django_capture_on_commit_callbacks(execute=True):
+                response = client.post("/forms/submit/", data)
+
+        assert response.status_code == 200
+        lead = Lead.objects.get(email="fanout@example.com")
+        assert lead.email_status == EmailStatus.PENDING
+        assert lead.webhook_status == WebhookStatus.PENDING
+        message = LeadOutboxMessage.objects.get(lead=lead)
+        assert message.attempts == 1
+        assert "Broker unreachable" in message.last_error
+
+        # Once the broker is back, the relay publishes the message.
+        LeadOutboxMessage.objects.update(available_at=timezone.now())
+        with patch("sum_core.leads.tasks.send_lead_notification.delay") as email:
+            assert relay_lead_outbox().published == 1
+        email.assert_called_once()
+        assert not LeadOutboxMessage.objects.filter(lead=lead).exists()
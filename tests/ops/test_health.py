@@ -1,12 +1,16 @@
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.urls import reverse
+from django.utils import timezone
+from sum_core.leads.models import Lead, LeadOutboxMessage
 from sum_core.ops.health import (
     CheckResult,
     check_cache,
     check_celery,
     check_db,
+    check_lead_outbox,
     get_health_status,
 )
 
@@ -92,6 +96,38 @@ def test_check_celery_failure_when_configured_but_unreachable(
     assert "Broker down" in (result.detail or "")
 
 
+def test_check_lead_outbox_fails_for_stale_messages(settings):
+    """Outbox messages nobody relays make the outbox check fail."""
+    settings.LEAD_OUTBOX_STALE_MINUTES = 10
+    lead = Lead.objects.create(name="A", email="a@example.com", message="Hi")
+    message = LeadOutboxMessage.objects.create(lead=lead, site_id=1)
+    assert check_lead_outbox().status == "ok"
+
+    LeadOutboxMessage.objects.filter(pk=message.pk).update(
+        created_at=timezone.now() - timedelta(minutes=11)
+    )
+    result = check_lead_outbox()
+
+    assert result.status == "fail"
+    assert "1 lead outbox message(s)" in (result.detail or "")
+
+
+def test_get_health_status_degraded_when_lead_outbox_is_stale(monkeypatch):
+    """A stale lead outbox degrades the service but does not make it unhealthy."""
+    for name in ("check_db", "check_cache", "check_celery"):
+        monkeypatch.setattr(
+            f"sum_core.ops.health.{name}", lambda: CheckResult(status="ok")
+        )
+    monkeypatch.setattr(
+        "sum_core.ops.health.check_lead_outbox",
+        lambda: CheckResult(status="fail", detail="3 stale"),
+    )
+
+    data = get_health_status()
+    assert data["status"] == "degraded"
+    assert data["checks"]["lead_outbox"]["status"] == "fail"
+
+
 def test_get_health_status_ok_when_celery_not_configured(monkeypatch):
     """If no Celery broker is configured, celery is skipped and overall status remains ok."""
     monkeypatch.setattr(
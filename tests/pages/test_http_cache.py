@@ -0,0 +1,125 @@
+"""
+Name: Page HTTP Caching Tests
+Path: tests/pages/test_http_cache.py
+Purpose: Validate page validators, 304 responses and per-page-type Cache-Control headers.
+Family: Part of the page-level test suite exercising the page types.
+Dependencies: sum_core.pages.http_cache, sum_core.pages.StandardPage/LegalPage, Wagtail.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory
+from sum_core.navigation.cache import invalidate_nav_cache
+from sum_core.pages.http_cache import apply_cache_headers, get_page_validators
+from sum_core.pages.legal import LegalPage
+from sum_core.pages.related import rebuild_related_posts_index
+from sum_core.pages.renditions import generate_image_renditions
+from sum_core.pages.search_index import rebuild_search_index
+from sum_core.pages.standard import StandardPage
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import Site
+
+pytestmark = pytest.mark.django_db
+
+
+def _publish(page):
+    site = Site.objects.get(is_default_site=True)
+    site.root_page.add_child(instance=page)
+    page.save_revision().publish()
+    return type(page).objects.get(pk=page.pk)
+
+
+@pytest.fixture
+def standard_page() -> StandardPage:
+    return _publish(StandardPage(title="About", slug="about-cache"))
+
+
+def test_page_response_has_validators_and_page_type_cache_control(
+    client, standard_page
+) -> None:
+    response = client.get(standard_page.url)
+
+    assert response.status_code == 200
+    assert response["ETag"].startswith('W/"')
+    assert response.has_header("Last-Modified")
+    assert response["Cache-Control"] == (
+        "public, max-age=60, stale-while-revalidate=300"
+    )
+    assert not response.has_header("Vary") or "Cookie" not in response["Vary"]
+
+    legal = _publish(LegalPage(title="Privacy", slug="privacy-cache"))
+    assert client.get(legal.url)["Cache-Control"] == (
+        "public, max-age=86400, stale-while-revalidate=86400"
+    )
+
+
+def test_conditional_request_returns_304_until_site_version_changes(
+    client, standard_page
+) -> None:
+    client.get(standard_page.url)  # Creates the site's settings rows.
+    etag = client.get(standard_page.url)["ETag"]
+
+    not_modified = client.get(standard_page.url, HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    invalidate_nav_cache(Site.objects.get(is_default_site=True).pk)
+    refreshed = client.get(standard_page.url, HTTP_IF_NONE_MATCH=etag)
+    assert refreshed.status_code == 200
+    assert refreshed["ETag"] != etag
+
+
+def _generate_renditions() -> None:
+    image = Image.objects.create(title="Hero", file=get_test_image_file())
+    generate_image_renditions(image.pk, ["fill-160x160"])
+
+
+@pytest.mark.parametrize(
+    "write_content",
+    [rebuild_related_posts_index, rebuild_search_index, _generate_renditions],
+    ids=["related-posts", "search-index", "renditions"],
+)
+def test_async_content_writes_change_validators(
+    client, standard_page, write_content
+) -> None:
+    client.get(standard_page.url)  # Creates the site's settings rows.
+    response = client.get(standard_page.url)
+    etag = response["ETag"]
+    assert client.get(standard_page.url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    write_content()
+
+    refreshed = client.get(standard_page.url, HTTP_IF_NONE_MATCH=etag)
+    assert refreshed.status_code == 200
+    assert refreshed["ETag"] != etag
+
+
+def test_cache_control_is_configurable_per_page_type(
+    client, settings, standard_page
+) -> None:
+    settings.PAGE_CACHE_CONTROL = {
+        "sum_core_pages.standardpage": {"max_age": 5, "stale_while_revalidate": 0}
+    }
+
+    assert client.get(standard_page.url)["Cache-Control"] == "public, max-age=5"
+
+
+def test_logged_in_and_visitor_dependent_responses_are_not_shared(
+    client, standard_page
+) -> None:
+    user = get_user_model().objects.create_user("editor", password="x")
+    client.force_login(user)
+    response = client.get(standard_page.url)
+    assert not response.has_header("ETag")
+    assert "public" not in response.get("Cache-Control", "")
+
+    request = RequestFactory().get(standard_page.url)
+    request.META["CSRF_COOKIE_NEEDS_UPDATE"] = True
+    validators = get_page_validators(standard_page, request)
+    response = apply_cache_headers(standard_page, request, HttpResponse(), validators)
+    assert response["Cache-Control"] == "private, no-cache"
+    assert response["ETag"] == validators.etag
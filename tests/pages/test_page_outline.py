@@ -0,0 +1,153 @@
+"""
+Name: Page Outline Tests
+Path: tests/pages/test_page_outline.py
+Purpose: Validate the per-revision page outline and its FAQ schema, TOC and anchor consumers.
+Family: Part of the page-level test suite exercising the page types.
+Dependencies: sum_core.pages.outline, sum_core.pages.StandardPage, Wagtail.
+"""
+
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import RequestFactory
+from sum_core.blocks import PageStreamBlock
+from sum_core.pages.outline import (
+    PageOutline,
+    add_heading_anchors,
+    build_page_outline,
+    get_page_outline,
+)
+from sum_core.pages.standard import StandardPage
+from wagtail.models import Site
+
+pytestmark = pytest.mark.django_db
+
+BODY = [
+    {
+        "type": "table_of_contents",
+        "value": {"items": [{"label": "Manual", "anchor": "manual"}]},
+    },
+    {
+        "type": "rich_text",
+        "value": "<h2>Planning &amp; Design</h2><p>One two three.</p><h3>Budget</h3>",
+    },
+    {
+        "type": "legal_section",
+        "value": {
+            "anchor": "budget",
+            "heading": "Payment terms",
+            "body": "<h3>Budget</h3><p>Four five.</p>",
+        },
+    },
+    {
+        "type": "faq",
+        "value": {
+            "heading": "<p>FAQ</p>",
+            "items": [
+                {"question": "How long?", "answer": "<p>About <b>six</b> weeks.</p>"},
+                {"question": "", "answer": "<p>Ignored</p>"},
+            ],
+        },
+    },
+]
+
+
+@pytest.fixture
+def outline_page() -> StandardPage:
+    home = Site.objects.get(is_default_site=True).root_page
+    page = StandardPage(title="Guide", slug="guide")
+    page.body = PageStreamBlock().to_python(BODY)
+    home.add_child(instance=page)
+    page.save_revision().publish()
+    return StandardPage.objects.get(pk=page.pk)
+
+
+def test_outline_collects_faq_pairs_headings_and_word_count(outline_page) -> None:
+    outline = build_page_outline(outline_page)
+
+    assert outline.faq_items == [
+        {"question": "How long?", "answer": "About six weeks."}
+    ]
+    assert [(h["level"], h["text"], h["anchor"]) for h in outline.headings] == [
+        (2, "Planning & Design", "planning-design"),
+        (3, "Budget", "budget-2"),
+        (2, "Payment terms", "budget"),
+        (3, "Budget", "budget-3"),
+    ]
+    assert outline.word_count > 10
+    assert outline.reading_time == 1
+
+
+def test_publish_stores_outline_for_live_revision(
+    outline_page, django_assert_num_queries
+) -> None:
+    stored = PageOutline.objects.get(page=outline_page)
+    assert stored.revision_id == outline_page.live_revision_id
+
+    with django_assert_num_queries(1):
+        outline = get_page_outline(outline_page)
+    assert outline.pk == stored.pk
+    # Memoized on the page instance.
+    with django_assert_num_queries(0):
+        assert get_page_outline(outline_page) is outline
+
+
+def test_stale_or_missing_outline_is_built_without_writing(outline_page) -> None:
+    PageOutline.objects.filter(page=outline_page).update(faq_items=[], revision=None)
+    assert get_page_outline(outline_page).faq_items
+    assert PageOutline.objects.get(page=outline_page).faq_items == []
+
+    PageOutline.objects.all().delete()
+    page = StandardPage.objects.get(pk=outline_page.pk)
+    assert get_page_outline(page).faq_items
+    assert not PageOutline.objects.exists()
+
+    call_command("rebuild_page_outlines", stdout=StringIO())
+    stored = PageOutline.objects.get(page=outline_page)
+    assert stored.faq_items
+    assert stored.revision_id == outline_page.live_revision_id
+
+
+def test_previews_are_not_stored(outline_page) -> None:
+    preview = StandardPage.objects.get(pk=outline_page.pk)
+    preview.body = PageStreamBlock().to_python([])
+    request = RequestFactory().get("/")
+    request.is_preview = True
+    assert get_page_outline(preview, request).faq_items == []
+    assert PageOutline.objects.get(page=outline_page).faq_items
+
+
+def test_add_heading_anchors_uses_outline_order_and_keeps_existing_ids() -> None:
+    html = '<h2>Intro</h2><h3 id="keep">Kept</h3><h2>Intro</h2>'
+
+    assert add_heading_anchors(html, ["a", "b", "c"]) == (
+        '<h2 id="a">Intro</h2><h3 id="keep">Kept</h3><h2 id="c">Intro</h2>'
+    )
+    assert add_heading_anchors(html).endswith('<h2 id="intro-2">Intro</h2>')
+
+
+def test_page_render_uses_outline_for_toc_anchors_and_faq_schema(
+    client, outline_page
+) -> None:
+    html = client.get(outline_page.url).content.decode()
+
+    assert '<h2 id="planning-design">' in html
+    assert '<h3 id="budget-2">Budget</h3>' in html
+    assert 'href="#planning-design"' in html
+    assert 'href="#budget"' in html
+    assert 'href="#manual"' not in html
+    assert '"@type": "FAQPage"' in html
+    assert "About six weeks." in html
+
+
+def test_page_outline_tag_exposes_reading_time(outline_page) -> None:
+    html = Template(
+        "{% load outline_tags %}{% page_outline page as outline %}"
+        "{{ outline.reading_time }} min"
+    ).render(Context({"page": outline_page}))
+
+    assert html == "1 min"
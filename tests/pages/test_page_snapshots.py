@@ -0,0 +1,169 @@
+"""
+Name: Page Snapshot Tests
+Path: tests/pages/test_page_snapshots.py
+Purpose: Validate the published-page HTML snapshot exporter and its publish hooks.
+Family: Part of the page-level test suite exercising the page types.
+Dependencies: sum_core.pages.snapshots, sum_core.pages.StandardPage, Wagtail.
+"""
+
+from __future__ import annotations
+
+import gzip
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.http import HttpResponse
+from sum_core.blocks import PageStreamBlock
+from sum_core.navigation.models import FooterNavigation
+from sum_core.pages.snapshots import (
+    export_page,
+    get_snapshot_dir,
+    is_snapshottable,
+)
+from sum_core.pages.standard import StandardPage
+from sum_core.pages.tasks import export_page_snapshots as export_task
+from sum_core.pages.tasks import export_site_snapshots as site_export_task
+from wagtail.models import PageViewRestriction, Site
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def snapshot_root(settings, tmp_path):
+    settings.PAGE_SNAPSHOT_ROOT = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def guide_page() -> StandardPage:
+    home = Site.objects.get(is_default_site=True).root_page
+    page = StandardPage(title="Guide", slug="guide")
+    page.body = PageStreamBlock().to_python(
+        [{"type": "rich_text", "value": "<p>" + "Snapshot body text. " * 40 + "</p>"}]
+    )
+    home.add_child(instance=page)
+    page.save_revision().publish()
+    return page
+
+
+def test_export_writes_html_and_gzip_sibling(snapshot_root, guide_page) -> None:
+    path = export_page(guide_page)
+
+    assert path == get_snapshot_dir(guide_page) / "index.html"
+    assert path.is_relative_to(snapshot_root.resolve())
+    html = path.read_bytes()
+    assert b"Snapshot body text." in html
+    assert gzip.decompress(path.with_name("index.html.gz").read_bytes()) == html
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Vary": "Accept-Encoding, Cookie"},
+        {"Cache-Control": "private, max-age=0"},
+        {"Content-Type": "application/json"},
+    ],
+)
+def test_visitor_dependent_responses_are_not_snapshottable(headers) -> None:
+    response = HttpResponse("<html></html>")
+    assert is_snapshottable(response)
+
+    for name, value in headers.items():
+        response[name] = value
+    assert not is_snapshottable(response)
+
+    with_cookie = HttpResponse("<html></html>")
+    with_cookie.set_cookie("csrftoken", "x")
+    assert not is_snapshottable(with_cookie)
+
+
+def test_restricted_page_snapshot_is_removed(snapshot_root, guide_page) -> None:
+    path = export_page(guide_page)
+    PageViewRestriction.objects.create(
+        page=guide_page, restriction_type=PageViewRestriction.PASSWORD, password="x"
+    )
+
+    assert export_page(guide_page) is None
+    assert not path.exists()
+    assert not path.with_name("index.html.gz").exists()
+
+
+def test_publish_queues_export_of_page_and_ancestors(
+    snapshot_root, guide_page, django_capture_on_commit_callbacks
+) -> None:
+    def run_task(page_ids):
+        export_task.apply(args=(page_ids,))
+
+    with patch.object(export_task, "delay", side_effect=run_task) as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            guide_page.save_revision().publish()
+
+    home = guide_page.get_parent()
+    delay.assert_called_once_with([guide_page.pk, home.pk])
+    assert (get_snapshot_dir(guide_page) / "index.html").exists()
+    assert (get_snapshot_dir(home) / "index.html").exists()
+
+    guide_page.unpublish()
+    assert not (get_snapshot_dir(guide_page) / "index.html").exists()
+
+
+def test_slug_change_reexports_the_subtree_at_its_new_url(
+    snapshot_root, guide_page, django_capture_on_commit_callbacks
+) -> None:
+    child = StandardPage(title="Step", slug="step")
+    guide_page.add_child(instance=child)
+    child.save_revision().publish()
+    export_page(guide_page)
+    export_page(child)
+    old_dir = get_snapshot_dir(guide_page)
+
+    with patch.object(export_task, "delay") as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            guide_page.slug = "handbook"
+            guide_page.save_revision().publish()
+
+    assert not old_dir.exists()
+    queued = {pk for call in delay.call_args_list for pk in call.args[0]}
+    assert {guide_page.pk, child.pk} <= queued
+
+
+def test_navigation_save_reexports_the_site(
+    snapshot_root, guide_page, django_capture_on_commit_callbacks
+) -> None:
+    site = Site.objects.get(is_default_site=True)
+
+    def run_task(site_id):
+        site_export_task.apply(args=(site_id,))
+
+    with patch.object(site_export_task, "delay", side_effect=run_task) as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            FooterNavigation.for_site(site).save()
+
+    delay.assert_called_once_with(site.pk)
+    assert (get_snapshot_dir(guide_page) / "index.html").exists()
+    assert (get_snapshot_dir(site.root_page) / "index.html").exists()
+
+
+def test_command_exports_all_pages_and_prunes_stale_files(
+    snapshot_root, guide_page
+) -> None:
+    stale = snapshot_root / "localhost" / "removed-page"
+    stale.mkdir(parents=True)
+    (stale / "index.html").write_text("old")
+
+    out = StringIO()
+    call_command("export_page_snapshots", "--prune", stdout=out)
+
+    assert "page snapshot(s)" in out.getvalue()
+    assert (get_snapshot_dir(guide_page) / "index.html").exists()
+    assert not (stale / "index.html").exists()
+
+
+def test_command_is_a_no_op_without_snapshot_root(settings) -> None:
+    settings.PAGE_SNAPSHOT_ROOT = ""
+    out = StringIO()
+    call_command("export_page_snapshots", stdout=out)
+
+    assert "not set" in out.getvalue()
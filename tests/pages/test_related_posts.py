@@ -0,0 +1,209 @@
+"""
+Name: Related Posts Index Tests
+Path: tests/pages/test_related_posts.py
+Purpose: Validate the precomputed related-posts / more-in-category index.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from sum_core.blocks import PageStreamBlock
+from sum_core.pages.blog import BlogIndexPage, BlogPostPage, Category
+from sum_core.pages.related import (
+    BlogPostTermVector,
+    RelatedBlogPost,
+    extract_terms,
+    rebuild_related_posts_index,
+    refresh_related_posts,
+)
+from sum_core.pages.tasks import update_related_posts
+from wagtail.models import Page
+
+pytestmark = pytest.mark.django_db
+
+
+def _make_blog_index(slug: str = "blog-related") -> BlogIndexPage:
+    root = Page.get_first_root_node()
+    blog_index = BlogIndexPage(title="Blog", slug=slug)
+    root.add_child(instance=blog_index)
+    return blog_index
+
+
+def _make_post(
+    blog_index: BlogIndexPage, slug: str, text: str, category: Category
+) -> BlogPostPage:
+    body = PageStreamBlock().to_python(
+        [{"type": "rich_text", "value": f"<p>{text}</p>"}]
+    )
+    post = BlogPostPage(title=slug.replace("-", " "), slug=slug, category=category)
+    post.body = body
+    blog_index.add_child(instance=post)
+    return post
+
+
+@pytest.fixture
+def posts():
+    energy = Category.objects.create(name="Energy", slug="energy")
+    interiors = Category.objects.create(name="Interiors", slug="interiors")
+    blog_index = _make_blog_index()
+    solar = _make_post(
+        blog_index,
+        "solar-panels",
+        "Solar panels and battery storage cut energy bills for homeowners.",
+        energy,
+    )
+    battery = _make_post(
+        blog_index,
+        "battery-storage",
+        "Battery storage pairs with solar panels to store daytime energy.",
+        energy,
+    )
+    kitchen = _make_post(
+        blog_index,
+        "kitchen-tiles",
+        "Choosing kitchen tiles and worktops for a bright modern kitchen.",
+        interiors,
+    )
+    heat_pump = _make_post(
+        blog_index,
+        "heat-pumps",
+        "Heat pumps replace gas boilers with efficient electric heating.",
+        energy,
+    )
+    return {
+        "solar": solar,
+        "battery": battery,
+        "kitchen": kitchen,
+        "heat_pump": heat_pump,
+    }
+
+
+def test_extract_terms_skips_stop_words_and_short_tokens() -> None:
+    terms = extract_terms("The solar panels and the battery: 2024 is at 10kW")
+
+    assert terms == {"solar": 1, "panels": 1, "battery": 1, "10kw": 1}
+
+
+def test_refresh_ranks_most_similar_post_first(posts) -> None:
+    for post in posts.values():
+        refresh_related_posts(post.pk)
+
+    related = list(posts["solar"].get_related_posts())
+
+    assert related[0].pk == posts["battery"].pk
+    assert posts["kitchen"].pk not in [post.pk for post in related]
+
+
+def test_more_in_category_only_lists_same_category(posts) -> None:
+    for post in posts.values():
+        refresh_related_posts(post.pk)
+
+    more = [post.pk for post in posts["solar"].get_more_in_category()]
+
+    assert set(more) == {posts["battery"].pk, posts["heat_pump"].pk}
+    assert list(posts["kitchen"].get_more_in_category()) == []
+
+
+def test_refresh_merges_new_post_into_existing_neighbours(posts) -> None:
+    refresh_related_posts(posts["solar"].pk)
+    refresh_related_posts(posts["kitchen"].pk)
+    assert not RelatedBlogPost.objects.filter(
+        post=posts["solar"], related=posts["battery"]
+    ).exists()
+
+    # Indexing battery must update solar's stored list without rescoring solar.
+    refresh_related_posts(posts["battery"].pk)
+
+    assert RelatedBlogPost.objects.filter(
+        post=posts["solar"],
+        related=posts["battery"],
+        kind=RelatedBlogPost.Kind.RELATED,
+        rank=1,
+    ).exists()
+
+
+def test_post_edited_out_of_a_list_frees_the_slot_for_the_next_best() -> None:
+    blog_index = _make_blog_index("blog-refill")
+    solar, battery, roof = (
+        _make_post(
+            blog_index, slug, text, Category.objects.create(name=slug, slug=slug)
+        )
+        for slug, text in (
+            ("alpha", "Solar panels with battery storage and inverters."),
+            ("bravo", "Battery storage and inverters for solar panels."),
+            ("charlie", "Roof mounting for solar panels."),
+        )
+    )
+    with patch("sum_core.pages.related.RELATED_POSTS_LIMIT", 1):
+        rebuild_related_posts_index()
+        assert [post.pk for post in solar.get_related_posts()] == [battery.pk]
+
+        battery.body = PageStreamBlock().to_python(
+            [{"type": "rich_text", "value": "<p>Kitchen tiles and worktops.</p>"}]
+        )
+        battery.save()
+        refresh_related_posts(battery.pk)
+
+        assert [post.pk for post in solar.get_related_posts()] == [roof.pk]
+
+
+def test_unpublished_post_is_removed_from_neighbour_lists(posts) -> None:
+    for post in posts.values():
+        refresh_related_posts(post.pk)
+
+    posts["battery"].unpublish()
+    refresh_related_posts(posts["battery"].pk)
+
+    assert not BlogPostTermVector.objects.filter(post=posts["battery"]).exists()
+    assert not RelatedBlogPost.objects.filter(related=posts["battery"]).exists()
+    assert posts["battery"].pk not in [
+        post.pk for post in posts["solar"].get_related_posts()
+    ]
+
+
+def test_publish_queues_refresh_on_commit(
+    posts, django_capture_on_commit_callbacks
+) -> None:
+    def run_task(post_id, neighbour_ids=None):
+        update_related_posts.apply(
+            args=(post_id,), kwargs={"neighbour_ids": neighbour_ids}
+        )
+
+    with patch.object(update_related_posts, "delay", side_effect=run_task) as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            posts["solar"].save_revision().publish()
+            posts["battery"].save_revision().publish()
+
+    assert delay.call_count == 2
+    assert RelatedBlogPost.objects.filter(
+        post=posts["solar"], related=posts["battery"]
+    ).exists()
+
+
+def test_publish_does_not_queue_before_commit(posts) -> None:
+    with patch.object(update_related_posts, "delay") as delay:
+        posts["solar"].save_revision().publish()
+
+    delay.assert_not_called()
+
+
+def test_context_reads_precomputed_lists(posts, rf, django_assert_num_queries) -> None:
+    rebuild_related_posts_index()
+    post = posts["solar"]
+
+    context = post.get_context(rf.get("/"))
+
+    with django_assert_num_queries(1):
+        related = list(context["related_posts"])
+    assert related
+    assert "more_in_category" in context
+
+
+def test_rebuild_command_indexes_live_posts(posts) -> None:
+    call_command("rebuild_related_posts", stdout=None)
+
+    assert BlogPostTermVector.objects.count() == len(posts)
+    assert RelatedBlogPost.objects.filter(post=posts["heat_pump"]).exists()
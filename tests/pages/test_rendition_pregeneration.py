@@ -0,0 +1,141 @@
+"""
+Name: Rendition Pre-generation Tests
+Path: tests/pages/test_rendition_pregeneration.py
+Purpose: Validate background rendition generation on publish, image save and backfill.
+"""
+
+from __future__ import annotations
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from sum_core.blocks import PageStreamBlock
+from sum_core.blocks.renditions import expand_rendition_specs
+from sum_core.pages.renditions import get_image_rendition_specs
+from sum_core.pages.standard import StandardPage
+from sum_core.pages.tasks import (
+    generate_image_renditions,
+    pregenerate_image_renditions,
+    pregenerate_page_renditions,
+)
+from wagtail.images.models import Image, Rendition
+from wagtail.images.tests.utils import get_test_image_file
+from wagtail.models import ReferenceIndex, Site
+
+pytestmark = pytest.mark.django_db
+
+GALLERY_SPECS = sorted(expand_rendition_specs(["gallery"]))
+FIRST_IMAGE_SPECS = sorted(expand_rendition_specs(["gallery", "content"]))
+
+
+@pytest.fixture(autouse=True)
+def _clear_rendition_cache():
+    # Wagtail caches renditions by image id, which the rolled-back DB reuses.
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def images():
+    return [
+        Image.objects.create(title=f"Photo {index}", file=get_test_image_file())
+        for index in range(2)
+    ]
+
+
+@pytest.fixture
+def gallery_page(images):
+    home = Site.objects.get(is_default_site=True).root_page
+    page = StandardPage(title="Projects", slug="projects")
+    page.body = PageStreamBlock().to_python(
+        [
+            {
+                "type": "gallery",
+                "value": {"images": [{"image": image.pk} for image in images]},
+            },
+            {"type": "image_block", "value": {"image": images[0].pk, "alt_text": "A"}},
+        ]
+    )
+    home.add_child(instance=page)
+    # Wagtail updates the reference index on commit; tests run inside a transaction.
+    ReferenceIndex.create_or_update_for_object(page)
+    return page
+
+
+def _run_inline(task):
+    return lambda *args: task.apply(args=args)
+
+
+def test_publish_fans_out_one_task_per_image(
+    gallery_page, images, django_capture_on_commit_callbacks
+) -> None:
+    with (
+        patch.object(
+            pregenerate_page_renditions,
+            "delay",
+            side_effect=_run_inline(pregenerate_page_renditions),
+        ),
+        patch.object(
+            generate_image_renditions,
+            "delay",
+            side_effect=_run_inline(generate_image_renditions),
+        ) as generate_delay,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            gallery_page.save_revision().publish()
+
+    assert generate_delay.call_count == len(images)
+    generate_delay.assert_any_call(images[0].pk, FIRST_IMAGE_SPECS)
+    assert Rendition.objects.filter(filter_spec="fill-1200x900").count() == 2
+    assert Rendition.objects.filter(filter_spec="width-2400").count() == 1
+
+
+def test_publish_does_not_queue_before_commit(gallery_page) -> None:
+    with patch.object(pregenerate_page_renditions, "delay") as delay:
+        gallery_page.save_revision().publish()
+
+    delay.assert_not_called()
+
+
+def test_image_specs_come_from_referencing_pages(gallery_page, images) -> None:
+    assert get_image_rendition_specs(images[0].pk) == FIRST_IMAGE_SPECS
+    assert get_image_rendition_specs(images[1].pk) == GALLERY_SPECS
+
+
+def test_image_save_regenerates_renditions(
+    gallery_page, images, django_capture_on_commit_callbacks
+) -> None:
+    image = images[1]
+    image.set_focal_point(None)
+
+    with patch.object(
+        pregenerate_image_renditions,
+        "delay",
+        side_effect=_run_inline(pregenerate_image_renditions),
+    ) as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            image.save()
+
+    delay.assert_called_once_with(image.pk)
+    assert Rendition.objects.filter(image=image, filter_spec="fill-1200x900").exists()
+
+
+def test_backfill_command_generates_renditions_in_process(gallery_page) -> None:
+    out = StringIO()
+
+    call_command("pregenerate_renditions", "--sync", stdout=out)
+
+    expected = len(FIRST_IMAGE_SPECS) + len(GALLERY_SPECS)
+    assert f"Ensured {expected} rendition(s)" in out.getvalue()
+    assert Rendition.objects.count() == expected
+
+
+def test_backfill_command_queues_one_task_per_page(gallery_page) -> None:
+    with patch.object(pregenerate_page_renditions, "delay") as delay:
+        call_command("pregenerate_renditions", stdout=StringIO())
+
+    delay.assert_any_call(gallery_page.pk)
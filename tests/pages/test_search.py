@@ -0,0 +1,233 @@
+"""
+Name: Site Search Tests
+Path: tests/pages/test_search.py
+Purpose: Validate the inverted search index, ranking and SearchPage rendering.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from sum_core.blocks import PageStreamBlock
+from sum_core.pages.blog import BlogIndexPage, BlogPostPage, Category
+from sum_core.pages.search import SearchPage
+from sum_core.pages.search_index import (
+    SearchDocument,
+    SearchTerm,
+    index_page,
+    search,
+    stream_to_text,
+)
+from sum_core.pages.services import ServiceIndexPage, ServicePage
+from sum_core.pages.standard import StandardPage
+from sum_core.pages.tasks import update_search_index
+from wagtail.models import PageViewRestriction, Site
+
+pytestmark = pytest.mark.django_db
+
+
+def _rich_text_body(text: str):
+    return PageStreamBlock().to_python(
+        [{"type": "rich_text", "value": f"<p>{text}</p>"}]
+    )
+
+
+@pytest.fixture
+def site_pages():
+    site = Site.objects.get(is_default_site=True)
+    home = site.root_page
+
+    blog_index = BlogIndexPage(title="Blog", slug="blog")
+    home.add_child(instance=blog_index)
+    category = Category.objects.create(name="Energy", slug="energy")
+    solar_post = BlogPostPage(
+        title="Solar panel guide", slug="solar-guide", category=category
+    )
+    solar_post.body = _rich_text_body(
+        "Solar panels lower bills. Solar installs take two days."
+    )
+    blog_index.add_child(instance=solar_post)
+
+    service_index = ServiceIndexPage(title="Services", slug="services")
+    home.add_child(instance=service_index)
+    roofing = ServicePage(
+        title="Roofing",
+        slug="roofing",
+        short_description="Slate roofing and repairs, including solar mounting.",
+    )
+    service_index.add_child(instance=roofing)
+
+    about = StandardPage(title="About us", slug="about")
+    about.body = _rich_text_body("A family business founded on kitchen fitting.")
+    home.add_child(instance=about)
+
+    search_page = SearchPage(title="Search", slug="search", results_per_page=1)
+    home.add_child(instance=search_page)
+
+    return {
+        "solar_post": solar_post,
+        "roofing": roofing,
+        "about": about,
+        "search_page": search_page,
+        "root": home,
+    }
+
+
+def test_stream_to_text_flattens_nested_blocks() -> None:
+    value = PageStreamBlock().to_python(
+        [
+            {"type": "rich_text", "value": "<p>Hello <b>world</b></p>"},
+            {
+                "type": "faq",
+                "value": {
+                    "heading": "<p>Questions</p>",
+                    "items": [{"question": "Why?", "answer": "<p>Because.</p>"}],
+                },
+            },
+        ]
+    )
+
+    text = stream_to_text(value)
+
+    assert "Hello world" in text
+    assert "Why?" in text
+    assert "Because." in text
+
+
+def test_index_page_stores_postings_with_title_weight(site_pages) -> None:
+    assert index_page(site_pages["solar_post"].pk)
+
+    document = SearchDocument.objects.get(page=site_pages["solar_post"])
+    solar = SearchTerm.objects.get(document=document, term="solar")
+    # Twice in the body plus once in the title weighted x3.
+    assert solar.frequency == 5
+    assert document.length == sum(
+        SearchTerm.objects.filter(document=document).values_list("frequency", flat=True)
+    )
+
+
+def test_non_searchable_pages_are_not_indexed(site_pages) -> None:
+    assert not index_page(site_pages["search_page"].pk)
+    assert not SearchDocument.objects.filter(page=site_pages["search_page"]).exists()
+
+
+def test_search_ranks_stronger_match_first(site_pages) -> None:
+    for key in ("solar_post", "roofing", "about"):
+        index_page(site_pages[key].pk)
+
+    page_obj, results = search("solar", per_page=10)
+
+    assert [result.page.pk for result in results] == [
+        site_pages["solar_post"].pk,
+        site_pages["roofing"].pk,
+    ]
+    assert page_obj.paginator.count == 2
+    assert "Solar" in results[0].snippet
+
+
+def test_search_unknown_terms_return_nothing(site_pages) -> None:
+    index_page(site_pages["about"].pk)
+
+    page_obj, results = search("the and of")
+
+    assert results == []
+    assert page_obj.paginator.count == 0
+
+
+def test_unpublish_removes_document(site_pages) -> None:
+    index_page(site_pages["about"].pk)
+
+    site_pages["about"].unpublish()
+
+    assert not SearchDocument.objects.filter(page=site_pages["about"]).exists()
+    assert not SearchTerm.objects.exists()
+
+
+def test_restriction_added_after_indexing_hides_subtree(
+    site_pages, django_capture_on_commit_callbacks
+) -> None:
+    call_command("rebuild_search_index", stdout=None)
+    blog_index = site_pages["solar_post"].get_parent()
+    assert [r.title for r in search("solar")[1]] == [
+        "Solar panel guide",
+        "Roofing",
+    ]
+
+    restriction = PageViewRestriction.objects.create(
+        page=blog_index, restriction_type=PageViewRestriction.PASSWORD, password="x"
+    )
+    assert not SearchDocument.objects.filter(page=site_pages["solar_post"]).exists()
+    assert [r.title for r in search("solar")[1]] == ["Roofing"]
+
+    with patch.object(
+        update_search_index, "delay", side_effect=lambda pk: index_page(pk)
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            restriction.delete()
+    assert [r.title for r in search("solar")[1]][0] == "Solar panel guide"
+
+
+def test_search_filters_restricted_documents_still_in_index(site_pages) -> None:
+    call_command("rebuild_search_index", stdout=None)
+    PageViewRestriction.objects.bulk_create(
+        [
+            PageViewRestriction(
+                page=site_pages["roofing"].get_parent(),
+                restriction_type=PageViewRestriction.PASSWORD,
+                password="x",
+            )
+        ]
+    )
+
+    assert SearchDocument.objects.filter(page=site_pages["roofing"]).exists()
+    assert [r.title for r in search("solar")[1]] == ["Solar panel guide"]
+
+
+def test_publish_queues_index_update_on_commit(
+    site_pages, django_capture_on_commit_callbacks
+) -> None:
+    def run_task(page_id):
+        update_search_index.apply(args=(page_id,))
+
+    with patch.object(update_search_index, "delay", side_effect=run_task) as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            site_pages["roofing"].save_revision().publish()
+            site_pages["search_page"].save_revision().publish()
+
+    delay.assert_called_once_with(site_pages["roofing"].pk)
+    assert SearchDocument.objects.filter(page=site_pages["roofing"]).exists()
+
+
+def test_search_uses_fixed_number_of_queries(
+    site_pages, django_assert_num_queries
+) -> None:
+    call_command("rebuild_search_index", stdout=None)
+    search("warm up")
+
+    # document frequencies, count, ranked slice, documents + pages
+    with django_assert_num_queries(4):
+        search("solar roofing", per_page=10, root_page=site_pages["root"])
+
+
+def test_search_page_renders_paginated_results(site_pages, client) -> None:
+    call_command("rebuild_search_index", stdout=None)
+    url = site_pages["search_page"].get_url()
+
+    response = client.get(url, {"q": "solar"})
+    second = client.get(url, {"q": "solar", "page": 2})
+
+    assert response.status_code == 200
+    assert response.context["results_page"].paginator.num_pages == 2
+    assert "Solar panel guide" in response.content.decode()
+    assert "q=solar" in response.content.decode()
+    assert "Roofing" in second.content.decode()
+
+
+def test_search_page_without_query_has_no_results(site_pages, client) -> None:
+    response = client.get(site_pages["search_page"].get_url())
+
+    assert response.status_code == 200
+    assert response.context["search_results"] == []
+    assert response.context["results_page"] is None
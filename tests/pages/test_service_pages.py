@@ -9,11 +9,17 @@ Dependencies: Wagtail Site & Page models, sum_core.pages.services, home.HomePage
 from __future__ import annotations
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from home.models import HomePage
 from sum_core.blocks import PageStreamBlock
+from sum_core.pages.cache import get_service_listing_cache_key
 from sum_core.pages.services import ServiceIndexPage, ServicePage
 from wagtail.fields import StreamField
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
 from wagtail.models import Page, Site
 
 pytestmark = pytest.mark.django_db
@@ -488,3 +494,77 @@ def test_service_page_renders_title_and_description() -> None:
     assert (
         service_page.short_description == "Transform your kitchen with our expert team."
     )
+
+
+# =============================================================================
+# Service Listing Query/Cache Tests
+# =============================================================================
+
+
+def _publish_services(service_index: ServiceIndexPage, count: int) -> None:
+    for number in range(count):
+        image = Image.objects.create(
+            title=f"Service {number}", file=get_test_image_file()
+        )
+        service = ServicePage(
+            title=f"Service {number}",
+            slug=f"service-{number}-{service_index.get_children_count()}",
+            short_description="Card text.",
+            featured_image=image,
+        )
+        service_index.add_child(instance=service)
+        service.save_revision().publish()
+
+
+def _render_query_count(client, service_index: ServiceIndexPage) -> int:
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(service_index.url)
+    assert response.status_code == 200
+    return len(queries)
+
+
+def test_service_index_renders_in_constant_queries(
+    client, wagtail_default_site
+) -> None:
+    """Rendering the listing does not issue queries per service card."""
+    service_index = ServiceIndexPage(title="Services", slug="services-queries")
+    wagtail_default_site.root_page.add_child(instance=service_index)
+
+    _publish_services(service_index, 2)
+    client.get(service_index.url)  # Warm site/settings caches.
+    with_two = _render_query_count(client, service_index)
+
+    _publish_services(service_index, 3)
+    client.get(service_index.url)
+    with_five = _render_query_count(client, service_index)
+
+    assert with_five == with_two
+    html = client.get(service_index.url).content.decode()
+    assert html.count("services__icon-image") == 5
+    assert 'href="/services-queries/service-0-0/"' in html
+
+
+def test_service_listing_is_cached_and_invalidated_by_child_publish() -> None:
+    """Listings come from the cache until a child is published or unpublished."""
+    root = Page.get_first_root_node()
+    service_index = ServiceIndexPage(title="Services", slug="services-cache")
+    root.add_child(instance=service_index)
+    _publish_services(service_index, 1)
+
+    listed = service_index.get_services()
+    assert [service.title for service in listed] == ["Service 0"]
+    # Cards are plain data carrying the card rendition.
+    assert listed[0].image["width"] == 160
+    assert listed[0].image["url"]
+    raw = cache.get(get_service_listing_cache_key(service_index))
+    assert all(type(row) is tuple for row in raw)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert service_index.get_services() == listed
+    assert len(queries) == 0
+
+    _publish_services(service_index, 1)
+    assert len(service_index.get_services()) == 2
+
+    ServicePage.objects.get(slug="service-0-0").unpublish()
+    assert [service.title for service in service_index.get_services()] == ["Service 0"]
@@ -169,6 +169,8 @@ def test_portfolio_filter_bar_when_multiple_categories(image):
     assert "Residential" in html
     assert "Commercial" in html
     assert "?category=residential" in html
+    assert 'data-portfolio-filter="residential"' in html
+    assert "data-portfolio " in html
 
 
 def test_portfolio_filters_by_querystring(image):
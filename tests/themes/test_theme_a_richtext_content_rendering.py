@@ -72,7 +72,7 @@ class TestThemeARichTextContentBlock:
         )
         assert "max-w-3xl mx-auto" in content
         assert "prose-headings:text-center" in content
-        assert "<h2>Section Heading</h2>" in content
+        assert '<h2 id="section-heading">Section Heading</h2>' in content
         assert "<ul>" in content
         assert '<a href="#link"' in content
         soup = BeautifulSoup(content, "html.parser")
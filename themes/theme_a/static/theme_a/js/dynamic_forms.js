@@ -37,6 +37,15 @@
     }
   }
 
+  function setTimeTokenForForm(form, token) {
+    var input = form.querySelector('input[name="_time_token"]');
+    if (input && token) {
+      // Time tokens are single-use; the server sends a fresh one on success.
+      input.value = token;
+      input.defaultValue = token;
+    }
+  }
+
   function setMessage(messagesDiv, type, text) {
     if (!messagesDiv) {
       return;
@@ -123,6 +132,7 @@
           );
           form.reset();
           setTimestampForForm(form);
+          setTimeTokenForForm(form, result.data.time_token);
 
           var redirectUrl = form.dataset.successRedirect;
           if (redirectUrl) {